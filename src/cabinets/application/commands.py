@@ -32,6 +32,7 @@ if TYPE_CHECKING:
         RoomLayoutOrchestratorProtocol,
         RoomLayoutServiceProtocol,
     )
+    from cabinets.application.config import CabinetConfiguration
     from cabinets.domain.services.installation import InstallationConfig
 
 
@@ -222,6 +223,50 @@ class GenerateLayoutCommand:
             installation_result=installation_result,
         )
 
+    def execute_from_config(
+        self, config: "CabinetConfiguration"
+    ) -> LayoutOutput | RoomLayoutOutput:
+        """Generate the layout described by a configuration.
+
+        This is the generation path of the web API's *-from-config
+        endpoints. Batch jobs that fill the shared artifact store use it too,
+        so their artifacts match what the API would generate.
+
+        Args:
+            config: Validated cabinet configuration.
+
+        Returns:
+            RoomLayoutOutput if the configuration has room geometry,
+            LayoutOutput otherwise.
+
+        Raises:
+            ValueError: If the configuration cannot be converted to inputs.
+        """
+        from cabinets.application.config import (
+            config_to_all_section_specs,
+            config_to_dtos,
+            config_to_room,
+            config_to_section_specs,
+            config_to_zone_configs,
+        )
+
+        if config.room is not None:
+            room = config_to_room(config)
+            if room is None:
+                raise ValueError("Invalid room configuration")
+            _, params_input = config_to_dtos(config)
+            return self.execute_room_layout(
+                room, config_to_all_section_specs(config), params_input
+            )
+
+        wall_input, params_input = config_to_dtos(config)
+        return self.execute(
+            wall_input,
+            params_input,
+            section_specs=config_to_section_specs(config),
+            zone_configs=config_to_zone_configs(config),
+        )
+
     def execute_room_layout(
         self,
         room: Room,
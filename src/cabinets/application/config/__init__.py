@@ -20,10 +20,15 @@ Public API:
     - HeightMode: Height mode enum for cabinet sections
     - load_config: Load configuration from a JSON file
     - load_config_from_dict: Load configuration from a dictionary
+    - ProjectConfiguration: Multi-room project configuration model
+    - load_project_config: Load a project configuration and its room files
+    - ConfigParseCache: LRU cache of validated configurations keyed on raw JSON
+    - get_config_parse_cache: Process-wide configuration parse cache
     - ConfigError: Exception for configuration errors
     - ValidationResult: Container for validation results
     - ValidationError: Blocking validation error
     - ValidationWarning: Non-blocking validation warning
+    - ValidationSession: Per-session cache for incremental validation
     - validate_config: Perform full configuration validation
     - config_to_obstacles: Convert config obstacles to domain entities
     - config_to_clearance_defaults: Convert config defaults to domain mapping
@@ -43,6 +48,7 @@ from cabinets.application.config.loader import (
     ConfigError as ConfigError,
     load_config as load_config,
     load_config_from_dict as load_config_from_dict,
+    load_project_config as load_project_config,
 )
 from cabinets.application.config.schemas import (
     AccessibilityConfigSchema as AccessibilityConfigSchema,
@@ -95,6 +101,8 @@ from cabinets.application.config.schemas import (
     OutsideCornerConfigSchema as OutsideCornerConfigSchema,
     OutputConfig as OutputConfig,
     PositionConfigSchema as PositionConfigSchema,
+    ProjectConfiguration as ProjectConfiguration,
+    ProjectRoomConfig as ProjectRoomConfig,
     RoomConfig as RoomConfig,
     RowConfig as RowConfig,
     SafetyConfigSchema as SafetyConfigSchema,
@@ -157,11 +165,17 @@ from cabinets.application.config.schemas import (
 from cabinets.application.config.validator import (
     ValidationError as ValidationError,
     ValidationResult as ValidationResult,
+    ValidationSession as ValidationSession,
     ValidationWarning as ValidationWarning,
     check_infrastructure_advisories as check_infrastructure_advisories,
     check_obstacle_advisories as check_obstacle_advisories,
     validate_config as validate_config,
 )
+from cabinets.application.config.parse_cache import (
+    ConfigParseCache as ConfigParseCache,
+    ParseMetrics as ParseMetrics,
+    get_config_parse_cache as get_config_parse_cache,
+)
 from cabinets.application.config.merger import (
     merge_config_with_cli as merge_config_with_cli,
 )
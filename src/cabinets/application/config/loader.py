@@ -11,7 +11,10 @@ from typing import Any
 
 from pydantic import ValidationError as PydanticValidationError
 
-from cabinets.application.config.schemas import CabinetConfiguration
+from cabinets.application.config.schemas import (
+    CabinetConfiguration,
+    ProjectConfiguration,
+)
 
 
 class ConfigError(Exception):
@@ -122,35 +125,17 @@ def _format_validation_error_message(details: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def load_config(path: Path) -> CabinetConfiguration:
-    """Load and validate a cabinet configuration from a JSON file.
-
-    This function handles three types of errors:
-    1. File not found - The specified file does not exist
-    2. JSON parse error - The file contains invalid JSON
-    3. Validation error - The JSON is valid but doesn't match the schema
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON configuration file.
 
     Args:
         path: Path to the JSON configuration file
 
     Returns:
-        A validated CabinetConfiguration instance
+        The parsed JSON data
 
     Raises:
-        ConfigError: If the file cannot be loaded or validated.
-            The error_type attribute indicates the specific error category:
-            - "file_not_found": File does not exist
-            - "json_parse": Invalid JSON syntax
-            - "validation": Schema validation failed
-
-    Example:
-        >>> from pathlib import Path
-        >>> try:
-        ...     config = load_config(Path("my-cabinet.json"))
-        ... except ConfigError as e:
-        ...     print(f"Error: {e}")
-        ...     for detail in e.details:
-        ...         print(f"  {detail['path']}: {detail['message']}")
+        ConfigError: If the file is missing, unreadable, or not valid JSON.
     """
     # Check if file exists
     if not path.exists():
@@ -193,6 +178,41 @@ def load_config(path: Path) -> CabinetConfiguration:
             ],
         )
 
+    return data
+
+
+def load_config(path: Path) -> CabinetConfiguration:
+    """Load and validate a cabinet configuration from a JSON file.
+
+    This function handles three types of errors:
+    1. File not found - The specified file does not exist
+    2. JSON parse error - The file contains invalid JSON
+    3. Validation error - The JSON is valid but doesn't match the schema
+
+    Args:
+        path: Path to the JSON configuration file
+
+    Returns:
+        A validated CabinetConfiguration instance
+
+    Raises:
+        ConfigError: If the file cannot be loaded or validated.
+            The error_type attribute indicates the specific error category:
+            - "file_not_found": File does not exist
+            - "json_parse": Invalid JSON syntax
+            - "validation": Schema validation failed
+
+    Example:
+        >>> from pathlib import Path
+        >>> try:
+        ...     config = load_config(Path("my-cabinet.json"))
+        ... except ConfigError as e:
+        ...     print(f"Error: {e}")
+        ...     for detail in e.details:
+        ...         print(f"  {detail['path']}: {detail['message']}")
+    """
+    data = _read_json(path)
+
     # Validate against schema
     try:
         return CabinetConfiguration.model_validate(data)
@@ -230,3 +250,44 @@ def load_config_from_dict(data: dict[str, Any]) -> CabinetConfiguration:
             error_type="validation",
             details=details,
         )
+
+
+def load_project_config(path: Path) -> ProjectConfiguration:
+    """Load and validate a multi-room project configuration from a JSON file.
+
+    Rooms given by 'path' are loaded with load_config(), resolving the path
+    relative to the project file, so every room of the returned project has
+    an inline configuration.
+
+    Args:
+        path: Path to the JSON project configuration file
+
+    Returns:
+        A validated ProjectConfiguration instance
+
+    Raises:
+        ConfigError: If the project file or any room file cannot be loaded
+            or validated. Room file errors carry the room file's path.
+    """
+    data = _read_json(path)
+
+    try:
+        project = ProjectConfiguration.model_validate(data)
+    except PydanticValidationError as e:
+        details = _extract_validation_errors(e)
+        raise ConfigError(
+            message=_format_validation_error_message(details),
+            error_type="validation",
+            path=path,
+            details=details,
+        )
+
+    rooms = [
+        room
+        if room.path is None
+        else room.model_copy(
+            update={"config": load_config(path.parent / room.path), "path": None}
+        )
+        for room in project.rooms
+    ]
+    return project.model_copy(update={"rooms": rooms})
@@ -0,0 +1,277 @@
+"""Cached configuration parsing for repeated requests.
+
+Full Pydantic validation of a CabinetConfiguration walks dozens of nested
+models and custom validators. Interactive clients (the web editor) submit
+the same configuration to several endpoints in a row, so this module keeps
+an LRU cache of validated configurations keyed on a hash of the raw JSON.
+
+Raw request bodies are validated directly with ``model_validate_json`` so
+no intermediate ``dict`` is built. Cached configurations are shared between
+callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NoReturn
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from cabinets.application.config.loader import (
+    ConfigError,
+    _extract_validation_errors,
+    _format_validation_error_message,
+)
+from cabinets.application.config.schemas import CabinetConfiguration
+
+# Default number of validated configurations retained
+DEFAULT_PARSE_CACHE_SIZE = 128
+
+
+class ConfigEnvelope(BaseModel):
+    """Request body wrapper holding a configuration under the ``config`` key.
+
+    Matches the body of GenerateFromConfigRequest so request bodies can be
+    validated straight from bytes into a CabinetConfiguration.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    config: CabinetConfiguration
+
+
+_ENVELOPE_ADAPTER: TypeAdapter[ConfigEnvelope] = TypeAdapter(ConfigEnvelope)
+
+
+@dataclass(frozen=True)
+class ParseMetrics:
+    """Snapshot of configuration parse cache statistics.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that required full validation.
+        size: Number of configurations currently cached.
+        max_size: Maximum number of cached configurations.
+        total_parse_seconds: Cumulative time spent validating on misses.
+        last_parse_seconds: Validation time of the most recent miss.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    total_parse_seconds: float
+    last_parse_seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a JSON-serializable dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "size": self.size,
+            "max_size": self.max_size,
+            "total_parse_ms": round(self.total_parse_seconds * 1000, 3),
+            "last_parse_ms": round(self.last_parse_seconds * 1000, 3),
+        }
+
+
+def _strip_envelope(details: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Remove the leading ``config.`` segment from envelope error paths."""
+    for detail in details:
+        path = detail["path"]
+        if path.startswith("config."):
+            detail["path"] = path[len("config.") :]
+    return details
+
+
+def _raise_config_error(error: PydanticValidationError, envelope: bool) -> NoReturn:
+    """Convert a Pydantic error into a ConfigError with readable paths."""
+    if any(err["type"] == "json_invalid" for err in error.errors()):
+        message = error.errors()[0]["msg"]
+        raise ConfigError(
+            message=f"Invalid JSON in configuration: {message}",
+            error_type="json_parse",
+            details=[{"message": message}],
+        ) from error
+    details = _extract_validation_errors(error)
+    if envelope:
+        details = _strip_envelope(details)
+    raise ConfigError(
+        message=_format_validation_error_message(details),
+        error_type="validation",
+        details=details,
+    ) from error
+
+
+class ConfigParseCache:
+    """LRU cache of validated CabinetConfiguration objects.
+
+    Keys are SHA-256 hashes of the raw JSON (or of a canonical dump for
+    dictionaries). Only successful parses are cached; invalid input raises
+    ConfigError every time. The cache is safe to share between threads.
+
+    Example:
+        cache = ConfigParseCache(max_size=64)
+        config = cache.parse_json(request_bytes)
+        print(cache.metrics().to_dict())
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PARSE_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of configurations to retain.
+
+        Raises:
+            ValueError: If max_size is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._entries: OrderedDict[str, CabinetConfiguration] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._total_parse_seconds = 0.0
+        self._last_parse_seconds = 0.0
+
+    def parse_json(self, raw: bytes | str) -> CabinetConfiguration:
+        """Parse a configuration from raw JSON.
+
+        Args:
+            raw: JSON document whose root is a configuration.
+
+        Returns:
+            The validated (possibly cached) configuration.
+
+        Raises:
+            ConfigError: If the JSON is malformed or fails validation.
+        """
+        return self._get_or_parse(
+            "config:" + _digest(raw),
+            lambda: CabinetConfiguration.model_validate_json(raw),
+            envelope=False,
+        )
+
+    def parse_envelope(self, raw: bytes | str) -> CabinetConfiguration:
+        """Parse a configuration from a ``{"config": {...}}`` request body.
+
+        Args:
+            raw: Raw request body bytes.
+
+        Returns:
+            The validated (possibly cached) configuration.
+
+        Raises:
+            ConfigError: If the body is malformed or fails validation.
+        """
+        return self._get_or_parse(
+            "envelope:" + _digest(raw),
+            lambda: _ENVELOPE_ADAPTER.validate_json(raw).config,
+            envelope=True,
+        )
+
+    def parse_dict(self, data: dict[str, Any]) -> CabinetConfiguration:
+        """Parse a configuration from an already-decoded dictionary.
+
+        Args:
+            data: Dictionary containing configuration data.
+
+        Returns:
+            The validated (possibly cached) configuration.
+
+        Raises:
+            ConfigError: If the data fails validation.
+        """
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        return self._get_or_parse(
+            "config:" + _digest(canonical),
+            lambda: CabinetConfiguration.model_validate(data),
+            envelope=False,
+        )
+
+    def metrics(self) -> ParseMetrics:
+        """Get a snapshot of cache statistics."""
+        with self._lock:
+            return ParseMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self._max_size,
+                total_parse_seconds=self._total_parse_seconds,
+                last_parse_seconds=self._last_parse_seconds,
+            )
+
+    def clear(self) -> None:
+        """Remove all cached configurations and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._total_parse_seconds = 0.0
+            self._last_parse_seconds = 0.0
+
+    def _get_or_parse(
+        self,
+        key: str,
+        parse: Callable[[], CabinetConfiguration],
+        envelope: bool,
+    ) -> CabinetConfiguration:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        start = time.perf_counter()
+        try:
+            config = parse()
+        except PydanticValidationError as e:
+            _raise_config_error(e, envelope)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._total_parse_seconds += elapsed
+                self._last_parse_seconds = elapsed
+
+        with self._lock:
+            self._entries[key] = config
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return config
+
+
+def _digest(raw: bytes | str) -> str:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+_default_cache: ConfigParseCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_config_parse_cache() -> ConfigParseCache:
+    """Get the process-wide configuration parse cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ConfigParseCache()
+        return _default_cache
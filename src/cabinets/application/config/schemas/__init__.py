@@ -16,6 +16,7 @@ The schemas are organized into the following modules:
 - entertainment_schema.py: Entertainment center configurations
 - output_schema.py: Output format configurations
 - root.py: Root configuration model
+- project_schema.py: Multi-room project configuration model
 """
 
 # Base enums and shared models
@@ -182,5 +183,11 @@ from cabinets.application.config.schemas.root import (
     CabinetConfiguration as CabinetConfiguration,
 )
 
+# Project configuration
+from cabinets.application.config.schemas.project_schema import (
+    ProjectConfiguration as ProjectConfiguration,
+    ProjectRoomConfig as ProjectRoomConfig,
+)
+
 # All imported names are automatically available for direct import.
 # No __all__ needed since star imports are not used.
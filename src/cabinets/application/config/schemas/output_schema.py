@@ -107,6 +107,7 @@ class AssemblyOutputConfigSchema(BaseModel):
         timeout_seconds: LLM generation timeout in seconds.
         include_troubleshooting: Include troubleshooting tips section (LLM mode).
         include_time_estimates: Include time estimates per step (LLM mode).
+        llm_cache_only: Use only cached LLM instructions, never calling the model.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -141,6 +142,10 @@ class AssemblyOutputConfigSchema(BaseModel):
     include_time_estimates: bool = Field(
         default=True, description="Include time estimates per step (LLM mode)"
     )
+    llm_cache_only: bool = Field(
+        default=False,
+        description="Use only cached LLM instructions, never calling the model",
+    )
 
     @field_validator("llm_model")
     @classmethod
@@ -0,0 +1,99 @@
+"""Whole-project configuration schema.
+
+This module contains the ProjectConfiguration model, which groups the
+cabinet configurations of several rooms into one job so they can be
+generated together and share sheet goods and hardware purchasing.
+"""
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+from cabinets.application.config.schemas.root import CabinetConfiguration
+from cabinets.application.config.schemas.woodworking_schema import (
+    BinPackingConfigSchema,
+)
+
+
+class ProjectRoomConfig(BaseModel):
+    """One room of a project.
+
+    A room's cabinet configuration is either given inline or loaded from
+    a separate configuration file.
+
+    Attributes:
+        name: Unique room name, used to label the room's cut pieces.
+        config: Inline cabinet configuration for the room.
+        path: Path to the room's configuration file, relative to the
+            project file.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = Field(..., min_length=1, max_length=100)
+    config: CabinetConfiguration | None = None
+    path: str | None = Field(default=None, min_length=1)
+
+    @model_validator(mode="after")
+    def validate_config_or_path(self) -> "ProjectRoomConfig":
+        """Validate that exactly one of 'config' or 'path' is given."""
+        if (self.config is None) == (self.path is None):
+            raise ValueError(
+                f"Room '{self.name}' needs exactly one of 'config' or 'path'"
+            )
+        return self
+
+
+class ProjectConfiguration(BaseModel):
+    """Root configuration model for a multi-room project.
+
+    Rooms are generated independently, then their cut lists are merged
+    and packed onto sheets in a single pass using the project's
+    bin_packing settings; the bin_packing settings of individual rooms
+    are not used.
+
+    Attributes:
+        schema_version: Version string in format "major.minor" (e.g., "1.0")
+        name: Project name
+        rooms: Rooms of the project (1 to 50)
+        bin_packing: Bin packing configuration for the whole project
+
+    Example:
+        >>> project = ProjectConfiguration(
+        ...     schema_version="1.0",
+        ...     name="Smith House",
+        ...     rooms=[ProjectRoomConfig(name="Kitchen", path="kitchen.json")],
+        ... )
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: str = Field(..., pattern=r"^\d+\.\d+$")
+    name: str = Field(default="Project", min_length=1, max_length=100)
+    rooms: list[ProjectRoomConfig] = Field(..., min_length=1, max_length=50)
+    bin_packing: BinPackingConfigSchema | None = Field(
+        default=None, description="Bin packing for the whole project (optional)"
+    )
+
+    @field_validator("schema_version")
+    @classmethod
+    def validate_supported_version(cls, v: str) -> str:
+        """Validate the schema version as CabinetConfiguration does."""
+        return CabinetConfiguration.validate_supported_version(v)
+
+    @field_validator("rooms")
+    @classmethod
+    def validate_unique_room_names(
+        cls, v: list[ProjectRoomConfig]
+    ) -> list[ProjectRoomConfig]:
+        """Ensure room names are unique."""
+        seen: set[str] = set()
+        for room in v:
+            if room.name in seen:
+                raise ValueError(f"Duplicate room name '{room.name}'")
+            seen.add(room.name)
+        return v
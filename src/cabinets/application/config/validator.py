@@ -18,7 +18,7 @@ from .validators.infrastructure import (
     check_infrastructure_advisories,
 )
 from .validators.obstacle import check_obstacle_advisories
-from .validators.registry import ValidatorRegistry
+from .validators.registry import ValidationSession, ValidatorRegistry
 from .validators.woodworking import (
     MAX_ASPECT_RATIO,
     MIN_RECOMMENDED_THICKNESS,
@@ -59,7 +59,13 @@ def _ensure_validators_registered() -> None:
 _ensure_validators_registered()
 
 
-def validate_config(config: CabinetConfiguration) -> ValidationResult:
+def validate_config(
+    config: CabinetConfiguration,
+    *,
+    session: ValidationSession | None = None,
+    fail_fast: bool = False,
+    max_workers: int | None = None,
+) -> ValidationResult:
     """Perform full validation of a cabinet configuration.
 
     This function performs both structural validation (which should already
@@ -68,6 +74,10 @@ def validate_config(config: CabinetConfiguration) -> ValidationResult:
 
     Args:
         config: A CabinetConfiguration instance (already validated by Pydantic)
+        session: Optional ValidationSession used to skip validators whose
+            configuration subtrees are unchanged since the previous call.
+        fail_fast: Stop at the first validator reporting a blocking error.
+        max_workers: Run validators concurrently on this many threads.
 
     Returns:
         ValidationResult containing any errors or warnings
@@ -76,7 +86,9 @@ def validate_config(config: CabinetConfiguration) -> ValidationResult:
     _ensure_validators_registered()
 
     # Use the registry to run all validators
-    return ValidatorRegistry.validate_all(config)
+    return ValidatorRegistry.validate_all(
+        config, session=session, fail_fast=fail_fast, max_workers=max_workers
+    )
 
 
 __all__ = [
@@ -88,6 +100,7 @@ __all__ = [
     "ValidationResult",
     # Registry
     "ValidatorRegistry",
+    "ValidationSession",
     # Legacy functions for backwards compatibility
     "check_woodworking_advisories",
     "check_obstacle_advisories",
@@ -23,7 +23,7 @@ from .helpers import (
 )
 from .infrastructure import InfrastructureValidator
 from .obstacle import ObstacleValidator
-from .registry import ValidatorRegistry
+from .registry import ValidationSession, ValidatorRegistry
 from .section import SectionDimensionValidator
 from .woodworking import WoodworkingValidator
 
@@ -34,6 +34,7 @@ __all__ = [
     "ValidationResult",
     # Registry
     "ValidatorRegistry",
+    "ValidationSession",
     # Validators
     "WoodworkingValidator",
     "ObstacleValidator",
@@ -8,9 +8,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from cabinets.domain.components.cutout_index import CutoutIndex
+
 from .base import ValidationError, ValidationResult, ValidationWarning
 from .helpers import (
-    cutouts_overlap,
     get_cutout_info,
     get_panel_dimensions,
     get_section_count,
@@ -47,6 +48,11 @@ class InfrastructureValidator:
         """Return the validator name."""
         return "infrastructure"
 
+    @property
+    def dependencies(self) -> tuple[str, ...]:
+        """Return the top-level configuration fields this validator reads."""
+        return ("cabinet", "infrastructure")
+
     def validate(self, config: CabinetConfiguration) -> ValidationResult:
         """Check infrastructure configuration for potential issues.
 
@@ -298,15 +304,36 @@ class InfrastructureValidator:
         ],
         result: ValidationResult,
     ) -> None:
-        """Check for cutout overlaps on each panel."""
+        """Check for cutout overlaps on each panel.
+
+        Outlets, grommets and ventilation share one CutoutIndex, so
+        overlaps between different element types are reported too.
+        """
+        index = CutoutIndex()
+        positions: dict[str, tuple[float, float]] = {}
         for panel, cutouts in panel_cutouts.items():
-            for i, (path1, pos1, dims1) in enumerate(cutouts):
-                for j, (path2, pos2, dims2) in enumerate(cutouts[i + 1 :], start=i + 1):
-                    if cutouts_overlap(pos1, dims1, pos2, dims2):
-                        result.add_error(
-                            path=path1,
-                            message=f"Cutouts overlap at ({pos1[0]}, {pos1[1]})",
-                        )
+            for i, (path, pos, dims) in enumerate(cutouts):
+                index.add(
+                    path,
+                    i,
+                    panel,
+                    path,
+                    pos[0],
+                    pos[1],
+                    pos[0] + dims[0],
+                    pos[1] + dims[1],
+                )
+                positions[path] = pos
+
+        for conflict in index.overlaps():
+            pos = positions[conflict.first.source]
+            result.add_error(
+                path=conflict.first.source,
+                message=(
+                    f"Cutouts overlap at ({pos[0]}, {pos[1]}) "
+                    f"with {conflict.second.source}"
+                ),
+            )
 
     def _check_ventilation_adequacy(
         self, infra: "InfrastructureConfigSchema", result: ValidationResult
@@ -31,6 +31,11 @@ class ObstacleValidator:
         """Return the validator name."""
         return "obstacle"
 
+    @property
+    def dependencies(self) -> tuple[str, ...]:
+        """Return the top-level configuration fields this validator reads."""
+        return ("room",)
+
     def validate(self, config: CabinetConfiguration) -> ValidationResult:
         """Check obstacle-related validation rules.
 
@@ -6,7 +6,10 @@ similar to the ExporterRegistry pattern used in infrastructure/exporters/base.py
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, ClassVar
 
 from .base import ValidationResult
@@ -18,6 +21,108 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def get_validator_dependencies(validator: "Validator") -> tuple[str, ...] | None:
+    """Get the top-level configuration fields a validator reads.
+
+    Validators may optionally expose a ``dependencies`` attribute listing
+    the top-level CabinetConfiguration fields they inspect (e.g.
+    ``("cabinet", "room")``). Validators that do not declare dependencies
+    are assumed to read the whole configuration.
+
+    Args:
+        validator: The validator to inspect.
+
+    Returns:
+        Tuple of field names, or None if the validator reads everything.
+    """
+    dependencies = getattr(validator, "dependencies", None)
+    if dependencies is None:
+        return None
+    return tuple(dependencies)
+
+
+class ValidationSession:
+    """Per-session cache of validator results keyed on config subtree hashes.
+
+    A session remembers, for each validator, the hash of the configuration
+    subtrees it declared as dependencies and the result it produced. When
+    ValidatorRegistry.validate_all() is called again with the same session,
+    validators whose subtrees are unchanged reuse their previous result
+    instead of re-running. This keeps repeated validation of an
+    incrementally edited configuration (e.g. from an editor UI) cheap.
+
+    Example:
+        session = ValidationSession()
+        result = ValidatorRegistry.validate_all(config, session=session)
+        # Only validators reading changed subtrees run again
+        result = ValidatorRegistry.validate_all(edited_config, session=session)
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, ValidationResult]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, name: str, fingerprint: str) -> ValidationResult | None:
+        """Get the cached result for a validator if its inputs are unchanged.
+
+        Args:
+            name: The validator name.
+            fingerprint: Hash of the validator's configuration subtrees.
+
+        Returns:
+            The cached ValidationResult, or None on a miss.
+        """
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def store(self, name: str, fingerprint: str, result: ValidationResult) -> None:
+        """Remember a validator's result for the given fingerprint.
+
+        Args:
+            name: The validator name.
+            fingerprint: Hash of the validator's configuration subtrees.
+            result: The result produced by the validator.
+        """
+        self._entries[name] = (fingerprint, result)
+
+    def clear(self) -> None:
+        """Forget all cached results."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class _SubtreeHasher:
+    """Lazily hashes top-level configuration fields, once per field."""
+
+    def __init__(self, config: "CabinetConfiguration") -> None:
+        self._config = config
+        self._digests: dict[str, str] = {}
+
+    def _field_digest(self, field_name: str) -> str:
+        if field_name not in self._digests:
+            dumped = self._config.model_dump(mode="json", include={field_name})
+            payload = json.dumps(dumped, sort_keys=True, default=str)
+            self._digests[field_name] = hashlib.sha256(
+                payload.encode("utf-8")
+            ).hexdigest()
+        return self._digests[field_name]
+
+    def fingerprint(self, dependencies: tuple[str, ...] | None) -> str:
+        """Combine the digests of the given fields into one fingerprint."""
+        if dependencies is None:
+            dependencies = tuple(type(self._config).model_fields.keys())
+        combined = "|".join(
+            f"{name}={self._field_digest(name)}" for name in sorted(dependencies)
+        )
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
 class ValidatorRegistry:
     """Registry for validator classes.
 
@@ -27,7 +132,9 @@ class ValidatorRegistry:
     The registry supports:
     - Registering validator instances
     - Enabling/disabling specific validators
-    - Running all enabled validators
+    - Running all enabled validators, optionally concurrently
+    - Skipping validators whose inputs are unchanged (via ValidationSession)
+    - Fail-fast mode that stops at the first blocking error
     - Clearing for testing purposes
 
     Example:
@@ -148,36 +255,117 @@ class ValidatorRegistry:
         return name in cls._validators and name not in cls._disabled
 
     @classmethod
-    def validate_all(cls, config: "CabinetConfiguration") -> ValidationResult:
+    def validate_all(
+        cls,
+        config: "CabinetConfiguration",
+        *,
+        session: ValidationSession | None = None,
+        fail_fast: bool = False,
+        max_workers: int | None = None,
+    ) -> ValidationResult:
         """Run all enabled validators against a configuration.
 
+        Results are always merged in validator name order so output is
+        deterministic regardless of execution order.
+
         Args:
             config: The cabinet configuration to validate.
+            session: Optional ValidationSession. When given, validators whose
+                declared configuration subtrees are unchanged since the last
+                call with this session reuse their previous result.
+            fail_fast: If True, stop running validators once any validator
+                reports a blocking error. Validators that have not started
+                are skipped, so the result may be incomplete.
+            max_workers: Number of threads to run validators on. None or 1
+                runs validators serially in name order.
 
         Returns:
             ValidationResult containing merged errors and warnings from all validators.
         """
-        result = ValidationResult()
-
+        names = []
         for name in sorted(cls._validators.keys()):
             if name in cls._disabled:
                 logger.debug(f"Skipping disabled validator '{name}'")
                 continue
+            names.append(name)
 
-            validator = cls._validators[name]
-            logger.debug(f"Running validator '{name}'")
-            try:
-                validator_result = validator.validate(config)
-                result.merge(validator_result)
-            except Exception as e:
-                logger.error(f"Validator '{name}' raised an exception: {e}")
-                result.add_error(
-                    path="validation",
-                    message=f"Validator '{name}' failed: {str(e)}",
+        hasher = _SubtreeHasher(config) if session is not None else None
+        results: dict[str, ValidationResult] = {}
+        pending: list[tuple[str, str | None]] = []
+
+        for name in names:
+            fingerprint = None
+            if session is not None and hasher is not None:
+                fingerprint = hasher.fingerprint(
+                    get_validator_dependencies(cls._validators[name])
                 )
+                cached = session.lookup(name, fingerprint)
+                if cached is not None:
+                    logger.debug(f"Reusing cached result for validator '{name}'")
+                    results[name] = cached
+                    continue
+            pending.append((name, fingerprint))
+
+        if fail_fast and any(not r.is_valid for r in results.values()):
+            pending = []
+
+        if max_workers is None or max_workers <= 1 or len(pending) <= 1:
+            for name, fingerprint in pending:
+                validator_result = cls._run_validator(name, config)
+                results[name] = validator_result
+                if session is not None and fingerprint is not None:
+                    session.store(name, fingerprint, validator_result)
+                if fail_fast and not validator_result.is_valid:
+                    logger.debug(f"Fail-fast: stopping after validator '{name}'")
+                    break
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(cls._run_validator, name, config): (
+                        name,
+                        fingerprint,
+                    )
+                    for name, fingerprint in pending
+                }
+                not_done = set(futures)
+                while not_done:
+                    done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                    stop = False
+                    for future in done:
+                        name, fingerprint = futures[future]
+                        validator_result = future.result()
+                        results[name] = validator_result
+                        if session is not None and fingerprint is not None:
+                            session.store(name, fingerprint, validator_result)
+                        if fail_fast and not validator_result.is_valid:
+                            stop = True
+                    if stop:
+                        for future in not_done:
+                            future.cancel()
+                        break
 
+        result = ValidationResult()
+        for name in names:
+            if name in results:
+                result.merge(results[name])
         return result
 
+    @classmethod
+    def _run_validator(
+        cls, name: str, config: "CabinetConfiguration"
+    ) -> ValidationResult:
+        """Run one validator, converting exceptions into validation errors."""
+        validator = cls._validators[name]
+        logger.debug(f"Running validator '{name}'")
+        try:
+            return validator.validate(config)
+        except Exception as e:
+            logger.error(f"Validator '{name}' raised an exception: {e}")
+            return ValidationResult().add_error(
+                path="validation",
+                message=f"Validator '{name}' failed: {str(e)}",
+            )
+
     @classmethod
     def validate_single(
         cls, name: str, config: "CabinetConfiguration"
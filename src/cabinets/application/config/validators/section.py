@@ -28,6 +28,11 @@ class SectionDimensionValidator:
         """Return the validator name."""
         return "section_dimension"
 
+    @property
+    def dependencies(self) -> tuple[str, ...]:
+        """Return the top-level configuration fields this validator reads."""
+        return ("cabinet",)
+
     def validate(self, config: CabinetConfiguration) -> ValidationResult:
         """Validate section dimensions against cabinet constraints.
 
@@ -38,6 +38,11 @@ class WoodworkingValidator:
         """Return the validator name."""
         return "woodworking"
 
+    @property
+    def dependencies(self) -> tuple[str, ...]:
+        """Return the top-level configuration fields this validator reads."""
+        return ("cabinet",)
+
     def validate(self, config: CabinetConfiguration) -> ValidationResult:
         """Check configuration against woodworking best practices.
 
@@ -24,6 +24,7 @@ from cabinets.contracts.dtos import (
     InstallationOutput,
     LayoutOutput,
     PackingOutput,
+    ProjectLayoutOutput,
     RoomLayoutOutput,
     WoodworkingOutput,
 )
@@ -146,6 +147,7 @@ __all__ = [
     "InstallationOutput",
     "LayoutOutput",
     "PackingOutput",
+    "ProjectLayoutOutput",
     "RoomLayoutOutput",
     "WoodworkingOutput",
     # Safety output
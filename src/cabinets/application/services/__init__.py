@@ -8,19 +8,55 @@ to follow Single Responsibility Principle:
 - InstallationPlannerService: Coordinates installation planning
 - SectionWidthResolverService: Resolves "fill" widths in room context
 - RoomLayoutOrchestratorService: Orchestrates multi-wall room layouts
+- SectionWidthOptimizerService: Searches fill widths that minimize sheet count
+- DesignSweepService: Evaluates parameter sweeps and builds Pareto tables
+- ProjectGenerationService: Generates multi-room projects with shared packing
+- AsyncGenerationService: Awaitable generation, export and LLM stages
 """
 
+from .async_generation import (
+    AsyncGenerationService,
+    StageDeadlines,
+    StageTimeoutError,
+)
+from .design_sweep import (
+    DesignSweepResult,
+    DesignSweepService,
+    SheetPricing,
+    SweepPoint,
+    SweepRanges,
+    SweepRow,
+)
 from .input_validator import InputValidatorService
 from .installation_planner import InstallationPlannerService, InstallationPlanResult
 from .output_assembler import OutputAssemblerService
+from .project_generation import ProjectGenerationService
 from .section_width_resolver import SectionWidthResolverService
 from .room_layout_orchestrator import RoomLayoutOrchestratorService
+from .width_optimizer import (
+    SectionWidthOptimizerService,
+    WidthOptimizationConfig,
+    WidthOptimizationResult,
+)
 
 __all__ = [
+    "AsyncGenerationService",
+    "DesignSweepResult",
+    "DesignSweepService",
     "InputValidatorService",
     "InstallationPlannerService",
     "InstallationPlanResult",
     "OutputAssemblerService",
+    "ProjectGenerationService",
     "RoomLayoutOrchestratorService",
+    "SectionWidthOptimizerService",
     "SectionWidthResolverService",
+    "SheetPricing",
+    "StageDeadlines",
+    "StageTimeoutError",
+    "SweepPoint",
+    "SweepRanges",
+    "SweepRow",
+    "WidthOptimizationConfig",
+    "WidthOptimizationResult",
 ]
@@ -0,0 +1,355 @@
+"""Async facade over layout generation, packing, export and LLM stages.
+
+GenerateLayoutCommand, the bin packer and the exporters are synchronous,
+and the LLM generator is async. Calling the synchronous stages from a
+coroutine blocks the event loop, and the ``*_sync`` wrappers around the
+async ones cannot be called from inside a running loop at all. This
+service awaits every stage instead: CPU-bound stages run in an executor
+and I/O-bound ones are awaited directly, so one request can run, say, an
+STL export, a BOM and LLM assembly instructions concurrently.
+
+Every stage runs under its own deadline (see StageDeadlines) and can be
+cancelled by cancelling the awaiting task. Stages still queued in the
+executor are then dropped; a stage already running in a worker thread
+finishes in the background and its result is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import tempfile
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from cabinets.application.commands import GenerateLayoutCommand
+    from cabinets.application.config import CabinetConfiguration
+    from cabinets.application.dtos import (
+        LayoutOutput,
+        LayoutParametersInput,
+        RoomLayoutOutput,
+        WallInput,
+    )
+    from cabinets.domain import CutPiece
+    from cabinets.infrastructure import BinPackingConfig, PackingResult
+    from cabinets.infrastructure.llm import LLMAssemblyGenerator
+
+T = TypeVar("T")
+
+
+class StageTimeoutError(TimeoutError):
+    """A generation stage did not finish before its deadline.
+
+    Attributes:
+        stage: Name of the stage that timed out.
+        timeout: Deadline of the stage in seconds.
+    """
+
+    def __init__(self, stage: str, timeout: float) -> None:
+        super().__init__(f"Stage '{stage}' did not finish within {timeout:g}s")
+        self.stage = stage
+        self.timeout = timeout
+
+
+@dataclass(frozen=True)
+class StageDeadlines:
+    """Per-stage time limits in seconds; None disables a limit.
+
+    Attributes:
+        generate: Layout generation from inputs or a configuration.
+        pack: Bin packing of a cut list.
+        export: One exporter producing a file or string.
+        assembly: LLM assembly instructions, including any fallback.
+    """
+
+    generate: float | None = 30.0
+    pack: float | None = 30.0
+    export: float | None = 60.0
+    assembly: float | None = 180.0
+
+
+class AsyncGenerationService:
+    """Awaitable generation, packing, export and LLM assembly stages.
+
+    Example:
+        service = AsyncGenerationService(factory.create_generate_command())
+        output = await service.generate(config)
+        stl, bom = await service.gather(
+            service.export_bytes(StlLayoutExporter(), output, ".stl"),
+            service.export_string(BomGenerator(), output),
+        )
+    """
+
+    def __init__(
+        self,
+        command: GenerateLayoutCommand,
+        deadlines: StageDeadlines | None = None,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            command: Command that generates layouts.
+            deadlines: Per-stage time limits. Defaults to StageDeadlines().
+            executor: Executor for CPU-bound stages. Defaults to a thread
+                pool owned (and shut down) by this service.
+            max_workers: Threads of the default executor.
+        """
+        self.command = command
+        self.deadlines = deadlines or StageDeadlines()
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cabinets-stage"
+        )
+
+    async def generate(
+        self, config: CabinetConfiguration, timeout: float | None = None
+    ) -> LayoutOutput | RoomLayoutOutput:
+        """Generate a single-cabinet or room layout from a configuration.
+
+        Args:
+            config: Cabinet configuration.
+            timeout: Deadline overriding StageDeadlines.generate.
+
+        Returns:
+            Layout output; check is_valid for generation errors.
+
+        Raises:
+            ValueError: If the configuration cannot be converted.
+            StageTimeoutError: If generation exceeds its deadline.
+        """
+        return await self.run_blocking(
+            "generate",
+            self.command.execute_from_config,
+            config,
+            timeout=timeout,
+        )
+
+    async def generate_layout(
+        self,
+        wall_input: WallInput,
+        params_input: LayoutParametersInput,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> LayoutOutput:
+        """Generate a single-cabinet layout from wall and layout inputs.
+
+        Args:
+            wall_input: Wall dimensions.
+            params_input: Layout parameters.
+            timeout: Deadline overriding StageDeadlines.generate.
+            **kwargs: Further GenerateLayoutCommand.execute() arguments,
+                such as section_specs and zone_configs.
+
+        Returns:
+            Layout output; check is_valid for generation errors.
+
+        Raises:
+            StageTimeoutError: If generation exceeds its deadline.
+        """
+        return await self.run_blocking(
+            "generate",
+            functools.partial(self.command.execute, wall_input, params_input, **kwargs),
+            timeout=timeout,
+        )
+
+    async def pack(
+        self,
+        cut_list: list[CutPiece],
+        config: BinPackingConfig | None = None,
+        timeout: float | None = None,
+    ) -> PackingResult:
+        """Pack a cut list onto sheets.
+
+        Args:
+            cut_list: Pieces to pack.
+            config: Packing settings. Defaults to BinPackingConfig().
+            timeout: Deadline overriding StageDeadlines.pack.
+
+        Returns:
+            Packing result with sheet layouts and offcuts.
+
+        Raises:
+            ValueError: If a piece does not fit on a sheet.
+            StageTimeoutError: If packing exceeds its deadline.
+        """
+        from cabinets.infrastructure import BinPackingConfig, BinPackingService
+
+        service = BinPackingService(config or BinPackingConfig())
+        return await self.run_blocking(
+            "pack",
+            service.optimize_cut_list,
+            cut_list,
+            timeout=timeout,
+        )
+
+    async def export_string(
+        self, exporter: Any, output: Any, timeout: float | None = None
+    ) -> str:
+        """Export an output to a string with a text exporter.
+
+        Args:
+            exporter: Exporter instance with an export_string() method.
+            output: Layout, room or project output to export.
+            timeout: Deadline overriding StageDeadlines.export.
+
+        Returns:
+            Exported content.
+
+        Raises:
+            NotImplementedError: If the exporter only writes files.
+            StageTimeoutError: If the export exceeds its deadline.
+        """
+        return await self.run_blocking(
+            "export",
+            exporter.export_string,
+            output,
+            timeout=timeout,
+        )
+
+    async def export_bytes(
+        self, exporter: Any, output: Any, suffix: str, timeout: float | None = None
+    ) -> bytes:
+        """Export an output through a temporary file and return its bytes.
+
+        Args:
+            exporter: Exporter instance with an export(output, path) method.
+            output: Layout, room or project output to export.
+            suffix: File suffix passed to the exporter, e.g. ".stl".
+            timeout: Deadline overriding StageDeadlines.export.
+
+        Returns:
+            Contents of the exported file.
+
+        Raises:
+            StageTimeoutError: If the export exceeds its deadline.
+        """
+        return await self.run_blocking(
+            "export",
+            _export_bytes,
+            exporter,
+            output,
+            suffix,
+            timeout=timeout,
+        )
+
+    async def assembly_instructions(
+        self,
+        generator: LLMAssemblyGenerator,
+        output: LayoutOutput | RoomLayoutOutput,
+        timeout: float | None = None,
+    ) -> str:
+        """Generate LLM assembly instructions, awaited on the event loop.
+
+        Args:
+            generator: LLM assembly generator.
+            output: Layout or room output to describe.
+            timeout: Deadline overriding StageDeadlines.assembly.
+
+        Returns:
+            Assembly instructions as Markdown.
+
+        Raises:
+            StageTimeoutError: If generation exceeds its deadline.
+        """
+        return await self.run_stage(
+            "assembly",
+            generator.generate(output),
+            timeout=timeout,
+        )
+
+    async def run_blocking(
+        self,
+        stage: str,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """Run a synchronous function in the executor as a named stage.
+
+        Args:
+            stage: Stage name; also selects the default deadline from
+                StageDeadlines for the stages named there.
+            func: Function to call.
+            *args: Positional arguments for func.
+            timeout: Deadline in seconds overriding the stage default.
+
+        Returns:
+            Return value of func.
+
+        Raises:
+            StageTimeoutError: If func does not return within timeout.
+        """
+        loop = asyncio.get_running_loop()
+        return await self.run_stage(
+            stage, loop.run_in_executor(self._executor, func, *args), timeout
+        )
+
+    async def run_stage(
+        self, stage: str, awaitable: Awaitable[T], timeout: float | None = None
+    ) -> T:
+        """Await a named stage under a deadline.
+
+        Args:
+            stage: Stage name; also selects the default deadline from
+                StageDeadlines for the stages named there.
+            awaitable: Coroutine or future of the stage.
+            timeout: Deadline in seconds overriding the stage default.
+
+        Returns:
+            Result of the stage.
+
+        Raises:
+            StageTimeoutError: If the stage does not finish within timeout.
+        """
+        if timeout is None:
+            timeout = getattr(self.deadlines, stage, None)
+        try:
+            async with asyncio.timeout(timeout):
+                return await awaitable
+        except TimeoutError as e:
+            if isinstance(e, StageTimeoutError) or timeout is None:
+                raise
+            raise StageTimeoutError(stage, timeout) from e
+
+    @staticmethod
+    async def gather(*stages: Awaitable[Any]) -> list[Any]:
+        """Run stages concurrently and return their results in order.
+
+        If any stage fails, the others are cancelled and its exception is
+        raised (the first one, if several fail together).
+
+        Args:
+            *stages: Coroutines of the stages to run.
+
+        Returns:
+            Results in the order the stages were given.
+        """
+
+        async def await_stage(stage: Awaitable[Any]) -> Any:
+            return await stage
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(await_stage(stage)) for stage in stages]
+        except BaseExceptionGroup as group_error:
+            raise group_error.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    def close(self) -> None:
+        """Shut down the default executor, dropping queued stages."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _export_bytes(exporter: Any, output: Any, suffix: str) -> bytes:
+    """Export to a temporary file and return its contents."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / f"cabinet{suffix}"
+        exporter.export(output, path)
+        return path.read_bytes()
@@ -0,0 +1,461 @@
+"""Design-space sweep over material thickness, section and shelf counts.
+
+Estimators compare variants such as 3/4" vs 5/8" material or 4 vs 5
+sections by generating each one and looking at sheet count, weight, shelf
+capacity and cost. This service evaluates the Cartesian product of the
+requested parameter ranges in a process pool and marks the Pareto-optimal
+rows: those no other variant beats on cost, sheets, weight and minimum
+shelf capacity at once.
+
+The process pool is created on first use and kept for the lifetime of
+the service, so each worker builds its generation, packing, BOM and
+estimation services once and reuses them across sweeps. Workers are
+started with the forkserver (or spawn) method, never by forking the
+calling process, which may be a multi-threaded server. Rows are cached on
+the service in a bounded LRU, so repeated or overlapping sweeps only
+evaluate new variants.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cabinets.application.dtos import WallInput
+
+# Upper bound on the number of variants in one sweep
+MAX_SWEEP_POINTS = 500
+
+# Default number of evaluated rows kept in a service's cache
+DEFAULT_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True, order=True)
+class SweepPoint:
+    """One combination of swept parameters.
+
+    Attributes:
+        thickness: Case material thickness in inches.
+        sections: Number of vertical sections.
+        shelves: Shelves per section.
+    """
+
+    thickness: float
+    sections: int
+    shelves: int
+
+
+@dataclass(frozen=True)
+class SweepRanges:
+    """Parameter values to sweep; every combination is evaluated.
+
+    Attributes:
+        thicknesses: Material thicknesses in inches.
+        section_counts: Numbers of vertical sections.
+        shelf_counts: Shelves per section.
+    """
+
+    thicknesses: tuple[float, ...]
+    section_counts: tuple[int, ...]
+    shelf_counts: tuple[int, ...]
+
+    def __post_init__(self) -> None:
+        if not self.thicknesses or not self.section_counts or not self.shelf_counts:
+            raise ValueError("Every sweep range needs at least one value")
+        if len(self.points()) > MAX_SWEEP_POINTS:
+            raise ValueError(
+                f"Sweep has {len(self.points())} combinations; "
+                f"maximum is {MAX_SWEEP_POINTS}"
+            )
+
+    def points(self) -> list[SweepPoint]:
+        """Get the Cartesian product of the ranges, without duplicates."""
+        return sorted(
+            {
+                SweepPoint(thickness=t, sections=n, shelves=s)
+                for t, n, s in itertools.product(
+                    self.thicknesses, self.section_counts, self.shelf_counts
+                )
+            }
+        )
+
+
+@dataclass(frozen=True)
+class SheetPricing:
+    """Sheet goods prices used to estimate cost.
+
+    Attributes:
+        price_per_inch: Price of a 4x8 sheet per inch of thickness, used
+            for thicknesses without an explicit price.
+        prices: Explicit price per sheet keyed by thickness in inches.
+    """
+
+    price_per_inch: float = 80.0
+    prices: dict[float, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.price_per_inch < 0:
+            raise ValueError("price_per_inch must be non-negative")
+        if any(price < 0 for price in self.prices.values()):
+            raise ValueError("Sheet prices must be non-negative")
+
+    def sheet_price(self, thickness: float) -> float:
+        """Get the price of one sheet of the given thickness."""
+        for key, price in self.prices.items():
+            if abs(key - thickness) < 1e-6:
+                return price
+        return round(thickness * self.price_per_inch, 2)
+
+
+@dataclass(frozen=True)
+class SweepRow:
+    """Metrics for one evaluated variant.
+
+    Attributes:
+        point: Parameters of the variant.
+        cost: Estimated sheet goods cost in dollars.
+        sheet_count: Sheets needed across all materials.
+        weight_lbs: Estimated empty cabinet weight in pounds.
+        min_shelf_capacity_lbs: Lowest advisory shelf capacity, or None if
+            the variant has no shelves.
+        errors: Generation errors; metrics are None when present.
+        pareto_optimal: Whether no other valid variant dominates this one.
+    """
+
+    point: SweepPoint
+    cost: float | None = None
+    sheet_count: int | None = None
+    weight_lbs: float | None = None
+    min_shelf_capacity_lbs: float | None = None
+    errors: tuple[str, ...] = ()
+    pareto_optimal: bool = False
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if the variant generated successfully."""
+        return not self.errors
+
+    def dominates(self, other: SweepRow) -> bool:
+        """Check if this row is at least as good on every objective and
+        strictly better on one.
+
+        Cost, sheets and weight are minimized; minimum shelf capacity is
+        maximized, with shelf-less variants treated as zero capacity.
+        """
+        mine = self._objectives()
+        theirs = other._objectives()
+        return all(a <= b for a, b in zip(mine, theirs)) and mine != theirs
+
+    def _objectives(self) -> tuple[float, float, float, float]:
+        return (
+            self.cost or 0.0,
+            float(self.sheet_count or 0),
+            self.weight_lbs or 0.0,
+            -(self.min_shelf_capacity_lbs or 0.0),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for JSON output."""
+        return {
+            "thickness": self.point.thickness,
+            "sections": self.point.sections,
+            "shelves": self.point.shelves,
+            "cost": self.cost,
+            "sheet_count": self.sheet_count,
+            "weight_lbs": self.weight_lbs,
+            "min_shelf_capacity_lbs": self.min_shelf_capacity_lbs,
+            "pareto_optimal": self.pareto_optimal,
+            "errors": list(self.errors),
+        }
+
+
+@dataclass
+class DesignSweepResult:
+    """Outcome of a design-space sweep.
+
+    Attributes:
+        rows: One row per variant, ordered by parameters.
+        evaluated: Number of variants generated by this sweep (the rest
+            came from the service's cache).
+        elapsed_seconds: Wall-clock time spent on the sweep.
+    """
+
+    rows: list[SweepRow]
+    evaluated: int
+    elapsed_seconds: float
+
+    @property
+    def pareto_rows(self) -> list[SweepRow]:
+        """Pareto-optimal rows ordered by cost."""
+        return sorted(
+            (row for row in self.rows if row.pareto_optimal),
+            key=lambda row: (row.cost or 0.0, row.point),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for JSON output."""
+        return {
+            "rows": [row.to_dict() for row in self.rows],
+            "pareto": [row.to_dict() for row in self.pareto_rows],
+            "evaluated": self.evaluated,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+class DesignSweepService:
+    """Evaluates parameter sweeps and builds Pareto tables.
+
+    Example:
+        service = DesignSweepService()
+        result = service.run(
+            WallInput(width=96, height=84, depth=12),
+            SweepRanges(thicknesses=(0.75, 0.625), section_counts=(4, 5),
+                        shelf_counts=(3, 4)),
+        )
+        for row in result.pareto_rows:
+            print(row.point, row.cost, row.sheet_count)
+    """
+
+    def __init__(
+        self,
+        pricing: SheetPricing | None = None,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize the sweep service.
+
+        Args:
+            pricing: Default sheet prices for cost estimates. Defaults to
+                SheetPricing().
+            max_workers: Worker processes (or threads) to use. Defaults to
+                the CPU count.
+            use_processes: Evaluate in a process pool; set False to use
+                threads, e.g. where processes cannot be spawned.
+            cache_size: Maximum number of evaluated rows to keep; the least
+                recently used rows are evicted first.
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self.pricing = pricing or SheetPricing()
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, SweepRow] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: Executor | None = None
+
+    def run(
+        self,
+        wall_input: WallInput,
+        ranges: SweepRanges,
+        material_type: str = "plywood",
+        back_thickness: float = 0.25,
+        pricing: SheetPricing | None = None,
+    ) -> DesignSweepResult:
+        """Evaluate every combination of the ranges.
+
+        Args:
+            wall_input: Cabinet dimensions shared by all variants.
+            ranges: Parameter values to sweep.
+            material_type: Case material type for every variant.
+            back_thickness: Back panel thickness for every variant.
+            pricing: Sheet prices for this sweep. Defaults to the
+                service's pricing.
+
+        Returns:
+            DesignSweepResult with one row per variant and Pareto flags.
+        """
+        start = time.perf_counter()
+        pricing = pricing or self.pricing
+        points = ranges.points()
+        base_key = (
+            wall_input.width,
+            wall_input.height,
+            wall_input.depth,
+            material_type,
+            back_thickness,
+            pricing.price_per_inch,
+            tuple(sorted(pricing.prices.items())),
+        )
+
+        rows: dict[SweepPoint, SweepRow] = {}
+        with self._lock:
+            for point in points:
+                row = self._cache.get((*base_key, point))
+                if row is not None:
+                    self._cache.move_to_end((*base_key, point))
+                    rows[point] = row
+        missing = [point for point in points if point not in rows]
+
+        if missing:
+            args = (wall_input, material_type, back_thickness, pricing)
+            if len(missing) == 1:
+                evaluated = [_evaluate_point(missing[0], *args)]
+            else:
+                evaluated = list(
+                    self._executor().map(
+                        _evaluate_point,
+                        missing,
+                        *(itertools.repeat(arg) for arg in args),
+                    )
+                )
+            with self._lock:
+                for row in evaluated:
+                    rows[row.point] = row
+                    if self.cache_size:
+                        self._cache[(*base_key, row.point)] = row
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        ordered = _mark_pareto([rows[point] for point in points])
+        return DesignSweepResult(
+            rows=ordered,
+            evaluated=len(missing),
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool; a later sweep starts a new one."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _executor(self) -> Executor:
+        """Get the long-lived worker pool, creating it on first use."""
+        with self._lock:
+            if self._pool is None:
+                workers = self.max_workers or os.cpu_count() or 1
+                if self.use_processes:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=workers, mp_context=_worker_context()
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=workers)
+            return self._pool
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for worker processes that never forks the caller."""
+    method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return multiprocessing.get_context(method)
+
+
+def _mark_pareto(rows: list[SweepRow]) -> list[SweepRow]:
+    """Flag valid rows that no other valid row dominates."""
+    valid = [row for row in rows if row.is_valid]
+    result: list[SweepRow] = []
+    for row in rows:
+        optimal = row.is_valid and not any(other.dominates(row) for other in valid)
+        result.append(
+            SweepRow(
+                point=row.point,
+                cost=row.cost,
+                sheet_count=row.sheet_count,
+                weight_lbs=row.weight_lbs,
+                min_shelf_capacity_lbs=row.min_shelf_capacity_lbs,
+                errors=row.errors,
+                pareto_optimal=optimal,
+            )
+        )
+    return result
+
+
+@dataclass(frozen=True)
+class _SweepContext:
+    """Services shared by every variant evaluated in one process."""
+
+    command: Any
+    bin_packing: Any
+    bom_generator: Any
+    weight_estimator: Any
+    capacity_calculator: Any
+
+
+@lru_cache(maxsize=1)
+def _sweep_context() -> _SweepContext:
+    """Build the per-process service context on first use."""
+    from cabinets.application.factory import get_factory
+    from cabinets.domain.services.installation import (
+        InstallationConfig,
+        WeightEstimator,
+    )
+    from cabinets.domain.services.woodworking import CapacityCalculator
+    from cabinets.infrastructure import BinPackingConfig, BinPackingService
+    from cabinets.infrastructure.exporters import BomGenerator
+
+    return _SweepContext(
+        command=get_factory().create_generate_command(),
+        bin_packing=BinPackingService(BinPackingConfig()),
+        bom_generator=BomGenerator(),
+        weight_estimator=WeightEstimator(InstallationConfig()),
+        capacity_calculator=CapacityCalculator(),
+    )
+
+
+def _evaluate_point(
+    point: SweepPoint,
+    wall_input: WallInput,
+    material_type: str,
+    back_thickness: float,
+    pricing: SheetPricing,
+) -> SweepRow:
+    """Generate one variant and compute its metrics.
+
+    Module-level so it can run in worker processes.
+    """
+    from cabinets.application.dtos import LayoutParametersInput
+
+    context = _sweep_context()
+    params_input = LayoutParametersInput(
+        num_sections=point.sections,
+        shelves_per_section=point.shelves,
+        material_thickness=point.thickness,
+        material_type=material_type,
+        back_thickness=back_thickness,
+    )
+    errors = wall_input.validate() + params_input.validate()
+    if errors:
+        return SweepRow(point=point, errors=tuple(errors))
+
+    try:
+        output = context.command.execute(wall_input, params_input)
+    except ValueError as e:
+        return SweepRow(point=point, errors=(str(e),))
+    if not output.is_valid:
+        return SweepRow(point=point, errors=tuple(output.errors))
+
+    if output.packing_result is None:
+        output.packing_result = context.bin_packing.optimize_cut_list(output.cut_list)
+    bom = context.bom_generator.generate(output)
+    sheet_count = sum(item.quantity for item in bom.sheet_goods)
+    cost = sum(
+        item.quantity * pricing.sheet_price(item.thickness) for item in bom.sheet_goods
+    )
+
+    weight = context.weight_estimator.estimate_weight(output.cabinet)
+    capacities = context.capacity_calculator.get_shelf_capacities(output.cabinet)
+
+    return SweepRow(
+        point=point,
+        cost=round(cost, 2),
+        sheet_count=sheet_count,
+        weight_lbs=round(weight.empty_weight_lbs, 1),
+        min_shelf_capacity_lbs=(
+            min(c.capacity_lbs for c in capacities) if capacities else None
+        ),
+    )
@@ -15,6 +15,7 @@ from cabinets.contracts.dtos import (
     RoomLayoutOutput,
     WoodworkingOutput,
 )
+from cabinets.domain.value_objects import CutListTable
 
 if TYPE_CHECKING:
     from cabinets.contracts.protocols import (
@@ -56,8 +57,10 @@ class OutputAssemblerService:
             Complete LayoutOutput DTO.
         """
         # Estimate materials
-        material_estimates = material_estimator.estimate(cut_list)
-        total_estimate = material_estimator.estimate_total(cut_list)
+        # Both estimates read the same columnar table
+        cut_table = CutListTable.from_pieces(cut_list)
+        material_estimates = material_estimator.estimate(cut_table)
+        total_estimate = material_estimator.estimate_total(cut_table)
 
         # Build core output
         core = CoreLayoutOutput(
@@ -106,8 +109,10 @@ class OutputAssemblerService:
         Returns:
             Complete RoomLayoutOutput DTO.
         """
-        material_estimates = material_estimator.estimate(cut_list)
-        total_estimate = material_estimator.estimate_total(cut_list)
+        # Both estimates read the same columnar table
+        cut_table = CutListTable.from_pieces(cut_list)
+        material_estimates = material_estimator.estimate(cut_table)
+        total_estimate = material_estimator.estimate_total(cut_table)
 
         return RoomLayoutOutput(
             room=room,
@@ -0,0 +1,196 @@
+"""Whole-project generation across several rooms.
+
+A customer job usually covers several rooms, each with its own cabinet
+configuration. Generating them separately packs every room onto its own
+sheets and buys hardware per room. This service generates the rooms of a
+ProjectConfiguration in a process pool, merges their cut lists and
+hardware, and runs one bin packing pass over the combined cut list so
+sheet counts and the bill of materials cover the whole job.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from cabinets.application.dtos import (
+    LayoutOutput,
+    ProjectLayoutOutput,
+    RoomLayoutOutput,
+)
+from cabinets.domain import CutPiece, MaterialEstimator
+from cabinets.domain.components.results import HardwareItem
+
+if TYPE_CHECKING:
+    from cabinets.application.config import (
+        CabinetConfiguration,
+        ProjectConfiguration,
+    )
+    from cabinets.infrastructure import OffcutInventory
+
+
+@lru_cache(maxsize=1)
+def _generate_command() -> Any:
+    """Build the per-process generate command on first use."""
+    from cabinets.application.factory import get_factory
+
+    return get_factory().create_generate_command()
+
+
+def _generate_room(
+    config: CabinetConfiguration,
+) -> tuple[LayoutOutput | RoomLayoutOutput | None, tuple[str, ...]]:
+    """Generate one room and return its output and errors.
+
+    Module-level so it can run in worker processes.
+    """
+    try:
+        output = _generate_command().execute_from_config(config)
+    except ValueError as e:
+        return None, (str(e),)
+    if not output.is_valid:
+        return None, tuple(output.errors)
+    return output, ()
+
+
+def _room_hardware(output: LayoutOutput | RoomLayoutOutput) -> list[HardwareItem]:
+    """Get the assembly and installation hardware of a room."""
+    if isinstance(output, RoomLayoutOutput):
+        return list(output.installation_hardware or [])
+    return list(output.hardware) + list(output.installation_hardware or [])
+
+
+def _consolidate_hardware(items: list[HardwareItem]) -> list[HardwareItem]:
+    """Sum the quantities of hardware items with the same name and SKU."""
+    merged: dict[tuple[str, str | None], HardwareItem] = {}
+    for item in items:
+        key = (item.name, item.sku)
+        if key in merged:
+            merged[key] = replace(
+                merged[key], quantity=merged[key].quantity + item.quantity
+            )
+        else:
+            merged[key] = item
+    return list(merged.values())
+
+
+def _group_by_material(pieces: list[CutPiece]) -> list[CutPiece]:
+    """Order pieces by material, keeping room order within each material."""
+    return sorted(
+        pieces,
+        key=lambda piece: (
+            piece.material.material_type.value,
+            -piece.material.thickness,
+        ),
+    )
+
+
+class ProjectGenerationService:
+    """Generates every room of a project and consolidates the results.
+
+    Example:
+        project = load_project_config(Path("smith-house.json"))
+        output = ProjectGenerationService().run(project)
+        print(output.packing_result.total_sheets)
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        inventory: OffcutInventory | None = None,
+    ) -> None:
+        """Initialize the project service.
+
+        Args:
+            max_workers: Worker processes (or threads) to use. Defaults to
+                the CPU count.
+            use_processes: Generate rooms in a process pool; set False to
+                use threads, e.g. where processes cannot be spawned.
+            inventory: Optional offcut inventory the project's packing
+                fills first and records its leftover offcuts in.
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.inventory = inventory
+        self._material_estimator = MaterialEstimator()
+
+    def run(self, project: ProjectConfiguration) -> ProjectLayoutOutput:
+        """Generate all rooms and pack their combined cut list.
+
+        Args:
+            project: Project configuration whose rooms all have inline
+                configurations, as returned by load_project_config().
+
+        Returns:
+            ProjectLayoutOutput with per-room outputs, the combined cut list
+            and hardware, and one packing result for the whole project.
+
+        Raises:
+            ValueError: If a room has no inline configuration.
+        """
+        from cabinets.application.config import config_to_bin_packing
+        from cabinets.infrastructure import BinPackingService
+
+        configs: list[CabinetConfiguration] = []
+        for room in project.rooms:
+            if room.config is None:
+                raise ValueError(
+                    f"Room '{room.name}' has no configuration; "
+                    "load the project with load_project_config()"
+                )
+            configs.append(room.config)
+
+        if len(configs) == 1:
+            results = [_generate_room(configs[0])]
+        else:
+            with self._executor(len(configs)) as executor:
+                results = list(executor.map(_generate_room, configs))
+
+        rooms: dict[str, LayoutOutput | RoomLayoutOutput] = {}
+        cut_list: list[CutPiece] = []
+        hardware: list[HardwareItem] = []
+        errors: list[str] = []
+        for room, (output, room_errors) in zip(project.rooms, results):
+            errors.extend(f"{room.name}: {error}" for error in room_errors)
+            if output is None:
+                continue
+            rooms[room.name] = output
+            cut_list.extend(
+                replace(piece, label=f"{room.name}: {piece.label}")
+                for piece in output.cut_list
+            )
+            hardware.extend(_room_hardware(output))
+
+        cut_list = _group_by_material(cut_list)
+        result = ProjectLayoutOutput(
+            name=project.name,
+            rooms=rooms,
+            cut_list=cut_list,
+            hardware=_consolidate_hardware(hardware),
+            material_estimates=self._material_estimator.estimate(cut_list),
+            total_estimate=self._material_estimator.estimate_total(cut_list),
+            errors=errors,
+        )
+
+        # A failed room leaves the job incomplete, so it must not take
+        # offcuts out of (or add offcuts to) the shared inventory
+        inventory = self.inventory if not errors else None
+        bin_packing_config = config_to_bin_packing(project.bin_packing)
+        if bin_packing_config.enabled and cut_list:
+            try:
+                result.packing_result = BinPackingService(
+                    bin_packing_config, inventory
+                ).optimize_cut_list(cut_list, job=project.name)
+            except ValueError as e:
+                result.errors.append(f"Bin packing: {e}")
+        return result
+
+    def _executor(self, num_rooms: int) -> Executor:
+        workers = min(num_rooms, self.max_workers or os.cpu_count() or 1)
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(max_workers=workers)
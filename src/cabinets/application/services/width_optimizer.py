@@ -0,0 +1,422 @@
+"""Sheet-yield-aware section width optimizer.
+
+Equal "fill" widths often produce shelves and dividers that nest badly on
+stock sheets. This service searches fill-section widths (and optionally
+section depths) within user tolerances, scores every candidate with a fast
+sheet count from the guillotine packer, and keeps the layout that needs the
+fewest sheets.
+
+Scoring is CPU-bound pure Python, so candidates are evaluated in-process,
+nearest to the equal split first, with each packing abandoned once it needs
+more sheets than the best layout so far. The search stops when the time
+budget is spent (after the candidate being scored at that moment); the
+equal-split baseline is always evaluated first so a result is available
+even with a zero budget.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+from cabinets.domain.section_resolver import (
+    SectionSpec,
+    SectionWidthError,
+    resolve_section_widths,
+)
+
+if TYPE_CHECKING:
+    from cabinets.application.commands import GenerateLayoutCommand
+    from cabinets.application.dtos import (
+        LayoutOutput,
+        LayoutParametersInput,
+        WallInput,
+    )
+    from cabinets.domain.value_objects import CutPiece, MaterialSpec
+    from cabinets.infrastructure.bin_packing import BinPackingConfig
+
+# Upper bound on enumerated width combinations before truncation
+_MAX_ENUMERATED_COMBINATIONS = 50_000
+
+
+@dataclass(frozen=True)
+class WidthOptimizationConfig:
+    """Search bounds for the section width optimizer.
+
+    Attributes:
+        width_tolerance: Maximum deviation of any fill section from the equal
+            split, in inches.
+        depth_tolerance: Maximum reduction of fill-section depth, in inches.
+            Zero keeps the configured depth.
+        step: Search granularity in inches.
+        time_budget_seconds: Wall-clock limit for the search.
+        max_candidates: Maximum number of candidates to evaluate.
+    """
+
+    width_tolerance: float = 2.0
+    depth_tolerance: float = 0.0
+    step: float = 0.25
+    time_budget_seconds: float = 5.0
+    max_candidates: int = 500
+
+    def __post_init__(self) -> None:
+        if self.width_tolerance < 0:
+            raise ValueError("width_tolerance must be non-negative")
+        if self.depth_tolerance < 0:
+            raise ValueError("depth_tolerance must be non-negative")
+        if self.step <= 0:
+            raise ValueError("step must be positive")
+        if self.time_budget_seconds < 0:
+            raise ValueError("time_budget_seconds must be non-negative")
+        if self.max_candidates < 1:
+            raise ValueError("max_candidates must be at least 1")
+
+
+@dataclass(frozen=True, order=True)
+class WidthCandidate:
+    """A candidate assignment of fill-section widths and depth reduction.
+
+    Attributes:
+        widths: Resolved width of every section, in spec order.
+        depth_reduction: Inches removed from the depth of fill sections.
+    """
+
+    widths: tuple[float, ...]
+    depth_reduction: float = 0.0
+
+
+@dataclass
+class WidthOptimizationResult:
+    """Outcome of a section width optimization.
+
+    Attributes:
+        output: Layout output for the best candidate.
+        section_specs: Section specifications that produced the output, with
+            fill sections replaced by fixed widths.
+        section_widths: Resolved width of every section.
+        depth_reduction: Depth removed from fill sections, in inches.
+        sheet_count: Sheets needed by the best candidate.
+        baseline_sheet_count: Sheets needed by the equal-split layout.
+        candidates_evaluated: Number of candidates scored.
+        timed_out: Whether the time budget ended the search early.
+        elapsed_seconds: Wall-clock time spent searching.
+    """
+
+    output: LayoutOutput
+    section_specs: list[SectionSpec]
+    section_widths: list[float]
+    depth_reduction: float
+    sheet_count: int
+    baseline_sheet_count: int
+    candidates_evaluated: int
+    timed_out: bool
+    elapsed_seconds: float
+
+    @property
+    def sheets_saved(self) -> int:
+        """Sheets saved relative to the equal-split baseline."""
+        return self.baseline_sheet_count - self.sheet_count
+
+    def to_dict(self) -> dict:
+        """Convert the optimization summary to a JSON-serializable dict."""
+        return {
+            "section_widths": [round(w, 4) for w in self.section_widths],
+            "depth_reduction": self.depth_reduction,
+            "sheet_count": self.sheet_count,
+            "baseline_sheet_count": self.baseline_sheet_count,
+            "sheets_saved": self.sheets_saved,
+            "candidates_evaluated": self.candidates_evaluated,
+            "timed_out": self.timed_out,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+@dataclass(order=True)
+class _Score:
+    """Ordering key: fewest sheets, then closest to the requested layout.
+
+    The candidate itself is the final key so ties always resolve the same
+    way.
+    """
+
+    sheets: int
+    distance: float
+    candidate: WidthCandidate
+    output: LayoutOutput = field(compare=False, repr=False)
+
+
+class SectionWidthOptimizerService:
+    """Searches fill-section widths that minimize sheet count.
+
+    Sheet counts are memoized per material group, so candidates that change
+    only some pieces (for example, only 3/4" shelves) reuse the packing of
+    unchanged groups. Packing of a group is abandoned as soon as it needs
+    more sheets than the best candidate found so far.
+
+    Example:
+        optimizer = SectionWidthOptimizerService(command, BinPackingConfig())
+        result = optimizer.optimize(wall_input, params_input, section_specs)
+        print(result.section_widths, result.sheet_count)
+    """
+
+    def __init__(
+        self,
+        command: GenerateLayoutCommand,
+        bin_packing_config: BinPackingConfig | None = None,
+        config: WidthOptimizationConfig | None = None,
+    ) -> None:
+        """Initialize the optimizer.
+
+        Args:
+            command: Command used to generate each candidate layout.
+            bin_packing_config: Sheet size and kerf settings used for scoring.
+                Defaults to BinPackingConfig().
+            config: Search bounds. Defaults to WidthOptimizationConfig().
+        """
+        from cabinets.infrastructure.bin_packing import (
+            BinPackingConfig,
+            GuillotineBinPacker,
+        )
+
+        self._command = command
+        self._packer = GuillotineBinPacker(bin_packing_config or BinPackingConfig())
+        self.config = config or WidthOptimizationConfig()
+        self._group_cache: dict[tuple, int] = {}
+
+    def optimize(
+        self,
+        wall_input: WallInput,
+        params_input: LayoutParametersInput,
+        section_specs: list[SectionSpec],
+        zone_configs: dict[str, dict | None] | None = None,
+    ) -> WidthOptimizationResult:
+        """Find the fill widths that need the fewest sheets.
+
+        Args:
+            wall_input: Cabinet dimensions.
+            params_input: Layout parameters (material thickness, etc.).
+            section_specs: Section specifications; "fill" sections are
+                searched, fixed sections are kept as-is.
+            zone_configs: Optional zone configurations passed to generation.
+
+        Returns:
+            WidthOptimizationResult for the best candidate.
+
+        Raises:
+            SectionWidthError: If the baseline (equal split) layout is invalid.
+        """
+        start = time.perf_counter()
+        deadline = start + self.config.time_budget_seconds
+
+        baseline_widths = tuple(
+            resolve_section_widths(
+                section_specs, wall_input.width, params_input.material_thickness
+            )
+        )
+        baseline_output = self._command.execute(
+            wall_input,
+            params_input,
+            section_specs=section_specs,
+            zone_configs=zone_configs,
+        )
+        if not baseline_output.is_valid:
+            raise SectionWidthError("; ".join(baseline_output.errors))
+        sheets = self._count_sheets(baseline_output.cut_list, sheet_limit=None)
+        if sheets is None:
+            raise SectionWidthError("Cut list does not fit on the configured sheets")
+        best = _Score(
+            sheets=sheets,
+            distance=0.0,
+            candidate=WidthCandidate(widths=baseline_widths),
+            output=baseline_output,
+        )
+        baseline_sheets = best.sheets
+
+        candidates = self._candidates(section_specs, baseline_widths, wall_input.depth)
+        evaluated = 1
+        timed_out = False
+
+        for candidate in candidates:
+            if time.perf_counter() >= deadline:
+                timed_out = True
+                break
+            score = self._evaluate(
+                candidate,
+                baseline_widths,
+                wall_input,
+                params_input,
+                section_specs,
+                zone_configs,
+                best.sheets,
+            )
+            evaluated += 1
+            if score is not None and score < best:
+                best = score
+
+        return WidthOptimizationResult(
+            output=best.output,
+            section_specs=self._specs_for(
+                best.candidate, section_specs, wall_input.depth
+            ),
+            section_widths=list(best.candidate.widths),
+            depth_reduction=best.candidate.depth_reduction,
+            sheet_count=best.sheets,
+            baseline_sheet_count=baseline_sheets,
+            candidates_evaluated=evaluated,
+            timed_out=timed_out,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    def _candidates(
+        self,
+        specs: list[SectionSpec],
+        baseline_widths: tuple[float, ...],
+        cabinet_depth: float,
+    ) -> list[WidthCandidate]:
+        """Enumerate candidates ordered by distance from the equal split."""
+        fill_indices = [i for i, spec in enumerate(specs) if spec.is_fill]
+        if not fill_indices:
+            return []
+
+        step = self.config.step
+        steps = int(math.floor(self.config.width_tolerance / step + 1e-9))
+        offsets = [k * step for k in range(-steps, steps + 1)]
+
+        width_options: list[tuple[float, ...]] = []
+        free = fill_indices[:-1]
+        last = fill_indices[-1]
+        for combo in itertools.islice(
+            itertools.product(offsets, repeat=len(free)), _MAX_ENUMERATED_COMBINATIONS
+        ):
+            last_offset = -sum(combo)
+            if abs(last_offset) > self.config.width_tolerance + 1e-9:
+                continue
+            widths = list(baseline_widths)
+            for index, offset in zip(free, combo):
+                widths[index] = baseline_widths[index] + offset
+            widths[last] = baseline_widths[last] + last_offset
+            if all(self._width_allowed(specs[i], widths[i]) for i in fill_indices):
+                width_options.append(tuple(widths))
+
+        depth_steps = int(math.floor(self.config.depth_tolerance / step + 1e-9))
+        min_depth = min(specs[i].depth or cabinet_depth for i in fill_indices)
+        depth_options = [
+            k * step for k in range(depth_steps + 1) if min_depth - k * step > 0
+        ]
+
+        candidates = [
+            WidthCandidate(widths=widths, depth_reduction=depth)
+            for widths in width_options
+            for depth in depth_options
+            if widths != baseline_widths or depth > 0
+        ]
+        candidates.sort(
+            key=lambda c: (_distance(c.widths, baseline_widths), c.depth_reduction)
+        )
+        return candidates[: self.config.max_candidates]
+
+    @staticmethod
+    def _width_allowed(spec: SectionSpec, width: float) -> bool:
+        if width < spec.min_width - 1e-9:
+            return False
+        return spec.max_width is None or width <= spec.max_width + 1e-9
+
+    @staticmethod
+    def _specs_for(
+        candidate: WidthCandidate,
+        specs: list[SectionSpec],
+        cabinet_depth: float,
+    ) -> list[SectionSpec]:
+        """Replace fill sections with the candidate's fixed widths and depth."""
+        result: list[SectionSpec] = []
+        for spec, width in zip(specs, candidate.widths):
+            if not spec.is_fill:
+                result.append(spec)
+                continue
+            depth = spec.depth
+            if candidate.depth_reduction > 0:
+                depth = (spec.depth or cabinet_depth) - candidate.depth_reduction
+            result.append(replace(spec, width=width, depth=depth))
+        return result
+
+    def _evaluate(
+        self,
+        candidate: WidthCandidate,
+        baseline_widths: tuple[float, ...],
+        wall_input: WallInput,
+        params_input: LayoutParametersInput,
+        specs: list[SectionSpec],
+        zone_configs: dict[str, dict | None] | None,
+        sheet_limit: int | None,
+    ) -> _Score | None:
+        """Generate and score one candidate; None if invalid or over limit."""
+        candidate_specs = self._specs_for(candidate, specs, wall_input.depth)
+        try:
+            output = self._command.execute(
+                wall_input,
+                params_input,
+                section_specs=candidate_specs,
+                zone_configs=zone_configs,
+            )
+        except (SectionWidthError, ValueError):
+            return None
+        if not output.is_valid:
+            return None
+
+        sheets = self._count_sheets(output.cut_list, sheet_limit)
+        if sheets is None:
+            return None
+        return _Score(
+            sheets=sheets,
+            distance=_distance(candidate.widths, baseline_widths)
+            + candidate.depth_reduction,
+            candidate=candidate,
+            output=output,
+        )
+
+    def _count_sheets(
+        self, pieces: list[CutPiece], sheet_limit: int | None
+    ) -> int | None:
+        """Total sheets across material groups, reusing cached group counts."""
+        groups: dict[MaterialSpec, list[CutPiece]] = {}
+        for piece in pieces:
+            groups.setdefault(piece.material, []).append(piece)
+
+        total = 0
+        for material, group in groups.items():
+            key = (
+                material,
+                tuple(
+                    sorted(
+                        (
+                            round(p.width, 4),
+                            round(p.height, 4),
+                            p.quantity,
+                            p.panel_type.value,
+                            p.label,
+                        )
+                        for p in group
+                    )
+                ),
+            )
+            count = self._group_cache.get(key)
+            if count is None:
+                limit = None if sheet_limit is None else sheet_limit - total
+                try:
+                    count = self._packer.count_sheets(group, limit)
+                except ValueError:
+                    return None
+                if count is None:
+                    return None
+                self._group_cache[key] = count
+            total += count
+            if sheet_limit is not None and total > sheet_limit:
+                return None
+        return total
+
+
+def _distance(widths: tuple[float, ...], baseline: tuple[float, ...]) -> float:
+    return round(sum(abs(a - b) for a, b in zip(widths, baseline)), 6)
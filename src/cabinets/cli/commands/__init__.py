@@ -6,20 +6,39 @@ Subcommands:
 - validate: Validate a configuration file
 - templates: Manage cabinet configuration templates
 - generate: Generate cabinet layouts (main command)
+- sweep: Compare design variants in a Pareto table
+- project: Generate a multi-room project with shared sheets and one BOM
 
 Helper Modules:
 - output_handlers: Multi-format export handling
+- config_layout: Generate command inputs from a configuration file
 - zone_stack: Zone stack generation (kitchen, mudroom, etc.)
 - safety: Safety configuration and output
+- watch: Watch mode with incremental rebuilds for generate --watch
 """
 
 from cabinets.cli.commands.validate import validate_command
 from cabinets.cli.commands.templates import templates_app
 from cabinets.cli.commands.generate import generate
+from cabinets.cli.commands.sweep import sweep
+from cabinets.cli.commands.project import project
 from cabinets.cli.commands.output_handlers import handle_multi_format_export
+from cabinets.cli.commands.config_layout import (
+    ConfigLayoutInputs,
+    config_layout_inputs,
+    execute_config_layout,
+)
+from cabinets.cli.commands.watch import (
+    IncrementalBuilder,
+    RebuildReport,
+    changed_config_fields,
+    watch_config,
+)
 from cabinets.cli.commands.zone_stack import (
     generate_zone_stack,
+    generate_zone_stack_layout,
     handle_zone_stack_multi_format_export,
+    write_zone_stack_files,
     output_zone_stack_cutlist,
     output_zone_stack_materials,
     output_zone_stack_diagram,
@@ -42,11 +61,24 @@ __all__ = [
     "validate_command",
     "templates_app",
     "generate",
+    "sweep",
+    "project",
     # Output handlers
     "handle_multi_format_export",
+    # Configuration layout inputs
+    "ConfigLayoutInputs",
+    "config_layout_inputs",
+    "execute_config_layout",
+    # Watch mode
+    "IncrementalBuilder",
+    "RebuildReport",
+    "changed_config_fields",
+    "watch_config",
     # Zone stack functions
     "generate_zone_stack",
+    "generate_zone_stack_layout",
     "handle_zone_stack_multi_format_export",
+    "write_zone_stack_files",
     "output_zone_stack_cutlist",
     "output_zone_stack_materials",
     "output_zone_stack_diagram",
@@ -0,0 +1,132 @@
+"""Layout inputs described by a configuration file.
+
+This module resolves a loaded configuration into the inputs of the
+generate command: wall and layout parameters, section or row
+specifications, zone configurations, installation settings and room
+geometry. `cabinets generate --config` and watch mode both use it, so a
+configuration produces the same layout either way.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from cabinets.application.config import (
+    CabinetConfiguration,
+    config_to_all_section_specs,
+    config_to_dtos,
+    config_to_installation,
+    config_to_room,
+    config_to_row_specs,
+    config_to_section_specs,
+    config_to_zone_configs,
+    has_row_specs,
+    has_section_specs,
+)
+
+from .safety import build_installation_config
+
+if TYPE_CHECKING:
+    from cabinets.application import LayoutParametersInput, WallInput
+    from cabinets.application.commands import (
+        GenerateLayoutCommand,
+        LayoutOutput,
+        RoomLayoutOutput,
+    )
+    from cabinets.domain.entities import Room
+    from cabinets.domain.section_resolver import RowSpec, SectionSpec
+    from cabinets.domain.services.installation import InstallationConfig
+
+__all__ = [
+    "ConfigLayoutInputs",
+    "config_layout_inputs",
+    "execute_config_layout",
+]
+
+
+@dataclass
+class ConfigLayoutInputs:
+    """Generate command inputs taken from a configuration.
+
+    Attributes:
+        wall_input: Wall dimensions.
+        params_input: Layout parameters.
+        section_specs: Explicit section specifications, if any.
+        row_specs: Row specifications for multi-row layouts, if any.
+        zone_configs: Toe kick, crown molding and light rail settings.
+        installation_config: Installation settings, if configured.
+        room: Room geometry, if configured.
+        room_section_specs: Sections of all rows for room layouts.
+    """
+
+    wall_input: WallInput
+    params_input: LayoutParametersInput
+    section_specs: list[SectionSpec] | None = None
+    row_specs: list[RowSpec] | None = None
+    zone_configs: dict[str, dict | None] | None = None
+    installation_config: InstallationConfig | None = None
+    room: Room | None = None
+    room_section_specs: list[SectionSpec] | None = None
+
+
+def config_layout_inputs(config: CabinetConfiguration) -> ConfigLayoutInputs:
+    """Resolve a configuration into generate command inputs.
+
+    Args:
+        config: Loaded configuration.
+
+    Returns:
+        Inputs for GenerateLayoutCommand.
+    """
+    wall_input, params_input = config_to_dtos(config)
+    inputs = ConfigLayoutInputs(
+        wall_input=wall_input,
+        params_input=params_input,
+        zone_configs=config_to_zone_configs(config),
+    )
+
+    if has_row_specs(config):
+        # Multi-row layout - use row specs
+        inputs.row_specs = config_to_row_specs(config)
+    elif has_section_specs(config):
+        # Single-row with explicit sections
+        inputs.section_specs = config_to_section_specs(config)
+
+    installation_dict = config_to_installation(config)
+    if installation_dict is not None:
+        inputs.installation_config = build_installation_config(installation_dict)
+
+    if config.room is not None:
+        inputs.room = config_to_room(config)
+        # For room layouts, extract all sections (from rows or flat sections)
+        inputs.room_section_specs = config_to_all_section_specs(config)
+
+    return inputs
+
+
+def execute_config_layout(
+    command: GenerateLayoutCommand, inputs: ConfigLayoutInputs
+) -> LayoutOutput | RoomLayoutOutput:
+    """Generate the layout for resolved configuration inputs.
+
+    Args:
+        command: The generate command.
+        inputs: Inputs from config_layout_inputs.
+
+    Returns:
+        RoomLayoutOutput if the configuration has room geometry,
+        LayoutOutput otherwise.
+    """
+    if inputs.room is not None:
+        return command.execute_room_layout(
+            inputs.room, inputs.room_section_specs or [], inputs.params_input
+        )
+    return command.execute(
+        inputs.wall_input,
+        inputs.params_input,
+        section_specs=inputs.section_specs,
+        row_specs=inputs.row_specs,
+        zone_configs=inputs.zone_configs,
+        installation_config=inputs.installation_config,
+    )
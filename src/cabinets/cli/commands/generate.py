@@ -16,25 +16,22 @@ from cabinets.application import (
     WallInput,
 )
 from cabinets.application.config import (
+    CabinetConfiguration,
     ConfigError,
-    config_to_all_section_specs,
     config_to_bin_packing,
-    config_to_dtos,
-    config_to_installation,
     config_to_obstacles,
-    config_to_room,
-    config_to_row_specs,
     config_to_safety,
-    config_to_section_specs,
     config_to_woodworking,
-    config_to_zone_configs,
-    has_row_specs,
-    has_section_specs,
     load_config,
     merge_config_with_cli,
 )
 from cabinets.application.factory import get_factory
+from cabinets.application.services import (
+    SectionWidthOptimizerService,
+    WidthOptimizationConfig,
+)
 from cabinets.domain import Cabinet
+from cabinets.domain.section_resolver import SectionSpec, SectionWidthError
 from cabinets.infrastructure import (
     BinPackingConfig,
     BinPackingService,
@@ -44,14 +41,15 @@ from cabinets.infrastructure.llm import check_ollama_sync
 
 from cabinets.infrastructure.exporters import ExporterRegistry
 
-from .output_handlers import handle_multi_format_export
+from .config_layout import ConfigLayoutInputs, config_layout_inputs
+from .output_handlers import handle_multi_format_export, parse_export_formats
 from .safety import (
-    build_installation_config,
     build_installation_config_from_cli,
     build_safety_config,
     display_safety_summary,
     export_safety_labels,
 )
+from .watch import DEFAULT_WATCH_INTERVAL, IncrementalBuilder, watch_config
 from .zone_stack import generate_zone_stack
 
 __all__ = ["generate"]
@@ -100,6 +98,38 @@ def generate(
             "--optimize", help="Enable bin packing optimization for cut layout"
         ),
     ] = False,
+    optimize_widths: Annotated[
+        bool,
+        typer.Option(
+            "--optimize-widths",
+            help="Search fill-section widths (and depths) for the layout "
+            "that needs the fewest sheets",
+        ),
+    ] = False,
+    width_tolerance: Annotated[
+        float,
+        typer.Option(
+            "--width-tolerance",
+            help="Max deviation of fill sections from an equal split, in inches",
+            min=0.0,
+        ),
+    ] = 2.0,
+    depth_tolerance: Annotated[
+        float,
+        typer.Option(
+            "--depth-tolerance",
+            help="Max reduction of fill-section depth when optimizing, in inches",
+            min=0.0,
+        ),
+    ] = 0.0,
+    optimize_budget: Annotated[
+        float,
+        typer.Option(
+            "--optimize-budget",
+            help="Time budget for --optimize-widths in seconds",
+            min=0.0,
+        ),
+    ] = 5.0,
     output_file: Annotated[
         Path | None,
         typer.Option(
@@ -127,6 +157,21 @@ def generate(
             help="Project name for output file naming",
         ),
     ] = "cabinet",
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Watch --config and rebuild --output-formats after every change",
+        ),
+    ] = False,
+    watch_interval: Annotated[
+        float,
+        typer.Option(
+            "--watch-interval",
+            help="Seconds between checks of the config file in --watch mode",
+            min=0.05,
+        ),
+    ] = DEFAULT_WATCH_INTERVAL,
     # Installation options (FRD-17)
     wall_type: Annotated[
         str | None,
@@ -292,12 +337,14 @@ def generate(
         cabinets generate --config my-cabinet.json --width 60
         cabinets generate --config my-cabinet.json --output-formats stl,json --output-dir ./output
         cabinets generate --config my-cabinet.json --output-formats all --output-dir ./output --optimize
+        cabinets generate --config my-cabinet.json --optimize-widths --width-tolerance 3
         cabinets generate --config my-cabinet.json --llm-instructions
         cabinets generate --config my-cabinet.json --llm-instructions --skill-level beginner
         cabinets generate --config my-cabinet.json --llm-instructions --llm-model mistral:7b
         cabinets generate --config my-cabinet.json --accessibility --child-safe --format safety
         cabinets generate --config my-cabinet.json --seismic-zone D --format safety
         cabinets generate --config kitchen-zone.json --format cutlist
+        cabinets generate --config my-cabinet.json --output-formats stl,dxf,bom --output-dir ./output --watch
     """
     # Validate skill_level option
     valid_skill_levels = {"beginner", "intermediate", "expert"}
@@ -309,6 +356,31 @@ def generate(
         )
         raise typer.Exit(code=1)
 
+    if watch:
+        if config_file is None or output_formats is None:
+            typer.echo(
+                "Error: --watch requires --config and --output-formats", err=True
+            )
+            raise typer.Exit(code=1)
+        builder = IncrementalBuilder(
+            parse_export_formats(output_formats),
+            output_dir or Path("."),
+            project_name=project_name,
+            optimize=optimize,
+        )
+        watch_config(
+            config_file,
+            builder,
+            overrides={
+                "width": width,
+                "height": height,
+                "depth": depth,
+                "material_thickness": thickness,
+            },
+            interval=watch_interval,
+        )
+        return
+
     # Determine input source and create DTOs
     section_specs = None  # Will be set if config has section specifications
     row_specs = None  # Will be set if config has row specifications
@@ -316,6 +388,7 @@ def generate(
         None  # Will be set if bin packing is configured
     )
     config = None  # Will be set if config file is loaded
+    config_inputs: ConfigLayoutInputs | None = None
 
     if config_file is not None:
         # Load configuration from file
@@ -336,18 +409,16 @@ def generate(
             stl_file=output_file,
         )
 
-        # Convert to DTOs
-        wall_input, params_input = config_to_dtos(config)
+        # Convert to generate command inputs (shared with watch mode)
+        config_inputs = config_layout_inputs(config)
+        wall_input = config_inputs.wall_input
+        params_input = config_inputs.params_input
 
-        # Check if config has row or section specifications
-        # Only use specs if CLI doesn't override sections/shelves
+        # Use row or section specifications from the config only if the
+        # CLI doesn't override sections/shelves
         if sections is None and shelves is None:
-            if has_row_specs(config):
-                # Multi-row layout - use row specs
-                row_specs = config_to_row_specs(config)
-            elif has_section_specs(config):
-                # Single-row with explicit sections
-                section_specs = config_to_section_specs(config)
+            row_specs = config_inputs.row_specs
+            section_specs = config_inputs.section_specs
         else:
             # Override sections/shelves if provided via CLI
             if sections is not None:
@@ -398,13 +469,19 @@ def generate(
     if output_format is None:
         output_format = "all"
 
+    width_optimization = None
+    if optimize_widths:
+        width_optimization = WidthOptimizationConfig(
+            width_tolerance=width_tolerance,
+            depth_tolerance=depth_tolerance,
+            time_budget_seconds=optimize_budget,
+        )
+
     # Build installation config from CLI options and/or config file
     installation_config = None
-    if config_file is not None and config is not None:
+    if config_inputs is not None:
         # Start with config file installation settings
-        installation_dict = config_to_installation(config)
-        if installation_dict is not None:
-            installation_config = build_installation_config(installation_dict)
+        installation_config = config_inputs.installation_config
 
     # Override with CLI options if provided
     if wall_type or stud_spacing or mounting_system or expected_load:
@@ -491,8 +568,8 @@ def generate(
 
     # Extract zone configs (toe kick, crown molding, light rail) from config
     zone_configs = None
-    if config_file is not None and config is not None:
-        zone_configs = config_to_zone_configs(config)
+    if config_inputs is not None:
+        zone_configs = config_inputs.zone_configs
 
     # Check for zone stack configuration (FRD-22)
     if config is not None and config.cabinet and config.cabinet.zone_stack:
@@ -507,15 +584,33 @@ def generate(
         )
         return
 
+    # Exports may use the shared artifact store only when the layout is
+    # generated from the configuration alone, exactly as the API does
+    artifact_source = None
+    if (
+        config is not None
+        and sections is None
+        and shelves is None
+        and row_specs is None
+        and installation_config is None
+        and width_optimization is None
+    ):
+        artifact_source = config
+
     # Check if config has room geometry - use room layout if present
     room = None
     room_section_specs = None
-    if config_file is not None and config is not None and config.room is not None:
-        room = config_to_room(config)
-        # For room layouts, extract all sections (from rows or flat sections)
-        room_section_specs = config_to_all_section_specs(config)
+    if config_inputs is not None:
+        room = config_inputs.room
+        room_section_specs = config_inputs.room_section_specs
 
     if room is not None:
+        if width_optimization is not None:
+            typer.echo(
+                "Warning: --optimize-widths applies to single-cabinet layouts "
+                "and is ignored for room layouts.",
+                err=True,
+            )
         # Room layout mode - generate cabinets for each wall section
         _handle_room_layout(
             command=command,
@@ -530,6 +625,7 @@ def generate(
             bin_packing_config=bin_packing_config,
             optimize=optimize,
             factory=factory,
+            artifact_source=artifact_source,
         )
     else:
         # Single-wall cabinet mode (original behavior)
@@ -549,6 +645,7 @@ def generate(
             project_name=project_name,
             bin_packing_config=bin_packing_config,
             optimize=optimize,
+            width_optimization=width_optimization,
             config_file=config_file,
             config=config,
             factory=factory,
@@ -563,6 +660,7 @@ def generate(
             seismic_zone=seismic_zone,
             material_cert=material_cert,
             no_clearance_check=no_clearance_check,
+            artifact_source=artifact_source,
         )
 
 
@@ -579,6 +677,7 @@ def _handle_room_layout(
     bin_packing_config: BinPackingConfig | None,
     optimize: bool,
     factory,
+    artifact_source: CabinetConfiguration | None = None,
 ) -> None:
     """Handle room layout generation mode.
 
@@ -595,6 +694,8 @@ def _handle_room_layout(
         bin_packing_config: Bin packing configuration.
         optimize: Whether optimization is enabled.
         factory: Factory for creating services.
+        artifact_source: Configuration that fully determines the layout,
+            enabling the shared artifact store for multi-format export.
     """
     result = command.execute_room_layout(room, room_section_specs, params_input)
 
@@ -625,6 +726,7 @@ def _handle_room_layout(
             project_name,
             result,
             optimize_enabled=optimize,
+            source=artifact_source,
         )
         return  # Exit after multi-format export
 
@@ -767,6 +869,7 @@ def _handle_single_cabinet(
     project_name: str,
     bin_packing_config: BinPackingConfig | None,
     optimize: bool,
+    width_optimization: WidthOptimizationConfig | None,
     config_file: Path | None,
     config,
     factory,
@@ -781,6 +884,7 @@ def _handle_single_cabinet(
     seismic_zone: str | None,
     material_cert: str,
     no_clearance_check: bool,
+    artifact_source: CabinetConfiguration | None = None,
 ) -> None:
     """Handle single cabinet generation mode.
 
@@ -800,6 +904,7 @@ def _handle_single_cabinet(
         project_name: Project name for file naming.
         bin_packing_config: Bin packing configuration.
         optimize: Whether optimization is enabled.
+        width_optimization: Search bounds for --optimize-widths, or None.
         config_file: Path to config file if used.
         config: Loaded configuration.
         factory: Factory for creating services.
@@ -814,7 +919,21 @@ def _handle_single_cabinet(
         seismic_zone: IBC seismic zone.
         material_cert: Material certification.
         no_clearance_check: Disable clearance checking.
+        artifact_source: Configuration that fully determines the layout,
+            enabling the shared artifact store for multi-format export.
     """
+    if width_optimization is not None:
+        section_specs = _optimize_section_widths(
+            command,
+            wall_input,
+            params_input,
+            section_specs,
+            row_specs,
+            zone_configs,
+            bin_packing_config,
+            width_optimization,
+        )
+
     result = command.execute(
         wall_input,
         params_input,
@@ -851,6 +970,7 @@ def _handle_single_cabinet(
             project_name,
             result,
             optimize_enabled=optimize,
+            source=artifact_source,
         )
         return  # Exit after multi-format export
 
@@ -950,6 +1070,75 @@ def _handle_single_cabinet(
         _handle_all_output(result, factory, packing_result, safety_config)
 
 
+def _optimize_section_widths(
+    command,
+    wall_input,
+    params_input,
+    section_specs,
+    row_specs,
+    zone_configs,
+    bin_packing_config: BinPackingConfig | None,
+    width_optimization: WidthOptimizationConfig,
+):
+    """Run the sheet-yield width optimizer and return the chosen specs.
+
+    Uniform CLI layouts are treated as equal "fill" sections. Row-based
+    layouts are not optimized and their specs are returned unchanged.
+
+    Args:
+        command: The generate command.
+        wall_input: Wall dimensions input.
+        params_input: Layout parameters.
+        section_specs: Section specifications, or None for uniform sections.
+        row_specs: Row specifications for multi-row layouts.
+        zone_configs: Zone configurations (toe kick, crown, etc.).
+        bin_packing_config: Sheet settings used to count sheets.
+        width_optimization: Search bounds.
+
+    Returns:
+        Section specifications with optimized fixed widths.
+    """
+    if row_specs is not None:
+        typer.echo(
+            "Warning: --optimize-widths does not support row layouts; skipping.",
+            err=True,
+        )
+        return section_specs
+
+    if section_specs is None:
+        section_specs = [
+            SectionSpec(width="fill", shelves=params_input.shelves_per_section)
+            for _ in range(params_input.num_sections)
+        ]
+
+    optimizer = SectionWidthOptimizerService(
+        command, bin_packing_config, width_optimization
+    )
+    try:
+        optimization = optimizer.optimize(
+            wall_input, params_input, section_specs, zone_configs
+        )
+    except SectionWidthError as e:
+        typer.echo(f"Warning: Width optimization skipped: {e}", err=True)
+        return section_specs
+
+    widths = ", ".join(f'{w:.3f}"' for w in optimization.section_widths)
+    typer.echo(
+        f"Width optimization: {optimization.baseline_sheet_count} -> "
+        f"{optimization.sheet_count} sheets "
+        f"({optimization.candidates_evaluated} candidates"
+        f"{', time budget reached' if optimization.timed_out else ''}). "
+        f"Section widths: {widths}",
+        err=True,
+    )
+    if optimization.depth_reduction:
+        typer.echo(
+            f'  Fill-section depth reduced by {optimization.depth_reduction:.3f}"',
+            err=True,
+        )
+    return optimization.section_specs
+
+
 def _handle_woodworking_output(result, config_file, config, factory) -> None:
     """Handle woodworking format output."""
     from cabinets.domain.services.woodworking import WoodworkingIntelligence
@@ -983,8 +1172,9 @@ def _handle_woodworking_output(result, config_file, config, factory) -> None:
         typer.echo(f"  ... and {len(joinery) - 10} more connections")
     typer.echo("")
 
-    # Span warnings
-    warnings = intel.check_spans(result.cabinet)
+    # Span warnings and capacities share one batched shelf analysis
+    shelf_table = intel.analyze_shelves(result.cabinet)
+    warnings = intel.check_spans(result.cabinet, shelf_table)
     if warnings:
         typer.echo("SPAN WARNINGS:")
         for w in warnings:
@@ -996,7 +1186,7 @@ def _handle_woodworking_output(result, config_file, config, factory) -> None:
         typer.echo("")
 
     # Weight capacity estimates
-    capacities = intel.get_shelf_capacities(result.cabinet)
+    capacities = intel.get_shelf_capacities(result.cabinet, shelf_table)
     if capacities:
         typer.echo("WEIGHT CAPACITY ESTIMATES:")
         typer.echo("  (Advisory only - not engineered)")
@@ -1077,18 +1267,29 @@ def _handle_llm_assembly_output(
     effective_time_estimates = (
         assembly_config.include_time_estimates if assembly_config else True
     )
+    cache_only = assembly_config.llm_cache_only if assembly_config else False
 
     typer.echo("Generating LLM-enhanced assembly instructions...")
 
-    # Check Ollama availability
-    available, message = check_ollama_sync(
-        base_url=effective_url,
-        model_name=effective_model,
-    )
+    from cabinets.infrastructure.llm import get_instruction_cache
+
+    cache = get_instruction_cache()
+    if cache is not None or cache_only:
+        # The generator serves cached instructions without Ollama
+        available, message = True, ""
+    else:
+        # Check Ollama availability
+        available, message = check_ollama_sync(
+            base_url=effective_url,
+            model_name=effective_model,
+        )
 
     if available:
         typer.echo(f"  Model: {effective_model}")
         typer.echo(f"  Skill level: {effective_skill}")
+        if cache is not None:
+            mode = " (cache only)" if cache_only else ""
+            typer.echo(f"  Instruction cache: {cache.root}{mode}")
 
         from cabinets.infrastructure.llm import LLMAssemblyGenerator
 
@@ -1099,6 +1300,8 @@ def _handle_llm_assembly_output(
             skill_level=effective_skill,  # type: ignore[arg-type]
             include_troubleshooting=effective_troubleshooting,
             include_time_estimates=effective_time_estimates,
+            cache=cache,
+            cache_only=cache_only,
         )
 
         try:
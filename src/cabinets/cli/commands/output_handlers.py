@@ -13,41 +13,35 @@ import typer
 
 if TYPE_CHECKING:
     from cabinets.application.commands import LayoutOutput, RoomLayoutOutput
+    from cabinets.application.config import CabinetConfiguration
 
+from cabinets.infrastructure.artifact_store import get_artifact_store
 from cabinets.infrastructure.exporters import ExporterRegistry, ExportManager
 
 __all__ = [
+    "applicable_export_formats",
     "handle_multi_format_export",
+    "parse_export_formats",
 ]
 
 
-def handle_multi_format_export(
-    output_formats_str: str,
-    output_dir: Path | None,
-    project_name: str,
-    result: "LayoutOutput | RoomLayoutOutput",
-    optimize_enabled: bool,
-) -> bool:
-    """Handle multi-format export via --output-formats option.
+def parse_export_formats(output_formats_str: str) -> list[str]:
+    """Parse and validate the --output-formats option.
 
     Args:
         output_formats_str: Comma-separated format list or "all".
-        output_dir: Output directory for exported files.
-        project_name: Project name for file naming.
-        result: The layout output to export.
-        optimize_enabled: Whether bin packing optimization was enabled.
 
     Returns:
-        True if multi-format export was handled (caller should exit),
-        False if not applicable.
+        Requested format names.
+
+    Raises:
+        typer.Exit: If any format is not registered.
     """
-    # Parse formats
     if output_formats_str.lower() == "all":
         formats = ExporterRegistry.available_formats()
     else:
         formats = [f.strip().lower() for f in output_formats_str.split(",")]
 
-    # Validate formats
     available = ExporterRegistry.available_formats()
     invalid = [f for f in formats if f not in available]
     if invalid:
@@ -55,6 +49,24 @@ def handle_multi_format_export(
         typer.echo(f"Available formats: {', '.join(available)}", err=True)
         raise typer.Exit(code=1)
 
+    return formats
+
+
+def applicable_export_formats(
+    formats: list[str],
+    result: "LayoutOutput | RoomLayoutOutput",
+    optimize_enabled: bool,
+) -> list[str]:
+    """Drop formats the layout output cannot be exported to, with a warning.
+
+    Args:
+        formats: Requested format names.
+        result: The layout output to export.
+        optimize_enabled: Whether bin packing optimization was enabled.
+
+    Returns:
+        Formats that can be exported.
+    """
     # Check if SVG is requested but no packing result
     packing_result = getattr(result, "packing_result", None)
     if "svg" in formats and packing_result is None:
@@ -63,13 +75,12 @@ def handle_multi_format_export(
                 "Warning: SVG export skipped - bin packing failed or no cut pieces.",
                 err=True,
             )
-            formats = [f for f in formats if f != "svg"]
         else:
             typer.echo(
                 "Warning: SVG export requires --optimize flag. Skipping SVG.",
                 err=True,
             )
-            formats = [f for f in formats if f != "svg"]
+        formats = [f for f in formats if f != "svg"]
 
     # Check if safety-labels is requested but no safety assessment
     safety_assessment = getattr(result, "safety_assessment", None)
@@ -81,6 +92,36 @@ def handle_multi_format_export(
         )
         formats = [f for f in formats if f != "safety-labels"]
 
+    return formats
+
+
+def handle_multi_format_export(
+    output_formats_str: str,
+    output_dir: Path | None,
+    project_name: str,
+    result: "LayoutOutput | RoomLayoutOutput",
+    optimize_enabled: bool,
+    source: "CabinetConfiguration | None" = None,
+) -> bool:
+    """Handle multi-format export via --output-formats option.
+
+    Args:
+        output_formats_str: Comma-separated format list or "all".
+        output_dir: Output directory for exported files.
+        project_name: Project name for file naming.
+        result: The layout output to export.
+        optimize_enabled: Whether bin packing optimization was enabled.
+        source: Configuration the result was generated from, if the result
+            is fully determined by it. Enables the shared artifact store.
+
+    Returns:
+        True if multi-format export was handled (caller should exit),
+        False if not applicable.
+    """
+    formats = applicable_export_formats(
+        parse_export_formats(output_formats_str), result, optimize_enabled
+    )
+
     if not formats:
         typer.echo("No valid formats to export.", err=True)
         raise typer.Exit(code=1)
@@ -90,9 +131,10 @@ def handle_multi_format_export(
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Export all formats
-    manager = ExportManager(out_dir)
+    store = get_artifact_store() if source is not None else None
+    manager = ExportManager(out_dir, artifact_store=store)
     try:
-        files = manager.export_all(formats, result, project_name)
+        files = manager.export_all(formats, result, project_name, source=source)
     except Exception as e:
         typer.echo(f"Export error: {e}", err=True)
         raise typer.Exit(code=1)
@@ -0,0 +1,182 @@
+"""Project command for whole-house jobs.
+
+This module provides the `project` command, which generates every room of
+a project configuration, packs the combined cut list onto sheets in one
+pass and prints a consolidated bill of materials for the whole job.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from cabinets.application.config import ConfigError, load_project_config
+from cabinets.application.dtos import (
+    LayoutOutput,
+    ProjectLayoutOutput,
+    RoomLayoutOutput,
+)
+from cabinets.application.services import ProjectGenerationService
+from cabinets.domain import MaterialSpec
+from cabinets.infrastructure import OffcutInventory
+from cabinets.infrastructure.exporters import BomGenerator
+
+# BOM output formats by file suffix for --output
+_BOM_FORMATS = {".csv": "csv", ".json": "json", ".md": "markdown"}
+
+
+def project(
+    config_file: Annotated[
+        Path, typer.Argument(help="Project configuration file (JSON)")
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Write the BOM to a file (.txt, .csv, .json or .md)",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", help="Worker processes (default: CPU count)"),
+    ] = None,
+    offcut_inventory: Annotated[
+        Path | None,
+        typer.Option(
+            "--offcut-inventory",
+            help="Offcut inventory database to cut from first and add leftovers to",
+        ),
+    ] = None,
+    output_format: Annotated[
+        str, typer.Option("--format", "-f", help="Output format: text or json")
+    ] = "text",
+) -> None:
+    """Generate all rooms of a project with shared sheets and one BOM.
+
+    Rooms are generated in parallel, their cut lists are merged by
+    material and packed onto sheets in a single pass, and hardware is
+    totalled across the whole job. With --offcut-inventory, pieces are cut
+    from stored offcuts before new sheets are opened.
+
+    Example:
+        cabinets project smith-house.json -o smith-house-bom.csv
+    """
+    if output_format not in ("text", "json"):
+        typer.echo(f"Error: Unknown format '{output_format}'", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        config = load_project_config(config_file)
+    except ConfigError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    result = ProjectGenerationService(
+        max_workers=workers,
+        inventory=(
+            OffcutInventory(offcut_inventory) if offcut_inventory is not None else None
+        ),
+    ).run(config)
+
+    if output is not None:
+        BomGenerator(
+            output_format=_BOM_FORMATS.get(output.suffix.lower(), "text")
+        ).export(result, output)
+
+    if output_format == "json":
+        typer.echo(json.dumps(build_project_json(result), indent=2))
+    else:
+        typer.echo(format_project_summary(result))
+        typer.echo("")
+        typer.echo(BomGenerator().format_for_console(result))
+
+    if not result.is_valid:
+        raise typer.Exit(code=1)
+
+
+def build_project_json(result: ProjectLayoutOutput) -> dict:
+    """Build the JSON output of a project run.
+
+    Args:
+        result: Project output to convert.
+
+    Returns:
+        Dictionary with per-room counts, sheet totals, stored offcuts used,
+        errors and the BOM.
+    """
+    packing = result.packing_result
+    return {
+        "name": result.name,
+        "rooms": [
+            {
+                "name": name,
+                "cabinets": _cabinet_count(output),
+                "pieces": sum(piece.quantity for piece in output.cut_list),
+            }
+            for name, output in result.rooms.items()
+        ],
+        "sheets": (
+            {
+                _material_name(material): count
+                for material, count in packing.sheets_by_material.items()
+            }
+            if packing is not None
+            else None
+        ),
+        "offcuts_used": (
+            sum(1 for layout in packing.layouts if layout.is_offcut)
+            if packing is not None
+            else None
+        ),
+        "waste_percentage": (
+            round(packing.total_waste_percentage, 1) if packing is not None else None
+        ),
+        "errors": result.errors,
+        "bom": json.loads(BomGenerator(output_format="json").export_string(result)),
+    }
+
+
+def format_project_summary(result: ProjectLayoutOutput) -> str:
+    """Format per-room counts and project sheet totals as text.
+
+    Args:
+        result: Project output to summarize.
+
+    Returns:
+        Multi-line summary of rooms, sheets and errors.
+    """
+    lines = [f"Project: {result.name} ({len(result.rooms)} rooms)"]
+    for name, output in result.rooms.items():
+        pieces = sum(piece.quantity for piece in output.cut_list)
+        lines.append(f"  {name}: {_cabinet_count(output)} cabinets, {pieces} pieces")
+
+    packing = result.packing_result
+    if packing is not None:
+        lines.append("")
+        lines.append(f"Sheets for the whole project: {packing.total_sheets}")
+        for material, count in packing.sheets_by_material.items():
+            lines.append(f"  {_material_name(material)}: {count}")
+        reused = sum(1 for layout in packing.layouts if layout.is_offcut)
+        if reused:
+            lines.append(f"  Stored offcuts used: {reused}")
+        lines.append(f"  Waste: {packing.total_waste_percentage:.1f}%")
+
+    if result.errors:
+        lines.append("")
+        lines.append("Errors:")
+        lines.extend(f"  - {error}" for error in result.errors)
+    return "\n".join(lines)
+
+
+def _cabinet_count(output: LayoutOutput | RoomLayoutOutput) -> int:
+    if isinstance(output, RoomLayoutOutput):
+        return len(output.cabinets)
+    return 1
+
+
+def _material_name(material: MaterialSpec) -> str:
+    return f'{material.thickness:.3f}" {material.material_type.value}'
@@ -0,0 +1,205 @@
+"""Sweep command for comparing design variants.
+
+This module provides the `sweep` command, which evaluates every
+combination of material thickness, section count and shelf count for a
+wall and prints a Pareto table of cost, sheets, weight and minimum shelf
+capacity.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Annotated
+
+import typer
+
+from cabinets.application.dtos import WallInput
+from cabinets.application.services import (
+    DesignSweepResult,
+    DesignSweepService,
+    SheetPricing,
+    SweepRanges,
+    SweepRow,
+)
+
+
+def sweep(
+    width: Annotated[float, typer.Option("--width", "-w", help="Wall width in inches")],
+    height: Annotated[
+        float, typer.Option("--height", "-h", help="Wall height in inches")
+    ],
+    depth: Annotated[
+        float, typer.Option("--depth", "-d", help="Cabinet depth in inches")
+    ],
+    thicknesses: Annotated[
+        str,
+        typer.Option(
+            "--thicknesses",
+            "-t",
+            help='Comma-separated material thicknesses, e.g. "0.75,0.625"',
+        ),
+    ] = "0.75",
+    sections: Annotated[
+        str,
+        typer.Option(
+            "--sections",
+            "-s",
+            help='Section counts as a list or range, e.g. "4,5" or "3-6"',
+        ),
+    ] = "1",
+    shelves: Annotated[
+        str,
+        typer.Option("--shelves", help='Shelves per section, e.g. "3,4" or "2-5"'),
+    ] = "3",
+    material: Annotated[
+        str, typer.Option("--material", "-m", help="Material type")
+    ] = "plywood",
+    sheet_price: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--sheet-price",
+            help='Price per sheet for a thickness, e.g. "0.75=68" (repeatable)',
+        ),
+    ] = None,
+    price_per_inch: Annotated[
+        float,
+        typer.Option(
+            "--price-per-inch",
+            help="Sheet price per inch of thickness for unpriced thicknesses",
+        ),
+    ] = 80.0,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", help="Worker processes (default: CPU count)"),
+    ] = None,
+    pareto_only: Annotated[
+        bool,
+        typer.Option("--pareto-only", help="Only show Pareto-optimal variants"),
+    ] = False,
+    output_format: Annotated[
+        str, typer.Option("--format", "-f", help="Output format: table or json")
+    ] = "table",
+) -> None:
+    """Compare design variants across thickness, section and shelf counts.
+
+    Every combination is generated, and variants no other variant beats on
+    cost, sheet count, weight and minimum shelf capacity are marked with *.
+
+    Example:
+        cabinets sweep -w 96 -h 84 -d 12 -t 0.75,0.625 -s 4,5 --shelves 3-5
+    """
+    if output_format not in ("table", "json"):
+        typer.echo(f"Error: Unknown format '{output_format}'", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        ranges = SweepRanges(
+            thicknesses=tuple(_parse_floats(thicknesses)),
+            section_counts=tuple(_parse_ints(sections)),
+            shelf_counts=tuple(_parse_ints(shelves)),
+        )
+        pricing = SheetPricing(
+            price_per_inch=price_per_inch,
+            prices=_parse_prices(sheet_price or []),
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    service = DesignSweepService(pricing=pricing, max_workers=workers)
+    try:
+        result = service.run(
+            WallInput(width=width, height=height, depth=depth),
+            ranges,
+            material_type=material,
+        )
+    finally:
+        service.close()
+
+    if output_format == "json":
+        typer.echo(json.dumps(result.to_dict(), indent=2))
+    else:
+        typer.echo(format_sweep_table(result, pareto_only=pareto_only))
+
+
+def format_sweep_table(result: DesignSweepResult, pareto_only: bool = False) -> str:
+    """Format sweep results as a text table.
+
+    Args:
+        result: Sweep result to format.
+        pareto_only: Only include Pareto-optimal rows.
+
+    Returns:
+        Table with one row per variant; Pareto-optimal rows are starred.
+    """
+    rows = result.pareto_rows if pareto_only else result.rows
+    lines = [
+        f"{'':2}{'Thick':>6} {'Sect':>4} {'Shlv':>4} {'Cost':>9} {'Sheets':>6} "
+        f"{'Weight':>8} {'MinCap':>7}",
+        "-" * 52,
+    ]
+    for row in rows:
+        lines.append(_format_row(row))
+    lines.append("")
+    lines.append(
+        f"{len(result.pareto_rows)} Pareto-optimal of {len(result.rows)} variants "
+        f"({result.evaluated} evaluated in {result.elapsed_seconds:.1f}s)"
+    )
+    return "\n".join(lines)
+
+
+def _format_row(row: SweepRow) -> str:
+    marker = "* " if row.pareto_optimal else "  "
+    point = row.point
+    prefix = f'{marker}{point.thickness:>5.3f}" {point.sections:>4} {point.shelves:>4}'
+    if not row.is_valid:
+        return f"{prefix} error: {row.errors[0]}"
+    capacity = (
+        f"{row.min_shelf_capacity_lbs:>4.0f} lb"
+        if row.min_shelf_capacity_lbs is not None
+        else f"{'-':>7}"
+    )
+    return (
+        f"{prefix} ${row.cost:>8.2f} {row.sheet_count:>6} "
+        f"{row.weight_lbs:>5.1f} lb {capacity}"
+    )
+
+
+def _parse_floats(value: str) -> list[float]:
+    try:
+        return [float(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid number list: '{value}'") from None
+
+
+def _parse_ints(value: str) -> list[int]:
+    """Parse "3,4,5" or "3-5" (or a mix) into integers."""
+    result: list[int] = []
+    try:
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                low, high = (int(bound) for bound in part.split("-", 1))
+                result.extend(range(low, high + 1))
+            else:
+                result.append(int(part))
+    except ValueError:
+        raise ValueError(f"Invalid integer list or range: '{value}'") from None
+    return result
+
+
+def _parse_prices(values: list[str]) -> dict[float, float]:
+    prices: dict[float, float] = {}
+    for value in values:
+        thickness, sep, price = value.partition("=")
+        try:
+            if not sep:
+                raise ValueError
+            prices[float(thickness)] = float(price)
+        except ValueError:
+            raise ValueError(
+                f"Invalid sheet price '{value}', expected THICKNESS=PRICE"
+            ) from None
+    return prices
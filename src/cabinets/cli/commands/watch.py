@@ -0,0 +1,484 @@
+"""Watch mode for the generate command.
+
+This module provides `cabinets generate --watch`, which keeps the process
+and its generation services warm, polls the configuration file for
+changes and rebuilds the requested artifacts after every edit.
+
+Each rebuild compares the new configuration with the last one that built
+successfully, field by field, and reruns only the stages that depend on
+what changed:
+
+- layout: cabinet, room, obstacle, infrastructure, installation and
+  woodworking settings, generated as `cabinets generate --config` does
+- packing: bin_packing settings (and any layout change)
+- export: whenever layout or packing ran
+
+Exported files are compared by content hash and only rewritten when
+their content changed, so downstream tools watching the output directory
+are not retriggered by identical artifacts.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+from cabinets.application.config import (
+    CabinetConfiguration,
+    ConfigError,
+    config_to_bin_packing,
+    load_config,
+    merge_config_with_cli,
+)
+from cabinets.application.factory import get_factory
+from cabinets.contracts.dtos import LayoutOutput, PackingOutput, RoomLayoutOutput
+from cabinets.domain.services.zone_layout import ZoneStackLayoutResult
+from cabinets.infrastructure import BinPackingConfig, BinPackingService
+from cabinets.infrastructure.exporters import ArtifactWrite, ExportManager
+
+from .config_layout import config_layout_inputs, execute_config_layout
+from .output_handlers import applicable_export_formats
+from .zone_stack import (
+    ZONE_STACK_FORMATS,
+    generate_zone_stack_layout,
+    write_zone_stack_files,
+)
+
+if TYPE_CHECKING:
+    from cabinets.infrastructure.bin_packing import PackingResult
+
+__all__ = [
+    "IncrementalBuilder",
+    "RebuildReport",
+    "changed_config_fields",
+    "watch_config",
+]
+
+# Fields that never affect multi-format export output
+EXPORT_INDEPENDENT_FIELDS = frozenset({"schema_version", "output", "safety"})
+
+# Fields that only affect the bin packing stage
+PACKING_FIELDS = frozenset({"bin_packing"})
+
+# Default seconds between checks of the configuration file
+DEFAULT_WATCH_INTERVAL = 0.5
+
+# Default seconds the file must stay unchanged before a rebuild starts
+DEFAULT_DEBOUNCE = 0.3
+
+
+def changed_config_fields(
+    previous: CabinetConfiguration | None, current: CabinetConfiguration
+) -> list[str]:
+    """List the top-level configuration fields that differ.
+
+    Args:
+        previous: Configuration of the last successful build, or None.
+        current: Newly loaded configuration.
+
+    Returns:
+        Names of changed fields in schema order; every field when there
+        is no previous configuration.
+    """
+    fields = list(CabinetConfiguration.model_fields)
+    if previous is None:
+        return fields
+    return [
+        name for name in fields if getattr(previous, name) != getattr(current, name)
+    ]
+
+
+@dataclass(frozen=True)
+class RebuildReport:
+    """Outcome of one incremental rebuild.
+
+    Attributes:
+        changed_fields: Top-level configuration fields that changed.
+        stages: Stages that ran, in order ("layout", "packing", "export").
+        writes: Files produced by the export stage.
+        errors: Errors that stopped the rebuild; previous artifacts are kept.
+        warnings: Non-fatal problems, such as a failed bin packing run.
+        elapsed_seconds: Wall-clock time of the rebuild.
+    """
+
+    changed_fields: tuple[str, ...]
+    stages: tuple[str, ...]
+    writes: tuple[ArtifactWrite, ...] = ()
+    errors: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
+    elapsed_seconds: float = 0.0
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if the rebuild succeeded."""
+        return not self.errors
+
+    @property
+    def written(self) -> list[Path]:
+        """Files whose content changed and were rewritten."""
+        return [w.path for w in self.writes if w.changed]
+
+    @property
+    def unchanged(self) -> list[Path]:
+        """Files whose content was identical and were left untouched."""
+        return [w.path for w in self.writes if not w.changed]
+
+
+class IncrementalBuilder:
+    """Rebuild multi-format exports, rerunning only stages affected by a change.
+
+    The builder keeps the configuration, layout output and packing result
+    of its last successful build. A failed build leaves that state, and
+    the files on disk, as they were.
+
+    Layouts are generated exactly as `cabinets generate --config` does;
+    zone stack configurations produce the zone stack exports (JSON, STL).
+
+    Example:
+        builder = IncrementalBuilder(["stl", "bom"], Path("out"))
+        report = builder.rebuild(load_config(Path("cabinet.json")))
+        print(report.stages, report.written)
+    """
+
+    def __init__(
+        self,
+        formats: list[str],
+        output_dir: Path,
+        project_name: str = "cabinet",
+        optimize: bool = False,
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            formats: Export formats to produce.
+            output_dir: Directory for exported files.
+            project_name: Project name for file naming.
+            optimize: Enable bin packing even if the configuration does not.
+        """
+        self._formats = list(formats)
+        self._project_name = project_name
+        self._optimize = optimize
+        self._export_manager = ExportManager(output_dir)
+        self._command = get_factory().create_generate_command()
+        self._config: CabinetConfiguration | None = None
+        self._result: LayoutOutput | RoomLayoutOutput | ZoneStackLayoutResult | None = (
+            None
+        )
+
+    @property
+    def result(self) -> LayoutOutput | RoomLayoutOutput | ZoneStackLayoutResult | None:
+        """Layout output of the last successful build."""
+        return self._result
+
+    def rebuild(self, config: CabinetConfiguration) -> RebuildReport:
+        """Bring the exported artifacts up to date with a configuration.
+
+        Args:
+            config: Newly loaded configuration.
+
+        Returns:
+            Report of the changed fields, stages run and files written.
+        """
+        start = time.perf_counter()
+        changed = changed_config_fields(self._config, config)
+        relevant = set(changed) - EXPORT_INDEPENDENT_FIELDS
+
+        def report(**kwargs: Any) -> RebuildReport:
+            return RebuildReport(
+                changed_fields=tuple(changed),
+                elapsed_seconds=time.perf_counter() - start,
+                **kwargs,
+            )
+
+        if config.cabinet.zone_stack is not None:
+            # Zone stacks have no packing stage
+            if isinstance(self._result, ZoneStackLayoutResult) and not (
+                relevant - PACKING_FIELDS
+            ):
+                self._config = config
+                return report(stages=())
+            return self._rebuild_zone_stack(config, report)
+
+        previous = (
+            None if isinstance(self._result, ZoneStackLayoutResult) else self._result
+        )
+        rerun_layout = previous is None or bool(relevant - PACKING_FIELDS)
+        rerun_packing = rerun_layout or bool(relevant & PACKING_FIELDS)
+
+        if not rerun_packing:
+            self._config = config
+            return report(stages=())
+
+        stages: list[str] = []
+        result = previous
+        if rerun_layout:
+            stages.append("layout")
+            try:
+                result = execute_config_layout(
+                    self._command, config_layout_inputs(config)
+                )
+            except ValueError as e:
+                return report(stages=tuple(stages), errors=(str(e),))
+            if not result.is_valid:
+                return report(stages=tuple(stages), errors=tuple(result.errors))
+        assert result is not None
+
+        stages.append("packing")
+        result, warnings = self._pack(config, result)
+
+        stages.append("export")
+        formats = applicable_export_formats(self._formats, result, self._optimize)
+        if not formats:
+            return report(
+                stages=tuple(stages),
+                errors=("No valid formats to export.",),
+                warnings=warnings,
+            )
+        try:
+            writes = self._export_manager.export_changed(
+                formats, result, self._project_name
+            )
+        except Exception as e:
+            return report(
+                stages=tuple(stages),
+                errors=(f"Export error: {e}",),
+                warnings=warnings,
+            )
+
+        self._config = config
+        self._result = result
+        return report(stages=tuple(stages), writes=tuple(writes), warnings=warnings)
+
+    def _rebuild_zone_stack(
+        self,
+        config: CabinetConfiguration,
+        report: Callable[..., RebuildReport],
+    ) -> RebuildReport:
+        """Run the layout and export stages for a zone stack configuration."""
+        stages = ("layout", "export")
+        try:
+            result = generate_zone_stack_layout(config)
+        except ValueError as e:
+            return report(stages=stages[:1], errors=(str(e),))
+        if result.has_errors:
+            return report(stages=stages[:1], errors=tuple(result.errors))
+
+        warnings = list(result.warnings)
+        unsupported = [f for f in self._formats if f not in ZONE_STACK_FORMATS]
+        if unsupported:
+            warnings.append(
+                f"Zone stacks don't support formats: {', '.join(unsupported)}"
+            )
+        formats = [f for f in self._formats if f in ZONE_STACK_FORMATS]
+        if not formats:
+            return report(
+                stages=stages,
+                errors=("No valid formats to export for zone stack.",),
+                warnings=tuple(warnings),
+            )
+
+        writes: list[ArtifactWrite] = []
+        try:
+            for fmt in formats:
+                writes.extend(
+                    self._export_manager.write_changed(
+                        fmt,
+                        functools.partial(
+                            write_zone_stack_files,
+                            result,
+                            config,
+                            [fmt],
+                            project_name=self._project_name,
+                        ),
+                    )
+                )
+        except Exception as e:
+            return report(
+                stages=stages,
+                errors=(f"Export error: {e}",),
+                warnings=tuple(warnings),
+            )
+
+        self._config = config
+        self._result = result
+        return report(stages=stages, writes=tuple(writes), warnings=tuple(warnings))
+
+    def _pack(
+        self,
+        config: CabinetConfiguration,
+        result: LayoutOutput | RoomLayoutOutput,
+    ) -> tuple[LayoutOutput | RoomLayoutOutput, tuple[str, ...]]:
+        """Run the packing stage.
+
+        The layout output is not modified; the packing result is set on a
+        copy, so a build that fails later leaves the previous output intact.
+
+        Returns:
+            Copy of the output with its packing result, and warnings raised
+            by bin packing.
+        """
+        packing_config = (
+            config_to_bin_packing(config.bin_packing)
+            if config.bin_packing is not None
+            else None
+        )
+        if self._optimize and (packing_config is None or not packing_config.enabled):
+            packing_config = (
+                BinPackingConfig(enabled=True)
+                if packing_config is None
+                else BinPackingConfig(
+                    enabled=True,
+                    sheet_size=packing_config.sheet_size,
+                    kerf=packing_config.kerf,
+                    min_offcut_size=packing_config.min_offcut_size,
+                )
+            )
+
+        if packing_config is None or not packing_config.enabled or not result.cut_list:
+            return _with_packing_result(result, None), ()
+
+        try:
+            packing_result = BinPackingService(packing_config).optimize_cut_list(
+                result.cut_list
+            )
+        except ValueError as e:
+            return _with_packing_result(result, None), (f"Bin packing failed: {e}",)
+        return _with_packing_result(result, packing_result), ()
+
+
+def _with_packing_result(
+    result: LayoutOutput | RoomLayoutOutput,
+    packing_result: PackingResult | None,
+) -> LayoutOutput | RoomLayoutOutput:
+    """Copy a layout output with a different packing result."""
+    if isinstance(result, RoomLayoutOutput):
+        return dataclasses.replace(result, packing_result=packing_result)
+    return LayoutOutput(
+        core=result.core,
+        woodworking=result.woodworking,
+        packing=PackingOutput(packing_result=packing_result)
+        if packing_result is not None
+        else None,
+        installation=result.installation,
+    )
+
+
+def _echo_report(report: RebuildReport) -> None:
+    """Print a one-line summary of a rebuild followed by its details."""
+    stamp = time.strftime("%H:%M:%S")
+    changed = ", ".join(report.changed_fields) or "none"
+    stages = ", ".join(report.stages) or "none"
+
+    if not report.is_valid:
+        typer.echo(f"[{stamp}] Rebuild failed (changed: {changed})", err=True)
+        for error in report.errors:
+            typer.echo(f"  - {error}", err=True)
+        typer.echo("  Keeping previous artifacts.", err=True)
+        return
+
+    typer.echo(
+        f"[{stamp}] Rebuilt in {report.elapsed_seconds:.2f}s "
+        f"(changed: {changed}; stages: {stages})"
+    )
+    for warning in report.warnings:
+        typer.echo(f"  Warning: {warning}", err=True)
+    for path in report.written:
+        typer.echo(f"  written: {path}")
+    if report.unchanged:
+        typer.echo(f"  unchanged: {len(report.unchanged)} file(s)")
+
+
+def _file_state(path: Path) -> tuple[int, int] | None:
+    """Get (mtime_ns, size) of a file, or None if it cannot be read."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def watch_config(
+    config_file: Path,
+    builder: IncrementalBuilder,
+    overrides: Mapping[str, Any] | None = None,
+    interval: float = DEFAULT_WATCH_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    max_rebuilds: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Rebuild artifacts whenever the configuration file changes.
+
+    Polls the file's modification time and size. After a change, waits
+    until the file has been stable for `debounce` seconds so that editors
+    writing in several steps trigger a single rebuild. Saves that leave
+    the content unchanged are ignored. Configuration errors are printed
+    and watching continues.
+
+    Args:
+        config_file: Configuration file to watch.
+        builder: Builder that produces the artifacts.
+        overrides: Keyword arguments for merge_config_with_cli applied to
+            every loaded configuration.
+        interval: Seconds between checks of the file.
+        debounce: Seconds the file must stay unchanged before rebuilding.
+        max_rebuilds: Stop after this many rebuild attempts, including the
+            initial build. None watches until interrupted.
+        sleep: Function used to wait; replaceable for testing.
+
+    Returns:
+        Number of rebuild attempts made.
+    """
+    overrides = dict(overrides or {})
+    last_digest: str | None = None
+    attempts = 0
+
+    def build() -> None:
+        nonlocal last_digest, attempts
+        try:
+            raw = config_file.read_bytes()
+        except OSError as e:
+            typer.echo(f"Error: Cannot read {config_file}: {e}", err=True)
+            return
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest == last_digest:
+            return
+        last_digest = digest
+        attempts += 1
+        try:
+            config = merge_config_with_cli(load_config(config_file), **overrides)
+        except ConfigError as e:
+            typer.echo(f"Error: {e}", err=True)
+            return
+        _echo_report(builder.rebuild(config))
+
+    typer.echo(f"Watching {config_file} for changes (Ctrl+C to stop)")
+    state = _file_state(config_file)
+    build()
+
+    try:
+        while max_rebuilds is None or attempts < max_rebuilds:
+            sleep(interval)
+            current = _file_state(config_file)
+            if current == state:
+                continue
+            # Debounce: wait until the file stops changing
+            while True:
+                sleep(debounce)
+                settled = _file_state(config_file)
+                if settled == current:
+                    break
+                current = settled
+            state = current
+            build()
+    except KeyboardInterrupt:
+        typer.echo("\nStopped watching.")
+
+    return attempts
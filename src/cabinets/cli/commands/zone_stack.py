@@ -22,8 +22,11 @@ from cabinets.application.factory import get_factory
 from cabinets.domain.value_objects import MaterialSpec
 
 __all__ = [
+    "ZONE_STACK_FORMATS",
     "generate_zone_stack",
+    "generate_zone_stack_layout",
     "handle_zone_stack_multi_format_export",
+    "write_zone_stack_files",
     "output_zone_stack_cutlist",
     "output_zone_stack_materials",
     "output_zone_stack_diagram",
@@ -34,30 +37,27 @@ __all__ = [
     "export_cabinet_stl",
 ]
 
+# Export formats available for zone stacks
+ZONE_STACK_FORMATS = frozenset({"json", "stl"})
 
-def generate_zone_stack(
+
+def generate_zone_stack_layout(
     config: "CabinetConfiguration",
-    output_format: str,
-    output_file: Path | None,
-    output_dir: Path | None,
-    output_formats: str | None,
-    project_name: str,
-) -> None:
-    """Generate layout for a zone stack configuration.
+) -> "ZoneStackLayoutResult":
+    """Generate the zone stack layout described by a configuration.
 
     Args:
         config: Full configuration schema with zone_stack.
-        output_format: Single output format (cutlist, materials, diagram, etc.).
-        output_file: Optional output file path (for STL).
-        output_dir: Optional output directory (for multi-format).
-        output_formats: Comma-separated list of formats or "all".
-        project_name: Project name for file naming.
+
+    Returns:
+        Zone stack layout result, including any generation errors.
+
+    Raises:
+        ValueError: If the configuration has no zone_stack.
     """
-    # Convert config to zone layout config
     zone_stack_schema = config.cabinet.zone_stack
     if zone_stack_schema is None:
-        typer.echo("Error: No zone_stack configuration found", err=True)
-        raise typer.Exit(code=1)
+        raise ValueError("No zone_stack configuration found")
 
     # Get material from cabinet config
     material = None
@@ -73,10 +73,32 @@ def generate_zone_stack(
         material=material,
     )
 
-    # Generate zone stack
-    factory = get_factory()
-    service = factory.get_zone_layout_service()
-    result = service.generate(zone_layout_config)
+    return get_factory().get_zone_layout_service().generate(zone_layout_config)
+
+
+def generate_zone_stack(
+    config: "CabinetConfiguration",
+    output_format: str,
+    output_file: Path | None,
+    output_dir: Path | None,
+    output_formats: str | None,
+    project_name: str,
+) -> None:
+    """Generate layout for a zone stack configuration.
+
+    Args:
+        config: Full configuration schema with zone_stack.
+        output_format: Single output format (cutlist, materials, diagram, etc.).
+        output_file: Optional output file path (for STL).
+        output_dir: Optional output directory (for multi-format).
+        output_formats: Comma-separated list of formats or "all".
+        project_name: Project name for file naming.
+    """
+    if config.cabinet.zone_stack is None:
+        typer.echo("Error: No zone_stack configuration found", err=True)
+        raise typer.Exit(code=1)
+
+    result = generate_zone_stack_layout(config)
 
     # Handle errors
     if result.has_errors:
@@ -151,18 +173,17 @@ def handle_zone_stack_multi_format_export(
         formats = [f.strip().lower() for f in output_formats_str.split(",")]
 
     # Validate formats - zone stacks support a subset of formats
-    supported_formats = {"json", "stl"}
-    invalid = [f for f in formats if f not in supported_formats]
+    invalid = [f for f in formats if f not in ZONE_STACK_FORMATS]
     if invalid:
         typer.echo(
             f"Warning: Zone stacks don't support formats: {', '.join(invalid)}",
             err=True,
         )
         typer.echo(
-            f"Supported zone stack formats: {', '.join(sorted(supported_formats))}",
+            f"Supported zone stack formats: {', '.join(sorted(ZONE_STACK_FORMATS))}",
             err=True,
         )
-        formats = [f for f in formats if f in supported_formats]
+        formats = [f for f in formats if f in ZONE_STACK_FORMATS]
 
     if not formats:
         typer.echo("No valid formats to export for zone stack.", err=True)
@@ -172,6 +193,34 @@ def handle_zone_stack_multi_format_export(
     out_dir = output_dir or Path(".")
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    exported_files = write_zone_stack_files(
+        result, config, formats, out_dir, project_name
+    )
+
+    typer.echo("\nExported files:")
+    for fmt_name, path in exported_files.items():
+        typer.echo(f"  {fmt_name}: {path}")
+
+
+def write_zone_stack_files(
+    result: "ZoneStackLayoutResult",
+    config: "CabinetConfiguration",
+    formats: list[str],
+    out_dir: Path,
+    project_name: str,
+) -> dict[str, Path]:
+    """Write zone stack export files to a directory.
+
+    Args:
+        result: Zone stack layout result.
+        config: Original configuration.
+        formats: Formats to write; each must be in ZONE_STACK_FORMATS.
+        out_dir: Existing directory for the exported files.
+        project_name: Project name for file naming.
+
+    Returns:
+        Mapping of display name to the path of each file written.
+    """
     exported_files: dict[str, Path] = {}
 
     for fmt in formats:
@@ -194,9 +243,7 @@ def handle_zone_stack_multi_format_export(
                 export_cabinet_stl(result.upper_cabinet, upper_path)
                 exported_files["STL (upper)"] = upper_path
 
-    typer.echo("\nExported files:")
-    for fmt_name, path in exported_files.items():
-        typer.echo(f"  {fmt_name}: {path}")
+    return exported_files
 
 
 def export_cabinet_stl(cabinet: "Cabinet", output_path: Path) -> None:
@@ -18,6 +18,8 @@ from cabinets.application import (
 from cabinets.application.factory import get_factory
 from cabinets.cli.commands import validate_command, templates_app
 from cabinets.cli.commands.generate import generate
+from cabinets.cli.commands.project import project
+from cabinets.cli.commands.sweep import sweep
 
 __all__ = ["app", "generate", "cutlist", "materials", "diagram"]
 
@@ -35,6 +37,12 @@ app.add_typer(templates_app, name="templates")
 # Register generate command from extracted module
 app.command()(generate)
 
+# Register design-space sweep command
+app.command()(sweep)
+
+# Register whole-house project command
+app.command()(project)
+
 
 @app.command()
 def cutlist(
@@ -28,6 +28,7 @@ from .dtos import (
     InstallationOutput as InstallationOutput,
     LayoutOutput as LayoutOutput,
     PackingOutput as PackingOutput,
+    ProjectLayoutOutput as ProjectLayoutOutput,
     RoomLayoutOutput as RoomLayoutOutput,
     WoodworkingOutput as WoodworkingOutput,
 )
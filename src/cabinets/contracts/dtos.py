@@ -328,11 +328,49 @@ class RoomLayoutOutput:
         return len(self.errors) == 0
 
 
+@dataclass
+class ProjectLayoutOutput:
+    """Output DTO from whole-project generation across several rooms.
+
+    Cut pieces and hardware from every room are merged so that sheet counts
+    and purchasing cover the whole job. Cut piece labels are prefixed with
+    the room name ("Kitchen: Left Side") so pieces can be sorted back out
+    in the shop.
+
+    Attributes:
+        name: Project name.
+        rooms: Layout output of each room keyed by room name, in
+            configuration order.
+        cut_list: Combined cut list of all rooms, grouped by material.
+        hardware: Combined hardware of all rooms with duplicates summed.
+        material_estimates: Material estimates grouped by material type.
+        total_estimate: Total material estimate across all rooms.
+        errors: List of error messages, prefixed with the room name.
+        packing_result: Result from one bin packing pass over the combined
+            cut list, if enabled.
+    """
+
+    name: str
+    rooms: dict[str, LayoutOutput | RoomLayoutOutput]
+    cut_list: list[CutPiece]
+    hardware: list[HardwareItem]
+    material_estimates: dict[MaterialSpec, MaterialEstimate]
+    total_estimate: MaterialEstimate
+    errors: list[str] = field(default_factory=list)
+    packing_result: "PackingResult | None" = None
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if every room was generated successfully."""
+        return len(self.errors) == 0
+
+
 __all__ = [
     "CoreLayoutOutput",
     "InstallationOutput",
     "LayoutOutput",
     "PackingOutput",
+    "ProjectLayoutOutput",
     "RoomLayoutOutput",
     "WoodworkingOutput",
 ]
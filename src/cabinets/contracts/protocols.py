@@ -7,6 +7,7 @@ and testability through dependency injection.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -16,7 +17,12 @@ if TYPE_CHECKING:
     from cabinets.domain.services.installation.models import InstallationPlan
     from cabinets.domain.services.layout_calculator import LayoutParameters
     from cabinets.domain.services.material_estimator import MaterialEstimate
-    from cabinets.domain.value_objects import CutPiece, MaterialSpec, SectionTransform
+    from cabinets.domain.value_objects import (
+        CutListTable,
+        CutPiece,
+        MaterialSpec,
+        SectionTransform,
+    )
     from cabinets.application.dtos import (
         LayoutOutput,
         LayoutParametersInput,
@@ -139,23 +145,27 @@ class MaterialEstimatorProtocol(Protocol):
     """
 
     def estimate(
-        self, cut_list: list[CutPiece]
+        self, cut_list: Sequence[CutPiece] | CutListTable
     ) -> dict[MaterialSpec, MaterialEstimate]:
         """Estimate materials needed for a cut list, grouped by material type.
 
         Args:
-            cut_list: List of cut pieces to estimate materials for.
+            cut_list: Cut pieces (or their columnar table) to estimate
+                materials for.
 
         Returns:
             Dictionary mapping MaterialSpec to MaterialEstimate.
         """
         ...
 
-    def estimate_total(self, cut_list: list[CutPiece]) -> MaterialEstimate:
+    def estimate_total(
+        self, cut_list: Sequence[CutPiece] | CutListTable
+    ) -> MaterialEstimate:
         """Estimate total materials needed (all types combined).
 
         Args:
-            cut_list: List of cut pieces to estimate materials for.
+            cut_list: Cut pieces (or their columnar table) to estimate
+                materials for.
 
         Returns:
             MaterialEstimate for the total.
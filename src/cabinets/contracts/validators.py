@@ -23,6 +23,12 @@ class Validator(Protocol):
     Attributes:
         name: Unique identifier for the validator (e.g., "woodworking", "obstacle").
 
+    Validators may additionally expose an optional ``dependencies`` attribute:
+    a tuple of top-level CabinetConfiguration field names the validator reads
+    (e.g. ``("cabinet", "room")``). ValidatorRegistry uses it to skip
+    validators whose inputs are unchanged within a ValidationSession.
+    Validators without it are treated as reading the whole configuration.
+
     Example:
         class MyValidator:
             @property
@@ -26,6 +26,8 @@ Infrastructure Integration (FRD-15):
 - ElectricalComponent: Outlet cutouts
 - CableManagementComponent: Cable grommets
 - VentilationComponent: Ventilation patterns
+- CutoutIndex: Per-panel spatial index for cutout overlap checks
+- check_infrastructure_conflicts: Cross-component cutout validation
 """
 
 from .context import ComponentContext as ComponentContext
@@ -92,6 +94,11 @@ from .desk import (
     LShapedDeskConfiguration as LShapedDeskConfiguration,
     MonitorShelfComponent as MonitorShelfComponent,
 )
+from .cutout_index import (
+    CutoutConflict as CutoutConflict,
+    CutoutIndex as CutoutIndex,
+    IndexedCutout as IndexedCutout,
+)
 from .infrastructure import (
     CableChannelSpec as CableChannelSpec,
     CableManagementComponent as CableManagementComponent,
@@ -103,6 +110,7 @@ from .infrastructure import (
     VentilationComponent as VentilationComponent,
     VentilationSpec as VentilationSpec,
     WireRouteSpec as WireRouteSpec,
+    check_infrastructure_conflicts as check_infrastructure_conflicts,
 )
 from .countertop import (
     DEFAULT_THICKNESS as COUNTERTOP_DEFAULT_THICKNESS,
@@ -239,6 +247,11 @@ __all__ = [
     "VentilationComponent",
     "VentilationSpec",
     "WireRouteSpec",
+    "check_infrastructure_conflicts",
+    # Cutout index
+    "CutoutConflict",
+    "CutoutIndex",
+    "IndexedCutout",
     # Countertop components and constants
     "COUNTERTOP_DEFAULT_THICKNESS",  # Alias
     "COUNTERTOP_MAX_THICKNESS",  # Alias
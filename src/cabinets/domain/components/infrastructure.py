@@ -8,12 +8,16 @@ This module provides infrastructure integration components for cabinet sections:
 - CableManagementComponent: Grommets for cable pass-through
 - VentilationComponent: Ventilation patterns for electronics cooling
 
+check_infrastructure_conflicts validates the cutouts of several components
+together through a shared CutoutIndex.
+
 All components follow the Component protocol and register with the component_registry.
 """
 
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -28,10 +32,33 @@ from ..value_objects import (
     VentilationPattern,
 )
 from .context import ComponentContext
+from .cutout_index import CutoutIndex
 from .registry import component_registry
 from .results import GenerationResult, HardwareItem, ValidationResult
 
 
+# --- Panel Geometry ---
+
+
+def _panel_dimensions(
+    panel: PanelType, context: ComponentContext
+) -> tuple[float, float]:
+    """Get the (width, height) of a panel in its own cutout coordinates.
+
+    Args:
+        panel: Panel the cutout is on.
+        context: Component context with dimensions.
+
+    Returns:
+        Tuple of (panel_width, panel_height) in inches.
+    """
+    if panel in (PanelType.LEFT_SIDE, PanelType.RIGHT_SIDE):
+        return context.depth, context.height
+    if panel in (PanelType.TOP, PanelType.BOTTOM):
+        return context.width, context.depth
+    return context.width, context.height
+
+
 # --- Spec Dataclasses ---
 
 
@@ -289,40 +316,14 @@ class _InfrastructureBase:
         Returns:
             List of error messages for overlapping cutouts.
         """
-        errors: list[str] = []
-
-        for i, cutout_a in enumerate(cutouts):
-            for j, cutout_b in enumerate(cutouts[i + 1 :], start=i + 1):
-                # Only check cutouts on the same panel
-                if cutout_a.panel != cutout_b.panel:
-                    continue
-
-                # Calculate bounds for each cutout
-                a_left = cutout_a.position.x - cutout_a.width / 2
-                a_right = cutout_a.position.x + cutout_a.width / 2
-                a_bottom = cutout_a.position.y - cutout_a.height / 2
-                a_top = cutout_a.position.y + cutout_a.height / 2
-
-                b_left = cutout_b.position.x - cutout_b.width / 2
-                b_right = cutout_b.position.x + cutout_b.width / 2
-                b_bottom = cutout_b.position.y - cutout_b.height / 2
-                b_top = cutout_b.position.y + cutout_b.height / 2
-
-                # Check for overlap (rectangles overlap if they don't not overlap)
-                overlaps = not (
-                    a_right <= b_left
-                    or b_right <= a_left
-                    or a_top <= b_bottom
-                    or b_top <= a_bottom
-                )
-
-                if overlaps:
-                    errors.append(
-                        f"Cutout {i} ({cutout_a.cutout_type}) overlaps with "
-                        f"cutout {j} ({cutout_b.cutout_type}) on {cutout_a.panel.value}"
-                    )
-
-        return errors
+        index = CutoutIndex()
+        index.add_panel_cutouts(type(self).__name__, cutouts)
+        return [
+            f"Cutout {conflict.first.index} ({conflict.first.cutout_type}) "
+            f"overlaps with cutout {conflict.second.index} "
+            f"({conflict.second.cutout_type}) on {conflict.panel}"
+            for conflict in index.overlaps()
+        ]
 
     def _cutout_to_dict(self, cutout: PanelCutout) -> dict[str, Any]:
         """Convert a PanelCutout to a serializable dictionary.
@@ -697,18 +698,7 @@ class ElectricalComponent(_InfrastructureBase):
             position = Point2D(x, y)
 
             # Determine panel dimensions based on panel type
-            if panel in (PanelType.LEFT_SIDE, PanelType.RIGHT_SIDE):
-                panel_width = context.depth
-                panel_height = context.height
-            elif panel == PanelType.BACK:
-                panel_width = context.width
-                panel_height = context.height
-            elif panel in (PanelType.TOP, PanelType.BOTTOM):
-                panel_width = context.width
-                panel_height = context.depth
-            else:
-                panel_width = context.width
-                panel_height = context.height
+            panel_width, panel_height = _panel_dimensions(panel, context)
 
             # Check edge distances
             edge_errors = self._validate_edge_distance(
@@ -895,18 +885,7 @@ class CableManagementComponent(_InfrastructureBase):
             position = Point2D(x, y)
 
             # Determine panel dimensions
-            if panel in (PanelType.LEFT_SIDE, PanelType.RIGHT_SIDE):
-                panel_width = context.depth
-                panel_height = context.height
-            elif panel == PanelType.BACK:
-                panel_width = context.width
-                panel_height = context.height
-            elif panel in (PanelType.TOP, PanelType.BOTTOM):
-                panel_width = context.width
-                panel_height = context.depth
-            else:
-                panel_width = context.width
-                panel_height = context.height
+            panel_width, panel_height = _panel_dimensions(panel, context)
 
             # Check edge distances (grommet is circular, so width = height = size)
             edge_errors = self._validate_edge_distance(
@@ -1112,18 +1091,7 @@ class VentilationComponent(_InfrastructureBase):
             position = Point2D(x, y)
 
             # Determine panel dimensions
-            if panel in (PanelType.LEFT_SIDE, PanelType.RIGHT_SIDE):
-                panel_width = context.depth
-                panel_height = context.height
-            elif panel == PanelType.BACK:
-                panel_width = context.width
-                panel_height = context.height
-            elif panel in (PanelType.TOP, PanelType.BOTTOM):
-                panel_width = context.width
-                panel_height = context.depth
-            else:
-                panel_width = context.width
-                panel_height = context.height
+            panel_width, panel_height = _panel_dimensions(panel, context)
 
             # Check edge distances
             edge_errors = self._validate_edge_distance(
@@ -1239,3 +1207,42 @@ class VentilationComponent(_InfrastructureBase):
             Empty list - ventilation is machined, no hardware needed.
         """
         return []
+
+
+# --- Cross-Component Validation ---
+
+
+def check_infrastructure_conflicts(
+    results: Mapping[str, GenerationResult],
+    context: ComponentContext,
+    min_edge: float = _InfrastructureBase.MIN_EDGE_DISTANCE,
+) -> ValidationResult:
+    """Validate the combined cutouts of several infrastructure components.
+
+    Each component validates its own configuration; this check builds one
+    CutoutIndex over the cutouts all of them generated, so cutouts from
+    different components that overlap (a grommet through an outlet box,
+    say) are caught too.
+
+    Args:
+        results: Generation results keyed by component identifier, e.g.
+            {"infrastructure.electrical": ..., "infrastructure.ventilation": ...}.
+        context: Component context with cabinet dimensions.
+        min_edge: Minimum distance from panel edges in inches.
+
+    Returns:
+        ValidationResult with an error per overlapping pair and per cutout
+        too close to a panel edge.
+    """
+    index = CutoutIndex.from_generation_results(results)
+    panel_sizes = {
+        panel.value: _panel_dimensions(panel, context) for panel in PanelType
+    }
+
+    errors = [conflict.message for conflict in index.overlaps()]
+    errors.extend(
+        f"{cutout.source} cutout {cutout.index} ({cutout.cutout_type}) is "
+        f'closer than {min_edge}" to the edge of the {cutout.panel} panel'
+        for cutout in index.edge_violations(panel_sizes, min_edge)
+    )
+    return ValidationResult(tuple(errors))
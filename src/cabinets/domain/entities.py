@@ -1,6 +1,5 @@
 """Domain entities for cabinet construction."""
 
-import math
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -13,8 +12,8 @@ from .value_objects import (
     ObstacleType,
     ObstacleZone,
     PanelType,
-    Point2D,
     Position,
+    RoomGeometry,
     SectionType,
     WallPosition,
 )
@@ -257,6 +256,10 @@ class Room:
     and runs along the positive X axis. Subsequent walls connect at the
     end of the previous wall, with direction changes based on their angle.
 
+    Derived geometry (wall positions, bounding box) is computed once and
+    cached in a RoomGeometry snapshot, which is rebuilt whenever a wall's
+    length or angle changes or walls are added or removed.
+
     Attributes:
         name: Identifier for the room.
         walls: List of wall segments that define the room boundary.
@@ -275,6 +278,22 @@ class Room:
             raise ValueError("Room must have at least one wall")
         if self.walls[0].angle != 0:
             raise ValueError("First wall must have angle=0")
+        # (wall lengths and angles, geometry computed from them)
+        self._geometry_cache: (
+            tuple[tuple[tuple[float, float], ...], RoomGeometry] | None
+        ) = None
+
+    @property
+    def geometry(self) -> RoomGeometry:
+        """Cached derived geometry of the room's walls.
+
+        Returns:
+            RoomGeometry snapshot for the current walls.
+        """
+        key = tuple((wall.length, wall.angle) for wall in self.walls)
+        if self._geometry_cache is None or self._geometry_cache[0] != key:
+            self._geometry_cache = (key, RoomGeometry.from_walls(key))
+        return self._geometry_cache[1]
 
     def get_wall_positions(self) -> list[WallPosition]:
         """Calculate global coordinates for each wall.
@@ -291,39 +310,7 @@ class Room:
         Returns:
             List of WallPosition objects with computed start/end coordinates.
         """
-        positions: list[WallPosition] = []
-
-        # Start at origin, facing along positive X axis (direction = 0 degrees)
-        current_x = 0.0
-        current_y = 0.0
-        current_direction = 0.0  # degrees from positive X axis
-
-        for i, wall in enumerate(self.walls):
-            # Apply the wall's angle to change direction
-            # Positive angle (90) = turn right = subtract from direction
-            # Negative angle (-90) = turn left = add to direction (subtract negative)
-            current_direction = (current_direction - wall.angle) % 360
-
-            # Calculate end point using trigonometry
-            # Convert direction to radians for math functions
-            direction_rad = math.radians(current_direction)
-            end_x = current_x + wall.length * math.cos(direction_rad)
-            end_y = current_y + wall.length * math.sin(direction_rad)
-
-            positions.append(
-                WallPosition(
-                    wall_index=i,
-                    start=Point2D(x=current_x, y=current_y),
-                    end=Point2D(x=end_x, y=end_y),
-                    direction=current_direction,
-                )
-            )
-
-            # Move to the end point for the next wall
-            current_x = end_x
-            current_y = end_y
-
-        return positions
+        return list(self.geometry.wall_positions)
 
     def validate_geometry(self) -> list[GeometryError]:
         """Check for geometry errors (self-intersection, closure gaps).
@@ -336,36 +323,22 @@ class Room:
             List of GeometryError objects describing any issues found.
         """
         errors: list[GeometryError] = []
-        positions = self.get_wall_positions()
-
-        # Check for self-intersection
-        for i, pos_i in enumerate(positions):
-            for j, pos_j in enumerate(positions):
-                # Only check pairs where j > i + 1 to avoid adjacent walls
-                # and avoid checking the same pair twice
-                if j <= i + 1:
-                    continue
-                # Also skip if first and last wall when checking closed room
-                # (they should meet, not intersect)
-                if i == 0 and j == len(positions) - 1 and self.is_closed:
-                    continue
-
-                if self._segments_intersect(pos_i, pos_j):
-                    errors.append(
-                        GeometryError(
-                            wall_indices=(i, j),
-                            message=f"Wall {i} intersects with wall {j}",
-                            error_type="intersection",
-                        )
-                    )
+        geometry = self.geometry
+        positions = geometry.wall_positions
+
+        # Check for self-intersection between non-adjacent walls
+        for i, j in geometry.intersecting_walls(self.is_closed):
+            errors.append(
+                GeometryError(
+                    wall_indices=(i, j),
+                    message=f"Wall {i} intersects with wall {j}",
+                    error_type="intersection",
+                )
+            )
 
         # Check closure gap if room should be closed
         if self.is_closed and positions:
-            start_point = positions[0].start
-            end_point = positions[-1].end
-            gap = math.sqrt(
-                (end_point.x - start_point.x) ** 2 + (end_point.y - start_point.y) ** 2
-            )
+            gap = geometry.closure_gap
             if gap > self.closure_tolerance:
                 errors.append(
                     GeometryError(
@@ -391,33 +364,7 @@ class Room:
         Returns:
             True if the segments intersect (excluding endpoints).
         """
-        # Extract coordinates
-        ax1, ay1 = pos_a.start.x, pos_a.start.y
-        ax2, ay2 = pos_a.end.x, pos_a.end.y
-        bx1, by1 = pos_b.start.x, pos_b.start.y
-        bx2, by2 = pos_b.end.x, pos_b.end.y
-
-        # Calculate cross products to determine if points are on opposite sides
-        def cross(
-            ox: float, oy: float, ax: float, ay: float, bx: float, by: float
-        ) -> float:
-            """Cross product of vectors (o->a) and (o->b)."""
-            return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
-
-        # Check if segment b straddles the line containing segment a
-        d1 = cross(ax1, ay1, ax2, ay2, bx1, by1)
-        d2 = cross(ax1, ay1, ax2, ay2, bx2, by2)
-
-        # Check if segment a straddles the line containing segment b
-        d3 = cross(bx1, by1, bx2, by2, ax1, ay1)
-        d4 = cross(bx1, by1, bx2, by2, ax2, ay2)
-
-        # Segments intersect if each straddles the other's line
-        # Use strict inequality to exclude endpoint touches
-        if d1 * d2 < 0 and d3 * d4 < 0:
-            return True
-
-        return False
+        return RoomGeometry.segments_intersect(pos_a, pos_b)
 
     @property
     def total_length(self) -> float:
@@ -435,28 +382,7 @@ class Room:
         Returns:
             Tuple of (width, depth) representing the bounding box dimensions.
         """
-        positions = self.get_wall_positions()
-
-        if not positions:
-            return (0.0, 0.0)
-
-        # Collect all x and y coordinates from wall positions
-        x_coords: list[float] = []
-        y_coords: list[float] = []
-
-        for pos in positions:
-            x_coords.extend([pos.start.x, pos.end.x])
-            y_coords.extend([pos.start.y, pos.end.y])
-
-        min_x = min(x_coords)
-        max_x = max(x_coords)
-        min_y = min(y_coords)
-        max_y = max(y_coords)
-
-        width = max_x - min_x
-        depth = max_y - min_y
-
-        return (width, depth)
+        return self.geometry.bounding_box
 
 
 @dataclass
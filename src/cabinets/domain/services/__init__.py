@@ -13,7 +13,7 @@ Import from subpackages for specialized functionality:
 from .cut_list import CutListGenerator
 from .layout_calculator import LayoutCalculator, LayoutParameters
 from .material_estimator import MaterialEstimate, MaterialEstimator
-from .panel_mapper import Panel3DMapper, RoomPanel3DMapper
+from .panel_mapper import Panel3DMapper, RoomPanel3DMapper, mapper_session
 
 # Obstacle handling
 from .obstacle import (
@@ -22,6 +22,7 @@ from .obstacle import (
 )
 
 # Geometry services (FRD-11)
+from .ceiling_field import CeilingField
 from .geometry import (
     OutsideCornerService,
     SkylightVoidService,
@@ -54,12 +55,14 @@ __all__ = [
     "MaterialEstimator",
     "Panel3DMapper",
     "RoomPanel3DMapper",
+    "mapper_session",
     # Room layout
     "RoomLayoutService",
     # Obstacle handling
     "ObstacleAwareLayoutService",
     "ObstacleCollisionService",
     # Geometry (FRD-11)
+    "CeilingField",
     "OutsideCornerService",
     "SkylightVoidService",
     "SlopedCeilingService",
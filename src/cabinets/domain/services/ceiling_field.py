@@ -0,0 +1,273 @@
+"""Precomputed ceiling field for batch height and void queries.
+
+A CeilingField is built once per room from its ceiling description (a
+sloped ceiling along the wall, skylights, and/or a radial bay ceiling) and
+answers height and void queries for whole arrays of sample points at once.
+Ceiling-aware services (SlopedCeilingService, SkylightVoidService,
+RadialCeilingService, PanelGeometryService) query it in batch instead of
+evaluating the value objects point by point.
+
+Results are identical to the scalar value object methods
+(CeilingSlope.height_at_position, Skylight.void_at_depth and
+RadialCeilingGeometry.height_at_point): the same floating point operations
+are applied element-wise, in the same order.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from math import radians, tan
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..value_objects import CeilingSlope, RadialCeilingGeometry, Skylight
+
+__all__ = ["CeilingField", "section_starts"]
+
+# Maximum number of distinct rooms whose fields are kept by for_room()
+_FIELD_CACHE_SIZE = 64
+
+
+class CeilingField:
+    """Ceiling heights and skylight voids of one room, evaluated in batch.
+
+    Slope coordinates are x positions along the wall, measured from its
+    left end. Radial coordinates are (x, y) points in room space.
+
+    Example:
+        >>> field = CeilingField.for_room(slope=slope, wall_length=96.0)
+        >>> field.section_heights([24.0, 24.0, 48.0])
+        array([...])
+    """
+
+    def __init__(
+        self,
+        slope: CeilingSlope | None = None,
+        wall_length: float = 0.0,
+        skylights: Sequence[Skylight] = (),
+        radial: RadialCeilingGeometry | None = None,
+    ) -> None:
+        """Build the field's lookup tables.
+
+        Args:
+            slope: Sloped ceiling along the wall, if any.
+            wall_length: Wall length in inches (needed for right_to_left slopes).
+            skylights: Skylights projecting into the cabinet space.
+            radial: Radial ceiling geometry of a bay alcove, if any.
+        """
+        self.slope = slope
+        self.wall_length = wall_length
+        self.skylights = tuple(skylights)
+        self.radial = radial
+
+        self._slope_tan = tan(radians(slope.angle)) if slope is not None else 0.0
+        self._voids: dict[float, tuple[np.ndarray, np.ndarray]] = {}
+
+        # Facet lookup table: edge centers, facet runs and edge heights
+        if radial is not None:
+            facets = radial.facets
+            apex = radial.apex
+            self._facet_cx = np.array(
+                [(f.edge_start.x + f.edge_end.x) / 2 for f in facets]
+            )
+            self._facet_cy = np.array(
+                [(f.edge_start.y + f.edge_end.y) / 2 for f in facets]
+            )
+            self._facet_run = np.sqrt(
+                (apex.x - self._facet_cx) ** 2 + (apex.y - self._facet_cy) ** 2
+            )
+            self._facet_edge_height = np.array([f.edge_height for f in facets])
+
+    @classmethod
+    def for_room(
+        cls,
+        slope: CeilingSlope | None = None,
+        wall_length: float = 0.0,
+        skylights: Sequence[Skylight] = (),
+        radial: RadialCeilingGeometry | None = None,
+    ) -> CeilingField:
+        """Get the shared field for a ceiling description.
+
+        Fields are cached by their (hashable) inputs, so services called
+        repeatedly for the same room reuse one set of lookup tables.
+
+        Args:
+            slope: Sloped ceiling along the wall, if any.
+            wall_length: Wall length in inches.
+            skylights: Skylights projecting into the cabinet space.
+            radial: Radial ceiling geometry, if any.
+
+        Returns:
+            Shared CeilingField for these inputs.
+        """
+        return _shared_field(slope, float(wall_length), tuple(skylights), radial)
+
+    def slope_heights(self, xs: ArrayLike, clamp: bool = True) -> np.ndarray:
+        """Ceiling heights at positions along the wall.
+
+        Args:
+            xs: X positions from the wall's left end in inches.
+            clamp: Raise heights below the slope's min_height to min_height.
+
+        Returns:
+            Heights in inches, one per position.
+
+        Raises:
+            ValueError: If the field has no sloped ceiling.
+        """
+        slope = self._require_slope()
+        xs = np.asarray(xs, dtype=np.float64)
+        if slope.direction == "right_to_left":
+            positions = self.wall_length - xs
+        else:
+            positions = xs
+        heights = slope.start_height - (positions * self._slope_tan)
+        if clamp:
+            heights = np.where(heights < slope.min_height, slope.min_height, heights)
+        return heights
+
+    def section_heights(self, widths: ArrayLike, clamp: bool = True) -> np.ndarray:
+        """Ceiling heights at the midpoints of consecutive sections.
+
+        Args:
+            widths: Widths of sections laid out left to right from x=0.
+            clamp: Raise heights below the slope's min_height to min_height.
+
+        Returns:
+            Heights in inches, one per section.
+        """
+        widths = np.asarray(widths, dtype=np.float64)
+        return self.slope_heights(section_starts(widths) + widths / 2, clamp)
+
+    def section_edge_heights(
+        self, xs: ArrayLike, widths: ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Clamped ceiling heights at the left and right edges of sections.
+
+        Args:
+            xs: X positions of section left edges in inches.
+            widths: Section widths in inches.
+
+        Returns:
+            Tuple of (left_heights, right_heights).
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        widths = np.asarray(widths, dtype=np.float64)
+        return self.slope_heights(xs), self.slope_heights(xs + widths)
+
+    def skylight_voids(self, cabinet_depth: float) -> tuple[np.ndarray, np.ndarray]:
+        """Skylight void extents at a cabinet depth.
+
+        Computed once per depth and cached.
+
+        Args:
+            cabinet_depth: Cabinet depth in inches.
+
+        Returns:
+            Tuple of (void_starts, void_ends) x positions, one per skylight.
+        """
+        voids = self._voids.get(cabinet_depth)
+        if voids is None:
+            extents = [s.void_at_depth(cabinet_depth) for s in self.skylights]
+            starts = np.array([x for x, _ in extents], dtype=np.float64)
+            widths = np.array([w for _, w in extents], dtype=np.float64)
+            voids = self._voids[cabinet_depth] = (starts, starts + widths)
+        return voids
+
+    def void_overlaps(
+        self, xs: ArrayLike, widths: ArrayLike, cabinet_depth: float
+    ) -> np.ndarray:
+        """Which skylight voids intersect which sections.
+
+        Args:
+            xs: X positions of section left edges in inches.
+            widths: Section widths in inches.
+            cabinet_depth: Cabinet depth in inches.
+
+        Returns:
+            Boolean array of shape (sections, skylights).
+        """
+        xs = np.asarray(xs, dtype=np.float64)[:, None]
+        ends = xs + np.asarray(widths, dtype=np.float64)[:, None]
+        void_starts, void_ends = self.skylight_voids(cabinet_depth)
+        return ~((void_ends <= xs) | (void_starts >= ends))
+
+    def facet_indices(self, xs: ArrayLike, ys: ArrayLike) -> np.ndarray:
+        """Index of the facet above each point (closest wall edge center).
+
+        Args:
+            xs: X coordinates in inches.
+            ys: Y coordinates in inches.
+
+        Returns:
+            Facet indices into ``radial.facets``.
+
+        Raises:
+            ValueError: If the field has no radial ceiling.
+        """
+        self._require_radial()
+        xs = np.asarray(xs, dtype=np.float64)[..., None]
+        ys = np.asarray(ys, dtype=np.float64)[..., None]
+        dists = np.sqrt((xs - self._facet_cx) ** 2 + (ys - self._facet_cy) ** 2)
+        # argmin picks the first facet on ties, like the scalar scan
+        return np.argmin(dists, axis=-1)
+
+    def radial_heights(self, xs: ArrayLike, ys: ArrayLike) -> np.ndarray:
+        """Radial ceiling heights at points in room space.
+
+        Args:
+            xs: X coordinates in inches.
+            ys: Y coordinates in inches.
+
+        Returns:
+            Heights in inches, one per point.
+        """
+        radial = self._require_radial()
+        facet = self.facet_indices(xs, ys)
+        apex = radial.apex
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        run = self._facet_run[facet]
+        point_dist = np.sqrt((apex.x - xs) ** 2 + (apex.y - ys) ** 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.minimum(1.0, point_dist / run)
+        heights = apex.z - t * (apex.z - self._facet_edge_height[facet])
+        # Degenerate facets (apex above the edge center) are at apex height
+        return np.where(run == 0, apex.z, heights)
+
+    def _require_slope(self) -> CeilingSlope:
+        if self.slope is None:
+            raise ValueError("Ceiling field has no sloped ceiling")
+        return self.slope
+
+    def _require_radial(self) -> RadialCeilingGeometry:
+        if self.radial is None:
+            raise ValueError("Ceiling field has no radial ceiling")
+        return self.radial
+
+
+def section_starts(widths: np.ndarray) -> np.ndarray:
+    """Left edge positions of consecutive sections laid out from x=0.
+
+    Args:
+        widths: Section widths in inches.
+
+    Returns:
+        X position of each section's left edge.
+    """
+    if widths.size == 0:
+        return widths
+    # cumsum adds in order, matching a running total
+    return np.concatenate(([0.0], np.cumsum(widths)[:-1]))
+
+
+@lru_cache(maxsize=_FIELD_CACHE_SIZE)
+def _shared_field(
+    slope: CeilingSlope | None,
+    wall_length: float,
+    skylights: tuple[Skylight, ...],
+    radial: RadialCeilingGeometry | None,
+) -> CeilingField:
+    return CeilingField(slope, wall_length, skylights, radial)
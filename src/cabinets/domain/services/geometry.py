@@ -11,6 +11,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
+
 if TYPE_CHECKING:
     pass
 
@@ -25,6 +27,7 @@ from ..value_objects import (
     Skylight,
     TaperSpec,
 )
+from .ceiling_field import CeilingField, section_starts
 
 __all__ = [
     "SlopedCeilingService",
@@ -41,6 +44,8 @@ class SlopedCeilingService:
     under sloped ceilings, such as in attic spaces or vaulted ceiling areas.
     It determines the appropriate height for each cabinet section based on its
     position along the slope and generates taper specifications for top panels.
+
+    Heights are evaluated in batch on the room's shared CeilingField.
     """
 
     def calculate_section_heights(
@@ -63,29 +68,8 @@ class SlopedCeilingService:
         Returns:
             List of calculated heights for each section in inches.
         """
-        heights = []
-        current_position = 0.0
-
-        for width in section_widths:
-            # Use section midpoint for height calculation
-            midpoint = current_position + width / 2
-
-            # Calculate position based on direction
-            if slope.direction == "right_to_left":
-                position = wall_length - midpoint
-            else:
-                position = midpoint
-
-            height = slope.height_at_position(position)
-
-            # Clamp to minimum height
-            if height < slope.min_height:
-                height = slope.min_height
-
-            heights.append(height)
-            current_position += width
-
-        return heights
+        field = CeilingField.for_room(slope=slope, wall_length=wall_length)
+        return field.section_heights(section_widths).tolist()
 
     def calculate_section_edge_heights(
         self,
@@ -108,20 +92,33 @@ class SlopedCeilingService:
         Returns:
             Tuple of (left_height, right_height) in inches.
         """
-        left_x = section_x
-        right_x = section_x + section_width
+        field = CeilingField.for_room(slope=slope, wall_length=wall_length)
+        left, right = field.section_edge_heights([section_x], [section_width])
+        return (float(left[0]), float(right[0]))
 
-        if slope.direction == "right_to_left":
-            left_pos = wall_length - left_x
-            right_pos = wall_length - right_x
-        else:
-            left_pos = left_x
-            right_pos = right_x
+    def calculate_all_section_edge_heights(
+        self,
+        section_widths: list[float],
+        slope: CeilingSlope,
+        wall_length: float,
+    ) -> list[tuple[float, float]]:
+        """Calculate left and right edge heights for consecutive sections.
 
-        left_height = max(slope.height_at_position(left_pos), slope.min_height)
-        right_height = max(slope.height_at_position(right_pos), slope.min_height)
+        Batch form of calculate_section_edge_heights() for sections laid out
+        left to right from the start of the wall.
 
-        return (left_height, right_height)
+        Args:
+            section_widths: Width of each section in inches.
+            slope: CeilingSlope definition.
+            wall_length: Total wall length in inches.
+
+        Returns:
+            List of (left_height, right_height) tuples, one per section.
+        """
+        field = CeilingField.for_room(slope=slope, wall_length=wall_length)
+        widths = np.asarray(section_widths, dtype=np.float64)
+        left, right = field.section_edge_heights(section_starts(widths), widths)
+        return list(zip(left.tolist(), right.tolist()))
 
     def generate_taper_spec(
         self,
@@ -149,7 +146,36 @@ class SlopedCeilingService:
         left_height, right_height = self.calculate_section_edge_heights(
             section_x, section_width, slope, wall_length
         )
+        return self._taper_spec(left_height, right_height)
+
+    def generate_taper_specs(
+        self,
+        section_widths: list[float],
+        slope: CeilingSlope,
+        wall_length: float,
+    ) -> list[TaperSpec | None]:
+        """Generate TaperSpecs for consecutive sections under a sloped ceiling.
 
+        Batch form of generate_taper_spec() for sections laid out left to
+        right from the start of the wall.
+
+        Args:
+            section_widths: Width of each section in inches.
+            slope: CeilingSlope definition.
+            wall_length: Total wall length in inches.
+
+        Returns:
+            TaperSpec (or None if no taper is needed) for each section.
+        """
+        return [
+            self._taper_spec(left_height, right_height)
+            for left_height, right_height in self.calculate_all_section_edge_heights(
+                section_widths, slope, wall_length
+            )
+        ]
+
+    def _taper_spec(self, left_height: float, right_height: float) -> TaperSpec | None:
+        """Build the TaperSpec for a section from its edge heights."""
         # No taper needed if heights are equal (within tolerance)
         if abs(left_height - right_height) < 0.001:
             return None
@@ -189,30 +215,21 @@ class SlopedCeilingService:
             for each section that violates the minimum height requirement.
             Empty list if no violations are detected.
         """
-        violations = []
-        current_position = 0.0
-
-        for i, width in enumerate(section_widths):
-            midpoint = current_position + width / 2
-
-            if slope.direction == "right_to_left":
-                position = wall_length - midpoint
-            else:
-                position = midpoint
-
-            height = slope.height_at_position(position)
-
-            if height < slope.min_height:
-                violations.append((i, height, slope.min_height))
-
-            current_position += width
-
-        return violations
+        field = CeilingField.for_room(slope=slope, wall_length=wall_length)
+        heights = field.section_heights(section_widths, clamp=False)
+        return [
+            (i, float(heights[i]), slope.min_height)
+            for i in np.flatnonzero(heights < slope.min_height).tolist()
+        ]
 
 
 @dataclass
 class SkylightVoidService:
-    """Calculates skylight void intersections with cabinet sections."""
+    """Calculates skylight void intersections with cabinet sections.
+
+    Void extents are computed once per cabinet depth on the shared
+    CeilingField and intersected with all sections in batch.
+    """
 
     def calculate_void_intersection(
         self,
@@ -240,6 +257,17 @@ class SkylightVoidService:
         if void_end <= section_x or void_x >= section_end:
             return None  # No intersection
 
+        return self._notch(skylight, void_x, void_end, section_x, section_width)
+
+    def _notch(
+        self,
+        skylight: Skylight,
+        void_x: float,
+        void_end: float,
+        section_x: float,
+        section_width: float,
+    ) -> NotchSpec:
+        """Build the notch for a void known to intersect a section."""
         # Calculate notch dimensions relative to section
         notch_x = max(0.0, void_x - section_x)
         notch_end = min(section_width, void_end - section_x)
@@ -270,14 +298,9 @@ class SkylightVoidService:
         Returns:
             List of NotchSpecs for all intersecting skylights
         """
-        notches = []
-        for skylight in skylights:
-            notch = self.calculate_void_intersection(
-                skylight, section_x, section_width, cabinet_depth
-            )
-            if notch is not None:
-                notches.append(notch)
-        return notches
+        return self.get_sections_with_voids(
+            skylights, [(section_x, section_width)], cabinet_depth
+        ).get(0, [])
 
     def get_sections_with_voids(
         self,
@@ -295,13 +318,27 @@ class SkylightVoidService:
         Returns:
             Dict mapping section index to list of NotchSpecs
         """
-        result = {}
-        for i, (section_x, section_width) in enumerate(section_specs):
-            notches = self.calculate_all_intersections(
-                skylights, section_x, section_width, cabinet_depth
+        result: dict[int, list[NotchSpec]] = {}
+        if not skylights or not section_specs:
+            return result
+
+        field = CeilingField.for_room(skylights=skylights)
+        void_starts, void_ends = field.skylight_voids(cabinet_depth)
+        xs = [x for x, _ in section_specs]
+        widths = [w for _, w in section_specs]
+        overlaps = field.void_overlaps(xs, widths, cabinet_depth)
+
+        for i, k in zip(*np.nonzero(overlaps)):
+            section_x, section_width = section_specs[i]
+            result.setdefault(int(i), []).append(
+                self._notch(
+                    skylights[k],
+                    float(void_starts[k]),
+                    float(void_ends[k]),
+                    section_x,
+                    section_width,
+                )
             )
-            if notches:
-                result[i] = notches
         return result
 
     def check_void_exceeds_section(
@@ -33,6 +33,7 @@ from .models import (
     CleatSpec,
     InstallationPlan,
     StudHitAnalysis,
+    StudPlacement,
     WeightEstimate,
 )
 
@@ -53,6 +54,7 @@ __all__ = [
     "CleatSpec",
     "InstallationPlan",
     "StudHitAnalysis",
+    "StudPlacement",
     "WeightEstimate",
     # Main service facade (backward compatible API)
     "InstallationService",
@@ -6,6 +6,7 @@ backward compatibility with the original monolithic installation module.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from ...components.results import HardwareItem
@@ -20,6 +21,7 @@ from .instruction_generator import InstructionGenerator
 from .models import (
     InstallationPlan,
     StudHitAnalysis,
+    StudPlacement,
     WeightEstimate,
 )
 from .mounting_service import MountingService
@@ -156,6 +158,50 @@ class InstallationService:
         """
         return self._stud_analyzer.calculate_stud_hits(cabinet, left_edge)
 
+    def find_stud_placements(
+        self,
+        cabinet: "Cabinet",
+        wall_length: float,
+        *,
+        min_left: float = 0.0,
+        max_left: float | None = None,
+        step: float = 0.25,
+        width_deltas: Sequence[float] = (0.0,),
+        preferred_left: float | None = None,
+        top_n: int = 5,
+    ) -> tuple[StudPlacement, ...]:
+        """Find cabinet placements along a wall that maximize stud hits.
+
+        Sweeps candidate left edge positions (and optional width
+        adjustments) along the wall and ranks them by stud alignment of
+        the cabinet span, French cleat, and standard mounting points.
+
+        Args:
+            cabinet: Cabinet to place.
+            wall_length: Length of the wall in inches.
+            min_left: Leftmost left edge position to consider.
+            max_left: Rightmost left edge position to consider. Defaults to
+                the last position where the cabinet still fits the wall.
+            step: Distance between candidate left edge positions.
+            width_deltas: Cabinet width adjustments to consider.
+            preferred_left: Position to prefer among equally scored
+                candidates. Defaults to ``min_left``.
+            top_n: Maximum number of placements to return.
+
+        Returns:
+            Up to ``top_n`` placements, best first.
+        """
+        return self._stud_analyzer.find_best_placements(
+            cabinet.width,
+            wall_length,
+            min_left=min_left,
+            max_left=max_left,
+            step=step,
+            width_deltas=width_deltas,
+            preferred_left=preferred_left,
+            top_n=top_n,
+        )
+
     def estimate_weight(self, cabinet: "Cabinet") -> WeightEstimate:
         """Estimate cabinet weight and expected load.
 
@@ -3,6 +3,7 @@
 This module provides data models for cabinet installation specifications:
 - CleatSpec: French cleat specification
 - StudHitAnalysis: Stud alignment analysis
+- StudPlacement: Candidate placement scored by stud alignment
 - WeightEstimate: Cabinet weight estimation
 - InstallationPlan: Complete installation specification
 """
@@ -102,6 +103,43 @@ class StudHitAnalysis:
         return (self.stud_hit_count / total) * 100
 
 
+@dataclass(frozen=True)
+class StudPlacement:
+    """Candidate cabinet placement scored by stud alignment.
+
+    Produced by the placement search, which evaluates many left edge
+    positions and cabinet widths along a wall at once.
+
+    Attributes:
+        left_edge: Position of cabinet left edge from wall start in inches.
+        width: Cabinet width in inches for this candidate.
+        stud_hit_count: Number of studs within the cabinet span.
+        mounting_point_hits: Number of standard mounting points over a stud.
+        mounting_point_count: Total number of standard mounting points.
+        cleat_stud_hits: Number of studs behind a centered French cleat.
+        width_delta: Change from the requested cabinet width in inches.
+    """
+
+    left_edge: float
+    width: float
+    stud_hit_count: int
+    mounting_point_hits: int
+    mounting_point_count: int
+    cleat_stud_hits: int
+    width_delta: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.width <= 0:
+            raise ValueError("Cabinet width must be positive")
+        if self.mounting_point_hits > self.mounting_point_count:
+            raise ValueError("Mounting point hits cannot exceed mounting points")
+
+    @property
+    def right_edge(self) -> float:
+        """Position of cabinet right edge from wall start in inches."""
+        return self.left_edge + self.width
+
+
 @dataclass(frozen=True)
 class WeightEstimate:
     """Estimated cabinet weight and load.
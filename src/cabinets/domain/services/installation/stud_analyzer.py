@@ -1,15 +1,20 @@
 """Stud hit analysis service.
 
 This module provides the StudAnalyzer class for analyzing wall stud
-alignment with cabinet mounting points.
+alignment with cabinet mounting points, and for searching placements
+along a wall that maximize stud alignment.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
+
+from ...value_objects import MountingSystem
 from .config import InstallationConfig
-from .models import StudHitAnalysis
+from .models import StudHitAnalysis, StudPlacement
 
 if TYPE_CHECKING:
     from ...entities import Cabinet
@@ -23,6 +28,16 @@ class StudAnalyzer:
     stud spacing and offset.
     """
 
+    # Standard mounting point spacing and offset from cabinet edges
+    MOUNTING_INTERVAL: ClassVar[float] = 16.0
+    EDGE_OFFSET: ClassVar[float] = 3.0
+
+    # Maximum distance from a mounting point to a stud center to count as a hit
+    STUD_TOLERANCE: ClassVar[float] = 0.5
+
+    # Slack for floating point comparisons of stud positions
+    _EPSILON: ClassVar[float] = 1e-9
+
     def __init__(self, config: InstallationConfig) -> None:
         """Initialize the stud analyzer.
 
@@ -64,8 +79,8 @@ class StudAnalyzer:
         # Calculate potential mounting points that miss studs
         # Mounting points are typically at the cabinet edges and at regular intervals
         # Standard mounting points: near left edge, near right edge, and any in between
-        mounting_interval = 16.0  # Standard mounting point spacing
-        edge_offset = 3.0  # Offset from cabinet edge for mounting points
+        mounting_interval = self.MOUNTING_INTERVAL
+        edge_offset = self.EDGE_OFFSET
 
         # Collect all potential mounting point positions
         potential_points: list[float] = []
@@ -79,7 +94,7 @@ class StudAnalyzer:
             current_point += mounting_interval
 
         # Determine which points hit studs (within 0.5" tolerance)
-        stud_tolerance = 0.5
+        stud_tolerance = self.STUD_TOLERANCE
         for point in potential_points:
             hits_stud = False
             for stud_pos in stud_positions:
@@ -114,3 +129,150 @@ class StudAnalyzer:
             stud_hit_count=stud_hit_count,
             recommendation=recommendation,
         )
+
+    def find_best_placements(
+        self,
+        cabinet_width: float,
+        wall_length: float,
+        *,
+        min_left: float = 0.0,
+        max_left: float | None = None,
+        step: float = 0.25,
+        width_deltas: Sequence[float] = (0.0,),
+        preferred_left: float | None = None,
+        top_n: int = 5,
+    ) -> tuple[StudPlacement, ...]:
+        """Search cabinet placements along a wall for the best stud alignment.
+
+        Sweeps left edge positions from ``min_left`` to ``max_left`` in
+        ``step`` increments for every cabinet width in ``cabinet_width +
+        width_deltas``, and scores all candidates at once with array
+        operations. Candidates that would extend past the wall are skipped.
+
+        Candidates are ranked by studs behind the French cleat (when the
+        mounting system uses cleats) or studs within the cabinet span,
+        then by standard mounting points landing on a stud, then by
+        distance from ``preferred_left`` and finally by the smallest
+        width change.
+
+        Args:
+            cabinet_width: Requested cabinet width in inches.
+            wall_length: Length of the wall in inches.
+            min_left: Leftmost left edge position to consider.
+            max_left: Rightmost left edge position to consider. Defaults to
+                the last position where the cabinet still fits the wall.
+            step: Distance between candidate left edge positions.
+            width_deltas: Width adjustments to consider, e.g. from
+                resizing fill sections. Use (0.0,) for a fixed width.
+            preferred_left: Position to prefer among equally scored
+                candidates. Defaults to ``min_left``.
+            top_n: Maximum number of placements to return.
+
+        Returns:
+            Up to ``top_n`` placements, best first. Empty if the cabinet
+            does not fit the wall at any candidate position.
+
+        Raises:
+            ValueError: If step, top_n, or any candidate width is not positive.
+        """
+        if step <= 0:
+            raise ValueError("Step must be positive")
+        if top_n <= 0:
+            raise ValueError("top_n must be positive")
+
+        deltas = np.asarray(width_deltas, dtype=float)
+        widths = cabinet_width + deltas
+        if len(widths) == 0 or np.any(widths <= 0):
+            raise ValueError("Candidate cabinet widths must be positive")
+
+        upper = wall_length - widths.min() if max_left is None else max_left
+        if upper < min_left - self._EPSILON:
+            return ()
+        num_positions = int(np.floor((upper - min_left) / step + self._EPSILON)) + 1
+        positions = min_left + step * np.arange(num_positions)
+
+        # Cartesian product of widths x positions, dropping candidates past the wall
+        width_index = np.repeat(np.arange(len(widths)), num_positions)
+        lefts = np.tile(positions, len(widths))
+        fits = lefts + widths[width_index] <= wall_length + self._EPSILON
+        width_index = width_index[fits]
+        lefts = lefts[fits]
+        if len(lefts) == 0:
+            return ()
+        candidate_widths = widths[width_index]
+
+        stud_counts = self._count_studs(lefts, lefts + candidate_widths)
+
+        cleat_widths = candidate_widths * (self.config.cleat_width_percentage / 100.0)
+        cleat_lefts = lefts + (candidate_widths - cleat_widths) / 2
+        cleat_counts = self._count_studs(cleat_lefts, cleat_lefts + cleat_widths)
+
+        # Mounting point offsets per width, padded with NaN to a common length
+        offsets = [self._mounting_offsets(float(width)) for width in widths]
+        max_points = max(len(row) for row in offsets)
+        offset_table = np.full((len(widths), max_points), np.nan)
+        for row, row_offsets in enumerate(offsets):
+            offset_table[row, : len(row_offsets)] = row_offsets
+
+        points = lefts[:, None] + offset_table[width_index]
+        valid = ~np.isnan(points)
+        point_hits = (self._hits_stud(points) & valid).sum(axis=1)
+        point_counts = valid.sum(axis=1)
+
+        if self.config.mounting_system == MountingSystem.FRENCH_CLEAT:
+            primary, secondary = cleat_counts, stud_counts
+        else:
+            primary, secondary = stud_counts, cleat_counts
+        target = min_left if preferred_left is None else preferred_left
+        # np.lexsort sorts by the last key first, ascending
+        order = np.lexsort(
+            (
+                np.abs(deltas[width_index]),
+                np.abs(lefts - target),
+                -secondary,
+                -point_hits,
+                -primary,
+            )
+        )
+
+        return tuple(
+            StudPlacement(
+                left_edge=round(float(lefts[i]), 6),
+                width=round(float(candidate_widths[i]), 6),
+                stud_hit_count=int(stud_counts[i]),
+                mounting_point_hits=int(point_hits[i]),
+                mounting_point_count=int(point_counts[i]),
+                cleat_stud_hits=int(cleat_counts[i]),
+                width_delta=float(deltas[width_index[i]]),
+            )
+            for i in order[:top_n]
+        )
+
+    def _mounting_offsets(self, width: float) -> list[float]:
+        """Get standard mounting point offsets from the cabinet left edge.
+
+        Mirrors the mounting points used by calculate_stud_hits.
+        """
+        offsets = [self.EDGE_OFFSET, width - self.EDGE_OFFSET]
+        current = self.EDGE_OFFSET + self.MOUNTING_INTERVAL
+        while current < width - self.EDGE_OFFSET:
+            offsets.append(current)
+            current += self.MOUNTING_INTERVAL
+        return offsets
+
+    def _count_studs(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Count studs within each closed span [start, end]."""
+        spacing = self.config.stud_spacing
+        offset = self.config.stud_offset
+        first = np.maximum(np.ceil((starts - offset) / spacing - self._EPSILON), 0)
+        last = np.floor((ends - offset) / spacing + self._EPSILON)
+        return np.maximum(last - first + 1, 0).astype(int)
+
+    def _hits_stud(self, points: np.ndarray) -> np.ndarray:
+        """Check whether each point is within tolerance of a stud center."""
+        spacing = self.config.stud_spacing
+        offset = self.config.stud_offset
+        with np.errstate(invalid="ignore"):
+            nearest = np.maximum(np.round((points - offset) / spacing), 0)
+            distance = np.abs(points - (offset + nearest * spacing))
+            return distance <= self.STUD_TOLERANCE + self._EPSILON
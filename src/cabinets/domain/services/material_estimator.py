@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from ..value_objects import CutListTable
+
 if TYPE_CHECKING:
     from ..value_objects import CutPiece, MaterialSpec
 
@@ -43,15 +46,11 @@ class MaterialEstimator:
         self.waste_factor = waste_factor
 
     def estimate(
-        self, cut_list: list[CutPiece]
+        self, cut_list: Sequence[CutPiece] | CutListTable
     ) -> dict[MaterialSpec, MaterialEstimate]:
         """Estimate materials needed for a cut list, grouped by material type."""
-        # Group pieces by material
-        material_areas: dict[MaterialSpec, float] = {}
-        for piece in cut_list:
-            if piece.material not in material_areas:
-                material_areas[piece.material] = 0
-            material_areas[piece.material] += piece.area
+        # Group piece areas by material
+        material_areas = CutListTable.coerce(cut_list).area_by_material()
 
         # Calculate estimates per material
         estimates: dict[MaterialSpec, MaterialEstimate] = {}
@@ -67,9 +66,11 @@ class MaterialEstimator:
 
         return estimates
 
-    def estimate_total(self, cut_list: list[CutPiece]) -> MaterialEstimate:
+    def estimate_total(
+        self, cut_list: Sequence[CutPiece] | CutListTable
+    ) -> MaterialEstimate:
         """Estimate total materials needed (all types combined)."""
-        total_area = sum(piece.area for piece in cut_list)
+        total_area = CutListTable.coerce(cut_list).total_area()
         area_with_waste = total_area * (1 + self.waste_factor)
         return MaterialEstimate(
             total_area_sqin=total_area,
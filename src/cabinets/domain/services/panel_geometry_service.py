@@ -160,16 +160,19 @@ class PanelGeometryService:
         geometry = self.ceiling_service.build_radial_ceiling_geometry()
         tapers: list[PanelTaperSpec] = []
 
-        for seg in segments:
-            # Get ceiling height at wall midpoint (front of cabinet)
-            front_height = geometry.height_at_point(seg.midpoint.x, seg.midpoint.y)
+        # Ceiling heights at all wall midpoints (front of cabinet) in one batch
+        front_heights = self.ceiling_service.get_ceiling_heights_at(
+            [seg.midpoint.x for seg in segments],
+            [seg.midpoint.y for seg in segments],
+        ).tolist()
 
+        for seg, front_height in zip(segments, front_heights):
             # Use edge_height as back reference (where cabinet meets wall)
             back_height = geometry.edge_height
 
             # Only create taper spec if there's a meaningful height difference
             # (> 0.5" to avoid floating point noise)
-            if front_height is not None and abs(front_height - back_height) > 0.5:
+            if abs(front_height - back_height) > 0.5:
                 tapers.append(
                     PanelTaperSpec(
                         wall_index=seg.index,
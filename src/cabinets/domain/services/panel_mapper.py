@@ -2,13 +2,26 @@
 
 This module provides services for mapping 2D panel representations to 3D
 bounding boxes, supporting both single cabinet and multi-cabinet room scenarios.
+
+Mapping is memoized: a Panel3DMapper keeps the panels it generated and the
+box of every panel it mapped. Inside a mapper_session(),
+Panel3DMapper.for_cabinet() shares one mapper per cabinet, so exporting the
+same layout to several formats maps each panel once. Sharing ends with the
+session, so cabinets changed between exports are always mapped afresh.
+Room transforms are applied to all boxes in one NumPy batch.
 """
 
 from __future__ import annotations
 
 import math
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from ..value_objects import BoundingBox3D, PanelType, Position3D, SectionTransform
 from .panel_generation import PanelGenerationService
 
@@ -18,9 +31,56 @@ if TYPE_CHECKING:
 __all__ = [
     "Panel3DMapper",
     "RoomPanel3DMapper",
+    "mapper_session",
 ]
 
 
+class _MapperSession:
+    """Mappers shared by the exports of one session, keyed by cabinet identity."""
+
+    def __init__(self) -> None:
+        self._mappers: dict[int, Panel3DMapper] = {}
+        self._lock = threading.Lock()
+
+    def mapper_for(self, cabinet: Cabinet) -> Panel3DMapper:
+        with self._lock:
+            mapper = self._mappers.get(id(cabinet))
+            # The mapper keeps its cabinet alive, so the id cannot be reused
+            if mapper is None or mapper.cabinet is not cabinet:
+                mapper = Panel3DMapper(cabinet)
+                self._mappers[id(cabinet)] = mapper
+            return mapper
+
+
+_session: ContextVar[_MapperSession | None] = ContextVar(
+    "panel_mapper_session", default=None
+)
+
+
+@contextmanager
+def mapper_session() -> Iterator[None]:
+    """Share panel mappers between the exports run inside the block.
+
+    Within the block, Panel3DMapper.for_cabinet() returns one mapper per
+    cabinet object, so the cabinet's panels are generated and mapped once
+    for all formats. Cabinets must not be modified inside the block.
+    Nested sessions reuse the outer one.
+
+    Example:
+        with mapper_session():
+            for exporter in exporters:
+                exporter.export(output, path)
+    """
+    if _session.get() is not None:
+        yield
+        return
+    token = _session.set(_MapperSession())
+    try:
+        yield
+    finally:
+        _session.reset(token)
+
+
 class Panel3DMapper:
     """Maps 2D panel representations to 3D bounding boxes.
 
@@ -37,13 +97,59 @@ class Panel3DMapper:
         assert cabinet.back_material is not None
         self.back_thickness = cabinet.back_material.thickness
         self.material_thickness = cabinet.material.thickness
+        # Cabinet dimensions read by every panel mapping
+        self.cabinet_width = cabinet.width
+        self.cabinet_height = cabinet.height
+        self.cabinet_depth = cabinet.depth
         # Extract toe kick height if present
         self.base_zone_height = 0.0
         if cabinet.base_zone and cabinet.base_zone.get("zone_type") == "toe_kick":
             self.base_zone_height = cabinet.base_zone.get("height", 0.0)
+        self._panels: list[Panel] | None = None
+        # Boxes keyed by panel identity; the panel is kept so its id stays valid
+        self._boxes: dict[int, tuple[Panel, BoundingBox3D]] = {}
+
+    @classmethod
+    def for_cabinet(cls, cabinet: Cabinet) -> Panel3DMapper:
+        """Get the mapper of a cabinet for the current export session.
+
+        Inside a mapper_session() every caller gets the same mapper for a
+        cabinet object, so every exporter of one layout reuses the same
+        generated panels and boxes. Outside a session a new mapper is
+        returned.
+
+        Args:
+            cabinet: Cabinet to map.
+
+        Returns:
+            Panel3DMapper for the cabinet.
+        """
+        session = _session.get()
+        if session is None:
+            return cls(cabinet)
+        return session.mapper_for(cabinet)
+
+    def panels(self) -> list[Panel]:
+        """Get the cabinet's panels, generating them on first use."""
+        if self._panels is None:
+            self._panels = PanelGenerationService().get_all_panels(self.cabinet)
+        return self._panels
 
     def map_panel(self, panel: Panel) -> BoundingBox3D:
-        """Convert a 2D panel to a 3D bounding box."""
+        """Convert a 2D panel to a 3D bounding box.
+
+        Boxes are cached per panel object, so panels must not be modified
+        after they are mapped.
+        """
+        cached = self._boxes.get(id(panel))
+        if cached is not None and cached[0] is panel:
+            return cached[1]
+        box = self._map_panel_uncached(panel)
+        self._boxes[id(panel)] = (panel, box)
+        return box
+
+    def _map_panel_uncached(self, panel: Panel) -> BoundingBox3D:
+        """Convert a 2D panel to a 3D bounding box without the cache."""
         thickness = panel.material.thickness
 
         match panel.panel_type:
@@ -53,9 +159,9 @@ class Panel3DMapper:
                     origin=Position3D(
                         x=0,
                         y=self.back_thickness,
-                        z=self.cabinet.height - thickness,
+                        z=self.cabinet_height - thickness,
                     ),
-                    size_x=self.cabinet.width,
+                    size_x=self.cabinet_width,
                     size_y=panel.height,  # panel.height is depth for horizontal panels
                     size_z=thickness,
                 )
@@ -66,7 +172,7 @@ class Panel3DMapper:
                     origin=Position3D(
                         x=0, y=self.back_thickness, z=self.base_zone_height
                     ),
-                    size_x=self.cabinet.width,
+                    size_x=self.cabinet_width,
                     size_y=panel.height,
                     size_z=thickness,
                 )
@@ -88,7 +194,7 @@ class Panel3DMapper:
                 # Vertical panel on right side
                 return BoundingBox3D(
                     origin=Position3D(
-                        x=self.cabinet.width - thickness,
+                        x=self.cabinet_width - thickness,
                         y=self.back_thickness,
                         z=panel.position.y,
                     ),
@@ -151,7 +257,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth - thickness,
+                        y=self.cabinet_depth - thickness,
                         z=panel.position.y,
                     ),
                     size_x=panel.width,
@@ -165,7 +271,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth - thickness,
+                        y=self.cabinet_depth - thickness,
                         z=panel.position.y,
                     ),
                     size_x=panel.width,
@@ -180,7 +286,7 @@ class Panel3DMapper:
                 # Sides extend backward from the box front
                 box_depth = panel.width
                 # Box front is flush behind decorative front
-                box_front_y = self.cabinet.depth - self.material_thickness - thickness
+                box_front_y = self.cabinet_depth - self.material_thickness - thickness
                 # Side starts at back edge and extends to box front
                 side_start_y = box_front_y - box_depth + thickness
                 return BoundingBox3D(
@@ -200,7 +306,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth - self.material_thickness - thickness,
+                        y=self.cabinet_depth - self.material_thickness - thickness,
                         z=panel.position.y,
                     ),
                     size_x=panel.width,
@@ -221,7 +327,7 @@ class Panel3DMapper:
                     else 0.5
                 )
                 box_front_y = (
-                    self.cabinet.depth - self.material_thickness - box_side_thickness
+                    self.cabinet_depth - self.material_thickness - box_side_thickness
                 )
                 bottom_start_y = box_front_y - bottom_depth + box_side_thickness
                 return BoundingBox3D(
@@ -245,7 +351,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth - thickness,
+                        y=self.cabinet_depth - thickness,
                         z=panel.position.y,
                     ),
                     size_x=panel.width,
@@ -275,7 +381,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=0,
-                        y=self.cabinet.depth - setback,  # Recessed from front
+                        y=self.cabinet_depth - setback,  # Recessed from front
                         z=0,
                     ),
                     size_x=panel.width,
@@ -291,7 +397,7 @@ class Panel3DMapper:
                     origin=Position3D(
                         x=0,
                         y=self.back_thickness,  # Just in front of back panel
-                        z=self.cabinet.height,  # On top of cabinet (above top panel)
+                        z=self.cabinet_height,  # On top of cabinet (above top panel)
                     ),
                     size_x=panel.width,
                     size_y=panel.height,  # Nailer depth
@@ -306,7 +412,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=0,
-                        y=self.cabinet.depth - thickness - setback,  # At front face
+                        y=self.cabinet_depth - thickness - setback,  # At front face
                         z=0,
                     ),
                     size_x=panel.width,
@@ -322,7 +428,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth,  # Flush with front, extends outward
+                        y=self.cabinet_depth,  # Flush with front, extends outward
                         z=panel.position.y,  # Typically 0 (starts at bottom)
                     ),
                     size_x=panel.width,  # Stile width
@@ -338,7 +444,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,  # Offset by stile width
-                        y=self.cabinet.depth,  # Flush with front, extends outward
+                        y=self.cabinet_depth,  # Flush with front, extends outward
                         z=panel.position.y,  # 0 for bottom, cabinet.height - rail_width for top
                     ),
                     size_x=panel.width,  # Rail length (between stiles)
@@ -369,7 +475,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth - thickness,
+                        y=self.cabinet_depth - thickness,
                         z=panel.position.y,
                     ),
                     size_x=panel.width,
@@ -475,7 +581,7 @@ class Panel3DMapper:
                 return BoundingBox3D(
                     origin=Position3D(
                         x=panel.position.x,
-                        y=self.cabinet.depth - thickness,  # At front of cabinet
+                        y=self.cabinet_depth - thickness,  # At front of cabinet
                         z=panel.position.y,  # Vertical position
                     ),
                     size_x=panel.width,  # Bracket width
@@ -516,9 +622,7 @@ class Panel3DMapper:
 
     def map_all_panels(self) -> list[BoundingBox3D]:
         """Convert all cabinet panels to 3D bounding boxes."""
-        panel_service = PanelGenerationService()
-        panels = panel_service.get_all_panels(self.cabinet)
-        return [self.map_panel(panel) for panel in panels]
+        return [self.map_panel(panel) for panel in self.panels()]
 
     def map_all_panels_with_types(self) -> list[tuple[BoundingBox3D, Panel]]:
         """Convert all cabinet panels to 3D bounding boxes with panel info.
@@ -530,9 +634,7 @@ class Panel3DMapper:
         Returns:
             List of (BoundingBox3D, Panel) tuples for all cabinet panels.
         """
-        panel_service = PanelGenerationService()
-        panels = panel_service.get_all_panels(self.cabinet)
-        return [(self.map_panel(panel), panel) for panel in panels]
+        return [(self.map_panel(panel), panel) for panel in self.panels()]
 
 
 class RoomPanel3DMapper:
@@ -579,25 +681,23 @@ class RoomPanel3DMapper:
                 f"number of transforms ({len(transforms)})"
             )
 
-        all_boxes: list[BoundingBox3D] = []
+        origin_boxes: list[BoundingBox3D] = []
+        box_transforms: list[SectionTransform] = []
 
         for cabinet, transform in zip(cabinets, transforms):
-            # Use provided mapper or create one for this cabinet
+            # Use provided mapper or the shared one for this cabinet
             if self._panel_mapper is not None:
                 # If a mapper was provided, use it (assumes same cabinet)
                 mapper = self._panel_mapper
             else:
-                mapper = Panel3DMapper(cabinet)
+                mapper = Panel3DMapper.for_cabinet(cabinet)
 
             # Get all panels mapped to boxes at origin
-            origin_boxes = mapper.map_all_panels()
+            boxes = mapper.map_all_panels()
+            origin_boxes.extend(boxes)
+            box_transforms.extend([transform] * len(boxes))
 
-            # Apply transform to each box
-            for box in origin_boxes:
-                transformed_box = self._apply_transform(box, transform)
-                all_boxes.append(transformed_box)
-
-        return all_boxes
+        return self._apply_transforms(origin_boxes, box_transforms)
 
     def map_cabinets_to_boxes_with_panels(
         self,
@@ -628,8 +728,8 @@ class RoomPanel3DMapper:
         results: list[tuple[BoundingBox3D, Panel, SectionTransform]] = []
 
         for cabinet, transform in zip(cabinets, transforms):
-            # Create mapper for this cabinet
-            mapper = Panel3DMapper(cabinet)
+            # Reuse the shared mapper for this cabinet
+            mapper = Panel3DMapper.for_cabinet(cabinet)
 
             # Get panels with boxes at origin (local coordinates)
             panels_with_boxes = mapper.map_all_panels_with_types()
@@ -640,6 +740,48 @@ class RoomPanel3DMapper:
 
         return results
 
+    @staticmethod
+    def room_corners(
+        boxes: list[BoundingBox3D],
+        transforms: list[SectionTransform],
+    ) -> np.ndarray:
+        """Transform the corners of boxes into room coordinates.
+
+        Args:
+            boxes: Bounding boxes in local cabinet coordinates.
+            transforms: The transform to apply to each box.
+
+        Returns:
+            Array of shape (N, 8, 3) with each box's corners, in
+            BoundingBox3D.get_vertices() order, rotated around the Z axis
+            and translated by the box's transform.
+        """
+        if not boxes:
+            return np.zeros((0, 8, 3))
+
+        origins = np.array([(b.origin.x, b.origin.y, b.origin.z) for b in boxes])
+        sizes = np.array([(b.size_x, b.size_y, b.size_z) for b in boxes])
+        corners = origins[:, np.newaxis, :] + sizes[:, np.newaxis, :] * _UNIT_CORNERS
+
+        # math.cos/sin per transform keeps results identical to scalar code
+        angles = [math.radians(t.rotation_z) for t in transforms]
+        cos_angle = np.array([math.cos(a) for a in angles])[:, np.newaxis]
+        sin_angle = np.array([math.sin(a) for a in angles])[:, np.newaxis]
+        offsets = np.array(
+            [(t.position.x, t.position.y, t.position.z) for t in transforms]
+        )
+
+        # Rotate around Z axis, then translate by transform position
+        x, y, z = corners[..., 0], corners[..., 1], corners[..., 2]
+        return np.stack(
+            (
+                x * cos_angle - y * sin_angle + offsets[:, 0:1],
+                x * sin_angle + y * cos_angle + offsets[:, 1:2],
+                z + offsets[:, 2:3],
+            ),
+            axis=-1,
+        )
+
     def _apply_transform(
         self,
         box: BoundingBox3D,
@@ -647,7 +789,23 @@ class RoomPanel3DMapper:
     ) -> BoundingBox3D:
         """Apply a SectionTransform to a bounding box.
 
-        The transform is applied in two steps:
+        Args:
+            box: The bounding box to transform
+            transform: The transform to apply (rotation + translation)
+
+        Returns:
+            New BoundingBox3D with transform applied
+        """
+        return self._apply_transforms([box], [transform])[0]
+
+    def _apply_transforms(
+        self,
+        boxes: list[BoundingBox3D],
+        transforms: list[SectionTransform],
+    ) -> list[BoundingBox3D]:
+        """Apply a SectionTransform to each bounding box in one batch.
+
+        Each transform is applied in two steps:
         1. Rotate the box around Z axis by transform.rotation_z degrees
         2. Translate by transform.position
 
@@ -656,86 +814,62 @@ class RoomPanel3DMapper:
         - y' = x * sin(angle) + y * cos(angle)
         - z' = z (unchanged)
 
-        After rotating all 8 corners, we compute a new axis-aligned bounding
-        box from the transformed corners.
+        All 8 corners of every box are rotated as one (N, 8, 3) array (see
+        room_corners), and a new axis-aligned bounding box is computed from
+        each box's corners.
 
         Args:
-            box: The bounding box to transform
-            transform: The transform to apply (rotation + translation)
+            boxes: The bounding boxes to transform
+            transforms: The transform to apply to each box
 
         Returns:
-            New BoundingBox3D with transform applied
+            New BoundingBox3D for each box with its transform applied
         """
-        # Get all 8 vertices of the box
-        vertices = box.get_vertices()
-
-        # Convert rotation to radians
-        angle_rad = math.radians(transform.rotation_z)
-        cos_angle = math.cos(angle_rad)
-        sin_angle = math.sin(angle_rad)
-
-        # Transform each vertex: rotate then translate
-        transformed_vertices: list[tuple[float, float, float]] = []
-        for x, y, z in vertices:
-            # Rotate around Z axis
-            x_rot = x * cos_angle - y * sin_angle
-            y_rot = x * sin_angle + y * cos_angle
-            z_rot = z  # Z unchanged for rotation around Z axis
-
-            # Translate by transform position
-            x_final = x_rot + transform.position.x
-            y_final = y_rot + transform.position.y
-            z_final = z_rot + transform.position.z
-
-            transformed_vertices.append((x_final, y_final, z_final))
-
-        # Compute new axis-aligned bounding box from transformed vertices
-        x_coords = [v[0] for v in transformed_vertices]
-        y_coords = [v[1] for v in transformed_vertices]
-        z_coords = [v[2] for v in transformed_vertices]
-
-        min_x = min(x_coords)
-        max_x = max(x_coords)
-        min_y = min(y_coords)
-        max_y = max(y_coords)
-        min_z = min(z_coords)
-        max_z = max(z_coords)
+        if not boxes:
+            return []
+
+        transformed = self.room_corners(boxes, transforms)
+        mins = transformed.min(axis=1)
+        maxs = transformed.max(axis=1)
 
         # Handle floating-point precision issues: clamp near-zero values to zero
         # This prevents very small negative numbers from causing Position3D validation errors
         epsilon = 1e-10
-        if abs(min_x) < epsilon:
-            min_x = 0.0
-        if abs(min_y) < epsilon:
-            min_y = 0.0
-        if abs(min_z) < epsilon:
-            min_z = 0.0
-        if abs(max_x) < epsilon:
-            max_x = 0.0
-        if abs(max_y) < epsilon:
-            max_y = 0.0
-        if abs(max_z) < epsilon:
-            max_z = 0.0
+        mins[np.abs(mins) < epsilon] = 0.0
+        maxs[np.abs(maxs) < epsilon] = 0.0
 
         # Position3D requires non-negative coordinates. In room coordinate space,
         # rotations can produce negative values. We need to shift the entire AABB
         # to positive space while preserving its size.
-        shift_x = -min_x if min_x < 0 else 0.0
-        shift_y = -min_y if min_y < 0 else 0.0
-        shift_z = -min_z if min_z < 0 else 0.0
-
-        # Apply shift to make all coordinates non-negative
-        min_x += shift_x
-        max_x += shift_x
-        min_y += shift_y
-        max_y += shift_y
-        min_z += shift_z
-        max_z += shift_z
-
-        # Create new bounding box with transformed origin and dimensions
-        return BoundingBox3D(
-            origin=Position3D(x=min_x, y=min_y, z=min_z),
-            size_x=max_x - min_x,
-            size_y=max_y - min_y,
-            size_z=max_z - min_z,
-        )
+        shift = np.where(mins < 0, -mins, 0.0)
+        mins += shift
+        maxs += shift
+        extents = maxs - mins
+
+        # Create new bounding boxes with transformed origin and dimensions
+        return [
+            BoundingBox3D(
+                origin=Position3D(x=min_x, y=min_y, z=min_z),
+                size_x=size_x,
+                size_y=size_y,
+                size_z=size_z,
+            )
+            for (min_x, min_y, min_z), (size_x, size_y, size_z) in zip(
+                mins.tolist(), extents.tolist()
+            )
+        ]
+
+
+# Unit-cube corners in BoundingBox3D.get_vertices() order
+_UNIT_CORNERS = np.array(
+    [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (0.0, 0.0, 1.0),
+        (1.0, 0.0, 1.0),
+        (1.0, 1.0, 1.0),
+        (0.0, 1.0, 1.0),
+    ]
+)
@@ -11,7 +11,11 @@ from dataclasses import dataclass
 from math import cos, radians, sin
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 from ..value_objects import ApexPoint, CeilingFacet, Point2D, RadialCeilingGeometry
+from .ceiling_field import CeilingField
 
 if TYPE_CHECKING:
     from ..value_objects import BayAlcoveConfig
@@ -71,6 +75,7 @@ class RadialCeilingService:
         self.bay_config = bay_config
         self._wall_segments: list[WallSegmentGeometry] | None = None
         self._radial_ceiling: RadialCeilingGeometry | None = None
+        self._ceiling_field: CeilingField | None = None
 
     def compute_wall_positions(self) -> list[WallSegmentGeometry]:
         """Compute the positions of all wall segments.
@@ -213,6 +218,33 @@ class RadialCeilingService:
         )
         return self._radial_ceiling
 
+    def build_ceiling_field(self) -> CeilingField:
+        """Build the ceiling field for batch height queries.
+
+        The field holds a facet lookup table for the radial ceiling and is
+        cached with the geometry.
+
+        Returns:
+            CeilingField over the radial ceiling geometry.
+        """
+        if self._ceiling_field is None:
+            self._ceiling_field = CeilingField(
+                radial=self.build_radial_ceiling_geometry()
+            )
+        return self._ceiling_field
+
+    def get_ceiling_heights_at(self, xs: ArrayLike, ys: ArrayLike) -> np.ndarray:
+        """Get ceiling heights at many points at once.
+
+        Args:
+            xs: X coordinates in room space (inches).
+            ys: Y coordinates in room space (inches).
+
+        Returns:
+            Ceiling heights in inches, one per point.
+        """
+        return self.build_ceiling_field().radial_heights(xs, ys)
+
     def get_ceiling_height_at(self, x: float, y: float) -> float | None:
         """Get ceiling height at a specific point.
 
@@ -277,3 +309,4 @@ class RadialCeilingService:
         """
         self._wall_segments = None
         self._radial_ceiling = None
+        self._ceiling_field = None
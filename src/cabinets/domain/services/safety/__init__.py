@@ -21,6 +21,10 @@ The package is organized into specialized sub-services:
 - SeismicService: Seismic zone requirements
 - ReportingService: Label and report generation
 
+SafetyAnalysisContext holds the cabinet-derived data (bounds, shelf
+heights, weight, capacities) computed once per assessment and shared by
+the sub-services.
+
 The SafetyService facade provides backward-compatible API while
 delegating to specialized sub-services.
 
@@ -92,6 +96,9 @@ from cabinets.domain.value_objects import (
 # Re-export config
 from .config import SafetyConfig
 
+# Re-export shared analysis context
+from .analysis_context import SafetyAnalysisContext, ShelfPlacement
+
 # Re-export main facade
 from .safety_facade import SafetyService
 
@@ -148,6 +155,9 @@ __all__ = [
     "SafetyAssessment",
     # Config
     "SafetyConfig",
+    # Analysis context
+    "SafetyAnalysisContext",
+    "ShelfPlacement",
     # Main service facade
     "SafetyService",
     # Sub-services (for advanced usage)
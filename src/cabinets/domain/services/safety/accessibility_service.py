@@ -18,6 +18,7 @@ from .constants import (
     ADA_MIN_ACCESSIBLE_PERCENTAGE,
     ADA_MIN_REACH,
 )
+from .analysis_context import SafetyAnalysisContext, ShelfPlacement
 from .models import AccessibilityReport, SafetyCheckResult
 
 if TYPE_CHECKING:
@@ -44,7 +45,11 @@ class AccessibilityService:
         """
         self.config = config
 
-    def analyze_accessibility(self, cabinet: "Cabinet") -> AccessibilityReport:
+    def analyze_accessibility(
+        self,
+        cabinet: "Cabinet",
+        context: SafetyAnalysisContext | None = None,
+    ) -> AccessibilityReport:
         """Analyze ADA accessibility compliance.
 
         Validates reach ranges and calculates accessible storage
@@ -53,6 +58,7 @@ class AccessibilityService:
 
         Args:
             cabinet: Cabinet to analyze.
+            context: Shared assessment context providing shelf placements.
 
         Returns:
             AccessibilityReport with compliance details.
@@ -70,51 +76,40 @@ class AccessibilityService:
                 standard=self.config.accessibility_standard,
             )
 
+        placements = (
+            context.shelf_placements
+            if context is not None
+            else self.get_shelf_placements(cabinet)
+        )
+
         # Calculate total and accessible storage volumes
         total_volume = 0.0
         accessible_volume = 0.0
         non_compliant_areas: list[str] = []
         reach_violations: list[str] = []
 
-        # Get floor offset if cabinet is wall-mounted
-        floor_offset = self._get_cabinet_floor_offset(cabinet)
+        for placement in placements:
+            total_volume += placement.storage_volume
 
-        for section_idx, section in enumerate(cabinet.sections):
-            for shelf_idx, shelf in enumerate(section.shelves):
-                # Calculate shelf position from floor
-                shelf_height_from_floor = self._calculate_shelf_height(
-                    cabinet, section, shelf, shelf_idx, floor_offset
-                )
-
-                # Calculate storage volume for this shelf area
-                shelf_width = section.width - (2 * cabinet.material.thickness)
-                shelf_depth = cabinet.depth - cabinet.material.thickness
-                # Assume shelf height is distance to next shelf or top
-                shelf_storage_height = self._get_shelf_storage_height(
-                    cabinet, section, shelf_idx
-                )
-
-                shelf_volume = shelf_width * shelf_depth * shelf_storage_height
-                total_volume += shelf_volume
+            # Check if shelf is within accessible reach range
+            is_accessible, violation = self._check_shelf_accessibility(
+                placement.height_from_floor,
+                placement.storage_height,
+                cabinet.depth,
+                placement.section_index,
+                placement.shelf_index,
+            )
 
-                # Check if shelf is within accessible reach range
-                is_accessible, violation = self._check_shelf_accessibility(
-                    shelf_height_from_floor,
-                    shelf_storage_height,
-                    cabinet.depth,
-                    section_idx,
-                    shelf_idx,
+            if is_accessible:
+                accessible_volume += placement.storage_volume
+            else:
+                non_compliant_areas.append(
+                    f"Section {placement.section_index}, "
+                    f"Shelf {placement.shelf_index}: "
+                    f'height {placement.height_from_floor:.1f}" from floor'
                 )
-
-                if is_accessible:
-                    accessible_volume += shelf_volume
-                else:
-                    non_compliant_areas.append(
-                        f"Section {section_idx}, Shelf {shelf_idx}: "
-                        f'height {shelf_height_from_floor:.1f}" from floor'
-                    )
-                    if violation:
-                        reach_violations.append(violation)
+                if violation:
+                    reach_violations.append(violation)
 
         # Calculate accessible percentage
         accessible_percentage = (
@@ -137,6 +132,52 @@ class AccessibilityService:
             standard=self.config.accessibility_standard,
         )
 
+    def get_shelf_placements(
+        self, cabinet: "Cabinet", floor_offset: float | None = None
+    ) -> tuple[ShelfPlacement, ...]:
+        """Get the height and storage volume of every shelf.
+
+        Args:
+            cabinet: Cabinet to analyze.
+            floor_offset: Height of the cabinet bottom from the floor.
+                Derived from the cabinet if not provided.
+
+        Returns:
+            One ShelfPlacement per shelf, section by section.
+        """
+        if floor_offset is None:
+            floor_offset = self._get_cabinet_floor_offset(cabinet)
+
+        shelf_width_by_section = [
+            section.width - (2 * cabinet.material.thickness)
+            for section in cabinet.sections
+        ]
+        shelf_depth = cabinet.depth - cabinet.material.thickness
+
+        placements: list[ShelfPlacement] = []
+        for section_idx, section in enumerate(cabinet.sections):
+            for shelf_idx, shelf in enumerate(section.shelves):
+                # Assume shelf height is distance to next shelf or top
+                storage_height = self._get_shelf_storage_height(
+                    cabinet, section, shelf_idx
+                )
+                placements.append(
+                    ShelfPlacement(
+                        section_index=section_idx,
+                        shelf_index=shelf_idx,
+                        height_from_floor=self._calculate_shelf_height(
+                            cabinet, section, shelf, shelf_idx, floor_offset
+                        ),
+                        storage_height=storage_height,
+                        storage_volume=(
+                            shelf_width_by_section[section_idx]
+                            * shelf_depth
+                            * storage_height
+                        ),
+                    )
+                )
+        return tuple(placements)
+
     def _get_cabinet_floor_offset(self, cabinet: "Cabinet") -> float:
         """Get the distance from floor to cabinet bottom.
 
@@ -298,11 +339,19 @@ class AccessibilityService:
 
         return notes
 
-    def check_accessibility(self, cabinet: "Cabinet") -> list[SafetyCheckResult]:
+    def check_accessibility(
+        self,
+        cabinet: "Cabinet",
+        context: SafetyAnalysisContext | None = None,
+        report: AccessibilityReport | None = None,
+    ) -> list[SafetyCheckResult]:
         """Perform accessibility checks.
 
         Args:
             cabinet: Cabinet to analyze.
+            context: Shared assessment context providing shelf placements.
+            report: Report already produced by analyze_accessibility, to
+                avoid analyzing the cabinet twice.
 
         Returns:
             List of SafetyCheckResult for accessibility checks.
@@ -320,7 +369,8 @@ class AccessibilityService:
             )
             return results
 
-        report = self.analyze_accessibility(cabinet)
+        if report is None:
+            report = self.analyze_accessibility(cabinet, context)
 
         # Overall compliance check
         if report.is_compliant:
@@ -0,0 +1,73 @@
+"""Shared cabinet-derived data for one safety assessment.
+
+This module provides SafetyAnalysisContext, which holds everything the
+safety sub-services derive from a cabinet: bounding box, shelf heights,
+estimated weight and shelf capacities. SafetyService builds it once per
+assessment and passes it to each check, so no sub-service recomputes
+what another already derived. The context is immutable, so independent
+checks can read it concurrently.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from cabinets.domain.services.woodworking import ShelfLoadTable
+
+from .models import WeightCapacityEstimate
+
+if TYPE_CHECKING:
+    from cabinets.domain.entities import Cabinet
+
+
+@dataclass(frozen=True)
+class ShelfPlacement:
+    """Position and storage volume of one shelf.
+
+    Attributes:
+        section_index: Index of the section containing the shelf.
+        shelf_index: Index of the shelf within its section.
+        height_from_floor: Height of the shelf surface from the floor.
+        storage_height: Usable storage height above the shelf.
+        storage_volume: Storage volume above the shelf in cubic inches.
+    """
+
+    section_index: int
+    shelf_index: int
+    height_from_floor: float
+    storage_height: float
+    storage_volume: float
+
+
+@dataclass(frozen=True, eq=False)
+class SafetyAnalysisContext:
+    """Cabinet-derived data shared by the checks of one assessment.
+
+    Built by SafetyService.build_context. Sub-service methods accept it
+    as an optional argument and derive the data themselves when it is
+    not provided.
+
+    Attributes:
+        cabinet: Cabinet being assessed.
+        bounds: Bounding box with left, right, bottom, top, front and back
+            coordinates.
+        floor_offset: Height of the cabinet bottom from the floor.
+        is_wall_mounted: Whether the cabinet is attached to a wall.
+        shelf_table: Columnar shelf data for structural analysis.
+        shelf_placements: Height and storage volume of every shelf.
+        weight_capacities: Safe load estimates for every shelf.
+        empty_weight_lbs: Estimated weight of the empty cabinet.
+    """
+
+    cabinet: "Cabinet"
+    bounds: dict[str, float]
+    floor_offset: float
+    is_wall_mounted: bool
+    shelf_table: ShelfLoadTable
+    shelf_placements: tuple[ShelfPlacement, ...]
+    weight_capacities: tuple[WeightCapacityEstimate, ...]
+    empty_weight_lbs: float
+
+
+__all__ = ["SafetyAnalysisContext", "ShelfPlacement"]
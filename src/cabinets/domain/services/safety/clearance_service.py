@@ -31,6 +31,8 @@ from .models import SafetyCheckResult
 if TYPE_CHECKING:
     from cabinets.domain.entities import Cabinet, Obstacle
 
+    from .analysis_context import SafetyAnalysisContext
+
 
 class ClearanceService:
     """Service for building code clearance analysis.
@@ -56,6 +58,7 @@ class ClearanceService:
         self,
         cabinet: "Cabinet",
         obstacles: list["Obstacle"],
+        context: SafetyAnalysisContext | None = None,
     ) -> list[SafetyCheckResult]:
         """Check clearances from electrical panels, heat sources, egress.
 
@@ -65,6 +68,7 @@ class ClearanceService:
         Args:
             cabinet: Cabinet configuration.
             obstacles: List of obstacles to check clearances against.
+            context: Shared assessment context providing cabinet bounds.
 
         Returns:
             List of SafetyCheckResult for each clearance check.
@@ -92,7 +96,9 @@ class ClearanceService:
         results: list[SafetyCheckResult] = []
 
         # Get cabinet bounds (assume cabinet positioned at origin for simplicity)
-        cabinet_bounds = self._get_cabinet_bounds(cabinet)
+        cabinet_bounds = (
+            context.bounds if context is not None else self.get_cabinet_bounds(cabinet)
+        )
 
         for obstacle in obstacles:
             obstacle_results = self._check_obstacle_clearance(
@@ -114,7 +120,7 @@ class ClearanceService:
 
         return results
 
-    def _get_cabinet_bounds(self, cabinet: "Cabinet") -> dict[str, float]:
+    def get_cabinet_bounds(self, cabinet: "Cabinet") -> dict[str, float]:
         """Get cabinet bounding box coordinates.
 
         Args:
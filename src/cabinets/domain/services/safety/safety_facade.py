@@ -6,9 +6,15 @@ backward compatibility while delegating to specialized sub-services.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from cabinets.domain.services.installation import InstallationConfig, WeightEstimator
+from cabinets.domain.services.woodworking import ShelfLoadTable
 
 from .accessibility_service import AccessibilityService
+from .analysis_context import SafetyAnalysisContext
 from .clearance_service import ClearanceService
 from .config import SafetyConfig
 from .constants import ANTI_TIP_HEIGHT_THRESHOLD, CHILD_ENTRAPMENT_VOLUME_THRESHOLD
@@ -52,13 +58,19 @@ class SafetyService:
                 print(error.formatted_message)
     """
 
-    def __init__(self, config: SafetyConfig) -> None:
+    def __init__(self, config: SafetyConfig, max_workers: int = 1) -> None:
         """Initialize SafetyService with configuration.
 
         Args:
             config: Safety analysis configuration.
+            max_workers: Threads used to run the independent checks of an
+                assessment concurrently. The default of 1 runs them in
+                sequence on the calling thread.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.config = config
+        self.max_workers = max_workers
 
         # Initialize sub-services
         self._structural = StructuralSafetyService(config)
@@ -68,6 +80,36 @@ class SafetyService:
         self._material = MaterialComplianceService(config)
         self._seismic = SeismicService(config)
         self._reporting = ReportingService(config)
+        self._weight_estimator = WeightEstimator(InstallationConfig())
+
+    def build_context(self, cabinet: "Cabinet") -> SafetyAnalysisContext:
+        """Derive the cabinet data shared by every check of an assessment.
+
+        Args:
+            cabinet: Cabinet to analyze.
+
+        Returns:
+            SafetyAnalysisContext with bounds, shelf heights, weight and
+            shelf capacities.
+        """
+        shelf_table = ShelfLoadTable.from_cabinet(cabinet)
+        floor_offset = self._accessibility._get_cabinet_floor_offset(cabinet)
+        return SafetyAnalysisContext(
+            cabinet=cabinet,
+            bounds=self._clearance.get_cabinet_bounds(cabinet),
+            floor_offset=floor_offset,
+            is_wall_mounted=self._stability.is_wall_mounted(cabinet),
+            shelf_table=shelf_table,
+            shelf_placements=self._accessibility.get_shelf_placements(
+                cabinet, floor_offset
+            ),
+            weight_capacities=tuple(
+                self._structural.get_shelf_capacities(cabinet, shelf_table)
+            ),
+            empty_weight_lbs=self._weight_estimator.estimate_weight(
+                cabinet
+            ).empty_weight_lbs,
+        )
 
     def analyze(
         self,
@@ -77,7 +119,11 @@ class SafetyService:
         """Perform complete safety analysis on a cabinet configuration.
 
         Runs all enabled safety checks and aggregates results into
-        a comprehensive SafetyAssessment.
+        a comprehensive SafetyAssessment. Cabinet-derived data is computed
+        once into a SafetyAnalysisContext; the structural, stability,
+        accessibility, clearance and seismic checks then run against it,
+        concurrently when max_workers is greater than 1. Results keep the
+        same order either way.
 
         Args:
             cabinet: Cabinet configuration to analyze.
@@ -86,43 +132,49 @@ class SafetyService:
         Returns:
             Complete SafetyAssessment with all check results.
         """
-        all_results: list[SafetyCheckResult] = []
-
-        # 1. Structural safety checks (weight capacity, span limits)
-        structural_results = self._structural.check_structural_safety(cabinet)
-        all_results.extend(structural_results)
-
-        # 2. Stability checks (anti-tip requirements)
-        stability_results = self._stability.check_stability(cabinet)
-        all_results.extend(stability_results)
-
-        # 3. Accessibility checks (ADA compliance)
-        accessibility_results = self._accessibility.check_accessibility(cabinet)
-        all_results.extend(accessibility_results)
-
-        # 4. Clearance checks (building codes)
-        if obstacles is not None:
-            clearance_results = self._clearance.check_clearances(cabinet, obstacles)
-            all_results.extend(clearance_results)
-
-        # 5. Material compliance
-        material_result = self._material.check_material_compliance()
-        all_results.append(material_result)
-
-        # 6. Seismic requirements
-        seismic_result = self._seismic.check_seismic_requirements()
-        all_results.append(seismic_result)
-
-        # Gather weight capacities
-        weight_capacities = self._structural.get_shelf_capacities(cabinet)
-
-        # Gather accessibility report
-        accessibility_report: AccessibilityReport | None = None
-        if self.config.accessibility_enabled:
-            accessibility_report = self._accessibility.analyze_accessibility(cabinet)
-
-        # Determine anti-tip requirement
-        anti_tip_result = self._stability.check_anti_tip_requirement(cabinet)
+        context = self.build_context(cabinet)
+        weight_capacities = list(context.weight_capacities)
+
+        checks: list[Callable[[], Any]] = [
+            # 1. Structural safety checks (weight capacity, span limits)
+            lambda: self._structural.check_structural_safety(
+                cabinet, capacities=weight_capacities, table=context.shelf_table
+            ),
+            # 2. Stability checks (anti-tip requirements)
+            lambda: self._stability.check_stability(cabinet, context),
+            # 3. Accessibility checks (ADA compliance)
+            lambda: self._run_accessibility(cabinet, context),
+            # 4. Clearance checks (building codes)
+            lambda: (
+                self._clearance.check_clearances(cabinet, obstacles, context)
+                if obstacles is not None
+                else []
+            ),
+            # 5. Material compliance
+            self._material.check_material_compliance,
+            # 6. Seismic requirements
+            self._seismic.check_seismic_requirements,
+        ]
+        (
+            structural_results,
+            stability_results,
+            (accessibility_results, accessibility_report),
+            clearance_results,
+            material_result,
+            seismic_result,
+        ) = self._run_checks(checks)
+
+        all_results: list[SafetyCheckResult] = [
+            *structural_results,
+            *stability_results,
+            *accessibility_results,
+            *clearance_results,
+            material_result,
+            seismic_result,
+        ]
+
+        # Anti-tip requirement comes from the stability checks
+        anti_tip_result = stability_results[0]
         anti_tip_required = anti_tip_result.details.get("anti_tip_required", False)
 
         # Gather seismic hardware recommendations
@@ -156,6 +208,36 @@ class SafetyService:
 
         return assessment
 
+    def _run_accessibility(
+        self, cabinet: "Cabinet", context: SafetyAnalysisContext
+    ) -> tuple[list[SafetyCheckResult], AccessibilityReport | None]:
+        """Run accessibility checks, analyzing the cabinet only once.
+
+        Returns:
+            Tuple of (check results, report or None if disabled).
+        """
+        if not self.config.accessibility_enabled:
+            return self._accessibility.check_accessibility(cabinet, context), None
+        report = self._accessibility.analyze_accessibility(cabinet, context)
+        results = self._accessibility.check_accessibility(
+            cabinet, context, report=report
+        )
+        return results, report
+
+    def _run_checks(self, checks: list[Callable[[], Any]]) -> list[Any]:
+        """Run independent checks, concurrently if configured.
+
+        Returns:
+            Check return values in the order of the checks.
+        """
+        if self.max_workers == 1:
+            return [check() for check in checks]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(checks))
+        ) as executor:
+            futures = [executor.submit(check) for check in checks]
+            return [future.result() for future in futures]
+
     # =========================================================================
     # Delegated methods for backward compatibility
     # =========================================================================
@@ -175,31 +257,39 @@ class SafetyService:
         """
         return self._structural.calculate_weight_capacity(panel)
 
-    def get_shelf_capacities(self, cabinet: "Cabinet") -> list[WeightCapacityEstimate]:
+    def get_shelf_capacities(
+        self, cabinet: "Cabinet", table: ShelfLoadTable | None = None
+    ) -> list[WeightCapacityEstimate]:
         """Get weight capacity estimates for all shelves in a cabinet.
 
         Delegates to StructuralSafetyService.
 
         Args:
             cabinet: Cabinet to analyze.
+            table: Optional precomputed shelf table shared with other analyses.
 
         Returns:
             List of WeightCapacityEstimate for all shelf panels.
         """
-        return self._structural.get_shelf_capacities(cabinet)
+        return self._structural.get_shelf_capacities(cabinet, table)
 
-    def check_anti_tip_requirement(self, cabinet: "Cabinet") -> SafetyCheckResult:
+    def check_anti_tip_requirement(
+        self,
+        cabinet: "Cabinet",
+        context: SafetyAnalysisContext | None = None,
+    ) -> SafetyCheckResult:
         """Check if cabinet requires anti-tip restraint.
 
         Delegates to StabilityService.
 
         Args:
             cabinet: Cabinet to check.
+            context: Optional shared assessment context.
 
         Returns:
             SafetyCheckResult indicating anti-tip requirement status.
         """
-        return self._stability.check_anti_tip_requirement(cabinet)
+        return self._stability.check_anti_tip_requirement(cabinet, context)
 
     def get_anti_tip_hardware(self, cabinet: "Cabinet") -> list[str]:
         """Get recommended anti-tip hardware for a cabinet.
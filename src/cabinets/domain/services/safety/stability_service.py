@@ -17,6 +17,8 @@ from .models import SafetyCheckResult
 if TYPE_CHECKING:
     from cabinets.domain.entities import Cabinet
 
+    from .analysis_context import SafetyAnalysisContext
+
 
 class StabilityService:
     """Service for cabinet stability analysis.
@@ -66,7 +68,11 @@ class StabilityService:
         # Default: freestanding cabinet
         return False
 
-    def check_anti_tip_requirement(self, cabinet: "Cabinet") -> SafetyCheckResult:
+    def check_anti_tip_requirement(
+        self,
+        cabinet: "Cabinet",
+        context: SafetyAnalysisContext | None = None,
+    ) -> SafetyCheckResult:
         """Check if cabinet requires anti-tip restraint.
 
         Units >= 27" tall that are not wall-mounted require anti-tip
@@ -76,6 +82,9 @@ class StabilityService:
 
         Args:
             cabinet: Cabinet to check.
+            context: Shared assessment context. When provided, its
+                mounting status is reused and the estimated empty weight
+                is included in the details of a required restraint.
 
         Returns:
             SafetyCheckResult indicating anti-tip requirement status.
@@ -83,7 +92,11 @@ class StabilityService:
         height = cabinet.height
 
         # Check if cabinet is wall-mounted (has mounting system configured)
-        is_wall_mounted = self.is_wall_mounted(cabinet)
+        is_wall_mounted = (
+            context.is_wall_mounted
+            if context is not None
+            else self.is_wall_mounted(cabinet)
+        )
 
         if is_wall_mounted:
             return SafetyCheckResult(
@@ -125,6 +138,18 @@ class StabilityService:
         height_to_depth_ratio = height / depth if depth > 0 else float("inf")
         risk_level = "high" if height_to_depth_ratio > 4 else "moderate"
 
+        details = {
+            "height": height,
+            "depth": depth,
+            "threshold": ANTI_TIP_HEIGHT_THRESHOLD,
+            "height_to_depth_ratio": round(height_to_depth_ratio, 2),
+            "risk_level": risk_level,
+            "is_wall_mounted": False,
+            "anti_tip_required": True,
+        }
+        if context is not None:
+            details["empty_weight_lbs"] = round(context.empty_weight_lbs, 1)
+
         return SafetyCheckResult(
             check_id="anti_tip_requirement",
             category=SafetyCategory.STABILITY,
@@ -139,15 +164,7 @@ class StabilityService:
                 'Mount 4" from cabinet top into wall stud or use appropriate anchor.'
             ),
             standard_reference="ASTM F2057-23 (guidance)",
-            details={
-                "height": height,
-                "depth": depth,
-                "threshold": ANTI_TIP_HEIGHT_THRESHOLD,
-                "height_to_depth_ratio": round(height_to_depth_ratio, 2),
-                "risk_level": risk_level,
-                "is_wall_mounted": False,
-                "anti_tip_required": True,
-            },
+            details=details,
         )
 
     def get_anti_tip_hardware(self, cabinet: "Cabinet") -> list[str]:
@@ -195,14 +212,20 @@ class StabilityService:
 
         return hardware
 
-    def check_stability(self, cabinet: "Cabinet") -> list[SafetyCheckResult]:
+    def check_stability(
+        self,
+        cabinet: "Cabinet",
+        context: SafetyAnalysisContext | None = None,
+    ) -> list[SafetyCheckResult]:
         """Perform stability checks including anti-tip requirement.
 
         Comprehensive stability analysis including anti-tip checks,
         height-to-depth ratio warnings, and child safety considerations.
+        The anti-tip result is always first.
 
         Args:
             cabinet: Cabinet to analyze.
+            context: Shared assessment context.
 
         Returns:
             List of SafetyCheckResult for stability checks.
@@ -210,7 +233,7 @@ class StabilityService:
         results: list[SafetyCheckResult] = []
 
         # Anti-tip check
-        anti_tip_result = self.check_anti_tip_requirement(cabinet)
+        anti_tip_result = self.check_anti_tip_requirement(cabinet, context)
         results.append(anti_tip_result)
 
         # Height-to-depth ratio warning for tall narrow units
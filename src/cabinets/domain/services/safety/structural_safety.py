@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from cabinets.domain.value_objects import (
     PanelType,
     SafetyCategory,
@@ -15,7 +17,7 @@ from cabinets.domain.value_objects import (
 )
 from cabinets.domain.services.woodworking import (
     MATERIAL_MODULUS,
-    get_max_span,
+    ShelfLoadTable,
 )
 
 from .config import SafetyConfig
@@ -38,6 +40,9 @@ class StructuralSafetyService:
         capacities = service.get_shelf_capacities(cabinet)
     """
 
+    # Modulus of elasticity used for materials without a known value (plywood)
+    DEFAULT_MODULUS: float = 1_200_000
+
     def __init__(self, config: SafetyConfig) -> None:
         """Initialize StructuralSafetyService.
 
@@ -67,7 +72,7 @@ class StructuralSafetyService:
 
         # Get material modulus
         material_type = panel.material.material_type
-        E = MATERIAL_MODULUS.get(material_type, 1_200_000)  # Default to plywood
+        E = MATERIAL_MODULUS.get(material_type, self.DEFAULT_MODULUS)
 
         # Calculate moment of inertia for rectangular cross-section
         # I = (b * h^3) / 12 where b = depth, h = thickness
@@ -119,88 +124,82 @@ class StructuralSafetyService:
             disclaimer=WEIGHT_CAPACITY_DISCLAIMER,
         )
 
-    def get_shelf_capacities(self, cabinet: "Cabinet") -> list[WeightCapacityEstimate]:
+    def get_shelf_capacities(
+        self, cabinet: "Cabinet", table: ShelfLoadTable | None = None
+    ) -> list[WeightCapacityEstimate]:
         """Get weight capacity estimates for all shelves in a cabinet.
 
-        Iterates through all sections and shelves, calculating weight
-        capacity for each horizontal surface.
+        Computes the beam deflection capacity of every shelf in one
+        batched pass. The span is the section width minus the side panel
+        thickness on each side; shelves without a positive span or depth
+        are skipped.
 
         Args:
             cabinet: Cabinet to analyze.
+            table: Precomputed shelf table to share with other analyses.
+                Built from the cabinet if not provided.
 
         Returns:
             List of WeightCapacityEstimate for all shelf panels.
         """
-        capacities: list[WeightCapacityEstimate] = []
-
-        for section_idx, section in enumerate(cabinet.sections):
-            for shelf_idx, shelf in enumerate(section.shelves):
-                # Create a unique panel identifier
-                panel_id = f"section_{section_idx}_shelf_{shelf_idx}"
-
-                # Get material from shelf
-                material = shelf.material
-
-                # Calculate capacity using shelf dimensions
-                # Span is the section width minus side panel thickness on each side
-                span = section.width - (2 * cabinet.material.thickness)
-                depth = shelf.depth
-
-                if span <= 0 or depth <= 0:
-                    continue
-
-                # Get material modulus
-                E = MATERIAL_MODULUS.get(material.material_type, 1_200_000)
-                h = material.thickness
-                moment_of_inertia = (depth * h**3) / 12
-
-                max_deflection = span / self.config.deflection_limit_ratio
-
-                if span > 0:
-                    max_load = (max_deflection * 384 * E * moment_of_inertia) / (
-                        5 * span**4
-                    )
-                else:
-                    max_load = 0
-
-                safe_load = max_load / self.config.safety_factor
-
-                if E * moment_of_inertia > 0 and span > 0:
-                    deflection_at_load = (5 * safe_load * span**4) / (
-                        384 * E * moment_of_inertia
-                    )
-                else:
-                    deflection_at_load = 0
-
-                capacities.append(
-                    WeightCapacityEstimate(
-                        panel_id=panel_id,
-                        safe_load_lbs=round(safe_load, 1),
-                        max_deflection_inches=round(max_deflection, 3),
-                        deflection_at_rated_load=round(deflection_at_load, 4),
-                        safety_factor=self.config.safety_factor,
-                        material=material.material_type.value,
-                        span_inches=span,
-                        disclaimer=WEIGHT_CAPACITY_DISCLAIMER,
-                    )
-                )
+        if table is None:
+            table = ShelfLoadTable.from_cabinet(cabinet)
+
+        spans = table.shelf_section_widths - (2 * cabinet.material.thickness)
+        max_deflections = spans / self.config.deflection_limit_ratio
+        safe_loads = (
+            table.distributed_load(
+                spans, self.config.deflection_limit_ratio, self.DEFAULT_MODULUS
+            )
+            / self.config.safety_factor
+        )
 
-        return capacities
+        # Deflection at the rated load
+        stiffness = table.modulus(self.DEFAULT_MODULUS) * table.moments_of_inertia
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deflections = (5 * safe_loads * spans**4) / (384 * stiffness)
+        deflections = np.where((stiffness > 0) & (spans > 0), deflections, 0.0)
+
+        valid = (spans > 0) & (table.depths > 0)
+        return [
+            WeightCapacityEstimate(
+                panel_id=(
+                    f"section_{table.section_indices[i]}_shelf_{table.shelf_indices[i]}"
+                ),
+                safe_load_lbs=round(float(safe_loads[i]), 1),
+                max_deflection_inches=round(float(max_deflections[i]), 3),
+                deflection_at_rated_load=round(float(deflections[i]), 4),
+                safety_factor=self.config.safety_factor,
+                material=table.materials[i].material_type.value,
+                span_inches=float(spans[i]),
+                disclaimer=WEIGHT_CAPACITY_DISCLAIMER,
+            )
+            for i in np.flatnonzero(valid)
+        ]
 
     def check_structural_safety(
         self,
         cabinet: "Cabinet",
+        capacities: list[WeightCapacityEstimate] | None = None,
+        table: ShelfLoadTable | None = None,
     ) -> list[SafetyCheckResult]:
         """Perform structural safety checks including weight capacity.
 
         Args:
             cabinet: Cabinet to analyze.
+            capacities: Shelf capacities already computed by
+                get_shelf_capacities, to avoid recomputing them.
+            table: Precomputed shelf table to share with other analyses.
+                Built from the cabinet if not provided.
 
         Returns:
             List of SafetyCheckResult for structural checks.
         """
         results: list[SafetyCheckResult] = []
-        capacities = self.get_shelf_capacities(cabinet)
+        if table is None:
+            table = ShelfLoadTable.from_cabinet(cabinet)
+        if capacities is None:
+            capacities = self.get_shelf_capacities(cabinet, table)
 
         if not capacities:
             results.append(
@@ -267,11 +266,10 @@ class StructuralSafetyService:
                 )
 
         # Check for span warnings
-        for section_idx, section in enumerate(cabinet.sections):
-            span = section.width - (2 * cabinet.material.thickness)
-            max_span = get_max_span(
-                cabinet.material.material_type, cabinet.material.thickness
-            )
+        max_span = table.case_max_span
+        section_spans = table.section_widths - (2 * cabinet.material.thickness)
+        for section_idx in np.flatnonzero(section_spans > max_span * 0.9).tolist():
+            span = float(section_spans[section_idx])
 
             if span > max_span:
                 results.append(
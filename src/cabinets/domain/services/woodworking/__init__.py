@@ -5,6 +5,7 @@ This package provides:
 - Joint specifications for panel connections
 - Span limits for material safety
 - Weight capacity estimations
+- Batched shelf tables shared by span and capacity analyses
 - Hardware aggregation
 - WoodworkingIntelligence service for joinery analysis
 
@@ -66,6 +67,7 @@ from .joint_selection import (
 )
 
 # Re-export specialized services
+from .shelf_analysis import ShelfLoadTable
 from .span_checker import SpanChecker
 from .capacity_calculator import CapacityCalculator
 from .hardware_calculator import HardwareCalculator
@@ -114,6 +116,7 @@ __all__ = [
     "select_joint",
     "JointSpecCalculator",
     # Specialized services
+    "ShelfLoadTable",
     "SpanChecker",
     "CapacityCalculator",
     "HardwareCalculator",
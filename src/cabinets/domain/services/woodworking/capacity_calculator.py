@@ -12,6 +12,7 @@ from cabinets.domain.value_objects import MaterialSpec, MaterialType
 
 from .constants import MATERIAL_MODULUS, MAX_DEFLECTION_RATIO, SAFETY_FACTOR
 from .models import WeightCapacity
+from .shelf_analysis import ShelfLoadTable
 
 if TYPE_CHECKING:
     from cabinets.domain.entities import Cabinet
@@ -25,6 +26,9 @@ class CapacityCalculator:
     and should not be used for structural engineering purposes.
     """
 
+    # Modulus of elasticity used for materials without a known value
+    DEFAULT_MODULUS: float = 1_000_000
+
     def estimate_capacity(
         self,
         thickness: float,
@@ -66,18 +70,9 @@ class CapacityCalculator:
         if load_type == "point":
             base_capacity *= 0.5  # 50% reduction for point loads
 
-        # Apply safety factor (divide by safety factor for safe load rating)
-        final_capacity = base_capacity / SAFETY_FACTOR
-
-        # Round to nearest 5 lbs for readability
-        final_capacity = round(final_capacity / 5) * 5
-
-        # Minimum capacity of 5 lbs
-        final_capacity = max(5.0, final_capacity)
-
         return WeightCapacity(
             panel_label=panel_label,
-            capacity_lbs=final_capacity,
+            capacity_lbs=self._rated_capacity(base_capacity),
             load_type=load_type,
             span=span,
             material=MaterialSpec(thickness=thickness, material_type=material_type),
@@ -118,7 +113,7 @@ class CapacityCalculator:
             return 0.0
 
         # Get modulus of elasticity
-        E = MATERIAL_MODULUS.get(material_type, 1_000_000)
+        E = MATERIAL_MODULUS.get(material_type, self.DEFAULT_MODULUS)
 
         # Moment of inertia for rectangular section
         # I = (b * h^3) / 12, where b = depth, h = thickness
@@ -139,36 +134,72 @@ class CapacityCalculator:
 
         return total_load
 
-    def get_shelf_capacities(self, cabinet: "Cabinet") -> list[WeightCapacity]:
+    @staticmethod
+    def _rated_capacity(base_capacity: float) -> float:
+        """Apply the safety factor and round a base capacity for display.
+
+        Args:
+            base_capacity: Capacity in pounds before the safety factor.
+
+        Returns:
+            Safe capacity rounded to the nearest 5 lbs, at least 5 lbs.
+        """
+        # Apply safety factor (divide by safety factor for safe load rating)
+        final_capacity = base_capacity / SAFETY_FACTOR
+
+        # Round to nearest 5 lbs for readability
+        final_capacity = round(final_capacity / 5) * 5
+
+        # Minimum capacity of 5 lbs
+        return max(5.0, final_capacity)
+
+    def get_shelf_capacities(
+        self, cabinet: "Cabinet", table: ShelfLoadTable | None = None
+    ) -> list[WeightCapacity]:
         """Get weight capacity estimates for all shelves in a cabinet.
 
-        Calculates capacity for each shelf based on its material,
-        thickness, depth, and span.
+        Calculates distributed-load capacity for every shelf in one
+        batched pass based on its material, thickness, depth, and span
+        (the section width).
 
         Args:
             cabinet: Cabinet to analyze.
+            table: Precomputed shelf table to share with other analyses.
+                Built from the cabinet if not provided.
 
         Returns:
             List of WeightCapacity objects, one per shelf.
         """
-        capacities: list[WeightCapacity] = []
-
-        for section_idx, section in enumerate(cabinet.sections):
-            for shelf_idx, shelf in enumerate(section.shelves):
-                # Calculate span (section width is unsupported span)
-                span = section.width
-
-                capacity = self.estimate_capacity(
-                    thickness=shelf.material.thickness,
-                    depth=shelf.depth,
-                    span=span,
-                    material_type=shelf.material.material_type,
-                    load_type="distributed",
-                    panel_label=f"Section {section_idx + 1} Shelf {shelf_idx + 1}",
-                )
-                capacities.append(capacity)
-
-        return capacities
+        if table is None:
+            table = ShelfLoadTable.from_cabinet(cabinet)
+
+        spans = table.shelf_section_widths
+        # Total capacity is load per inch times the span
+        base_capacities = (
+            table.distributed_load(spans, MAX_DEFLECTION_RATIO, self.DEFAULT_MODULUS)
+            * spans
+        )
+
+        return [
+            WeightCapacity(
+                panel_label=f"Section {section_idx + 1} Shelf {shelf_idx + 1}",
+                capacity_lbs=self._rated_capacity(float(base_capacity)),
+                load_type="distributed",
+                span=float(span),
+                material=MaterialSpec(
+                    thickness=material.thickness,
+                    material_type=material.material_type,
+                ),
+                disclaimer="Advisory only - not engineered",
+            )
+            for section_idx, shelf_idx, span, base_capacity, material in zip(
+                table.section_indices.tolist(),
+                table.shelf_indices.tolist(),
+                spans,
+                base_capacities,
+                table.materials,
+            )
+        ]
 
     def format_capacity_report(self, capacities: list[WeightCapacity]) -> str:
         """Format weight capacity estimates as a report.
@@ -0,0 +1,163 @@
+"""Batched structural analysis of horizontal panels.
+
+This module provides ShelfLoadTable, a columnar view of every shelf in a
+cabinet. Thickness, depth, span, modulus and span limit are gathered into
+NumPy arrays once so that capacity and span checks run in a single pass
+instead of recomputing the beam deflection formula shelf by shelf.
+
+The table is shared by the woodworking services, the safety services and
+the JSON exporter; build it once per cabinet and pass it to each consumer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cabinets.domain.value_objects import MaterialSpec
+
+from .constants import MATERIAL_MODULUS, get_max_span
+
+if TYPE_CHECKING:
+    from cabinets.domain.entities import Cabinet
+
+
+@dataclass(frozen=True, eq=False)
+class ShelfLoadTable:
+    """Columnar shelf data for batched capacity and span analysis.
+
+    Shelf arrays are ordered section by section, then shelf by shelf,
+    matching the order of the per-shelf loops they replace.
+
+    Attributes:
+        section_widths: Width of every section, shape (sections,).
+        section_indices: Section index of each shelf, shape (shelves,).
+        shelf_indices: Index of each shelf within its section.
+        thicknesses: Shelf material thickness in inches.
+        depths: Shelf depth in inches.
+        moduli: Modulus of elasticity in psi, NaN for unknown materials.
+        max_spans: Recommended maximum span for each shelf's material.
+        materials: Material specification of each shelf.
+        case_material: Material of the cabinet case.
+        case_max_span: Recommended maximum span for the case material.
+    """
+
+    section_widths: np.ndarray
+    section_indices: np.ndarray
+    shelf_indices: np.ndarray
+    thicknesses: np.ndarray
+    depths: np.ndarray
+    moduli: np.ndarray
+    max_spans: np.ndarray
+    materials: tuple[MaterialSpec, ...]
+    case_material: MaterialSpec
+    case_max_span: float
+
+    @classmethod
+    def from_cabinet(cls, cabinet: "Cabinet") -> ShelfLoadTable:
+        """Gather every shelf of a cabinet into arrays.
+
+        Args:
+            cabinet: Cabinet to analyze.
+
+        Returns:
+            ShelfLoadTable for the cabinet's current sections and shelves.
+        """
+        section_indices: list[int] = []
+        shelf_indices: list[int] = []
+        materials: list[MaterialSpec] = []
+        depths: list[float] = []
+        for section_idx, section in enumerate(cabinet.sections):
+            for shelf_idx, shelf in enumerate(section.shelves):
+                section_indices.append(section_idx)
+                shelf_indices.append(shelf_idx)
+                materials.append(shelf.material)
+                depths.append(shelf.depth)
+
+        # Span limits and moduli depend only on the material, so look each
+        # distinct material up once
+        max_span_by_material = {
+            material: get_max_span(material.material_type, material.thickness)
+            for material in set(materials)
+        }
+
+        case_material = cabinet.material
+        return cls(
+            section_widths=np.array(
+                [section.width for section in cabinet.sections], dtype=float
+            ),
+            section_indices=np.array(section_indices, dtype=int),
+            shelf_indices=np.array(shelf_indices, dtype=int),
+            thicknesses=np.array([m.thickness for m in materials], dtype=float),
+            depths=np.array(depths, dtype=float),
+            moduli=np.array(
+                [MATERIAL_MODULUS.get(m.material_type, np.nan) for m in materials],
+                dtype=float,
+            ),
+            max_spans=np.array(
+                [max_span_by_material[m] for m in materials], dtype=float
+            ),
+            materials=tuple(materials),
+            case_material=case_material,
+            case_max_span=get_max_span(
+                case_material.material_type, case_material.thickness
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Number of shelves in the table."""
+        return len(self.materials)
+
+    @property
+    def shelf_section_widths(self) -> np.ndarray:
+        """Width of the section containing each shelf."""
+        return self.section_widths[self.section_indices]
+
+    @cached_property
+    def moments_of_inertia(self) -> np.ndarray:
+        """Moment of inertia of each shelf cross-section, I = (b * h^3) / 12."""
+        return (self.depths * (self.thicknesses**3)) / 12
+
+    def modulus(self, default: float) -> np.ndarray:
+        """Get moduli with a fallback for materials without a known value.
+
+        Args:
+            default: Modulus in psi to use for unknown materials.
+
+        Returns:
+            Modulus of elasticity for each shelf.
+        """
+        return np.where(np.isnan(self.moduli), default, self.moduli)
+
+    def distributed_load(
+        self,
+        spans: np.ndarray,
+        deflection_ratio: float,
+        default_modulus: float,
+    ) -> np.ndarray:
+        """Maximum uniform load per inch at the deflection limit.
+
+        Solves the simply supported beam deflection formula
+        w = (384 * E * I * delta) / (5 * L^4) with delta = L / ratio for
+        every shelf at once. Shelves with a non-positive span get zero.
+
+        Args:
+            spans: Unsupported span of each shelf in inches.
+            deflection_ratio: Span to allowable deflection ratio (e.g. 300).
+            default_modulus: Modulus in psi for unknown materials.
+
+        Returns:
+            Load per inch of span for each shelf.
+        """
+        max_deflection = spans / deflection_ratio
+        with np.errstate(divide="ignore", invalid="ignore"):
+            load = (
+                max_deflection
+                * 384
+                * self.modulus(default_modulus)
+                * self.moments_of_inertia
+            ) / (5 * spans**4)
+        return np.where(spans > 0, load, 0.0)
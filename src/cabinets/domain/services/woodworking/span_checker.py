@@ -8,13 +8,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from cabinets.domain.value_objects import PanelType
 
-from .constants import get_max_span
 from .models import SpanWarning
+from .shelf_analysis import ShelfLoadTable
 
 if TYPE_CHECKING:
-    from cabinets.domain.entities import Cabinet, Section, Shelf
+    from cabinets.domain.entities import Cabinet
 
 
 class SpanChecker:
@@ -24,47 +26,52 @@ class SpanChecker:
     span limits. Returns warnings for any panels that exceed safe limits.
     """
 
-    def check_spans(self, cabinet: "Cabinet") -> list[SpanWarning]:
+    def check_spans(
+        self, cabinet: "Cabinet", table: ShelfLoadTable | None = None
+    ) -> list[SpanWarning]:
         """Check all horizontal panels for span violations.
 
         Analyzes shelves, top, and bottom panels against material-specific
         span limits. Returns warnings for any panels that exceed safe limits.
+        All shelves are compared against their limits in one batched pass.
 
         Args:
             cabinet: Cabinet to analyze.
+            table: Precomputed shelf table to share with other analyses.
+                Built from the cabinet if not provided.
 
         Returns:
             List of SpanWarning objects for panels exceeding limits.
         """
+        if table is None:
+            table = ShelfLoadTable.from_cabinet(cabinet)
+
         warnings: list[SpanWarning] = []
 
-        # Check each section's shelves
-        for section_idx, section in enumerate(cabinet.sections):
-            for shelf_idx, shelf in enumerate(section.shelves):
-                span = self._calculate_shelf_span(shelf, section)
-                max_span = get_max_span(
-                    shelf.material.material_type, shelf.material.thickness
+        # Check all shelves at once; only violations become warnings
+        spans = self._calculate_shelf_spans(table)
+        for i in np.flatnonzero(spans > table.max_spans):
+            span = float(spans[i])
+            max_span = float(table.max_spans[i])
+            severity = "critical" if span > max_span * 1.5 else "warning"
+            warnings.append(
+                SpanWarning(
+                    panel_label=(
+                        f"Section {table.section_indices[i] + 1} "
+                        f"Shelf {table.shelf_indices[i] + 1}"
+                    ),
+                    span=span,
+                    max_span=max_span,
+                    material=table.materials[i],
+                    suggestion=self._get_span_suggestion(span, max_span),
+                    severity=severity,
                 )
-
-                if span > max_span:
-                    severity = "critical" if span > max_span * 1.5 else "warning"
-                    warnings.append(
-                        SpanWarning(
-                            panel_label=f"Section {section_idx + 1} Shelf {shelf_idx + 1}",
-                            span=span,
-                            max_span=max_span,
-                            material=shelf.material,
-                            suggestion=self._get_span_suggestion(span, max_span),
-                            severity=severity,
-                        )
-                    )
+            )
 
         # Check top panel span
         top_span = self._calculate_case_span(cabinet, PanelType.TOP)
         if top_span > 0:
-            max_span = get_max_span(
-                cabinet.material.material_type, cabinet.material.thickness
-            )
+            max_span = table.case_max_span
             if top_span > max_span:
                 warnings.append(
                     SpanWarning(
@@ -80,9 +87,7 @@ class SpanChecker:
         # Check bottom panel span
         bottom_span = self._calculate_case_span(cabinet, PanelType.BOTTOM)
         if bottom_span > 0:
-            max_span = get_max_span(
-                cabinet.material.material_type, cabinet.material.thickness
-            )
+            max_span = table.case_max_span
             if bottom_span > max_span:
                 warnings.append(
                     SpanWarning(
@@ -97,23 +102,22 @@ class SpanChecker:
 
         return warnings
 
-    def _calculate_shelf_span(self, shelf: "Shelf", section: "Section") -> float:
-        """Calculate unsupported span for a shelf.
+    def _calculate_shelf_spans(self, table: ShelfLoadTable) -> np.ndarray:
+        """Calculate unsupported spans for all shelves.
 
         The unsupported span is the width of the section that the shelf
         spans, not accounting for any intermediate supports.
 
         Args:
-            shelf: The shelf to analyze.
-            section: The section containing the shelf.
+            table: Shelf table for the cabinet.
 
         Returns:
-            Unsupported span in inches.
+            Unsupported span of each shelf in inches.
         """
         # Basic calculation: section width is the unsupported span
         # In a more complex implementation, this could account for
         # intermediate dividers or supports
-        return section.width
+        return table.shelf_section_widths
 
     def _calculate_case_span(self, cabinet: "Cabinet", panel_type: PanelType) -> float:
         """Calculate unsupported span for top/bottom case panels.
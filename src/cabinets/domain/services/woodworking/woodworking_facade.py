@@ -17,6 +17,7 @@ from .grain_advisor import GrainAdvisor
 from .hardware_calculator import HardwareCalculator
 from .joint_selection import JointSpecCalculator, select_joint
 from .models import ConnectionJoinery, HardwareList, SpanWarning, WeightCapacity
+from .shelf_analysis import ShelfLoadTable
 from .span_checker import SpanChecker
 
 if TYPE_CHECKING:
@@ -277,16 +278,30 @@ class WoodworkingIntelligence:
 
     # --- Span Checking Methods (delegated to SpanChecker) ---
 
-    def check_spans(self, cabinet: "Cabinet") -> list[SpanWarning]:
+    def analyze_shelves(self, cabinet: "Cabinet") -> ShelfLoadTable:
+        """Gather all shelves into a table shared by span and capacity checks.
+
+        Args:
+            cabinet: Cabinet to analyze.
+
+        Returns:
+            ShelfLoadTable to pass to check_spans and get_shelf_capacities.
+        """
+        return ShelfLoadTable.from_cabinet(cabinet)
+
+    def check_spans(
+        self, cabinet: "Cabinet", table: ShelfLoadTable | None = None
+    ) -> list[SpanWarning]:
         """Check all horizontal panels for span violations.
 
         Args:
             cabinet: Cabinet to analyze.
+            table: Optional precomputed shelf table from analyze_shelves.
 
         Returns:
             List of SpanWarning objects for panels exceeding limits.
         """
-        return self._span_checker.check_spans(cabinet)
+        return self._span_checker.check_spans(cabinet, table)
 
     # --- Capacity Methods (delegated to CapacityCalculator) ---
 
@@ -321,16 +336,19 @@ class WoodworkingIntelligence:
             panel_label=panel_label,
         )
 
-    def get_shelf_capacities(self, cabinet: "Cabinet") -> list[WeightCapacity]:
+    def get_shelf_capacities(
+        self, cabinet: "Cabinet", table: ShelfLoadTable | None = None
+    ) -> list[WeightCapacity]:
         """Get weight capacity estimates for all shelves in a cabinet.
 
         Args:
             cabinet: Cabinet to analyze.
+            table: Optional precomputed shelf table from analyze_shelves.
 
         Returns:
             List of WeightCapacity objects, one per shelf.
         """
-        return self._capacity_calculator.get_shelf_capacities(cabinet)
+        return self._capacity_calculator.get_shelf_capacities(cabinet, table)
 
     def format_capacity_report(self, capacities: list[WeightCapacity]) -> str:
         """Format weight capacity estimates as a report.
@@ -2,12 +2,20 @@
 
 This service orchestrates the generation of vertical zone configurations,
 producing multiple cabinets, countertops, and gap zone metadata.
+
+Walls of a room often repeat the same preset at the same width, so the
+service memoizes preset resolution and the cabinet generated for each zone,
+keyed by preset, zone dimensions and section definitions. Memoized zone
+stacks and cabinets are shared between results and must be treated as
+read-only.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, TypeVar
 
 from ..entities import Cabinet, Panel, Section, Shelf
 from ..value_objects import (
@@ -27,6 +35,11 @@ from ..components.context import ComponentContext
 from ..components.countertop import CountertopSurfaceComponent
 from ..components.results import HardwareItem
 
+T = TypeVar("T")
+
+# Entries kept in each memo cache before the oldest are evicted
+_CACHE_SIZE = 256
+
 
 @dataclass(frozen=True)
 class GapZoneMetadata:
@@ -142,6 +155,33 @@ class ZoneLayoutService:
 
     def __init__(self) -> None:
         self._countertop_component = CountertopSurfaceComponent()
+        self._zone_stacks: dict[Hashable, VerticalZoneStack] = {}
+        self._zone_cabinets: dict[Hashable, Cabinet] = {}
+        self._lock = threading.Lock()
+
+    def generate_walls(
+        self, configs: Sequence[ZoneLayoutConfig]
+    ) -> list[ZoneStackLayoutResult]:
+        """Generate the zone stacks of several walls in one call.
+
+        Walls with identical configurations share one result object, and
+        walls using the same preset and width share their zone cabinets.
+        Results must therefore be treated as read-only.
+
+        Args:
+            configs: Zone layout configuration of each wall
+
+        Returns:
+            One ZoneStackLayoutResult per configuration, in order
+        """
+        results: dict[Hashable, ZoneStackLayoutResult] = {}
+        layouts: list[ZoneStackLayoutResult] = []
+        for config in configs:
+            key = _freeze(config)
+            if key not in results:
+                results[key] = self.generate(config)
+            layouts.append(results[key])
+        return layouts
 
     def generate(self, config: ZoneLayoutConfig) -> ZoneStackLayoutResult:
         """Generate a complete zone stack layout.
@@ -226,14 +266,39 @@ class ZoneLayoutService:
 
     def _resolve_zone_stack(self, config: ZoneLayoutConfig) -> VerticalZoneStack:
         """Resolve zone stack from preset or custom configuration."""
-        if config.preset.lower() == "custom":
+        preset = config.preset.lower()
+        if preset == "custom":
             if not config.custom_zones:
                 raise ValueError(
                     "Custom zone configuration requires 'custom_zones' list"
                 )
-            return self._build_custom_zone_stack(config)
-        else:
-            return get_preset(config.preset, width=config.width)
+            key = (
+                preset,
+                config.width,
+                config.full_height_sides,
+                _freeze(config.custom_zones),
+            )
+            return self._memoized(
+                self._zone_stacks, key, lambda: self._build_custom_zone_stack(config)
+            )
+        return self._memoized(
+            self._zone_stacks,
+            (preset, config.width),
+            lambda: get_preset(config.preset, width=config.width),
+        )
+
+    def _memoized(
+        self, cache: dict[Hashable, T], key: Hashable, build: Callable[[], T]
+    ) -> T:
+        """Get a cached value, building and storing it on a miss."""
+        with self._lock:
+            if key in cache:
+                return cache[key]
+        value = build()
+        with self._lock:
+            if key not in cache and len(cache) >= _CACHE_SIZE:
+                del cache[next(iter(cache))]
+            return cache.setdefault(key, value)
 
     def _build_custom_zone_stack(self, config: ZoneLayoutConfig) -> VerticalZoneStack:
         """Build a zone stack from custom zone definitions."""
@@ -330,21 +395,8 @@ class ZoneLayoutService:
 
         # Use the first floor zone for dimensions
         # (typically there's only one base zone)
-        primary_zone = floor_zones[0]
-
-        # Build sections from zone definitions
-        sections = self._build_sections_from_zone(
-            primary_zone, config, zone_stack.total_width
-        )
-
-        material = config.material or MaterialSpec(thickness=0.75)
-
-        return Cabinet(
-            width=zone_stack.total_width,
-            height=primary_zone.height,
-            depth=primary_zone.depth,
-            material=material,
-            sections=sections,
+        return self._generate_zone_cabinet(
+            floor_zones[0], config, zone_stack.total_width
         )
 
     def _generate_upper_cabinet(
@@ -361,22 +413,27 @@ class ZoneLayoutService:
             return None
 
         # Use the first wall zone for dimensions
-        primary_zone = wall_zones[0]
-
-        # Build sections from zone definitions
-        sections = self._build_sections_from_zone(
-            primary_zone, config, zone_stack.total_width
+        return self._generate_zone_cabinet(
+            wall_zones[0], config, zone_stack.total_width
         )
 
+    def _generate_zone_cabinet(
+        self, zone: VerticalZone, config: ZoneLayoutConfig, cabinet_width: float
+    ) -> Cabinet:
+        """Generate (or reuse) the cabinet for one zone."""
         material = config.material or MaterialSpec(thickness=0.75)
 
-        return Cabinet(
-            width=zone_stack.total_width,
-            height=primary_zone.height,
-            depth=primary_zone.depth,
-            material=material,
-            sections=sections,
-        )
+        def build() -> Cabinet:
+            return Cabinet(
+                width=cabinet_width,
+                height=zone.height,
+                depth=zone.depth,
+                material=material,
+                sections=self._build_sections_from_zone(zone, config, cabinet_width),
+            )
+
+        key = (_freeze(zone), cabinet_width, material)
+        return self._memoized(self._zone_cabinets, key, build)
 
     def _build_sections_from_zone(
         self, zone: VerticalZone, config: ZoneLayoutConfig, cabinet_width: float
@@ -677,3 +734,17 @@ class ZoneLayoutService:
         panels.append(right_panel)
 
         return tuple(panels)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert nested dicts, lists and dataclasses into a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__name__,
+            *(_freeze(getattr(value, f.name)) for f in fields(value)),
+        )
+    return value
@@ -18,6 +18,9 @@ from ._core_geometry import (
     Position3D,
 )
 
+# Columnar cut list
+from ._cut_table import CutListTable
+
 # Panel types and cutting specifications
 from ._panels import (
     AngleCut,
@@ -65,6 +68,7 @@ from ._layout import (
     LayoutResult,
     LayoutWarning,
     PlacedSection,
+    RoomGeometry,
     SectionTransform,
     SkippedArea,
     ValidRegion,
@@ -138,6 +142,7 @@ __all__ = [
     "Position",
     "MaterialSpec",
     "CutPiece",
+    "CutListTable",
     "Position3D",
     "Point2D",
     "MountingPoint",
@@ -172,6 +177,7 @@ __all__ = [
     # Layout
     "WallPosition",
     "GeometryError",
+    "RoomGeometry",
     "SectionTransform",
     "WallSectionAssignment",
     "FitError",
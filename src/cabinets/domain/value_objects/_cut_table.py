@@ -0,0 +1,240 @@
+"""Columnar cut list representation.
+
+CutListTable stores a cut list as parallel NumPy arrays, one row per
+CutPiece, with materials, panel types, labels and cut metadata interned in
+side tables. Large cut lists (thousands of pieces) take a fraction of the
+memory of CutPiece objects, and totals, grouping and sorting run at array
+speed. Tables convert losslessly to and from ``list[CutPiece]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ._core_geometry import CutPiece, MaterialSpec
+from ._panels import PanelType
+
+# Metadata code of rows without cut metadata
+NO_METADATA = -1
+
+
+@dataclass(frozen=True, eq=False)
+class CutListTable:
+    """A cut list stored column-wise.
+
+    Row ``i`` describes one CutPiece: its dimensions and quantity are read
+    from the numeric columns, and its label, panel type, material and cut
+    metadata from the side tables via the ``*_codes`` columns.
+
+    Attributes:
+        widths: Piece widths in inches (float64).
+        heights: Piece heights in inches (float64).
+        quantities: Piece quantities (int64).
+        label_codes: Index of each row's label in ``labels``.
+        panel_type_codes: Index of each row's panel type in ``panel_types``.
+        material_codes: Index of each row's material in ``materials``.
+        metadata_codes: Index of each row's cut metadata in ``metadata``,
+            or NO_METADATA.
+        labels: Distinct labels.
+        panel_types: Distinct panel types.
+        materials: Distinct materials, in order of first appearance.
+        metadata: Distinct cut metadata dictionaries (by identity).
+    """
+
+    widths: np.ndarray
+    heights: np.ndarray
+    quantities: np.ndarray
+    label_codes: np.ndarray
+    panel_type_codes: np.ndarray
+    material_codes: np.ndarray
+    metadata_codes: np.ndarray
+    labels: tuple[str, ...]
+    panel_types: tuple[PanelType, ...]
+    materials: tuple[MaterialSpec, ...]
+    metadata: tuple[dict[str, Any], ...]
+
+    @classmethod
+    def from_pieces(cls, pieces: Iterable[CutPiece]) -> CutListTable:
+        """Build a table from cut pieces.
+
+        Args:
+            pieces: Cut pieces, one row each.
+
+        Returns:
+            CutListTable with the pieces in order.
+        """
+        label_index: dict[str, int] = {}
+        panel_type_index: dict[PanelType, int] = {}
+        material_index: dict[MaterialSpec, int] = {}
+        # Metadata dicts are unhashable, so they are interned by identity
+        metadata_index: dict[int, int] = {}
+        metadata: list[dict[str, Any]] = []
+
+        widths: list[float] = []
+        heights: list[float] = []
+        quantities: list[int] = []
+        label_codes: list[int] = []
+        panel_type_codes: list[int] = []
+        material_codes: list[int] = []
+        metadata_codes: list[int] = []
+
+        for piece in pieces:
+            widths.append(piece.width)
+            heights.append(piece.height)
+            quantities.append(piece.quantity)
+            label_codes.append(label_index.setdefault(piece.label, len(label_index)))
+            panel_type_codes.append(
+                panel_type_index.setdefault(piece.panel_type, len(panel_type_index))
+            )
+            material_codes.append(
+                material_index.setdefault(piece.material, len(material_index))
+            )
+            if piece.cut_metadata is None:
+                metadata_codes.append(NO_METADATA)
+            else:
+                code = metadata_index.get(id(piece.cut_metadata))
+                if code is None:
+                    code = metadata_index[id(piece.cut_metadata)] = len(metadata)
+                    metadata.append(piece.cut_metadata)
+                metadata_codes.append(code)
+
+        return cls(
+            widths=np.array(widths, dtype=np.float64),
+            heights=np.array(heights, dtype=np.float64),
+            quantities=np.array(quantities, dtype=np.int64),
+            label_codes=np.array(label_codes, dtype=np.int32),
+            panel_type_codes=np.array(panel_type_codes, dtype=np.int16),
+            material_codes=np.array(material_codes, dtype=np.int16),
+            metadata_codes=np.array(metadata_codes, dtype=np.int32),
+            labels=tuple(label_index),
+            panel_types=tuple(panel_type_index),
+            materials=tuple(material_index),
+            metadata=tuple(metadata),
+        )
+
+    @classmethod
+    def coerce(cls, pieces: Sequence[CutPiece] | CutListTable) -> CutListTable:
+        """Get a table for pieces that may already be a table.
+
+        Args:
+            pieces: Cut pieces or an existing table.
+
+        Returns:
+            The table itself, or a new table built from the pieces.
+        """
+        if isinstance(pieces, CutListTable):
+            return pieces
+        return cls.from_pieces(pieces)
+
+    def __len__(self) -> int:
+        """Number of rows (distinct cut pieces, not units)."""
+        return len(self.widths)
+
+    @property
+    def areas(self) -> np.ndarray:
+        """Total area of each row (width x height x quantity) in square inches."""
+        return self.widths * self.heights * self.quantities
+
+    @property
+    def total_quantity(self) -> int:
+        """Total number of physical pieces across all rows."""
+        return int(self.quantities.sum())
+
+    def total_area(self) -> float:
+        """Total area of all pieces in square inches.
+
+        Uses the built-in sum over the row areas, so the result equals
+        summing ``CutPiece.area`` over the equivalent piece list.
+        """
+        return sum(self.areas.tolist())
+
+    def area_by_material(self) -> dict[MaterialSpec, float]:
+        """Total area per material, in order of first appearance.
+
+        Returns:
+            Dictionary mapping each material present to its total area.
+        """
+        # bincount accumulates rows in order, matching a sequential sum
+        totals = np.bincount(
+            self.material_codes, weights=self.areas, minlength=len(self.materials)
+        )
+        present = np.bincount(self.material_codes, minlength=len(self.materials))
+        return {
+            material: float(total)
+            for material, total, count in zip(self.materials, totals, present)
+            if count
+        }
+
+    def select(self, rows: np.ndarray) -> CutListTable:
+        """Get a table with a subset of rows, sharing the side tables.
+
+        Args:
+            rows: Row indices or boolean mask.
+
+        Returns:
+            CutListTable with the selected rows.
+        """
+        return CutListTable(
+            widths=self.widths[rows],
+            heights=self.heights[rows],
+            quantities=self.quantities[rows],
+            label_codes=self.label_codes[rows],
+            panel_type_codes=self.panel_type_codes[rows],
+            material_codes=self.material_codes[rows],
+            metadata_codes=self.metadata_codes[rows],
+            labels=self.labels,
+            panel_types=self.panel_types,
+            materials=self.materials,
+            metadata=self.metadata,
+        )
+
+    def group_by_material(self) -> dict[MaterialSpec, CutListTable]:
+        """Split the table by material, in order of first appearance.
+
+        Returns:
+            Dictionary mapping each material present to its rows.
+        """
+        groups: dict[MaterialSpec, CutListTable] = {}
+        for code, material in enumerate(self.materials):
+            mask = self.material_codes == code
+            if mask.any():
+                groups[material] = self.select(mask)
+        return groups
+
+    def piece(
+        self, row: int, quantity: int | None = None, label: str | None = None
+    ) -> CutPiece:
+        """Materialize one row as a CutPiece.
+
+        Args:
+            row: Row index.
+            quantity: Quantity override (default: the row's quantity).
+            label: Label override (default: the row's label).
+
+        Returns:
+            CutPiece for the row.
+        """
+        metadata_code = int(self.metadata_codes[row])
+        return CutPiece(
+            width=float(self.widths[row]),
+            height=float(self.heights[row]),
+            quantity=int(self.quantities[row]) if quantity is None else quantity,
+            label=self.labels[self.label_codes[row]] if label is None else label,
+            panel_type=self.panel_types[self.panel_type_codes[row]],
+            material=self.materials[self.material_codes[row]],
+            cut_metadata=(
+                None if metadata_code == NO_METADATA else self.metadata[metadata_code]
+            ),
+        )
+
+    def to_pieces(self) -> list[CutPiece]:
+        """Convert the table back to cut pieces.
+
+        Returns:
+            One CutPiece per row, in order.
+        """
+        return [self.piece(row) for row in range(len(self))]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from ._core_geometry import Point2D, Position3D
@@ -46,6 +48,163 @@ class GeometryError:
             )
 
 
+@dataclass(frozen=True)
+class RoomGeometry:
+    """Derived geometry of a chain of connected walls.
+
+    An immutable snapshot of everything computed from wall lengths and
+    angles: global wall positions, the footprint bounding box and wall
+    intersections. Room caches one snapshot and rebuilds it only when its
+    walls change.
+
+    Attributes:
+        wall_positions: Global start/end coordinates of each wall.
+        bounding_box: (width, depth) of the footprint in inches.
+    """
+
+    wall_positions: tuple[WallPosition, ...]
+    bounding_box: tuple[float, float]
+
+    @classmethod
+    def from_walls(cls, walls: Sequence[tuple[float, float]]) -> RoomGeometry:
+        """Compute the geometry of a wall chain.
+
+        The first wall starts at the origin facing along positive X. Each
+        wall's angle turns the direction relative to the previous wall
+        (90 = turn right, -90 = turn left).
+
+        Args:
+            walls: (length, angle) of each wall, in order.
+
+        Returns:
+            RoomGeometry for the walls.
+        """
+        positions: list[WallPosition] = []
+        current_x = 0.0
+        current_y = 0.0
+        current_direction = 0.0  # degrees from positive X axis
+
+        for i, (length, angle) in enumerate(walls):
+            current_direction = (current_direction - angle) % 360
+            direction_rad = math.radians(current_direction)
+            end_x = current_x + length * math.cos(direction_rad)
+            end_y = current_y + length * math.sin(direction_rad)
+
+            positions.append(
+                WallPosition(
+                    wall_index=i,
+                    start=Point2D(x=current_x, y=current_y),
+                    end=Point2D(x=end_x, y=end_y),
+                    direction=current_direction,
+                )
+            )
+            current_x = end_x
+            current_y = end_y
+
+        if positions:
+            xs = [c for p in positions for c in (p.start.x, p.end.x)]
+            ys = [c for p in positions for c in (p.start.y, p.end.y)]
+            bounding_box = (max(xs) - min(xs), max(ys) - min(ys))
+        else:
+            bounding_box = (0.0, 0.0)
+
+        return cls(wall_positions=tuple(positions), bounding_box=bounding_box)
+
+    @property
+    def closure_gap(self) -> float:
+        """Distance from the end of the last wall to the start of the first."""
+        if not self.wall_positions:
+            return 0.0
+        start_point = self.wall_positions[0].start
+        end_point = self.wall_positions[-1].end
+        return math.sqrt(
+            (end_point.x - start_point.x) ** 2 + (end_point.y - start_point.y) ** 2
+        )
+
+    def intersecting_walls(self, is_closed: bool = False) -> list[tuple[int, int]]:
+        """Find pairs of non-adjacent walls that cross each other.
+
+        Sweeps a vertical line across the walls' x extents and only tests
+        walls whose bounding boxes overlap, so rooms with hundreds of walls
+        avoid the all-pairs comparison.
+
+        Args:
+            is_closed: Whether the room is closed, in which case the first
+                and last walls meet and are not tested against each other.
+
+        Returns:
+            Sorted (i, j) wall index pairs with i < j.
+        """
+        positions = self.wall_positions
+        last = len(positions) - 1
+        boxes = [
+            (
+                min(p.start.x, p.end.x),
+                max(p.start.x, p.end.x),
+                min(p.start.y, p.end.y),
+                max(p.start.y, p.end.y),
+            )
+            for p in positions
+        ]
+
+        pairs: list[tuple[int, int]] = []
+        active: list[int] = []
+        for k in sorted(range(len(positions)), key=lambda k: boxes[k][0]):
+            min_x, _, min_y, max_y = boxes[k]
+            # Drop walls that end before this one starts
+            active = [a for a in active if boxes[a][1] >= min_x]
+            for a in active:
+                if boxes[a][3] < min_y or boxes[a][2] > max_y:
+                    continue
+                i, j = min(a, k), max(a, k)
+                # Adjacent walls share an endpoint, as do the first and last
+                # walls of a closed room
+                if j <= i + 1 or (is_closed and i == 0 and j == last):
+                    continue
+                if self.segments_intersect(positions[i], positions[j]):
+                    pairs.append((i, j))
+            active.append(k)
+
+        pairs.sort()
+        return pairs
+
+    @staticmethod
+    def segments_intersect(pos_a: WallPosition, pos_b: WallPosition) -> bool:
+        """Check if two wall segments intersect.
+
+        Uses the cross product method: two segments intersect if and only
+        if each segment straddles the line containing the other.
+
+        Args:
+            pos_a: First wall position.
+            pos_b: Second wall position.
+
+        Returns:
+            True if the segments intersect (excluding endpoints).
+        """
+        ax1, ay1 = pos_a.start.x, pos_a.start.y
+        ax2, ay2 = pos_a.end.x, pos_a.end.y
+        bx1, by1 = pos_b.start.x, pos_b.start.y
+        bx2, by2 = pos_b.end.x, pos_b.end.y
+
+        def cross(
+            ox: float, oy: float, ax: float, ay: float, bx: float, by: float
+        ) -> float:
+            """Cross product of vectors (o->a) and (o->b)."""
+            return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+        # Check if segment b straddles the line containing segment a
+        d1 = cross(ax1, ay1, ax2, ay2, bx1, by1)
+        d2 = cross(ax1, ay1, ax2, ay2, bx2, by2)
+
+        # Check if segment a straddles the line containing segment b
+        d3 = cross(bx1, by1, bx2, by2, ax1, ay1)
+        d4 = cross(bx1, by1, bx2, by2, ax2, ay2)
+
+        # Use strict inequality to exclude endpoint touches
+        return d1 * d2 < 0 and d3 * d4 < 0
+
+
 @dataclass(frozen=True)
 class SectionTransform:
     """3D transform for positioning a cabinet section in room coordinates.
@@ -1,5 +1,12 @@
 """Infrastructure layer - external concerns and formatters."""
 
+from .artifact_store import (
+    ArtifactStore,
+    ArtifactStoreMetrics,
+    artifact_key,
+    configure_artifact_store,
+    get_artifact_store,
+)
 from .bin_packing import (
     BinPackingConfig,
     BinPackingService,
@@ -11,6 +18,7 @@ from .bin_packing import (
     SheetLayout,
 )
 from .cut_diagram_renderer import CutDiagramRenderer
+from .offcut_inventory import OffcutConflictError, OffcutInventory, StoredOffcut
 
 # Formatters (renamed from exporters.py to avoid conflict with exporters/ package)
 from .formatters import (
@@ -24,7 +32,7 @@ from .formatters import (
 )
 
 # STL exporter (keeping legacy import path for backwards compatibility)
-from .stl_exporter import StlExporter, StlMeshBuilder
+from .stl_exporter import CurveLOD, RenderSettings, StlExporter, StlMeshBuilder
 
 # New exporter framework from exporters/ package
 from .exporters import (
@@ -35,6 +43,12 @@ from .exporters import (
 )
 
 __all__ = [
+    # Artifact store
+    "ArtifactStore",
+    "ArtifactStoreMetrics",
+    "artifact_key",
+    "configure_artifact_store",
+    "get_artifact_store",
     # Bin packing
     "BinPackingConfig",
     "BinPackingService",
@@ -44,6 +58,10 @@ __all__ = [
     "PlacedPiece",
     "SheetConfig",
     "SheetLayout",
+    # Offcut inventory
+    "OffcutConflictError",
+    "OffcutInventory",
+    "StoredOffcut",
     # Cut diagram rendering
     "CutDiagramRenderer",
     # Legacy formatters
@@ -55,6 +73,8 @@ __all__ = [
     "MaterialReportFormatter",
     "RoomLayoutDiagramFormatter",
     # STL exporter (legacy)
+    "CurveLOD",
+    "RenderSettings",
     "StlExporter",
     "StlMeshBuilder",
     # New exporter framework
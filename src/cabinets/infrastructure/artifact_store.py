@@ -0,0 +1,428 @@
+"""Persistent content-addressed store for exported artifacts.
+
+Export artifacts are a pure function of the configuration (or export
+request) they are generated from, the exporter that produced them and the
+exporter options. ArtifactStore keeps artifact bytes on disk under a key
+derived from exactly those inputs, so any process pointed at the same
+directory - the CLI, a nightly batch job or the web API - can reuse an
+artifact another process already generated.
+
+Entries are written atomically (temporary file + rename), so concurrent
+readers never see a partial artifact. The total size is capped. Each
+process tracks the store size incrementally from its own writes and only
+scans the directory when that estimate crosses the cap (or every
+RESCAN_INTERVAL writes, to pick up other processes' writes); the scan
+evicts least recently used entries (by file modification time, refreshed
+on every read) down to EVICTION_TARGET of the cap, so one scan pays for
+many writes.
+
+The process-wide store is disabled unless configured, either with
+configure_artifact_store() or with these environment variables:
+
+- CABINETS_ARTIFACT_STORE: store directory
+- CABINETS_ARTIFACT_STORE_MAX_MB: size cap in megabytes (default 1024)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the shared store directory
+ARTIFACT_STORE_ENV = "CABINETS_ARTIFACT_STORE"
+
+# Environment variable overriding the store size cap, in megabytes
+ARTIFACT_STORE_MAX_MB_ENV = "CABINETS_ARTIFACT_STORE_MAX_MB"
+
+# Default size cap of a store in bytes (1 GiB)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Fraction of the size cap an eviction scan trims the store down to
+EVICTION_TARGET = 0.9
+
+# Writes between directory scans that resync the size estimate
+RESCAN_INTERVAL = 1024
+
+# File suffix of stored artifacts
+_ENTRY_SUFFIX = ".artifact"
+
+
+@lru_cache(maxsize=1)
+def _package_version() -> str:
+    try:
+        return metadata.version("builtin-cabinets-and-shelves")
+    except metadata.PackageNotFoundError:
+        return "0+unknown"
+
+
+def exporter_version(exporter_cls: type) -> str:
+    """Get the version string identifying an exporter's output format.
+
+    Args:
+        exporter_cls: Exporter class producing the artifact.
+
+    Returns:
+        Version combining the package version, the exporter class and its
+        ``format_version`` attribute (default "1").
+    """
+    format_version = getattr(exporter_cls, "format_version", "1")
+    return f"{_package_version()}:{exporter_cls.__qualname__}:{format_version}"
+
+
+def artifact_key(source: BaseModel, exporter_cls: type, **options: Any) -> str:
+    """Compute the content-addressed key of an export artifact.
+
+    Args:
+        source: Configuration or request model the artifact is generated from.
+        exporter_cls: Exporter class producing the artifact.
+        **options: Exporter options that affect the output bytes.
+
+    Returns:
+        SHA-256 hex digest of the exporter version, options and source.
+    """
+    digest = hashlib.sha256()
+    digest.update(exporter_version(exporter_cls).encode())
+    for key in sorted(options):
+        digest.update(f"\0{key}={options[key]!r}".encode())
+    digest.update(b"\0")
+    digest.update(source.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def artifact_options(exporter: object) -> dict[str, Any] | None:
+    """Get the options of an exporter instance that affect its output bytes.
+
+    Exporters declare them with an ``artifact_options()`` method that
+    returns every such option with defaults resolved, so an exporter built
+    with no arguments and one built with the same values explicitly share
+    artifact keys. Every producer of stored artifacts (ExportManager and
+    the web API) derives its keys from this function.
+
+    Args:
+        exporter: Exporter instance producing the artifact.
+
+    Returns:
+        Options to pass to artifact_key(), or None if the exporter does not
+        declare them, in which case its artifacts must not be stored.
+    """
+    declared = getattr(exporter, "artifact_options", None)
+    if declared is None:
+        return None
+    return dict(declared())
+
+
+@dataclass(frozen=True)
+class ArtifactStoreMetrics:
+    """Snapshot of artifact store statistics for this process.
+
+    Attributes:
+        hits: Lookups served from the store.
+        misses: Lookups that found no artifact.
+        writes: Artifacts written.
+        evictions: Artifacts removed to stay under the size cap.
+        max_bytes: Size cap of the store.
+    """
+
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the store."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a JSON-serializable dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class ArtifactStore:
+    """On-disk artifact store with a size cap and LRU eviction.
+
+    Entries live at ``<root>/<key[:2]>/<key>.artifact``. The store holds no
+    index in memory, only an estimate of its total size, so several
+    processes can share one directory.
+
+    Example:
+        store = ArtifactStore(Path("/var/cache/cabinets"))
+        key = artifact_key(config, StlLayoutExporter)
+        data = store.get_or_create(key, lambda: render_stl(config))
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the store, creating its directory if needed.
+
+        Args:
+            root: Store directory.
+            max_bytes: Maximum total size of stored artifacts.
+
+        Raises:
+            ValueError: If max_bytes is less than 1.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        # Estimated total size; None until the first scan
+        self._estimated_bytes: int | None = None
+        self._writes_since_scan = 0
+
+    @property
+    def root(self) -> Path:
+        """Store directory."""
+        return self._root
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of stored artifacts."""
+        return self._max_bytes
+
+    def path_for(self, key: str) -> Path:
+        """Get the file path of an entry.
+
+        Args:
+            key: Artifact key from artifact_key().
+
+        Returns:
+            Path where the artifact is (or would be) stored.
+        """
+        return self._root / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> bytes | None:
+        """Read an artifact and mark it as recently used.
+
+        Args:
+            key: Artifact key.
+
+        Returns:
+            Artifact bytes, or None if the store has no such artifact.
+        """
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted by another process between read and touch
+            pass
+        with self._lock:
+            self._hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an artifact atomically, evicting if the store is over the cap.
+
+        Artifacts larger than the cap are not stored. The directory is only
+        scanned when the estimated total size crosses the cap or every
+        RESCAN_INTERVAL writes.
+
+        Args:
+            key: Artifact key.
+            data: Artifact bytes.
+        """
+        if len(data) > self._max_bytes:
+            logger.info(f"Artifact {key[:12]} exceeds store size cap; not stored")
+            return
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._writes += 1
+            self._writes_since_scan += 1
+            if self._estimated_bytes is not None:
+                self._estimated_bytes += len(data) - replaced
+            scan = (
+                self._estimated_bytes is None
+                or self._estimated_bytes > self._max_bytes
+                or self._writes_since_scan >= RESCAN_INTERVAL
+            )
+        if scan:
+            self._evict(keep=path)
+
+    def get_or_create(self, key: str, create: Callable[[], bytes]) -> bytes:
+        """Read an artifact, generating and storing it on a miss.
+
+        Args:
+            key: Artifact key.
+            create: Function producing the artifact bytes.
+
+        Returns:
+            Stored or newly created artifact bytes.
+        """
+        data = self.get(key)
+        if data is None:
+            data = create()
+            self.put(key, data)
+        return data
+
+    def total_bytes(self) -> int:
+        """Get the total size of stored artifacts, scanning the directory."""
+        total = sum(size for _, _, size in self._entries())
+        with self._lock:
+            self._estimated_bytes = total
+        return total
+
+    def clear(self) -> None:
+        """Remove every stored artifact."""
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._estimated_bytes = 0
+
+    def metrics(self) -> ArtifactStoreMetrics:
+        """Get a snapshot of this process's store statistics."""
+        with self._lock:
+            return ArtifactStoreMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                evictions=self._evictions,
+                max_bytes=self._max_bytes,
+            )
+
+    def _entries(self) -> list[tuple[Path, int, int]]:
+        """List (path, mtime_ns, size) of every stored artifact."""
+        entries = []
+        for path in self._root.glob(f"*/*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_mtime_ns, stat.st_size))
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        """Scan the store and evict least recently used artifacts if over the cap.
+
+        Eviction trims the store to EVICTION_TARGET of the cap. The scan
+        also resets the size estimate.
+        """
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        if total > self._max_bytes:
+            target = int(self._max_bytes * EVICTION_TARGET)
+            for path, _, size in sorted(entries, key=lambda e: e[1]):
+                if total <= target:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    # Already evicted by another process
+                    pass
+                total -= size
+                evicted += 1
+        with self._lock:
+            self._evictions += evicted
+            self._estimated_bytes = total
+            self._writes_since_scan = 0
+
+
+_default_store: ArtifactStore | None = None
+_default_store_configured = False
+_default_store_lock = threading.Lock()
+
+
+def configure_artifact_store(
+    root: Path | None, max_bytes: int = DEFAULT_MAX_BYTES
+) -> ArtifactStore | None:
+    """Set the process-wide artifact store.
+
+    Args:
+        root: Store directory, or None to disable the store.
+        max_bytes: Maximum total size of stored artifacts.
+
+    Returns:
+        The configured store, or None if disabled.
+    """
+    global _default_store, _default_store_configured
+    with _default_store_lock:
+        _default_store = ArtifactStore(root, max_bytes) if root is not None else None
+        _default_store_configured = True
+        return _default_store
+
+
+def get_artifact_store() -> ArtifactStore | None:
+    """Get the process-wide artifact store.
+
+    On first use the store is configured from the CABINETS_ARTIFACT_STORE
+    and CABINETS_ARTIFACT_STORE_MAX_MB environment variables unless
+    configure_artifact_store() was called.
+
+    Returns:
+        The shared store, or None if no store is configured.
+    """
+    global _default_store, _default_store_configured
+    with _default_store_lock:
+        if not _default_store_configured:
+            root = os.environ.get(ARTIFACT_STORE_ENV)
+            if root:
+                max_mb = os.environ.get(ARTIFACT_STORE_MAX_MB_ENV)
+                max_bytes = (
+                    int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+                )
+                _default_store = ArtifactStore(Path(root), max_bytes)
+            _default_store_configured = True
+        return _default_store
+
+
+__all__ = [
+    "ARTIFACT_STORE_ENV",
+    "ARTIFACT_STORE_MAX_MB_ENV",
+    "EVICTION_TARGET",
+    "RESCAN_INTERVAL",
+    "ArtifactStore",
+    "ArtifactStoreMetrics",
+    "artifact_key",
+    "artifact_options",
+    "configure_artifact_store",
+    "exporter_version",
+    "get_artifact_store",
+]
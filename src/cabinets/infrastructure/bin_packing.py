@@ -11,13 +11,36 @@ hashability.
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-from cabinets.domain.value_objects import CutPiece, GrainDirection, MaterialSpec
+import numpy as np
+
+from cabinets.domain.value_objects import (
+    CutListTable,
+    CutPiece,
+    GrainDirection,
+    MaterialSpec,
+)
+
+if TYPE_CHECKING:
+    from cabinets.infrastructure.offcut_inventory import (
+        OffcutInventory,
+        StoredOffcut,
+    )
 
 logger = logging.getLogger(__name__)
 
+# Packing attempts before giving up on stored offcuts other jobs keep taking
+_OFFCUT_CLAIM_ATTEMPTS = 3
+
+
+def _sides(width: float, height: float) -> tuple[float, float]:
+    """Return (short side, long side) of a rectangle."""
+    return (width, height) if width <= height else (height, width)
+
 
 @dataclass(frozen=True)
 class SheetConfig:
@@ -157,12 +180,15 @@ class SheetLayout:
         sheet_config: Configuration of the sheet dimensions.
         placements: Tuple of placed pieces on this sheet.
         material: Material specification for this sheet.
+        offcut_id: Inventory identifier when the pieces are cut from a
+            stored offcut instead of a new sheet.
     """
 
     sheet_index: int
     sheet_config: SheetConfig
     placements: tuple[PlacedPiece, ...]
     material: MaterialSpec
+    offcut_id: int | None = None
 
     def __post_init__(self) -> None:
         if self.sheet_index < 0:
@@ -186,6 +212,11 @@ class SheetLayout:
         """Number of pieces placed on this sheet."""
         return len(self.placements)
 
+    @property
+    def is_offcut(self) -> bool:
+        """Whether this layout uses a stored offcut rather than a new sheet."""
+        return self.offcut_id is not None
+
 
 @dataclass(frozen=True)
 class Offcut:
@@ -226,7 +257,8 @@ class PackingResult:
         layouts: Tuple of sheet layouts with placed pieces.
         offcuts: Tuple of reusable offcuts identified.
         total_waste_percentage: Overall waste across all sheets.
-        sheets_by_material: Count of sheets needed per material.
+        sheets_by_material: Count of new sheets needed per material;
+            layouts cut from stored offcuts are not counted.
     """
 
     layouts: tuple[SheetLayout, ...]
@@ -303,23 +335,37 @@ class GuillotineBinPacker:
     This produces guillotine-compatible layouts where all cuts go edge-to-edge,
     suitable for panel saws and table saws.
 
+    With an offcut inventory, pieces are first placed on stored offcuts of
+    the same material, and only the rest go onto new sheets. The offcuts
+    used are removed from the inventory and the offcuts this packing leaves
+    behind are recorded.
+
     Attributes:
         config: Bin packing configuration (kerf, sheet size, etc.)
+        inventory: Offcut inventory consulted before opening new sheets.
     """
 
-    def __init__(self, config: BinPackingConfig) -> None:
+    def __init__(
+        self,
+        config: BinPackingConfig,
+        inventory: OffcutInventory | None = None,
+    ) -> None:
         """Initialize the packer with configuration.
 
         Args:
             config: Bin packing configuration specifying sheet size,
                 kerf width, and minimum offcut size.
+            inventory: Optional offcut inventory to fill before opening
+                new sheets.
         """
         self.config = config
+        self.inventory = inventory
 
     def pack(
         self,
-        pieces: Sequence[CutPiece],
+        pieces: Sequence[CutPiece] | CutListTable,
         material: MaterialSpec,
+        job: str = "",
     ) -> PackingResult:
         """Pack pieces onto sheets, minimizing waste.
 
@@ -328,8 +374,10 @@ class GuillotineBinPacker:
         Tries ALL existing sheets before creating new ones for better fill.
 
         Args:
-            pieces: Cut pieces to pack (may have quantity > 1).
+            pieces: Cut pieces (or their columnar table) to pack; pieces
+                may have quantity > 1.
             material: Material specification for all pieces.
+            job: Label recorded with offcuts stored in the inventory.
 
         Returns:
             PackingResult with layouts, offcuts, and waste percentage.
@@ -346,13 +394,267 @@ class GuillotineBinPacker:
             )
 
         # Expand quantities, split oversized pieces, and sort by area (largest first)
-        expanded = self._expand_pieces(pieces)
-        split_pieces = self._split_oversized_pieces(expanded)
-        sorted_pieces = self._sort_by_area(split_pieces)
+        table = CutListTable.coerce(pieces)
+        logger.debug("Packing %d pieces onto sheets", table.total_quantity)
+
+        ordered = list(self._packing_order(table))
+        if self.inventory is None:
+            sheets = self._place_pieces(ordered)
+            assert sheets is not None  # No sheet limit, so never aborted
+            layouts = self._to_layouts(sheets, [], material)
+            offcuts = self._extract_offcuts(layouts)
+        else:
+            layouts, offcuts = self._pack_with_inventory(
+                self.inventory, ordered, material, job
+            )
+
+        for layout in layouts:
+            logger.debug(
+                "Sheet %d: %d pieces, %.1f%% waste",
+                layout.sheet_index,
+                layout.piece_count,
+                layout.waste_percentage,
+            )
+
+        # Calculate results
+        total_waste = self._calculate_total_waste(layouts)
 
-        logger.debug("Packing %d pieces onto sheets", len(split_pieces))
+        return PackingResult(
+            layouts=tuple(layouts),
+            offcuts=tuple(offcuts),
+            total_waste_percentage=total_waste,
+            sheets_by_material={
+                material: sum(1 for layout in layouts if not layout.is_offcut)
+            },
+        )
+
+    def _pack_with_inventory(
+        self,
+        inventory: OffcutInventory,
+        pieces: list[CutPiece],
+        material: MaterialSpec,
+        job: str,
+    ) -> tuple[list[SheetLayout], list[Offcut]]:
+        """Pack onto stored offcuts first, then new sheets, and update stock.
+
+        If another job takes a planned offcut before this one records its
+        use, packing is planned again with the offcuts still in stock; the
+        last attempt uses new sheets only.
+
+        Args:
+            inventory: Offcut inventory to fill and update.
+            pieces: Expanded, split and sorted pieces.
+            material: Material specification for all pieces.
+            job: Label recorded with the new offcuts.
+
+        Returns:
+            Tuple of (layouts, offcuts left by this packing).
+        """
+        from cabinets.infrastructure.offcut_inventory import OffcutConflictError
+
+        for attempt in range(_OFFCUT_CLAIM_ATTEMPTS):
+            stored = (
+                self._stored_candidates(inventory, pieces, material)
+                if attempt < _OFFCUT_CLAIM_ATTEMPTS - 1
+                else []
+            )
+            used, remaining = self._place_on_offcuts(pieces, stored)
+            sheets = self._place_pieces(remaining)
+            assert sheets is not None  # No sheet limit, so never aborted
+            layouts = self._to_layouts(sheets, used, material)
+            offcuts = self._extract_offcuts(layouts)
+            try:
+                inventory.consume(
+                    (
+                        layout.offcut_id
+                        for layout in layouts
+                        if layout.offcut_id is not None
+                    ),
+                    offcuts,
+                    source=job,
+                )
+            except OffcutConflictError:
+                logger.info("Stored offcuts were taken by another job; replanning")
+                continue
+            return layouts, offcuts
+        raise AssertionError("Packing without stored offcuts cannot conflict")
+
+    def _stored_candidates(
+        self,
+        inventory: OffcutInventory,
+        pieces: list[CutPiece],
+        material: MaterialSpec,
+    ) -> list[StoredOffcut]:
+        """Get stored offcuts large enough for at least the smallest piece."""
+        if not pieces:
+            return []
+        return inventory.find(
+            material,
+            min_short_side=min(min(p.width, p.height) for p in pieces),
+            min_long_side=min(max(p.width, p.height) for p in pieces),
+        )
+
+    def _place_on_offcuts(
+        self,
+        pieces: list[CutPiece],
+        stored: list[StoredOffcut],
+    ) -> tuple[list[tuple[StoredOffcut, _SheetState]], list[CutPiece]]:
+        """Place pieces on stored offcuts using the shelf algorithm.
+
+        Each piece goes on an offcut already in use if it fits there, or
+        else opens the unused offcut with the shortest sides it fits on.
+        Unused offcuts are kept sorted by (short side, long side) so each
+        piece bisects past the ones that are too narrow instead of
+        scanning them all.
+
+        Args:
+            pieces: Expanded, split and sorted pieces.
+            stored: Candidate offcuts in any order.
+
+        Returns:
+            Tuple of (offcuts used with their placements, pieces that did
+            not fit on any offcut).
+        """
+        kerf = self.config.kerf
+        available = sorted(stored, key=lambda o: _sides(o.width, o.height))
+        sides = [_sides(o.width, o.height) for o in available]
+        used: list[tuple[StoredOffcut, _SheetState]] = []
+        remaining: list[CutPiece] = []
+
+        for piece in pieces:
+            placed = False
+            for _, sheet in used:
+                for shelf in sheet.shelves:
+                    fits, rotated = self._piece_fits_on_shelf(piece, shelf, kerf)
+                    if fits:
+                        self._place_on_shelf(piece, shelf, kerf, rotated)
+                        placed = True
+                        break
+                if not placed:
+                    placed = self._place_on_new_shelf(piece, sheet)
+                if placed:
+                    break
+
+            if not placed:
+                short_side, long_side = _sides(piece.width, piece.height)
+                start = bisect_left(sides, (short_side, long_side))
+                for i in range(start, len(available)):
+                    if sides[i][1] < long_side:
+                        continue
+                    offcut = available[i]
+                    sheet = _SheetState(
+                        index=0,
+                        shelves=[],
+                        current_y=0.0,
+                        sheet_config=SheetConfig(
+                            width=offcut.width,
+                            height=offcut.height,
+                            edge_allowance=0.0,
+                        ),
+                    )
+                    if self._place_on_new_shelf(piece, sheet):
+                        used.append((offcut, sheet))
+                        del available[i]
+                        del sides[i]
+                        placed = True
+                        break
+
+            if not placed:
+                remaining.append(piece)
+
+        return used, remaining
+
+    def _place_on_new_shelf(self, piece: CutPiece, sheet: _SheetState) -> bool:
+        """Start a new shelf for a piece if the sheet has room for it."""
+        fits, rotated = self._piece_fits_new_shelf(
+            piece, sheet.available_height, sheet.sheet_config.usable_width
+        )
+        if not fits:
+            return False
+        piece_height = piece.width if rotated else piece.height
+        shelf = _Shelf(
+            y=sheet.current_y,
+            height=piece_height,
+            remaining_width=sheet.sheet_config.usable_width,
+        )
+        self._place_on_shelf(piece, shelf, self.config.kerf, rotated)
+        sheet.shelves.append(shelf)
+        sheet.current_y += piece_height + self.config.kerf
+        return True
 
-        # Track all sheets with their state
+    def _to_layouts(
+        self,
+        sheets: list[_SheetState],
+        used: list[tuple[StoredOffcut, _SheetState]],
+        material: MaterialSpec,
+    ) -> list[SheetLayout]:
+        """Convert sheet states to layouts, new sheets before offcuts."""
+        layouts: list[SheetLayout] = []
+        states: list[tuple[int | None, _SheetState]] = [
+            (None, sheet) for sheet in sheets
+        ]
+        states.extend((offcut.id, sheet) for offcut, sheet in used)
+        for index, (offcut_id, sheet) in enumerate(states):
+            layouts.append(
+                SheetLayout(
+                    sheet_index=index,
+                    sheet_config=sheet.sheet_config,
+                    placements=tuple(
+                        placement
+                        for shelf in sheet.shelves
+                        for placement in shelf.pieces
+                    ),
+                    material=material,
+                    offcut_id=offcut_id,
+                )
+            )
+        return layouts
+
+    def count_sheets(
+        self,
+        pieces: Sequence[CutPiece] | CutListTable,
+        sheet_limit: int | None = None,
+    ) -> int | None:
+        """Count the sheets needed for pieces without building layouts.
+
+        Runs the same placement as pack() but skips layout, offcut and waste
+        bookkeeping, and stops as soon as more than ``sheet_limit`` sheets
+        are needed. Intended for scoring many candidate cut lists quickly.
+
+        Args:
+            pieces: Cut pieces (or their columnar table) to pack; pieces
+                may have quantity > 1.
+            sheet_limit: Optional maximum sheet count of interest.
+
+        Returns:
+            Number of sheets needed, or None if it exceeds sheet_limit.
+
+        Raises:
+            ValueError: If any piece is too large to fit on a sheet.
+        """
+        if not pieces:
+            return 0
+        table = CutListTable.coerce(pieces)
+        sheets = self._place_pieces(self._packing_order(table), sheet_limit)
+        return None if sheets is None else len(sheets)
+
+    def _place_pieces(
+        self,
+        sorted_pieces: Iterable[CutPiece],
+        sheet_limit: int | None = None,
+    ) -> list[_SheetState] | None:
+        """Place sorted pieces onto sheets using the shelf algorithm.
+
+        Args:
+            sorted_pieces: Expanded, split and sorted pieces.
+            sheet_limit: Stop and return None once more sheets are needed.
+
+        Returns:
+            Sheet states with placed pieces, or None if sheet_limit was exceeded.
+
+        Raises:
+            ValueError: If any piece is too large to fit on a sheet.
+        """
         sheets: list[_SheetState] = []
         kerf = self.config.kerf
 
@@ -447,88 +749,98 @@ class GuillotineBinPacker:
                     sheet_config=self.config.sheet_size,
                 )
                 sheets.append(new_sheet)
+                if sheet_limit is not None and len(sheets) > sheet_limit:
+                    return None
 
-        # Convert sheet states to layouts
-        layouts: list[SheetLayout] = []
-        for sheet in sheets:
-            all_placements: list[PlacedPiece] = []
-            for shelf in sheet.shelves:
-                all_placements.extend(shelf.pieces)
-
-            layout = SheetLayout(
-                sheet_index=sheet.index,
-                sheet_config=sheet.sheet_config,
-                placements=tuple(all_placements),
-                material=material,
-            )
-            layouts.append(layout)
-
-            logger.debug(
-                "Sheet %d: %d pieces, %.1f%% waste",
-                sheet.index,
-                len(all_placements),
-                layout.waste_percentage,
-            )
-
-        # Calculate results
-        offcuts = self._extract_offcuts(layouts)
-        total_waste = self._calculate_total_waste(layouts)
+        return sheets
 
-        return PackingResult(
-            layouts=tuple(layouts),
-            offcuts=tuple(offcuts),
-            total_waste_percentage=total_waste,
-            sheets_by_material={material: len(layouts)},
-        )
+    def _packing_order(self, table: CutListTable) -> Iterator[CutPiece]:
+        """Expand, split and sort pieces for first-fit decreasing packing.
 
-    def _expand_pieces(self, pieces: Sequence[CutPiece]) -> list[CutPiece]:
-        """Expand pieces with quantity > 1 into individual pieces.
+        Each row with quantity N becomes N individual pieces with quantity 1
+        (labels get a " #i" suffix when N > 1), oversized splittable pieces
+        are split, and pieces are ordered by area, then by max dimension,
+        largest first. Ties keep cut list order.
 
-        Each piece with quantity N becomes N separate pieces with quantity 1.
-        This allows individual placement of each physical piece.
+        Expansion and sorting run on the table's columns; a CutPiece is only
+        created for each piece as the packer reaches it.
 
         Args:
-            pieces: Sequence of cut pieces, possibly with quantity > 1.
+            table: Columnar cut list.
 
         Returns:
-            List of individual cut pieces, each with quantity 1.
+            Iterator over individual pieces in packing order.
         """
-        expanded: list[CutPiece] = []
-        for piece in pieces:
-            for i in range(piece.quantity):
-                # Create individual piece with quantity 1
-                # Append index to label if quantity > 1
-                label = (
-                    piece.label if piece.quantity == 1 else f"{piece.label} #{i + 1}"
-                )
-                individual = CutPiece(
-                    width=piece.width,
-                    height=piece.height,
-                    quantity=1,
-                    label=label,
-                    panel_type=piece.panel_type,
-                    material=piece.material,
-                    cut_metadata=piece.cut_metadata,
-                )
-                expanded.append(individual)
-        return expanded
+        usable_w = self.config.sheet_size.usable_width
+        usable_h = self.config.sheet_size.usable_height
+        widths, heights = table.widths, table.heights
 
-    def _sort_by_area(self, pieces: list[CutPiece]) -> list[CutPiece]:
-        """Sort pieces by area (largest first) for first-fit decreasing.
+        # Pieces that fit neither upright nor rotated
+        oversized = ~(
+            ((widths <= usable_w) & (heights <= usable_h))
+            | ((heights <= usable_w) & (widths <= usable_h))
+        )
+        splittable_codes = [
+            code
+            for code, panel_type in enumerate(table.panel_types)
+            if self.config.allow_panel_splitting
+            and panel_type.value in self.config.splittable_types
+        ]
+        split_rows = oversized & np.isin(table.panel_type_codes, splittable_codes)
+
+        # Rows that are not split: one entry per unit of quantity
+        quantities = np.where(split_rows, 0, table.quantities)
+        rows = np.repeat(np.arange(len(table)), quantities)
+        units = np.arange(len(rows)) - np.repeat(
+            np.cumsum(quantities) - quantities, quantities
+        )
+        parts = np.zeros(len(rows), dtype=np.int64)
+        unit_widths = widths[rows]
+        unit_heights = heights[rows]
 
-        Secondary sort by height (tallest first) to improve shelf utilization.
+        # Split rows: one entry per split part of each unit
+        split_pieces: list[CutPiece] = []
+        split_keys: list[tuple[int, int, int]] = []
+        for row in np.flatnonzero(split_rows).tolist():
+            for unit in range(int(table.quantities[row])):
+                piece = table.piece(
+                    row, quantity=1, label=self._unit_label(table, row, unit)
+                )
+                for part, split_piece in enumerate(self._split_oversized_piece(piece)):
+                    split_keys.append((row, unit, part))
+                    split_pieces.append(split_piece)
+
+        # Entries >= len(rows) refer to split_pieces
+        if split_pieces:
+            keys = np.array(split_keys, dtype=np.int64)
+            rows = np.concatenate((rows, keys[:, 0]))
+            units = np.concatenate((units, keys[:, 1]))
+            parts = np.concatenate((parts, keys[:, 2]))
+            unit_widths = np.concatenate((unit_widths, [p.width for p in split_pieces]))
+            unit_heights = np.concatenate(
+                (unit_heights, [p.height for p in split_pieces])
+            )
 
-        Args:
-            pieces: List of cut pieces to sort.
+        areas = unit_widths * unit_heights
+        max_dims = np.maximum(unit_widths, unit_heights)
+        # lexsort is stable and sorts by its last key first
+        order = np.lexsort((parts, units, rows, -max_dims, -areas))
 
-        Returns:
-            New list sorted by area descending, then by max dimension descending.
-        """
-        return sorted(
-            pieces,
-            key=lambda p: (p.width * p.height, max(p.width, p.height)),
-            reverse=True,
-        )
+        first_split = len(rows) - len(split_pieces)
+        for entry in order.tolist():
+            if entry >= first_split:
+                yield split_pieces[entry - first_split]
+            else:
+                row, unit = int(rows[entry]), int(units[entry])
+                yield table.piece(
+                    row, quantity=1, label=self._unit_label(table, row, unit)
+                )
+
+    @staticmethod
+    def _unit_label(table: CutListTable, row: int, unit: int) -> str:
+        """Label of one unit of a row, numbered if the row has quantity > 1."""
+        label = table.labels[table.label_codes[row]]
+        return label if table.quantities[row] == 1 else f"{label} #{unit + 1}"
 
     def _is_splittable(self, piece: CutPiece) -> bool:
         """Check if a piece's panel type allows splitting.
@@ -752,29 +1064,6 @@ class GuillotineBinPacker:
 
         return split_pieces
 
-    def _split_oversized_pieces(self, pieces: list[CutPiece]) -> list[CutPiece]:
-        """Process all pieces, splitting any that are oversized and splittable.
-
-        Args:
-            pieces: List of cut pieces to process.
-
-        Returns:
-            New list with oversized splittable pieces replaced by splits.
-        """
-        result: list[CutPiece] = []
-
-        for piece in pieces:
-            if self._piece_needs_splitting(piece):
-                if self._is_splittable(piece):
-                    result.extend(self._split_oversized_piece(piece))
-                else:
-                    # Not splittable, pass through (will fail during packing)
-                    result.append(piece)
-            else:
-                result.append(piece)
-
-        return result
-
     def _get_grain_direction(self, piece: CutPiece) -> GrainDirection:
         """Extract grain direction from piece cut_metadata.
 
@@ -1189,18 +1478,25 @@ class BinPackingService:
         packer: GuillotineBinPacker instance for actual packing.
     """
 
-    def __init__(self, config: BinPackingConfig) -> None:
+    def __init__(
+        self,
+        config: BinPackingConfig,
+        inventory: OffcutInventory | None = None,
+    ) -> None:
         """Initialize service with configuration.
 
         Args:
             config: Bin packing configuration with sheet sizes and options.
+            inventory: Optional offcut inventory filled before new sheets
+                are opened and updated with the offcuts left over.
         """
         self.config = config
-        self.packer = GuillotineBinPacker(config)
+        self.packer = GuillotineBinPacker(config, inventory)
 
     def optimize_cut_list(
         self,
-        pieces: Sequence[CutPiece],
+        pieces: Sequence[CutPiece] | CutListTable,
+        job: str = "",
     ) -> PackingResult:
         """Optimize cut list, grouping by material.
 
@@ -1208,7 +1504,9 @@ class BinPackingService:
         and combines results into a single PackingResult.
 
         Args:
-            pieces: All cut pieces from cabinet generation.
+            pieces: All cut pieces from cabinet generation, or their
+                columnar table.
+            job: Label recorded with offcuts stored in the inventory.
 
         Returns:
             PackingResult with layouts organized by material.
@@ -1249,20 +1547,20 @@ class BinPackingService:
 
         for material, group_pieces in groups.items():
             # Pack this material group
-            result = self.packer.pack(group_pieces, material)
+            result = self.packer.pack(group_pieces, material, job)
 
             logger.debug(
                 'Material %.3f" %s: %d pieces -> %d sheets',
                 material.thickness,
                 material.material_type.value,
                 len(group_pieces),
-                len(result.layouts),
+                result.total_sheets,
             )
 
             # Accumulate results
             all_layouts.extend(result.layouts)
             all_offcuts.extend(result.offcuts)
-            sheets_by_material[material] = len(result.layouts)
+            sheets_by_material[material] = result.total_sheets
 
         # Calculate combined statistics
         total_waste = self._calculate_combined_waste(all_layouts)
@@ -1276,28 +1574,19 @@ class BinPackingService:
 
     def _group_by_material(
         self,
-        pieces: Sequence[CutPiece],
-    ) -> dict[MaterialSpec, list[CutPiece]]:
+        pieces: Sequence[CutPiece] | CutListTable,
+    ) -> dict[MaterialSpec, CutListTable]:
         """Group pieces by their MaterialSpec.
 
-        MaterialSpec is frozen/hashable, so it can be used as a dict key.
         Pieces with the same material type and thickness are grouped together.
 
         Args:
-            pieces: Cut pieces to group.
+            pieces: Cut pieces (or their columnar table) to group.
 
         Returns:
-            Dictionary mapping MaterialSpec to list of pieces.
+            Dictionary mapping MaterialSpec to a table of its pieces.
         """
-        groups: dict[MaterialSpec, list[CutPiece]] = {}
-
-        for piece in pieces:
-            material = piece.material
-            if material not in groups:
-                groups[material] = []
-            groups[material].append(piece)
-
-        return groups
+        return CutListTable.coerce(pieces).group_by_material()
 
     def _calculate_combined_waste(
         self,
@@ -221,6 +221,8 @@ class CutDiagramRenderer:
             f"Sheet {layout.sheet_index + 1} of {total_sheets} - "
             f"{material_desc} - {waste:.1f}% waste"
         )
+        if layout.is_offcut:
+            header_text += f" - stored offcut #{layout.offcut_id}"
 
         return (
             f"  <!-- Header -->\n"
@@ -696,6 +698,8 @@ class CutDiagramRenderer:
             f"Sheet {layout.sheet_index + 1} of {total_sheets} - "
             f"{material_desc} - {layout.waste_percentage:.1f}% waste"
         )
+        if layout.is_offcut:
+            header += f" - stored offcut #{layout.offcut_id}"
         lines.append(header)
 
         # Top border
@@ -9,6 +9,7 @@ Registered exporters:
 - assembly: Markdown assembly instructions with build order and joinery details
 - bom: Bill of Materials with sheet goods, hardware, and edge banding
 - dxf: DXF format for 2D CNC machining and manufacturing
+- glb: Binary glTF with instanced panel boxes, a compact STL alternative
 - json: Enhanced JSON with normalized config, 3D positions, joinery, and BOM
 - llm-assembly: LLM-generated assembly instructions via Ollama
 - safety-labels: SVG safety labels for weight capacity, anti-tip, installation
@@ -23,6 +24,7 @@ Usage:
         DxfExporter,
         EnhancedJsonExporter,
         ExportManager,
+        GlbExporter,
         ExporterRegistry,
         LLMAssemblyExporter,
         StlLayoutExporter,
@@ -42,6 +44,9 @@ Usage:
     dxf_exporter_cls = ExporterRegistry.get("dxf")
     dxf_exporter = dxf_exporter_cls(mode="combined", units="mm")
 
+    glb_exporter_cls = ExporterRegistry.get("glb")
+    glb_exporter = glb_exporter_cls(units="meters")
+
     json_exporter_cls = ExporterRegistry.get("json")
     json_exporter = json_exporter_cls(include_3d_positions=True, include_joinery=True)
 
@@ -57,9 +62,13 @@ Usage:
     # Export to multiple formats
     manager = ExportManager(output_dir=Path("./output"))
     results = manager.export_all(["assembly", "bom", "dxf", "json", "stl", "svg"], layout_output, project_name="my_cabinet")
+
+    # Rewrite only files whose content changed since the last export
+    writes = manager.export_changed(["stl", "bom"], layout_output, project_name="my_cabinet")
 """
 
 from cabinets.infrastructure.exporters.base import (
+    ArtifactWrite,
     Exporter,
     ExporterRegistry,
     ExportManager,
@@ -76,6 +85,7 @@ from cabinets.infrastructure.exporters.bom import (
 )
 from cabinets.infrastructure.exporters.dxf import DxfExporter
 from cabinets.infrastructure.exporters.enhanced_json import EnhancedJsonExporter
+from cabinets.infrastructure.exporters.gltf import GlbExporter
 from cabinets.infrastructure.exporters.llm_assembly import LLMAssemblyExporter
 from cabinets.infrastructure.exporters.stl import StlLayoutExporter
 from cabinets.infrastructure.exporters.safety_labels import (
@@ -85,7 +95,12 @@ from cabinets.infrastructure.exporters.safety_labels import (
 from cabinets.infrastructure.exporters.svg import SvgExporter
 
 # Re-export the underlying STL implementation for backwards compatibility
-from cabinets.infrastructure.stl_exporter import StlExporter, StlMeshBuilder
+from cabinets.infrastructure.stl_exporter import (
+    CurveLOD,
+    RenderSettings,
+    StlExporter,
+    StlMeshBuilder,
+)
 
 # Re-export formatters for backwards compatibility
 # (these were previously in exporters.py, now in formatters.py)
@@ -100,6 +115,7 @@ from cabinets.infrastructure.formatters import (
 
 __all__ = [
     # Framework
+    "ArtifactWrite",
     "Exporter",
     "ExporterRegistry",
     "ExportManager",
@@ -110,6 +126,7 @@ __all__ = [
     "DxfExporter",
     "EdgeBandingItem",
     "EnhancedJsonExporter",
+    "GlbExporter",
     "HardwareBomItem",
     "LabelStyle",
     "LLMAssemblyExporter",
@@ -118,6 +135,8 @@ __all__ = [
     "StlLayoutExporter",
     "SvgExporter",
     # Legacy compatibility - STL
+    "CurveLOD",
+    "RenderSettings",
     "StlExporter",
     "StlMeshBuilder",
     # Legacy compatibility - Formatters
@@ -15,10 +15,11 @@ Build Order (FR-02.2):
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from cabinets.domain.value_objects import CutPiece, PanelType
 from cabinets.infrastructure.exporters.base import ExporterRegistry
@@ -194,6 +195,17 @@ class AssemblyInstructionGenerator:
         self.include_timestamps = include_timestamps
         self.include_warnings = include_warnings
 
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Timestamp and warning section settings.
+        """
+        return {
+            "include_timestamps": self.include_timestamps,
+            "include_warnings": self.include_warnings,
+        }
+
     def export(self, output: LayoutOutput | RoomLayoutOutput, path: Path) -> None:
         """Export assembly instructions to markdown file.
 
@@ -229,6 +241,23 @@ class AssemblyInstructionGenerator:
 
         return "\n".join(lines)
 
+    @staticmethod
+    def content_digest(data: bytes) -> str:
+        """Hash markdown instructions, ignoring the generation timestamp.
+
+        Args:
+            data: Contents of an exported markdown file.
+
+        Returns:
+            SHA-256 hex digest of the instructions.
+        """
+        lines = [
+            line
+            for line in data.decode("utf-8", errors="replace").splitlines()
+            if not line.startswith("*Generated: ")
+        ]
+        return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
     def format_for_console(self, output: LayoutOutput | RoomLayoutOutput) -> str:
         """Format assembly instructions for console display.
 
@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import tempfile
 from abc import abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, ClassVar, Protocol, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Protocol,
+    runtime_checkable,
+)
+
+from cabinets.domain.services.panel_mapper import mapper_session
 
 if TYPE_CHECKING:
+    from pydantic import BaseModel
+
     from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
+    from cabinets.infrastructure.artifact_store import ArtifactStore
 
 
 logger = logging.getLogger(__name__)
@@ -176,30 +193,93 @@ class ExporterRegistry:
         cls._exporters.clear()
 
 
+@dataclass(frozen=True)
+class ArtifactWrite:
+    """Outcome of exporting one file with ExportManager.export_changed.
+
+    Attributes:
+        format_name: Format that produced the file.
+        path: Final path of the file in the output directory.
+        digest: Hex digest of the file content, excluding volatile metadata.
+        changed: True if the file was written, False if the existing file
+            already had identical content and was left untouched.
+    """
+
+    format_name: str
+    path: Path
+    digest: str
+    changed: bool
+
+
+def _content_digest(exporter: object, path: Path) -> str:
+    """Compute the content digest of an exported file.
+
+    Exporters whose output embeds save timestamps or random identifiers
+    define a ``content_digest(data: bytes) -> str`` static method that
+    ignores them; other files are hashed with SHA-256 as-is.
+    """
+    data = path.read_bytes()
+    content_digest = getattr(exporter, "content_digest", None)
+    if content_digest is not None:
+        return content_digest(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling and rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 class ExportManager:
     """Manages export operations to multiple formats.
 
     Coordinates exporting layout output to one or more formats,
-    handling file naming and directory management.
+    handling file naming and directory management. With an artifact store,
+    exports generated from a known source (a configuration) are read from
+    and written to the store, so identical artifacts are only rendered once
+    across processes.
+    The formats of one export call share a panel mapper session, so each
+    cabinet's panels are generated and mapped once for all of them.
 
     Attributes:
         output_dir: Directory where exported files will be saved.
+        artifact_store: Optional persistent store shared between processes.
     """
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        artifact_store: ArtifactStore | None = None,
+        exporter_options: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
         """Initialize the export manager.
 
         Args:
             output_dir: Directory where exported files will be saved.
                         Will be created if it doesn't exist.
+            artifact_store: Optional persistent artifact store.
+            exporter_options: Constructor keyword arguments per format name,
+                e.g. {"stl": {"curve_lod": "preview"}}.
         """
         self.output_dir = Path(output_dir)
+        self.artifact_store = artifact_store
+        self._exporter_options = {
+            name: dict(options) for name, options in (exporter_options or {}).items()
+        }
 
     def export_all(
         self,
         formats: list[str],
         output: LayoutOutput | RoomLayoutOutput,
         project_name: str = "cabinet",
+        source: BaseModel | None = None,
     ) -> dict[str, Path]:
         """Export layout output to multiple formats.
 
@@ -207,6 +287,9 @@ class ExportManager:
             formats: List of format names to export (e.g., ["stl", "json"]).
             output: The layout output to export.
             project_name: Base name for output files (default "cabinet").
+            source: Configuration the output was generated from. When given
+                together with an artifact store, stored artifacts are reused
+                and new ones are added to the store.
 
         Returns:
             Dictionary mapping format names to output file paths.
@@ -218,22 +301,70 @@ class ExportManager:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        with mapper_session():
+            return self._export_all(formats, output, project_name, source)
+
+    def _export_all(
+        self,
+        formats: list[str],
+        output: LayoutOutput | RoomLayoutOutput,
+        project_name: str,
+        source: BaseModel | None,
+    ) -> dict[str, Path]:
+        """Export to multiple formats inside a mapper session."""
         results: dict[str, Path] = {}
 
         for format_name in formats:
             exporter_class = ExporterRegistry.get(format_name)
-            exporter = exporter_class()
+            options = self._exporter_options.get(format_name, {})
+            exporter = exporter_class(**options)
 
             # Generate filename: {project_name}_{format}.{ext}
             filename = f"{project_name}_{format_name}.{exporter.file_extension}"
             filepath = self.output_dir / filename
+            results[format_name] = filepath
+
+            key = self._artifact_key(source, exporter, output)
+            if key is not None and self.artifact_store is not None:
+                data = self.artifact_store.get(key)
+                if data is not None:
+                    logger.info(f"Reusing stored {format_name} artifact: {filepath}")
+                    _write_atomic(filepath, data)
+                    continue
 
             logger.info(f"Exporting to {format_name}: {filepath}")
             exporter.export(output, filepath)
-            results[format_name] = filepath
+
+            # Multi-file exports (e.g. per-panel DXF) are not stored
+            if key is not None and self.artifact_store is not None:
+                if filepath.is_file():
+                    self.artifact_store.put(key, filepath.read_bytes())
 
         return results
 
+    def _artifact_key(
+        self,
+        source: BaseModel | None,
+        exporter: Exporter,
+        output: LayoutOutput | RoomLayoutOutput,
+    ) -> str | None:
+        """Get the store key of an export, or None if it cannot be stored."""
+        if self.artifact_store is None or source is None:
+            return None
+
+        from cabinets.infrastructure.artifact_store import (
+            artifact_key,
+            artifact_options,
+        )
+
+        options = artifact_options(exporter)
+        if options is None:
+            return None
+        # Cut diagrams and packing summaries depend on whether packing ran
+        if getattr(output, "packing_result", None) is not None:
+            options["packing"] = True
+        return artifact_key(source, type(exporter), **options)
+
     def export_single(
         self,
         format_name: str,
@@ -258,3 +389,102 @@ class ExportManager:
         """
         results = self.export_all([format_name], output, project_name)
         return results[format_name]
+
+    def export_changed(
+        self,
+        formats: list[str],
+        output: LayoutOutput | RoomLayoutOutput,
+        project_name: str = "cabinet",
+    ) -> list[ArtifactWrite]:
+        """Export to multiple formats, rewriting only files whose content changed.
+
+        Each format is exported into a scratch directory inside the output
+        directory and every file it produces is compared by content digest
+        with the file of the same name already in the output directory.
+        Volatile metadata such as save timestamps is excluded from the
+        digest by exporters that define ``content_digest``.
+        Changed and new files are moved into place atomically; identical
+        files are discarded, so their modification times are preserved.
+        Exporters that write several files (such as per-panel DXF) are
+        handled file by file.
+
+        Args:
+            formats: List of format names to export (e.g., ["stl", "json"]).
+            output: The layout output to export.
+            project_name: Base name for output files (default "cabinet").
+
+        Returns:
+            One entry per file produced, in format order.
+
+        Raises:
+            KeyError: If any format is not registered.
+            OSError: If file operations fail.
+        """
+        writes: list[ArtifactWrite] = []
+        with mapper_session():
+            for format_name in formats:
+                exporter_class = ExporterRegistry.get(format_name)
+                options = self._exporter_options.get(format_name, {})
+                exporter = exporter_class(**options)
+                filename = f"{project_name}_{format_name}.{exporter.file_extension}"
+                writes.extend(
+                    self.write_changed(
+                        format_name,
+                        lambda scratch: exporter.export(output, scratch / filename),
+                        exporter=exporter,
+                    )
+                )
+        return writes
+
+    def write_changed(
+        self,
+        format_name: str,
+        write: Callable[[Path], object],
+        exporter: object | None = None,
+    ) -> list[ArtifactWrite]:
+        """Write files for one format, replacing only those whose content changed.
+
+        This is the file handling behind export_changed, for producers that
+        are not registered exporters, such as zone stack exports.
+
+        Args:
+            format_name: Format name recorded on each write.
+            write: Callable that writes the format's files into the scratch
+                directory it is given.
+            exporter: Exporter whose ``content_digest`` compares the files,
+                if any; files are hashed as-is otherwise.
+
+        Returns:
+            One entry per file written, sorted by file name.
+
+        Raises:
+            OSError: If file operations fail.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        writes: list[ArtifactWrite] = []
+        with tempfile.TemporaryDirectory(
+            prefix=".export-", dir=self.output_dir
+        ) as scratch:
+            scratch_dir = Path(scratch)
+            write(scratch_dir)
+
+            for produced in sorted(scratch_dir.iterdir()):
+                target = self.output_dir / produced.name
+                digest = _content_digest(exporter, produced)
+                changed = (
+                    not target.is_file() or _content_digest(exporter, target) != digest
+                )
+                if changed:
+                    os.replace(produced, target)
+                    logger.info(f"Exported {format_name}: {target}")
+                writes.append(
+                    ArtifactWrite(
+                        format_name=format_name,
+                        path=target,
+                        digest=digest,
+                        changed=changed,
+                    )
+                )
+
+        return writes
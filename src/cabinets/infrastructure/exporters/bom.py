@@ -22,11 +22,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from cabinets.domain.value_objects import CutListTable
 from cabinets.infrastructure.exporters.base import ExporterRegistry
 
 if TYPE_CHECKING:
-    from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
-    from cabinets.domain.value_objects import MaterialSpec
+    from cabinets.contracts.dtos import (
+        LayoutOutput,
+        ProjectLayoutOutput,
+        RoomLayoutOutput,
+    )
 
 
 logger = logging.getLogger(__name__)
@@ -298,14 +302,14 @@ class BomGenerator:
 
     def generate(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
     ) -> BillOfMaterials:
         """Generate BOM from layout output.
 
         Analyzes the layout to extract all material requirements.
 
         Args:
-            output: Layout output from cabinet generation.
+            output: Layout output from cabinet, room or project generation.
 
         Returns:
             Complete BillOfMaterials with all requirements.
@@ -320,9 +324,22 @@ class BomGenerator:
             edge_banding=tuple(edge_banding),
         )
 
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Output format, cost, sheet size and edge banding settings.
+        """
+        return {
+            "output_format": self.output_format,
+            "include_costs": self.include_costs,
+            "sheet_size": self.sheet_size,
+            "edge_banding_default_color": self.edge_banding_default_color,
+        }
+
     def export(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
         path: Path,
     ) -> None:
         """Export BOM to file.
@@ -337,7 +354,7 @@ class BomGenerator:
 
     def export_string(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
     ) -> str:
         """Generate BOM in specified format as string.
 
@@ -360,7 +377,7 @@ class BomGenerator:
 
     def format_for_console(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
     ) -> str:
         """Format BOM for console display.
 
@@ -791,7 +808,7 @@ class BomGenerator:
 
     def _calculate_sheet_goods(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
     ) -> list[SheetGoodItem]:
         """Calculate sheet goods from layout output.
 
@@ -817,19 +834,12 @@ class BomGenerator:
         if not cut_list:
             return []
 
-        # Group pieces by material
-
-        materials: dict[MaterialSpec, list[Any]] = {}
-        for piece in cut_list:
-            if piece.material not in materials:
-                materials[piece.material] = []
-            materials[piece.material].append(piece)
+        # Total area in square inches per material
+        material_areas = CutListTable.coerce(cut_list).area_by_material()
 
         sheet_goods: list[SheetGoodItem] = []
 
-        for material, pieces in materials.items():
-            # Calculate total area in square inches
-            total_area = sum(p.width * p.height * p.quantity for p in pieces)
+        for material, total_area in material_areas.items():
             total_sqft = total_area / 144.0
 
             # Determine sheet count
@@ -858,7 +868,7 @@ class BomGenerator:
 
     def _extract_hardware(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
     ) -> list[HardwareBomItem]:
         """Extract hardware items from layout output.
 
@@ -954,7 +964,7 @@ class BomGenerator:
 
     def _calculate_edge_banding(
         self,
-        output: LayoutOutput | RoomLayoutOutput,
+        output: LayoutOutput | RoomLayoutOutput | ProjectLayoutOutput,
     ) -> list[EdgeBandingItem]:
         """Calculate edge banding requirements from cut list.
 
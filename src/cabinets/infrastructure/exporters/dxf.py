@@ -2,14 +2,21 @@
 
 Generates 2D DXF files (R2010 format) for CNC machining and manufacturing.
 Supports per-panel and combined output modes, with 32mm system shelf pin holes.
+
+Output is byte-deterministic: the creation and update dates, version GUIDs
+and ezdxf markers that ezdxf would stamp with the save time or fresh random
+values are written as fixed values instead.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import ezdxf
 
@@ -40,6 +47,21 @@ SHELF_PIN_HOLE_DIAMETER_MM = 5.0  # Standard 5mm shelf pin holes
 SHELF_PIN_SPACING_MM = 32.0  # 32mm system spacing
 SHELF_PIN_EDGE_OFFSET_MM = 37.0  # Standard distance from panel edge to first hole
 
+# ezdxf.options is process-global; serializes the writers that toggle it
+_FIXED_METADATA_LOCK = threading.Lock()
+
+
+@contextmanager
+def _fixed_metadata() -> Iterator[None]:
+    """Make ezdxf write fixed dates, GUIDs and markers instead of current ones."""
+    with _FIXED_METADATA_LOCK:
+        previous = ezdxf.options.write_fixed_meta_data_for_testing
+        ezdxf.options.write_fixed_meta_data_for_testing = True
+        try:
+            yield
+        finally:
+            ezdxf.options.write_fixed_meta_data_for_testing = previous
+
 
 @ExporterRegistry.register("dxf")
 class DxfExporter:
@@ -105,6 +127,21 @@ class DxfExporter:
         self._hole_spacing = SHELF_PIN_SPACING_MM * MM_TO_INCH * self.scale
         self._edge_offset = SHELF_PIN_EDGE_OFFSET_MM * MM_TO_INCH * self.scale
 
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Mode, units, hole and panel arrangement settings.
+        """
+        return {
+            "mode": self.mode,
+            "units": self.units,
+            "hole_pattern": self.hole_pattern,
+            "hole_diameter": self.hole_diameter,
+            "panel_spacing": self.panel_spacing,
+            "panels_per_row": self.panels_per_row,
+        }
+
     def export(self, output: LayoutOutput | RoomLayoutOutput, path: Path) -> None:
         """Export layout output to DXF file(s).
 
@@ -170,7 +207,8 @@ class DxfExporter:
 
         # Write to string buffer
         stream = StringIO()
-        doc.write(stream)
+        with _fixed_metadata():
+            doc.write(stream)
         return stream.getvalue()
 
     def format_for_console(self, output: LayoutOutput | RoomLayoutOutput) -> str:
@@ -192,7 +230,8 @@ class DxfExporter:
         Returns:
             Configured DXF document.
         """
-        doc = ezdxf.new("R2010")
+        with _fixed_metadata():
+            doc = ezdxf.new("R2010")
         self._setup_layers(doc)
         return doc
 
@@ -227,7 +266,8 @@ class DxfExporter:
         doc = self._create_document()
         msp = doc.modelspace()
         self._draw_all_panels(msp, cut_list)
-        doc.saveas(path)
+        with _fixed_metadata():
+            doc.saveas(path)
         logger.info(f"Exported combined DXF to {path}")
 
     def _export_per_panel(self, cut_list: list[CutPiece], path: Path) -> None:
@@ -253,7 +293,8 @@ class DxfExporter:
             # Sanitize label for filename
             safe_label = piece.label.replace(" ", "_").replace("/", "-")
             panel_path = path_parent / f"{path_stem}_{safe_label}.dxf"
-            doc.saveas(panel_path)
+            with _fixed_metadata():
+                doc.saveas(panel_path)
             logger.info(f"Exported panel DXF to {panel_path}")
 
     def _draw_all_panels(self, msp: Modelspace, cut_list: list[CutPiece]) -> None:
@@ -75,6 +75,20 @@ class EnhancedJsonExporter:
         self.include_bom = include_bom
         self.indent = indent
 
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Included sections and indentation.
+        """
+        return {
+            "include_3d_positions": self.include_3d_positions,
+            "include_joinery": self.include_joinery,
+            "include_warnings": self.include_warnings,
+            "include_bom": self.include_bom,
+            "indent": self.indent,
+        }
+
     def export(self, output: LayoutOutput | RoomLayoutOutput, path: Path) -> None:
         """Export enhanced JSON to file.
 
@@ -316,11 +330,10 @@ class EnhancedJsonExporter:
         Returns:
             List of piece dictionaries with full details.
         """
-        from cabinets.domain.services import Panel3DMapper, PanelGenerationService
+        from cabinets.domain.services import Panel3DMapper
 
-        panel_service = PanelGenerationService()
-        panels = panel_service.get_all_panels(cabinet)
-        mapper = Panel3DMapper(cabinet)
+        mapper = Panel3DMapper.for_cabinet(cabinet)
+        panels = mapper.panels()
 
         pieces: list[dict[str, Any]] = []
         piece_id_counter: dict[str, int] = {}
@@ -0,0 +1,596 @@
+"""glTF binary (GLB) exporter for cabinet layouts.
+
+STL stores every panel as an independent triangle soup, so a room with
+hundreds of panels repeats the same box geometry hundreds of times. Nearly
+every cabinet panel is an axis-aligned box, so this exporter writes a single
+unit-cube mesh and places each panel as a node whose translation, rotation
+and scale turn the cube into that panel. Panel types map to materials and
+panel details are attached as node ``extras`` for the viewer.
+
+With ``gpu_instancing=True`` the per-panel transforms are instead stored
+as binary accessors using the EXT_mesh_gpu_instancing extension, one node
+per panel type, which shrinks large rooms by roughly another order of
+magnitude at the cost of per-panel extras and requiring viewer support.
+
+Panels with real non-box geometry (arch headers, scalloped valances, stepped
+sides) are written as explicit meshes built with StlMeshBuilder. Doors and
+drawers are emitted closed; their hinge side and drawer index are available
+in ``extras`` so viewers can animate them.
+
+Coordinate System:
+    Panels are positioned in domain coordinates (Z-up: X=width, Y=depth,
+    Z=height) under a root node that rotates -90 degrees about X, producing
+    glTF's right-handed Y-up frame with the cabinet front facing +Z.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+
+from cabinets.domain import Panel3DMapper, PanelType
+from cabinets.domain.services import RoomPanel3DMapper
+from cabinets.infrastructure.exporters.base import ExporterRegistry
+from cabinets.infrastructure.stl_exporter import StlMeshBuilder
+
+if TYPE_CHECKING:
+    from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
+    from cabinets.domain import BoundingBox3D, Panel
+    from cabinets.domain.value_objects import SectionTransform
+
+
+# GLB container constants (glTF 2.0 specification, section 4.4)
+GLB_MAGIC = 0x46546C67  # "glTF"
+GLB_VERSION = 2
+GLB_CHUNK_JSON = 0x4E4F534A  # "JSON"
+GLB_CHUNK_BIN = 0x004E4942  # "BIN\0"
+
+# glTF enum values
+_FLOAT = 5126
+_UNSIGNED_SHORT = 5123
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+# Inches to meters; glTF units are meters
+INCHES_TO_METERS = 0.0254
+
+# Root rotation from domain Z-up to glTF Y-up: -90 degrees about X
+_Z_UP_TO_Y_UP = [-math.sqrt(0.5), 0.0, 0.0, math.sqrt(0.5)]
+
+# Base colors (linear RGBA) by panel type; unlisted types use the default
+DEFAULT_PANEL_COLOR: tuple[float, float, float, float] = (0.76, 0.60, 0.42, 1.0)
+PANEL_TYPE_COLORS: dict[PanelType, tuple[float, float, float, float]] = {
+    PanelType.BACK: (0.55, 0.42, 0.30, 1.0),
+    PanelType.DOOR: (0.85, 0.72, 0.55, 1.0),
+    PanelType.DRAWER_FRONT: (0.85, 0.72, 0.55, 1.0),
+    PanelType.SHELF: (0.80, 0.66, 0.48, 1.0),
+    PanelType.FACE_FRAME_STILE: (0.70, 0.52, 0.36, 1.0),
+    PanelType.FACE_FRAME_RAIL: (0.70, 0.52, 0.36, 1.0),
+    PanelType.COUNTERTOP: (0.85, 0.85, 0.82, 1.0),
+}
+
+# Panel types rendered with explicit geometry instead of the instanced box
+_CURVED_PANEL_TYPES = frozenset(
+    {PanelType.ARCH_HEADER, PanelType.VALANCE, PanelType.STEPPED_SIDE}
+)
+
+# Metadata keys copied into node extras when present
+_EXTRA_METADATA_KEYS = (
+    "hinge_side",
+    "drawer_index",
+    "drawer_count",
+    "section_index",
+    "shelf_index",
+    "zone",
+)
+
+
+def _unit_box_geometry() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build a unit cube spanning [0, 1] on each axis with flat normals.
+
+    Each face has its own four vertices so normals stay flat, and triangles
+    wind counter-clockwise when viewed from outside.
+
+    Returns:
+        Tuple of (positions (24, 3) float32, normals (24, 3) float32,
+        indices (36,) uint16).
+    """
+    positions: list[np.ndarray] = []
+    normals: list[np.ndarray] = []
+    indices: list[list[int]] = []
+    for axis in range(3):
+        u_axis, v_axis = (axis + 1) % 3, (axis + 2) % 3
+        for side in (0.0, 1.0):
+            normal = np.zeros(3)
+            normal[axis] = 1.0 if side else -1.0
+            quad = np.zeros((4, 3))
+            quad[:, axis] = side
+            quad[:, u_axis] = [0, 1, 1, 0]
+            quad[:, v_axis] = [0, 0, 1, 1]
+            base = len(positions) * 4
+            tri = [base, base + 1, base + 2, base, base + 2, base + 3]
+            # Flip winding when the quad's natural normal points inward
+            if np.dot(np.cross(quad[1] - quad[0], quad[2] - quad[0]), normal) < 0:
+                tri = [base, base + 2, base + 1, base, base + 3, base + 2]
+            positions.append(quad)
+            normals.append(np.tile(normal, (4, 1)))
+            indices.append(tri)
+    return (
+        np.concatenate(positions).astype(np.float32),
+        np.concatenate(normals).astype(np.float32),
+        np.array(indices, dtype=np.uint16).reshape(-1),
+    )
+
+
+def _rounded(values: Any) -> list[float]:
+    """Round transform components to keep the JSON chunk compact."""
+    return [round(float(v), 5) for v in values]
+
+
+def _z_rotation_quaternion(degrees: float) -> list[float]:
+    """Quaternion (x, y, z, w) for a rotation about the Z axis."""
+    half = math.radians(degrees) / 2.0
+    return [0.0, 0.0, math.sin(half), math.cos(half)]
+
+
+@dataclass
+class _GlbBuilder:
+    """Accumulates glTF JSON structures and the binary buffer."""
+
+    scale: float
+    buffer: bytearray = field(default_factory=bytearray)
+    buffer_views: list[dict[str, Any]] = field(default_factory=list)
+    accessors: list[dict[str, Any]] = field(default_factory=list)
+    meshes: list[dict[str, Any]] = field(default_factory=list)
+    materials: list[dict[str, Any]] = field(default_factory=list)
+    nodes: list[dict[str, Any]] = field(default_factory=list)
+    root_children: list[int] = field(default_factory=list)
+    _material_index: dict[PanelType, int] = field(default_factory=dict)
+    _box_mesh_index: dict[PanelType, int] = field(default_factory=dict)
+    _box_accessors: tuple[int, int, int] | None = None
+    gpu_instances: dict[PanelType, list[list[float]]] = field(default_factory=dict)
+
+    def add_array(
+        self, array: np.ndarray, target: int | None, component_type: int
+    ) -> int:
+        """Append an array to the buffer and return its accessor index."""
+        while len(self.buffer) % 4:
+            self.buffer.append(0)
+        data = np.ascontiguousarray(array).tobytes()
+        view: dict[str, Any] = {
+            "buffer": 0,
+            "byteOffset": len(self.buffer),
+            "byteLength": len(data),
+        }
+        if target is not None:
+            view["target"] = target
+        self.buffer_views.append(view)
+        self.buffer.extend(data)
+        accessor: dict[str, Any] = {
+            "bufferView": len(self.buffer_views) - 1,
+            "componentType": component_type,
+            "count": int(array.shape[0]),
+            "type": f"VEC{array.shape[1]}" if array.ndim == 2 else "SCALAR",
+        }
+        if target == _ARRAY_BUFFER and array.ndim == 2:
+            accessor["min"] = [float(v) for v in array.min(axis=0)]
+            accessor["max"] = [float(v) for v in array.max(axis=0)]
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def material_for(self, panel_type: PanelType) -> int:
+        """Get (creating if needed) the material index for a panel type."""
+        if panel_type not in self._material_index:
+            color = PANEL_TYPE_COLORS.get(panel_type, DEFAULT_PANEL_COLOR)
+            self.materials.append(
+                {
+                    "name": panel_type.value,
+                    "pbrMetallicRoughness": {
+                        "baseColorFactor": list(color),
+                        "metallicFactor": 0.0,
+                        "roughnessFactor": 0.8,
+                    },
+                }
+            )
+            self._material_index[panel_type] = len(self.materials) - 1
+        return self._material_index[panel_type]
+
+    def box_mesh_for(self, panel_type: PanelType) -> int:
+        """Get the unit-box mesh for a panel type.
+
+        All box meshes share the same position, normal and index accessors;
+        only the material differs, so the geometry is stored once.
+        """
+        if self._box_accessors is None:
+            positions, normals, indices = _unit_box_geometry()
+            self._box_accessors = (
+                self.add_array(positions, _ARRAY_BUFFER, _FLOAT),
+                self.add_array(normals, _ARRAY_BUFFER, _FLOAT),
+                self.add_array(indices, _ELEMENT_ARRAY_BUFFER, _UNSIGNED_SHORT),
+            )
+        if panel_type not in self._box_mesh_index:
+            position_acc, normal_acc, index_acc = self._box_accessors
+            self.meshes.append(
+                {
+                    "name": f"box_{panel_type.value}",
+                    "primitives": [
+                        {
+                            "attributes": {
+                                "POSITION": position_acc,
+                                "NORMAL": normal_acc,
+                            },
+                            "indices": index_acc,
+                            "material": self.material_for(panel_type),
+                        }
+                    ],
+                }
+            )
+            self._box_mesh_index[panel_type] = len(self.meshes) - 1
+        return self._box_mesh_index[panel_type]
+
+    def add_triangle_mesh(
+        self, name: str, triangles: np.ndarray, panel_type: PanelType
+    ) -> int:
+        """Add explicit geometry given as an (N, 3, 3) triangle array."""
+        positions = triangles.reshape(-1, 3).astype(np.float32)
+        edge_a = triangles[:, 1] - triangles[:, 0]
+        edge_b = triangles[:, 2] - triangles[:, 0]
+        face_normals = np.cross(edge_a, edge_b)
+        lengths = np.linalg.norm(face_normals, axis=1, keepdims=True)
+        face_normals = np.divide(
+            face_normals, lengths, out=np.zeros_like(face_normals), where=lengths > 0
+        )
+        normals = np.repeat(face_normals, 3, axis=0).astype(np.float32)
+        indices = np.arange(positions.shape[0], dtype=np.uint32)
+        self.meshes.append(
+            {
+                "name": name,
+                "primitives": [
+                    {
+                        "attributes": {
+                            "POSITION": self.add_array(
+                                positions, _ARRAY_BUFFER, _FLOAT
+                            ),
+                            "NORMAL": self.add_array(normals, _ARRAY_BUFFER, _FLOAT),
+                        },
+                        "indices": self.add_array(
+                            indices, _ELEMENT_ARRAY_BUFFER, _UNSIGNED_INT
+                        ),
+                        "material": self.material_for(panel_type),
+                    }
+                ],
+            }
+        )
+        return len(self.meshes) - 1
+
+    def add_node(self, node: dict[str, Any]) -> None:
+        """Add a panel node under the root node."""
+        self.nodes.append(node)
+        self.root_children.append(len(self.nodes) - 1)
+
+    def add_gpu_instance(
+        self,
+        panel_type: PanelType,
+        translation: np.ndarray,
+        rotation: list[float],
+        scale: tuple[float, float, float],
+    ) -> None:
+        """Queue a box instance for EXT_mesh_gpu_instancing output."""
+        self.gpu_instances.setdefault(panel_type, []).append(
+            [*translation, *rotation, *scale]
+        )
+
+    def _flush_gpu_instances(self) -> None:
+        """Emit one instanced node per panel type from queued instances."""
+        for panel_type, rows in self.gpu_instances.items():
+            trs = np.array(rows, dtype=np.float32)
+            attributes = {
+                "TRANSLATION": self.add_array(trs[:, 0:3], None, _FLOAT),
+                "ROTATION": self.add_array(trs[:, 3:7], None, _FLOAT),
+                "SCALE": self.add_array(trs[:, 7:10], None, _FLOAT),
+            }
+            self.add_node(
+                {
+                    "name": panel_type.value,
+                    "mesh": self.box_mesh_for(panel_type),
+                    "extensions": {
+                        "EXT_mesh_gpu_instancing": {"attributes": attributes}
+                    },
+                    "extras": {"panel_type": panel_type.value, "count": len(rows)},
+                }
+            )
+        self.gpu_instances.clear()
+
+    def to_glb(self) -> bytes:
+        """Serialize the accumulated scene to GLB bytes."""
+        uses_gpu_instancing = bool(self.gpu_instances)
+        self._flush_gpu_instances()
+        root_index = len(self.nodes)
+        nodes = self.nodes + [
+            {
+                "name": "cabinets",
+                "rotation": _Z_UP_TO_Y_UP,
+                "scale": [self.scale] * 3,
+                "children": self.root_children,
+            }
+        ]
+        while len(self.buffer) % 4:
+            self.buffer.append(0)
+        document: dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "cabinets glb exporter"},
+            "scene": 0,
+            "scenes": [{"nodes": [root_index]}],
+            "nodes": nodes,
+            "meshes": self.meshes,
+            "materials": self.materials,
+            "accessors": self.accessors,
+            "bufferViews": self.buffer_views,
+            "buffers": [{"byteLength": len(self.buffer)}] if self.buffer else [],
+        }
+        if uses_gpu_instancing:
+            document["extensionsUsed"] = ["EXT_mesh_gpu_instancing"]
+            document["extensionsRequired"] = ["EXT_mesh_gpu_instancing"]
+        if not self.buffer:
+            for key in ("meshes", "materials", "accessors", "bufferViews", "buffers"):
+                del document[key]
+
+        json_bytes = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        json_bytes += b" " * (-len(json_bytes) % 4)
+
+        chunks = struct.pack("<II", len(json_bytes), GLB_CHUNK_JSON) + json_bytes
+        if self.buffer:
+            chunks += struct.pack("<II", len(self.buffer), GLB_CHUNK_BIN)
+            chunks += bytes(self.buffer)
+
+        header = struct.pack("<III", GLB_MAGIC, GLB_VERSION, 12 + len(chunks))
+        return header + chunks
+
+
+@ExporterRegistry.register("glb")
+class GlbExporter:
+    """Exports cabinet layouts to binary glTF (GLB) with instanced boxes.
+
+    Produces far smaller files than STL for the same layout because box
+    geometry is stored once and each panel is a node transform. Supports
+    both single cabinet (LayoutOutput) and room layout (RoomLayoutOutput)
+    exports.
+
+    Attributes:
+        format_name: "glb"
+        file_extension: "glb"
+    """
+
+    format_name: ClassVar[str] = "glb"
+    file_extension: ClassVar[str] = "glb"
+
+    def __init__(
+        self,
+        mesh_builder: StlMeshBuilder | None = None,
+        units: str = "inches",
+        gpu_instancing: bool = False,
+        include_metadata: bool = True,
+    ) -> None:
+        """Initialize the GLB exporter.
+
+        Args:
+            mesh_builder: Optional mesh builder for curved decorative panels.
+            units: "inches" to keep domain units, or "meters" to scale the
+                scene to glTF's nominal meter units.
+            gpu_instancing: Store box transforms as EXT_mesh_gpu_instancing
+                accessors instead of one node per panel.
+            include_metadata: Attach panel details as node extras.
+
+        Raises:
+            ValueError: If units is not "inches" or "meters".
+        """
+        if units not in ("inches", "meters"):
+            raise ValueError(f"Unsupported units '{units}'. Use 'inches' or 'meters'.")
+        self.mesh_builder = mesh_builder or StlMeshBuilder()
+        self.units = units
+        self.gpu_instancing = gpu_instancing
+        self.include_metadata = include_metadata
+
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Units, instancing, metadata and curve detail settings.
+        """
+        return {
+            "units": self.units,
+            "gpu_instancing": self.gpu_instancing,
+            "include_metadata": self.include_metadata,
+            "curve_lod": self.mesh_builder.curve_lod,
+        }
+
+    def export(self, output: LayoutOutput | RoomLayoutOutput, path: Path) -> None:
+        """Export layout output to a GLB file.
+
+        Args:
+            output: The layout output to export.
+            path: Path where the GLB file will be saved.
+        """
+        Path(path).write_bytes(self.export_bytes(output))
+
+    def export_bytes(self, output: LayoutOutput | RoomLayoutOutput) -> bytes:
+        """Export layout output to GLB bytes.
+
+        Args:
+            output: The layout output to export.
+
+        Returns:
+            The GLB file contents.
+
+        Raises:
+            TypeError: If output is not a LayoutOutput or RoomLayoutOutput.
+        """
+        # Import here to avoid circular imports at module level
+        from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
+
+        builder = _GlbBuilder(scale=INCHES_TO_METERS if self.units == "meters" else 1.0)
+
+        if isinstance(output, RoomLayoutOutput):
+            if output.cabinets:
+                panels = RoomPanel3DMapper().map_cabinets_to_boxes_with_panels(
+                    output.cabinets, output.transforms
+                )
+                for box, panel, transform in panels:
+                    self._add_panel(builder, box, panel, transform)
+        elif isinstance(output, LayoutOutput):
+            if output.cabinet is not None:
+                mapper = Panel3DMapper.for_cabinet(output.cabinet)
+                for box, panel in mapper.map_all_panels_with_types():
+                    self._add_panel(builder, box, panel, None)
+        else:
+            raise TypeError(
+                f"Expected LayoutOutput or RoomLayoutOutput, got {type(output).__name__}"
+            )
+
+        return builder.to_glb()
+
+    def _add_panel(
+        self,
+        builder: _GlbBuilder,
+        box: BoundingBox3D,
+        panel: Panel,
+        transform: SectionTransform | None,
+    ) -> None:
+        """Add one panel as an instanced box node or an explicit mesh node."""
+        rotation_z = transform.rotation_z if transform is not None else 0.0
+        offset = (
+            np.array([transform.position.x, transform.position.y, transform.position.z])
+            if transform is not None
+            else np.zeros(3)
+        )
+
+        triangles = self._explicit_geometry(box, panel)
+
+        if triangles is None:
+            # Node TRS: p = T + R * (S * u) with u in the unit cube
+            angle = math.radians(rotation_z)
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            x, y, z = box.origin.x, box.origin.y, box.origin.z
+            translation = offset + np.array(
+                [x * cos_a - y * sin_a, x * sin_a + y * cos_a, z]
+            )
+            scale = (box.size_x, box.size_y, box.size_z)
+            if self.gpu_instancing:
+                builder.add_gpu_instance(
+                    panel.panel_type,
+                    translation,
+                    _z_rotation_quaternion(rotation_z),
+                    scale,
+                )
+                return
+            node: dict[str, Any] = {
+                "name": panel.panel_type.value,
+                "mesh": builder.box_mesh_for(panel.panel_type),
+                "translation": _rounded(translation),
+                "scale": _rounded(scale),
+            }
+        else:
+            node = {
+                "name": panel.panel_type.value,
+                "mesh": builder.add_triangle_mesh(
+                    panel.panel_type.value, triangles, panel.panel_type
+                ),
+                "translation": _rounded(offset),
+            }
+
+        if rotation_z:
+            node["rotation"] = _z_rotation_quaternion(rotation_z)
+        if self.include_metadata:
+            node["extras"] = self._panel_extras(panel, transform)
+        builder.add_node(node)
+
+    def _explicit_geometry(self, box: BoundingBox3D, panel: Panel) -> np.ndarray | None:
+        """Build non-box geometry in domain coordinates, if the panel needs it.
+
+        StlMeshBuilder emits Y-up triangles with swapped Y/Z axes; swapping
+        back and reversing winding restores domain coordinates with outward
+        facing triangles.
+
+        Returns:
+            (N, 3, 3) triangle array, or None to use the instanced box.
+        """
+        if panel.panel_type not in _CURVED_PANEL_TYPES:
+            return None
+
+        stl_mesh = None
+        if panel.panel_type == PanelType.ARCH_HEADER:
+            curve_points = panel.metadata.get("curve_points")
+            if curve_points:
+                stl_mesh = self.mesh_builder.build_arch_header_mesh(box, curve_points)
+        elif panel.panel_type == PanelType.VALANCE:
+            scallop_points = panel.metadata.get("scallop_points")
+            if scallop_points:
+                stl_mesh = self.mesh_builder.build_scalloped_panel_mesh(
+                    box, scallop_points
+                )
+        elif panel.panel_type == PanelType.STEPPED_SIDE:
+            step_depth_change = panel.metadata.get("step_depth_change", 0.0)
+            if step_depth_change > 0:
+                stl_mesh = self.mesh_builder.build_stepped_side_mesh(
+                    box,
+                    step_height=panel.metadata.get("step_height", box.size_z / 2),
+                    step_depth_change=step_depth_change,
+                )
+
+        if stl_mesh is None or len(stl_mesh.vectors) == 0:
+            return None
+
+        # (x, z, y) -> (x, y, z) and reverse winding (v0, v2, v1)
+        triangles = np.asarray(stl_mesh.vectors, dtype=np.float64)[:, :, [0, 2, 1]]
+        return triangles[:, [0, 2, 1], :]
+
+    def _panel_extras(
+        self, panel: Panel, transform: SectionTransform | None
+    ) -> dict[str, Any]:
+        """Collect viewer metadata for a panel node."""
+        extras: dict[str, Any] = {
+            "panel_type": panel.panel_type.value,
+            "width": panel.width,
+            "height": panel.height,
+            "thickness": panel.material.thickness,
+            "material": panel.material.material_type.value,
+        }
+        for key in _EXTRA_METADATA_KEYS:
+            value = panel.metadata.get(key)
+            if isinstance(value, (str, int, float, bool)):
+                extras[key] = value
+        if transform is not None:
+            extras["cabinet_index"] = transform.section_index
+            extras["wall_index"] = transform.wall_index
+        return extras
+
+    def export_string(self, output: LayoutOutput | RoomLayoutOutput) -> str:
+        """GLB format does not support string export.
+
+        Raises:
+            NotImplementedError: Always raises this exception.
+        """
+        raise NotImplementedError(
+            "GLB format is binary and does not support string export. "
+            "Use export() to write to a file instead."
+        )
+
+    def format_for_console(self, output: LayoutOutput | RoomLayoutOutput) -> str:
+        """GLB format does not support console output.
+
+        Raises:
+            NotImplementedError: Always raises this exception.
+        """
+        raise NotImplementedError(
+            "GLB format is binary and does not support console output. "
+            "Use export() to write to a file instead."
+        )
+
+
+__all__ = ["GlbExporter"]
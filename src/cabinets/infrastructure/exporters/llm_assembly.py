@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Literal
 
 from cabinets.infrastructure.exporters.base import ExporterRegistry
+from cabinets.infrastructure.llm.cache import InstructionCache, get_instruction_cache
 from cabinets.infrastructure.llm.generator import LLMAssemblyGenerator
 
 if TYPE_CHECKING:
@@ -57,6 +58,8 @@ class LLMAssemblyExporter:
         skill_level: Literal["beginner", "intermediate", "expert"] = "intermediate",
         include_troubleshooting: bool = True,
         include_time_estimates: bool = True,
+        cache: InstructionCache | None = None,
+        cache_only: bool = False,
     ) -> None:
         """Initialize the LLM assembly exporter.
 
@@ -67,6 +70,9 @@ class LLMAssemblyExporter:
             skill_level: Target skill level for instructions.
             include_troubleshooting: Include troubleshooting section.
             include_time_estimates: Include time estimates per step.
+            cache: Instruction cache (default: the process-wide cache, if
+                configured).
+            cache_only: Use only cached instructions, never calling the model.
         """
         self.generator = LLMAssemblyGenerator(
             ollama_url=ollama_url,
@@ -75,6 +81,8 @@ class LLMAssemblyExporter:
             skill_level=skill_level,
             include_troubleshooting=include_troubleshooting,
             include_time_estimates=include_time_estimates,
+            cache=cache if cache is not None else get_instruction_cache(),
+            cache_only=cache_only,
         )
 
     def export(self, output: "LayoutOutput | RoomLayoutOutput", path: Path) -> None:
@@ -148,6 +156,7 @@ class LLMAssemblyExporter:
             skill_level=config.skill_level,
             include_troubleshooting=config.include_troubleshooting,
             include_time_estimates=config.include_time_estimates,
+            cache_only=config.llm_cache_only,
         )
 
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from cabinets.infrastructure.exporters.base import ExporterRegistry
 from cabinets.infrastructure.stl_exporter import StlExporter as StlExporterImpl
-from cabinets.infrastructure.stl_exporter import StlMeshBuilder
+from cabinets.infrastructure.stl_exporter import (
+    CurveLOD,
+    RenderSettings,
+    StlMeshBuilder,
+)
 
 if TYPE_CHECKING:
     from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
@@ -19,29 +24,63 @@ class StlLayoutExporter:
 
     Wraps the existing StlExporter implementation to conform to the
     Exporter protocol. Supports both single cabinet (LayoutOutput) and
-    room layout (RoomLayoutOutput) exports.
+    room layout (RoomLayoutOutput) exports. Output bytes depend only on the
+    layout and the render settings.
 
     Attributes:
         format_name: "stl"
         file_extension: "stl"
+        format_version: "3" since the preview curve LOD is bounded by
+            chord error per scallop.
     """
 
     format_name: ClassVar[str] = "stl"
     file_extension: ClassVar[str] = "stl"
+    format_version: ClassVar[str] = "3"
 
     def __init__(
         self,
         mesh_builder: StlMeshBuilder | None = None,
         door_ajar_angle: float = 45.0,
+        curve_lod: CurveLOD | str | None = None,
+        settings: RenderSettings | None = None,
+        seed: int | None = None,
     ) -> None:
         """Initialize the STL exporter.
 
         Args:
             mesh_builder: Optional mesh builder for dependency injection.
             door_ajar_angle: Angle in degrees to open doors (default 45).
+            curve_lod: Level of detail for arches and scallops, either a
+                CurveLOD or a preset name ("full", "preview"). Ignored when
+                mesh_builder is given. Defaults to full detail.
+            settings: Render settings for door angles, drawer pull-outs and
+                curve detail. Defaults to RenderSettings().
+            seed: Render seed overriding settings.seed.
         """
-        self._exporter = StlExporterImpl(mesh_builder=mesh_builder)
+        if mesh_builder is None:
+            if isinstance(curve_lod, str):
+                curve_lod = CurveLOD.from_name(curve_lod)
+            mesh_builder = StlMeshBuilder(curve_lod=curve_lod)
+        settings = settings or RenderSettings()
+        if seed is not None:
+            settings = replace(settings, seed=seed)
+        self._exporter = StlExporterImpl(mesh_builder=mesh_builder, settings=settings)
         self._door_ajar_angle = door_ajar_angle
+        self._curve_lod = settings.curve_lod or mesh_builder.curve_lod
+        self._settings = replace(settings, curve_lod=None)
+
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Effective curve detail, door angle and render settings.
+        """
+        return {
+            "curve_lod": self._curve_lod,
+            "door_ajar_angle": self._door_ajar_angle,
+            "settings": self._settings,
+        }
 
     def export(self, output: LayoutOutput | RoomLayoutOutput, path: Path) -> None:
         """Export layout output to an STL file.
@@ -103,4 +142,10 @@ class StlLayoutExporter:
 
 
 # Re-export the underlying implementation classes for backwards compatibility
-__all__ = ["StlLayoutExporter", "StlExporterImpl", "StlMeshBuilder"]
+__all__ = [
+    "CurveLOD",
+    "RenderSettings",
+    "StlLayoutExporter",
+    "StlExporterImpl",
+    "StlMeshBuilder",
+]
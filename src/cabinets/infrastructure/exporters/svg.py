@@ -8,7 +8,7 @@ results to be available in the layout output.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from cabinets.infrastructure.cut_diagram_renderer import CutDiagramRenderer
 from cabinets.infrastructure.exporters.base import ExporterRegistry
@@ -60,6 +60,20 @@ class SvgExporter:
             use_panel_colors=use_panel_colors,
         )
 
+    def artifact_options(self) -> dict[str, Any]:
+        """Get the options that affect the exported bytes.
+
+        Returns:
+            Scale and display settings of the cut diagram renderer.
+        """
+        return {
+            "scale": self.renderer.scale,
+            "show_dimensions": self.renderer.show_dimensions,
+            "show_labels": self.renderer.show_labels,
+            "show_grain": self.renderer.show_grain,
+            "use_panel_colors": self.renderer.use_panel_colors,
+        }
+
     def export(self, output: LayoutOutput | RoomLayoutOutput, path: Path) -> None:
         """Export SVG cut diagrams to file.
 
@@ -8,12 +8,14 @@ Submodules:
     ollama_client: Health check and client utilities for Ollama
     prompts: System prompts and skill-level templates
     assembly_agent: pydantic-ai agent definition for assembly generation
+    cache: Persistent cache of generated instructions
 """
 
 from __future__ import annotations
 
 from .models import (
     AssemblyDeps,
+    AssemblyEvent,
     AssemblyInstructions,
     AssemblyStep,
     SafetyWarning,
@@ -23,6 +25,7 @@ from .models import (
 )
 from .ollama_client import OllamaHealthCheck, check_ollama_sync
 from .prompts import (
+    PROMPT_VERSION,
     ASSEMBLY_SYSTEM_PROMPT,
     BEGINNER_PROMPT_ADDITIONS,
     EXPERT_PROMPT_ADDITIONS,
@@ -37,12 +40,21 @@ from .assembly_agent import (
     reset_default_agent,
     run_assembly_agent,
     run_assembly_agent_sync,
+    stream_assembly_agent,
+)
+from .cache import (
+    InstructionCache,
+    InstructionCacheMiss,
+    configure_instruction_cache,
+    get_instruction_cache,
+    instructions_key,
 )
 from .generator import LLMAssemblyGenerator
 
 __all__ = [
     # LLM output models
     "AssemblyDeps",
+    "AssemblyEvent",
     "AssemblyInstructions",
     "AssemblyStep",
     "SafetyWarning",
@@ -53,6 +65,7 @@ __all__ = [
     "OllamaHealthCheck",
     "check_ollama_sync",
     # Prompts
+    "PROMPT_VERSION",
     "ASSEMBLY_SYSTEM_PROMPT",
     "BEGINNER_PROMPT_ADDITIONS",
     "EXPERT_PROMPT_ADDITIONS",
@@ -66,6 +79,13 @@ __all__ = [
     "reset_default_agent",
     "run_assembly_agent",
     "run_assembly_agent_sync",
+    "stream_assembly_agent",
+    # Cache
+    "InstructionCache",
+    "InstructionCacheMiss",
+    "configure_instruction_cache",
+    "get_instruction_cache",
+    "instructions_key",
     # Generator
     "LLMAssemblyGenerator",
 ]
@@ -17,13 +17,23 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
 
+import httpx
+import pydantic_core
 from pydantic_ai import Agent, RunContext
+from pydantic_ai.messages import ModelResponsePart, ToolCallPart
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
 
-from cabinets.infrastructure.llm.models import AssemblyDeps, AssemblyInstructions
+from cabinets.infrastructure.llm.models import (
+    AssemblyDeps,
+    AssemblyInstructions,
+    AssemblyStep,
+)
 from cabinets.infrastructure.llm.prompts import (
     ASSEMBLY_SYSTEM_PROMPT,
     build_user_prompt,
@@ -41,6 +51,7 @@ logger = logging.getLogger(__name__)
 def _create_ollama_model(
     model_name: str,
     ollama_url: str,
+    http_client: httpx.AsyncClient | None = None,
 ) -> OpenAIChatModel:
     """Create an Ollama model using OpenAI-compatible API.
 
@@ -51,6 +62,8 @@ def _create_ollama_model(
         model_name: Model name (e.g., "llama3.2", "qwen3:30b").
             Should NOT include "ollama:" prefix.
         ollama_url: Base URL for Ollama server (without /v1 suffix).
+        http_client: Optional shared HTTP client, so several agents reuse
+            one connection pool.
 
     Returns:
         Configured OpenAIChatModel instance for use with pydantic-ai.
@@ -66,7 +79,9 @@ def _create_ollama_model(
 
     # Create OpenAI provider pointing to Ollama's OpenAI-compatible API
     # Use dummy API key since Ollama doesn't require authentication
-    provider = OpenAIProvider(base_url=base_url, api_key="ollama")
+    provider = OpenAIProvider(
+        base_url=base_url, api_key="ollama", http_client=http_client
+    )
 
     return OpenAIChatModel(model_name, provider=provider)
 
@@ -74,6 +89,7 @@ def _create_ollama_model(
 def create_assembly_agent(
     model: str = "ollama:llama3.2",
     ollama_url: str = "http://localhost:11434",
+    http_client: httpx.AsyncClient | None = None,
 ) -> Agent[AssemblyDeps, AssemblyInstructions]:
     """Create a configured assembly instruction agent.
 
@@ -83,6 +99,7 @@ def create_assembly_agent(
     Args:
         model: Model identifier in pydantic-ai format (e.g., "ollama:llama3.2").
         ollama_url: Base URL for Ollama server.
+        http_client: Optional shared HTTP client for requests to Ollama.
 
     Returns:
         Configured Agent ready for instruction generation.
@@ -92,7 +109,7 @@ def create_assembly_agent(
         the skill_level in AssemblyDeps.
     """
     # Create model with configured Ollama provider
-    model_instance = _create_ollama_model(model, ollama_url)
+    model_instance = _create_ollama_model(model, ollama_url, http_client)
 
     agent: Agent[AssemblyDeps, AssemblyInstructions] = Agent(
         model_instance,
@@ -160,6 +177,19 @@ def reset_default_agent() -> None:
 # =============================================================================
 
 
+def _user_prompt(deps: AssemblyDeps) -> str:
+    """Build the user prompt from agent dependencies."""
+    return build_user_prompt(
+        cabinet=deps.cabinet,
+        cut_list=deps.cut_list,
+        joinery=deps.joinery,
+        skill_level=deps.skill_level,
+        has_doors=deps.has_doors,
+        has_drawers=deps.has_drawers,
+        has_decorative=deps.has_decorative_elements,
+    )
+
+
 async def run_assembly_agent(
     deps: AssemblyDeps,
     model: str = "ollama:llama3.2",
@@ -202,16 +232,7 @@ async def run_assembly_agent(
     if agent is None:
         agent = create_assembly_agent(model=model, ollama_url=ollama_url)
 
-    # Build user prompt from dependencies
-    user_prompt = build_user_prompt(
-        cabinet=deps.cabinet,
-        cut_list=deps.cut_list,
-        joinery=deps.joinery,
-        skill_level=deps.skill_level,
-        has_doors=deps.has_doors,
-        has_drawers=deps.has_drawers,
-        has_decorative=deps.has_decorative_elements,
-    )
+    user_prompt = _user_prompt(deps)
 
     logger.debug(f"Running assembly agent with skill_level={deps.skill_level}")
     logger.debug(f"User prompt length: {len(user_prompt)} chars")
@@ -225,6 +246,72 @@ async def run_assembly_agent(
     return result.output
 
 
+async def stream_assembly_agent(
+    deps: AssemblyDeps,
+    model: str = "ollama:llama3.2",
+    ollama_url: str = "http://localhost:11434",
+    agent: Agent[AssemblyDeps, AssemblyInstructions] | None = None,
+    idle_timeout: float | None = None,
+) -> AsyncIterator[AssemblyStep | AssemblyInstructions]:
+    """Run the assembly agent, yielding steps as the model writes them.
+
+    The model's output is parsed as partial JSON while it streams. Each
+    step is yielded once the model has moved on to the next one, and the
+    complete, validated AssemblyInstructions are yielded last.
+
+    Args:
+        deps: Assembly dependencies including cabinet, cut list, etc.
+        model: Ollama model identifier (default: "ollama:llama3.2").
+        ollama_url: Ollama server URL (default: "http://localhost:11434").
+        agent: Optional pre-configured agent (for testing).
+        idle_timeout: Maximum seconds to wait for more output from the
+            model, or None to wait indefinitely.
+
+    Yields:
+        AssemblyStep for each completed step, then AssemblyInstructions.
+
+    Raises:
+        asyncio.TimeoutError: If the model sends nothing for idle_timeout.
+        pydantic_ai.exceptions.UnexpectedModelBehavior: On unexpected LLM response.
+        httpx.RequestError: On network errors to Ollama.
+    """
+    if agent is None:
+        agent = create_assembly_agent(model=model, ollama_url=ollama_url)
+
+    logger.debug(f"Streaming assembly agent with skill_level={deps.skill_level}")
+
+    emitted = 0
+    async with agent.run_stream(_user_prompt(deps), deps=deps) as result:
+        responses = result.stream_responses(debounce_by=None)
+        while True:
+            try:
+                response, _ = await asyncio.wait_for(anext(responses), idle_timeout)
+            except StopAsyncIteration:
+                break
+            steps = _partial_steps(response.parts)
+            # The last step may still be incomplete
+            for raw_step in steps[emitted : len(steps) - 1]:
+                yield AssemblyStep.model_validate(raw_step)
+                emitted += 1
+        output = await result.get_output()
+
+    for step in output.steps[emitted:]:
+        yield step
+    yield output
+
+
+def _partial_steps(parts: Sequence[ModelResponsePart]) -> list[Any]:
+    """Extract the steps written so far from a partial output tool call."""
+    for part in parts:
+        if isinstance(part, ToolCallPart) and part.args:
+            args = part.args
+            if isinstance(args, str):
+                args = pydantic_core.from_json(args, allow_partial=True)
+            steps = args.get("steps") if isinstance(args, dict) else None
+            return steps if isinstance(steps, list) else []
+    return []
+
+
 # =============================================================================
 # Synchronous Wrapper
 # =============================================================================
@@ -262,4 +349,5 @@ __all__ = [
     "reset_default_agent",
     "run_assembly_agent",
     "run_assembly_agent_sync",
+    "stream_assembly_agent",
 ]
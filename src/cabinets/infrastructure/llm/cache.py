@@ -0,0 +1,205 @@
+"""Persistent cache of LLM-generated assembly instructions.
+
+The model's answer depends only on the prompt it is sent, so identical
+cabinets can reuse instructions generated earlier. InstructionCache keeps
+AssemblyInstructions as JSON in an ArtifactStore (size cap, LRU eviction,
+safe to share between processes) under a key hashed from the model name,
+PROMPT_VERSION and the canonical user prompt built from the AssemblyDeps.
+
+The process-wide cache is disabled unless configured, either with
+configure_instruction_cache() or with these environment variables:
+
+- CABINETS_LLM_CACHE: cache directory
+- CABINETS_LLM_CACHE_MAX_MB: size cap in megabytes (default 256)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from cabinets.infrastructure.artifact_store import ArtifactStore, ArtifactStoreMetrics
+from cabinets.infrastructure.llm.models import AssemblyDeps, AssemblyInstructions
+from cabinets.infrastructure.llm.prompts import PROMPT_VERSION, build_user_prompt
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the shared cache directory
+LLM_CACHE_ENV = "CABINETS_LLM_CACHE"
+
+# Environment variable overriding the cache size cap, in megabytes
+LLM_CACHE_MAX_MB_ENV = "CABINETS_LLM_CACHE_MAX_MB"
+
+# Default size cap of an instruction cache in bytes (256 MiB)
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class InstructionCacheMiss(LookupError):
+    """No cached instructions for a prompt the model cannot be asked about."""
+
+
+def instructions_key(deps: AssemblyDeps, model: str) -> str:
+    """Compute the cache key of the instructions for a prompt.
+
+    Args:
+        deps: Assembly dependencies the prompt is built from.
+        model: Model identifier (with or without the "ollama:" prefix).
+
+    Returns:
+        SHA-256 hex digest of the model, prompt version and prompt.
+    """
+    canonical = {
+        "prompt_version": PROMPT_VERSION,
+        "model": model.removeprefix("ollama:"),
+        "skill_level": deps.skill_level,
+        "material_type": deps.material_type.value,
+        "has_doors": deps.has_doors,
+        "has_drawers": deps.has_drawers,
+        "has_decorative_elements": deps.has_decorative_elements,
+        "prompt": build_user_prompt(
+            cabinet=deps.cabinet,
+            cut_list=deps.cut_list,
+            joinery=deps.joinery,
+            skill_level=deps.skill_level,
+            has_doors=deps.has_doors,
+            has_drawers=deps.has_drawers,
+            has_decorative=deps.has_decorative_elements,
+        ),
+    }
+    data = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class InstructionCache:
+    """Size-bounded on-disk cache of AssemblyInstructions.
+
+    Example:
+        cache = InstructionCache(Path("~/.cache/cabinets/llm").expanduser())
+        generator = LLMAssemblyGenerator(cache=cache)
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        """Initialize the cache, creating its directory if needed.
+
+        Args:
+            root: Cache directory.
+            max_bytes: Maximum total size of cached instructions.
+
+        Raises:
+            ValueError: If max_bytes is less than 1.
+        """
+        self._store = ArtifactStore(root, max_bytes)
+
+    @property
+    def root(self) -> Path:
+        """Cache directory."""
+        return self._store.root
+
+    def get(self, deps: AssemblyDeps, model: str) -> AssemblyInstructions | None:
+        """Look up cached instructions.
+
+        Args:
+            deps: Assembly dependencies the prompt is built from.
+            model: Model identifier.
+
+        Returns:
+            Cached instructions, or None on a miss or unreadable entry.
+        """
+        data = self._store.get(instructions_key(deps, model))
+        if data is None:
+            return None
+        try:
+            return AssemblyInstructions.model_validate_json(data)
+        except ValidationError:
+            logger.warning("Ignoring unreadable cached assembly instructions")
+            return None
+
+    def put(
+        self, deps: AssemblyDeps, model: str, instructions: AssemblyInstructions
+    ) -> None:
+        """Store generated instructions.
+
+        Args:
+            deps: Assembly dependencies the prompt was built from.
+            model: Model identifier.
+            instructions: Instructions generated by the model.
+        """
+        self._store.put(
+            instructions_key(deps, model), instructions.model_dump_json().encode()
+        )
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self._store.clear()
+
+    def metrics(self) -> ArtifactStoreMetrics:
+        """Get a snapshot of this process's cache statistics."""
+        return self._store.metrics()
+
+
+_default_cache: InstructionCache | None = None
+_default_cache_configured = False
+_default_cache_lock = threading.Lock()
+
+
+def configure_instruction_cache(
+    root: Path | None, max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+) -> InstructionCache | None:
+    """Set the process-wide instruction cache.
+
+    Args:
+        root: Cache directory, or None to disable the cache.
+        max_bytes: Maximum total size of cached instructions.
+
+    Returns:
+        The configured cache, or None if disabled.
+    """
+    global _default_cache, _default_cache_configured
+    with _default_cache_lock:
+        _default_cache = InstructionCache(root, max_bytes) if root is not None else None
+        _default_cache_configured = True
+        return _default_cache
+
+
+def get_instruction_cache() -> InstructionCache | None:
+    """Get the process-wide instruction cache.
+
+    On first use the cache is configured from the CABINETS_LLM_CACHE and
+    CABINETS_LLM_CACHE_MAX_MB environment variables unless
+    configure_instruction_cache() was called.
+
+    Returns:
+        The shared cache, or None if no cache is configured.
+    """
+    global _default_cache, _default_cache_configured
+    with _default_cache_lock:
+        if not _default_cache_configured:
+            root = os.environ.get(LLM_CACHE_ENV)
+            if root:
+                max_mb = os.environ.get(LLM_CACHE_MAX_MB_ENV)
+                max_bytes = (
+                    int(float(max_mb) * 1024 * 1024)
+                    if max_mb
+                    else DEFAULT_CACHE_MAX_BYTES
+                )
+                _default_cache = InstructionCache(Path(root), max_bytes)
+            _default_cache_configured = True
+        return _default_cache
+
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_BYTES",
+    "LLM_CACHE_ENV",
+    "LLM_CACHE_MAX_MB_ENV",
+    "InstructionCache",
+    "InstructionCacheMiss",
+    "configure_instruction_cache",
+    "get_instruction_cache",
+    "instructions_key",
+]
@@ -12,23 +12,35 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, TypeGuard
 
+import httpx
 from pydantic import ValidationError
+from pydantic_ai import Agent
 
-from cabinets.domain.value_objects import PanelType
+from cabinets.domain.value_objects import CutPiece, PanelType
 from cabinets.infrastructure.exporters.assembly import AssemblyInstructionGenerator
-from cabinets.infrastructure.llm.assembly_agent import run_assembly_agent
+from cabinets.infrastructure.llm.assembly_agent import (
+    create_assembly_agent,
+    run_assembly_agent,
+    stream_assembly_agent,
+)
+from cabinets.infrastructure.llm.cache import InstructionCache, InstructionCacheMiss
 from cabinets.infrastructure.llm.models import (
     AssemblyDeps,
+    AssemblyEvent,
     AssemblyInstructions,
+    AssemblyStep,
     WarningSeverity,
 )
 from cabinets.infrastructure.llm.ollama_client import OllamaHealthCheck
 
 if TYPE_CHECKING:
     from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
+    from cabinets.domain.entities import Cabinet
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +54,16 @@ class LLMAssemblyGenerator:
     - LLM generation times out
     - LLM output fails schema validation
 
+    Room layouts with several cabinets get one set of instructions per
+    cabinet. Cabinets are generated concurrently (at most max_concurrency
+    requests in flight) over one pooled HTTP client, and a cabinet whose
+    generation fails falls back to template instructions on its own.
+
+    With an InstructionCache, instructions are looked up by prompt before
+    the model is called and stored after it answers. Cached instructions
+    are served even when Ollama is unavailable; in cache_only mode the
+    model is never called.
+
     Attributes:
         ollama_url: Ollama server URL
         model: Ollama model identifier
@@ -49,6 +71,10 @@ class LLMAssemblyGenerator:
         skill_level: Target skill level for instructions
         include_troubleshooting: Whether to include troubleshooting section
         include_time_estimates: Whether to include time estimates
+        max_concurrency: Maximum concurrent cabinet generations
+        http_client: Shared HTTP client, or None to open one per generate()
+        cache: Persistent instruction cache, or None
+        cache_only: Serve only cached instructions, never calling the model
 
     Example:
         >>> generator = LLMAssemblyGenerator(skill_level="beginner")
@@ -64,6 +90,11 @@ class LLMAssemblyGenerator:
         skill_level: Literal["beginner", "intermediate", "expert"] = "intermediate",
         include_troubleshooting: bool = True,
         include_time_estimates: bool = True,
+        max_concurrency: int = 4,
+        health_cache_ttl: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
+        cache: InstructionCache | None = None,
+        cache_only: bool = False,
     ) -> None:
         """Initialize the LLM assembly generator.
 
@@ -74,14 +105,33 @@ class LLMAssemblyGenerator:
             skill_level: Target skill level (default: intermediate).
             include_troubleshooting: Include troubleshooting tips (default: True).
             include_time_estimates: Include time estimates (default: True).
+            max_concurrency: Maximum cabinets generated at once (default: 4).
+            health_cache_ttl: Seconds to reuse server and model checks
+                (default: 30).
+            http_client: Shared HTTP client for Ollama requests (default:
+                a pooled client opened for each generate() call).
+            cache: Persistent instruction cache (default: None, no caching).
+            cache_only: Use only cached instructions; uncached cabinets get
+                template instructions (default: False).
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
         self.ollama_url = ollama_url
         self.model = model
         self.timeout = timeout
         self.skill_level = skill_level
         self.include_troubleshooting = include_troubleshooting
         self.include_time_estimates = include_time_estimates
-        self.health_check = OllamaHealthCheck(ollama_url)
+        self.max_concurrency = max_concurrency
+        self.http_client = http_client
+        self.cache = cache
+        self.cache_only = cache_only
+        self.health_check = OllamaHealthCheck(ollama_url, cache_ttl=health_cache_ttl)
         self.fallback = AssemblyInstructionGenerator()
 
     async def generate(self, output: "LayoutOutput | RoomLayoutOutput") -> str:
@@ -96,70 +146,115 @@ class LLMAssemblyGenerator:
         Returns:
             Markdown-formatted assembly instructions.
         """
-        # Check Ollama availability first
-        if not await self.health_check.is_available():
-            logger.info("Ollama unavailable, using template fallback")
-            return self._fallback_generate(output, reason="Ollama server not available")
-
-        # Check model availability
-        if not await self.health_check.has_model(self.model):
-            logger.warning(
-                f"Model '{self.model}' not found. Run: ollama pull {self.model}"
-            )
-            return self._fallback_generate(
-                output, reason=f"Model '{self.model}' not available"
-            )
-
-        # Attempt LLM generation with timeout
-        try:
-            deps = self._build_deps(output)
-
-            result = await asyncio.wait_for(
-                run_assembly_agent(
-                    deps=deps,
+        async with self._session() as client:
+            offline_reason = await self._offline_reason(client)
+            if offline_reason is not None and self.cache is None:
+                return self._fallback_generate(output, reason=offline_reason)
+
+            agent = None
+            if offline_reason is None:
+                agent = create_assembly_agent(
                     model=f"ollama:{self.model}",
                     ollama_url=self.ollama_url,
-                ),
-                timeout=self.timeout,
-            )
-
-            logger.info(
-                f"LLM generated {len(result.steps)} steps "
-                f"for skill_level={self.skill_level}"
-            )
-            return self._format_markdown(result)
+                    http_client=client,
+                )
 
-        except asyncio.TimeoutError:
-            logger.warning(f"LLM generation timed out after {self.timeout}s")
-            return self._fallback_generate(
-                output, reason=f"Generation timed out after {self.timeout}s"
-            )
+            if self._is_multi_cabinet(output):
+                return await self._generate_room(output, agent, offline_reason)
 
-        except ValidationError as e:
-            logger.warning(f"LLM output validation failed: {e.error_count()} errors")
-            # One retry attempt
+            # Attempt LLM generation with timeout
             try:
-                logger.info("Retrying LLM generation...")
-                result = await asyncio.wait_for(
-                    run_assembly_agent(
-                        deps=self._build_deps(output),
-                        model=f"ollama:{self.model}",
-                        ollama_url=self.ollama_url,
-                    ),
-                    timeout=self.timeout,
+                deps = self._build_deps(output)
+                result = await self._run_agent(deps, agent)
+
+                logger.info(
+                    f"LLM generated {len(result.steps)} steps "
+                    f"for skill_level={self.skill_level}"
                 )
                 return self._format_markdown(result)
-            except Exception as retry_error:
-                logger.warning(f"Retry failed: {retry_error}")
+
+            except InstructionCacheMiss:
                 return self._fallback_generate(
-                    output, reason="LLM output validation failed after retry"
+                    output, reason=f"{offline_reason}; no cached instructions"
                 )
 
-        except Exception as e:
-            logger.error(f"Unexpected error during LLM generation: {e}")
-            return self._fallback_generate(
-                output, reason=f"Unexpected error: {type(e).__name__}"
-            )
+            except asyncio.TimeoutError:
+                logger.warning(f"LLM generation timed out after {self.timeout}s")
+                return self._fallback_generate(
+                    output, reason=f"Generation timed out after {self.timeout}s"
+                )
+
+            except ValidationError as e:
+                logger.warning(
+                    f"LLM output validation failed: {e.error_count()} errors"
+                )
+                # One retry attempt
+                try:
+                    logger.info("Retrying LLM generation...")
+                    result = await self._run_agent(self._build_deps(output), agent)
+                    return self._format_markdown(result)
+                except Exception as retry_error:
+                    logger.warning(f"Retry failed: {retry_error}")
+                    return self._fallback_generate(
+                        output, reason="LLM output validation failed after retry"
+                    )
+
+            except Exception as e:
+                logger.error(f"Unexpected error during LLM generation: {e}")
+                return self._fallback_generate(
+                    output, reason=f"Unexpected error: {type(e).__name__}"
+                )
+
+    async def stream(
+        self, output: "LayoutOutput | RoomLayoutOutput"
+    ) -> AsyncIterator[AssemblyEvent]:
+        """Stream assembly instructions as they are generated.
+
+        The template-based instructions are yielded first, before Ollama is
+        contacted. Then, for each cabinet, the LLM steps are yielded as the
+        model writes them, followed by the formatted instructions, or by a
+        fallback event if the LLM cannot produce them.
+
+        Unlike generate(), the timeout applies to each wait for more model
+        output rather than to the whole run, so slow hardware still yields
+        LLM instructions as long as the model keeps writing.
+
+        Args:
+            output: Layout output containing cabinet and cut list.
+
+        Yields:
+            AssemblyEvent for the template, each step and each result.
+        """
+        yield AssemblyEvent(kind="template", data=self.fallback.export_string(output))
+
+        try:
+            if self._is_multi_cabinet(output):
+                from cabinets.domain.services import CutListGenerator
+
+                deps_list = [
+                    self._build_cabinet_deps(cab, CutListGenerator().generate(cab))
+                    for cab in output.cabinets
+                ]
+            else:
+                deps_list = [self._build_deps(output)]
+        except ValueError as e:
+            yield AssemblyEvent(kind="fallback", data=str(e))
+            return
+
+        async with self._session() as client:
+            offline_reason = await self._offline_reason(client)
+            agent = None
+            if offline_reason is None:
+                agent = create_assembly_agent(
+                    model=f"ollama:{self.model}",
+                    ollama_url=self.ollama_url,
+                    http_client=client,
+                )
+            for index, deps in enumerate(deps_list):
+                async for event in self._stream_cabinet(
+                    index, deps, agent, offline_reason
+                ):
+                    yield event
 
     def generate_sync(self, output: "LayoutOutput | RoomLayoutOutput") -> str:
         """Synchronous wrapper for generate().
@@ -172,6 +267,238 @@ class LLMAssemblyGenerator:
         """
         return asyncio.run(self.generate(output))
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the shared HTTP client, or open a pooled one for this call."""
+        if self.http_client is not None:
+            yield self.http_client
+            return
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        async with httpx.AsyncClient(limits=limits) as client:
+            yield client
+
+    async def _offline_reason(self, client: httpx.AsyncClient) -> str | None:
+        """Check whether the model can be called.
+
+        Returns:
+            Why the model cannot be called, or None if it can.
+        """
+        if self.cache_only:
+            return "Cache-only mode"
+        # Check Ollama availability first
+        if not await self.health_check.is_available(client=client):
+            logger.info("Ollama unavailable, using template fallback")
+            return "Ollama server not available"
+        # Check model availability
+        if not await self.health_check.has_model(self.model, client=client):
+            logger.warning(
+                f"Model '{self.model}' not found. Run: ollama pull {self.model}"
+            )
+            return f"Model '{self.model}' not available"
+        return None
+
+    async def _stream_cabinet(
+        self,
+        index: int,
+        deps: AssemblyDeps,
+        agent: Agent[AssemblyDeps, AssemblyInstructions] | None,
+        offline_reason: str | None,
+    ) -> AsyncIterator[AssemblyEvent]:
+        """Stream the LLM instructions of one cabinet.
+
+        Args:
+            index: Index of the cabinet.
+            deps: Agent dependencies for the cabinet.
+            agent: Agent sharing the pooled HTTP client, or None if the
+                model cannot be called.
+            offline_reason: Why the model cannot be called, if it cannot.
+
+        Yields:
+            Step events, then an instructions or fallback event.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(deps, self.model)
+            if cached is not None:
+                for step in cached.steps:
+                    yield AssemblyEvent(
+                        kind="step", data=step.model_dump_json(), cabinet=index
+                    )
+                yield AssemblyEvent(
+                    kind="instructions",
+                    data=self._format_markdown(cached),
+                    cabinet=index,
+                )
+                return
+
+        if agent is None:
+            reason = offline_reason or "LLM unavailable"
+            if self.cache is not None:
+                reason = f"{reason}; no cached instructions"
+            yield AssemblyEvent(kind="fallback", data=reason, cabinet=index)
+            return
+
+        try:
+            async for item in stream_assembly_agent(
+                deps,
+                model=f"ollama:{self.model}",
+                ollama_url=self.ollama_url,
+                agent=agent,
+                idle_timeout=self.timeout,
+            ):
+                if isinstance(item, AssemblyStep):
+                    yield AssemblyEvent(
+                        kind="step", data=item.model_dump_json(), cabinet=index
+                    )
+                else:
+                    if self.cache is not None:
+                        self.cache.put(deps, self.model, item)
+                    yield AssemblyEvent(
+                        kind="instructions",
+                        data=self._format_markdown(item),
+                        cabinet=index,
+                    )
+        except asyncio.TimeoutError:
+            logger.warning(f"No LLM output for {self.timeout}s")
+            yield AssemblyEvent(
+                kind="fallback",
+                data=f"No output from the model for {self.timeout}s",
+                cabinet=index,
+            )
+        except Exception as e:
+            logger.error(f"LLM streaming failed: {e}")
+            yield AssemblyEvent(
+                kind="fallback",
+                data=f"LLM generation failed: {type(e).__name__}",
+                cabinet=index,
+            )
+
+    async def _run_agent(
+        self,
+        deps: AssemblyDeps,
+        agent: Agent[AssemblyDeps, AssemblyInstructions] | None,
+    ) -> AssemblyInstructions:
+        """Get instructions from the cache, or run the assembly agent once.
+
+        Agent runs are bounded by the generation timeout, and their results
+        are stored in the cache.
+
+        Raises:
+            InstructionCacheMiss: If nothing is cached and agent is None.
+            asyncio.TimeoutError: If generation exceeds the timeout.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(deps, self.model)
+            if cached is not None:
+                return cached
+        if agent is None:
+            raise InstructionCacheMiss("No cached instructions")
+        result = await asyncio.wait_for(
+            run_assembly_agent(
+                deps=deps,
+                model=f"ollama:{self.model}",
+                ollama_url=self.ollama_url,
+                agent=agent,
+            ),
+            timeout=self.timeout,
+        )
+        if self.cache is not None:
+            self.cache.put(deps, self.model, result)
+        return result
+
+    @staticmethod
+    def _is_multi_cabinet(
+        output: "LayoutOutput | RoomLayoutOutput",
+    ) -> TypeGuard[RoomLayoutOutput]:
+        """Check whether output is a room layout with more than one cabinet."""
+        from cabinets.contracts.dtos import RoomLayoutOutput
+
+        return isinstance(output, RoomLayoutOutput) and len(output.cabinets) > 1
+
+    async def _generate_room(
+        self,
+        output: "RoomLayoutOutput",
+        agent: Agent[AssemblyDeps, AssemblyInstructions] | None,
+        offline_reason: str | None = None,
+    ) -> str:
+        """Generate instructions for each cabinet of a room concurrently.
+
+        Each cabinet gets its own cut list and agent run (with one retry
+        on validation errors). Cabinets whose generation fails get template
+        instructions; if every cabinet fails the whole room falls back.
+
+        Args:
+            output: Room layout output with more than one cabinet.
+            agent: Agent sharing the pooled HTTP client, or None if the
+                model cannot be called.
+            offline_reason: Why the model cannot be called, if it cannot.
+
+        Returns:
+            Markdown document with one part per cabinet.
+        """
+        from cabinets.contracts.dtos import LayoutOutput
+        from cabinets.domain.services import CutListGenerator
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        cut_lists = [CutListGenerator().generate(cab) for cab in output.cabinets]
+
+        async def generate_one(
+            cabinet: Cabinet, cut_list: list[CutPiece]
+        ) -> AssemblyInstructions:
+            deps = self._build_cabinet_deps(cabinet, cut_list)
+            async with semaphore:
+                try:
+                    return await self._run_agent(deps, agent)
+                except ValidationError as e:
+                    logger.warning(
+                        f"LLM output validation failed: {e.error_count()} errors"
+                    )
+                    return await self._run_agent(deps, agent)
+
+        results = await asyncio.gather(
+            *(
+                generate_one(cabinet, cut_list)
+                for cabinet, cut_list in zip(output.cabinets, cut_lists)
+            ),
+            return_exceptions=True,
+        )
+
+        miss_reason = f"{offline_reason}; no cached instructions"
+        if all(isinstance(result, BaseException) for result in results):
+            logger.warning("LLM generation failed for every cabinet")
+            if offline_reason is not None:
+                return self._fallback_generate(output, reason=miss_reason)
+            return self._fallback_generate(
+                output, reason=f"LLM generation failed for all {len(results)} cabinets"
+            )
+
+        count = len(results)
+        parts = [f"# {output.room.name} Assembly", ""]
+        for index, (cabinet, cut_list, result) in enumerate(
+            zip(output.cabinets, cut_lists, results), start=1
+        ):
+            parts.append(f"<!-- Cabinet {index} of {count} -->")
+            if isinstance(result, AssemblyInstructions):
+                parts.append(self._format_markdown(result))
+            elif isinstance(result, InstructionCacheMiss):
+                parts.append(
+                    self._fallback_generate(
+                        LayoutOutput(cabinet=cabinet, cut_list=cut_list),
+                        reason=miss_reason,
+                    )
+                )
+            else:
+                logger.warning(f"LLM generation failed for cabinet {index}: {result!r}")
+                parts.append(
+                    self._fallback_generate(
+                        LayoutOutput(cabinet=cabinet, cut_list=cut_list),
+                        reason=f"LLM generation failed: {type(result).__name__}",
+                    )
+                )
+        return "\n".join(parts)
+
     def _build_deps(self, output: "LayoutOutput | RoomLayoutOutput") -> AssemblyDeps:
         """Build agent dependencies from layout output.
 
@@ -182,7 +509,6 @@ class LLMAssemblyGenerator:
             AssemblyDeps configured for the cabinet.
         """
         from cabinets.contracts.dtos import LayoutOutput, RoomLayoutOutput
-        from cabinets.domain.services.woodworking import WoodworkingIntelligence
 
         # Extract cabinet and cut list
         if isinstance(output, RoomLayoutOutput):
@@ -197,6 +523,22 @@ class LLMAssemblyGenerator:
         if cabinet is None:
             raise ValueError("No cabinet found in output")
 
+        return self._build_cabinet_deps(cabinet, cut_list)
+
+    def _build_cabinet_deps(
+        self, cabinet: "Cabinet", cut_list: list[CutPiece]
+    ) -> AssemblyDeps:
+        """Build agent dependencies for one cabinet.
+
+        Args:
+            cabinet: Cabinet to generate instructions for.
+            cut_list: Cut pieces of the cabinet.
+
+        Returns:
+            AssemblyDeps configured for the cabinet.
+        """
+        from cabinets.domain.services.woodworking import WoodworkingIntelligence
+
         # Get joinery information
         joinery = []
         try:
@@ -12,6 +12,7 @@ Models:
     TroubleshootingTip: Common issue with solution
     AssemblyInstructions: Complete assembly output from LLM
     AssemblyDeps: Dependencies injected into the agent
+    AssemblyEvent: One event of a streamed generation
 """
 
 from __future__ import annotations
@@ -230,3 +231,23 @@ class AssemblyDeps(BaseModel):
     has_doors: bool = False
     has_drawers: bool = False
     has_decorative_elements: bool = False
+
+
+class AssemblyEvent(BaseModel):
+    """One event of a streamed assembly instruction generation.
+
+    Events arrive in this order: one ``template`` event with the complete
+    template-based instructions, then for each cabinet any number of
+    ``step`` events followed by either an ``instructions`` or a
+    ``fallback`` event.
+
+    Attributes:
+        kind: Event type.
+        data: Markdown for template and instructions events, AssemblyStep
+            JSON for step events, the reason for fallback events.
+        cabinet: Index of the cabinet the event belongs to.
+    """
+
+    kind: Literal["template", "step", "instructions", "fallback"]
+    data: str
+    cabinet: int = 0
@@ -10,6 +10,9 @@ Classes:
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
@@ -24,9 +27,16 @@ class OllamaHealthCheck:
     and that the required model is available before attempting
     LLM generation. All methods are async for non-blocking I/O.
 
+    Results of is_available() and has_model() can be cached for
+    ``cache_ttl`` seconds, so repeated generation calls do not probe the
+    server every time. Every method accepts an optional shared
+    ``httpx.AsyncClient``; without one a short-lived client is used.
+
     Attributes:
         base_url: Base URL of the Ollama server (default: http://localhost:11434)
         timeout: Request timeout in seconds (default: 5.0)
+        cache_ttl: Seconds to reuse health and model check results
+            (default: 0, no caching)
 
     Example:
         >>> health = OllamaHealthCheck()
@@ -40,22 +50,61 @@ class OllamaHealthCheck:
         self,
         base_url: str = "http://localhost:11434",
         timeout: float = 5.0,
+        cache_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize the health check client.
 
         Args:
             base_url: Ollama server URL. Defaults to localhost.
             timeout: Request timeout in seconds. Defaults to 5.0.
+            cache_ttl: Seconds to cache check results. Defaults to 0 (off).
+            clock: Monotonic time source used for cache expiry.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-
-    async def is_available(self) -> bool:
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        # Check name -> (time checked, result)
+        self._cache: dict[str, tuple[float, bool]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached health and model check results."""
+        self._cache.clear()
+
+    def _cached(self, key: str) -> bool | None:
+        """Get a cached check result that has not expired."""
+        entry = self._cache.get(key)
+        if entry is None or self._clock() - entry[0] >= self.cache_ttl:
+            return None
+        return entry[1]
+
+    def _store(self, key: str, result: bool) -> bool:
+        """Cache a check result if caching is enabled."""
+        if self.cache_ttl > 0:
+            self._cache[key] = (self._clock(), result)
+        return result
+
+    @asynccontextmanager
+    async def _session(
+        self, client: httpx.AsyncClient | None
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the shared client, or a short-lived one if none is given."""
+        if client is not None:
+            yield client
+        else:
+            async with httpx.AsyncClient() as own_client:
+                yield own_client
+
+    async def is_available(self, client: httpx.AsyncClient | None = None) -> bool:
         """Check if Ollama server is responding.
 
         Makes a lightweight request to the /api/tags endpoint
         to verify the server is running and accepting connections.
 
+        Args:
+            client: Optional shared HTTP client.
+
         Returns:
             True if server is available, False otherwise.
 
@@ -63,9 +112,16 @@ class OllamaHealthCheck:
             This method catches all exceptions and returns False
             rather than raising, making it safe for conditional checks.
         """
+        cached = self._cached("available")
+        if cached is not None:
+            return cached
+        return self._store("available", await self._check_available(client))
+
+    async def _check_available(self, client: httpx.AsyncClient | None) -> bool:
+        """Probe the server without consulting the cache."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
+            async with self._session(client) as session:
+                response = await session.get(
                     f"{self.base_url}/api/tags",
                     timeout=self.timeout,
                 )
@@ -90,7 +146,9 @@ class OllamaHealthCheck:
             logger.warning(f"Unexpected error checking Ollama availability: {e}")
             return False
 
-    async def has_model(self, model_name: str) -> bool:
+    async def has_model(
+        self, model_name: str, client: httpx.AsyncClient | None = None
+    ) -> bool:
         """Check if a specific model is available on the server.
 
         Queries the /api/tags endpoint and checks if the specified
@@ -100,6 +158,7 @@ class OllamaHealthCheck:
             model_name: Name of the model to check (e.g., "llama3.2").
                        Partial matches are supported (e.g., "llama3.2" matches
                        "llama3.2:latest").
+            client: Optional shared HTTP client.
 
         Returns:
             True if model is available, False otherwise.
@@ -107,9 +166,19 @@ class OllamaHealthCheck:
         Note:
             Returns False if the server is unavailable or any error occurs.
         """
+        key = f"model:{model_name}"
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        return self._store(key, await self._check_model(model_name, client))
+
+    async def _check_model(
+        self, model_name: str, client: httpx.AsyncClient | None
+    ) -> bool:
+        """Look up a model without consulting the cache."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
+            async with self._session(client) as session:
+                response = await session.get(
                     f"{self.base_url}/api/tags",
                     timeout=self.timeout,
                 )
@@ -142,12 +211,17 @@ class OllamaHealthCheck:
             logger.warning(f"Unexpected error checking model availability: {e}")
             return False
 
-    async def get_available_models(self) -> list[str]:
+    async def get_available_models(
+        self, client: httpx.AsyncClient | None = None
+    ) -> list[str]:
         """Get list of all available models on the server.
 
         Queries the /api/tags endpoint and returns the names of
         all installed models.
 
+        Args:
+            client: Optional shared HTTP client.
+
         Returns:
             List of model names. Empty list if server unavailable or error.
 
@@ -158,8 +232,8 @@ class OllamaHealthCheck:
             ['llama3.2:latest', 'mistral:7b', 'codellama:13b']
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
+            async with self._session(client) as session:
+                response = await session.get(
                     f"{self.base_url}/api/tags",
                     timeout=self.timeout,
                 )
@@ -174,13 +248,16 @@ class OllamaHealthCheck:
             logger.debug(f"Error getting model list: {e}")
             return []
 
-    async def get_model_info(self, model_name: str) -> dict[str, Any] | None:
+    async def get_model_info(
+        self, model_name: str, client: httpx.AsyncClient | None = None
+    ) -> dict[str, Any] | None:
         """Get detailed information about a specific model.
 
         Queries the /api/show endpoint for model details.
 
         Args:
             model_name: Name of the model to query.
+            client: Optional shared HTTP client.
 
         Returns:
             Dictionary with model information, or None if not found/error.
@@ -190,8 +267,8 @@ class OllamaHealthCheck:
             only be used when detailed model info is needed.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with self._session(client) as session:
+                response = await session.post(
                     f"{self.base_url}/api/show",
                     json={"name": model_name},
                     timeout=self.timeout,
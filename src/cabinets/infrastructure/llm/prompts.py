@@ -10,6 +10,7 @@ The prompt strategy uses a layered approach:
 4. Output schema - JSON schema derived from Pydantic models (handled by pydantic-ai)
 
 Constants:
+    PROMPT_VERSION: Version of the prompts, part of the LLM cache key
     ASSEMBLY_SYSTEM_PROMPT: Base system prompt for cabinet assembly
     BEGINNER_PROMPT_ADDITIONS: Additions for beginner skill level
     INTERMEDIATE_PROMPT_ADDITIONS: Additions for intermediate skill level
@@ -26,6 +27,11 @@ if TYPE_CHECKING:
     from cabinets.domain.value_objects import CutPiece
 
 
+# Bump when the prompts or the output schema change, so instructions cached
+# for the old prompts are no longer used
+PROMPT_VERSION = "1"
+
+
 # =============================================================================
 # Base System Prompt
 # =============================================================================
@@ -389,6 +395,7 @@ Make all instructions specific to this cabinet's dimensions and specifications."
 # =============================================================================
 
 __all__ = [
+    "PROMPT_VERSION",
     "ASSEMBLY_SYSTEM_PROMPT",
     "BEGINNER_PROMPT_ADDITIONS",
     "INTERMEDIATE_PROMPT_ADDITIONS",
@@ -0,0 +1,268 @@
+"""Persistent inventory of reusable offcuts shared across jobs.
+
+GuillotineBinPacker reports the offcuts each packing leaves behind. An
+OffcutInventory keeps them in a SQLite database so later jobs can cut
+pieces from stored offcuts before opening new sheets. The packer takes the
+offcuts it fills out of the inventory and records the offcuts that job
+leaves behind, in a single transaction.
+
+Offcuts are indexed by material type, thickness and their short and long
+sides, so finding the offcuts a piece fits in stays a range scan with
+thousands of stored scraps. Offcut width and height keep the sheet's
+orientation (height runs along the sheet grain), so grain constraints
+still apply when pieces are placed on them. Identifiers are never reused,
+so a job that planned around an offcut cannot claim a newer one by mistake.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from cabinets.domain.value_objects import MaterialSpec, MaterialType
+from cabinets.infrastructure.bin_packing import Offcut
+
+logger = logging.getLogger(__name__)
+
+# Dimension tolerance when comparing offcuts with pieces, in inches
+_TOLERANCE = 1e-6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS offcuts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    material_type TEXT NOT NULL,
+    thickness REAL NOT NULL,
+    short_side REAL NOT NULL,
+    long_side REAL NOT NULL,
+    width REAL NOT NULL,
+    height REAL NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS offcuts_by_size
+    ON offcuts (material_type, thickness, short_side, long_side);
+"""
+
+
+class OffcutConflictError(RuntimeError):
+    """Offcuts planned for a job were taken by another job first."""
+
+
+@dataclass(frozen=True)
+class StoredOffcut:
+    """An offcut held in the inventory.
+
+    Attributes:
+        id: Inventory identifier of the offcut.
+        width: Offcut width in inches (across the sheet grain).
+        height: Offcut height in inches (along the sheet grain).
+        material: Material specification of the offcut.
+        source: Label of the job that produced the offcut.
+    """
+
+    id: int
+    width: float
+    height: float
+    material: MaterialSpec
+    source: str = ""
+
+    @property
+    def area(self) -> float:
+        """Area of the offcut in square inches."""
+        return self.width * self.height
+
+
+class OffcutInventory:
+    """SQLite-backed store of reusable offcuts.
+
+    Safe to share between threads and processes: every operation runs in
+    its own transaction, and consume() fails with OffcutConflictError
+    rather than hand the same offcut to two jobs.
+
+    Example:
+        inventory = OffcutInventory(Path("~/.cabinets/offcuts.db").expanduser())
+        service = BinPackingService(BinPackingConfig(), inventory=inventory)
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open the inventory, creating the database if needed.
+
+        Args:
+            path: SQLite database file.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Database file."""
+        return self._path
+
+    def find(
+        self,
+        material: MaterialSpec,
+        min_short_side: float = 0.0,
+        min_long_side: float = 0.0,
+    ) -> list[StoredOffcut]:
+        """Find offcuts of a material at least as large as given sides.
+
+        Args:
+            material: Material of the offcuts.
+            min_short_side: Minimum length of the offcut's shorter side.
+            min_long_side: Minimum length of the offcut's longer side.
+
+        Returns:
+            Matching offcuts ordered by area, smallest first.
+        """
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT id, width, height, source FROM offcuts"
+                " WHERE material_type = ? AND thickness = ?"
+                " AND short_side >= ? AND long_side >= ?"
+                " ORDER BY width * height, id",
+                (
+                    material.material_type.value,
+                    material.thickness,
+                    min_short_side - _TOLERANCE,
+                    min_long_side - _TOLERANCE,
+                ),
+            ).fetchall()
+        return [
+            StoredOffcut(
+                id=row[0], width=row[1], height=row[2], material=material, source=row[3]
+            )
+            for row in rows
+        ]
+
+    def add(self, offcuts: Iterable[Offcut], source: str = "") -> list[int]:
+        """Record offcuts left over by a job.
+
+        Args:
+            offcuts: Offcuts to store.
+            source: Label of the job that produced them.
+
+        Returns:
+            Inventory identifiers of the stored offcuts.
+        """
+        with self._transaction() as db:
+            return self._insert(db, offcuts, source)
+
+    def consume(
+        self,
+        used_ids: Iterable[int],
+        new_offcuts: Iterable[Offcut] = (),
+        source: str = "",
+    ) -> list[int]:
+        """Remove offcuts a job used and record the ones it left, atomically.
+
+        Args:
+            used_ids: Identifiers of the offcuts the job cut pieces from.
+            new_offcuts: Offcuts the job left behind.
+            source: Label of the job.
+
+        Returns:
+            Inventory identifiers of the newly stored offcuts.
+
+        Raises:
+            OffcutConflictError: If any used offcut is no longer in the
+                inventory; nothing is changed in that case.
+        """
+        used = sorted(set(used_ids))
+        with self._transaction() as db:
+            deleted = sum(
+                db.execute("DELETE FROM offcuts WHERE id = ?", (offcut_id,)).rowcount
+                for offcut_id in used
+            )
+            if deleted != len(used):
+                raise OffcutConflictError(
+                    f"{len(used) - deleted} of {len(used)} offcuts were already used"
+                )
+            return self._insert(db, new_offcuts, source)
+
+    def all(self) -> list[StoredOffcut]:
+        """Get every stored offcut, ordered by identifier."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT id, width, height, material_type, thickness, source"
+                " FROM offcuts ORDER BY id"
+            ).fetchall()
+        return [
+            StoredOffcut(
+                id=row[0],
+                width=row[1],
+                height=row[2],
+                material=MaterialSpec(
+                    thickness=row[4], material_type=MaterialType(row[3])
+                ),
+                source=row[5],
+            )
+            for row in rows
+        ]
+
+    def __len__(self) -> int:
+        """Number of stored offcuts."""
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM offcuts").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every stored offcut."""
+        with self._connect() as db:
+            db.execute("DELETE FROM offcuts")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open an autocommit connection for one operation."""
+        with self._lock:
+            db = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+            try:
+                yield db
+            finally:
+                db.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection holding the database write lock until commit."""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.rollback()
+                raise
+            db.commit()
+
+    @staticmethod
+    def _insert(
+        db: sqlite3.Connection, offcuts: Iterable[Offcut], source: str
+    ) -> list[int]:
+        now = time.time()
+        ids: list[int] = []
+        for offcut in offcuts:
+            cursor = db.execute(
+                "INSERT INTO offcuts (material_type, thickness, short_side,"
+                " long_side, width, height, source, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    offcut.material.material_type.value,
+                    offcut.material.thickness,
+                    min(offcut.width, offcut.height),
+                    max(offcut.width, offcut.height),
+                    offcut.width,
+                    offcut.height,
+                    source,
+                    now,
+                ),
+            )
+            ids.append(cursor.lastrowid or 0)
+        if ids:
+            logger.debug("Stored %d offcuts from '%s'", len(ids), source)
+        return ids
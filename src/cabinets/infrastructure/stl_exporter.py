@@ -1,12 +1,14 @@
 """STL export functionality using numpy-stl."""
 
 import hashlib
+import heapq
+import io
 import math
-import random
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
-from stl import mesh
+from stl import Mode, mesh
 
 from cabinets.contracts.dtos import RoomLayoutOutput
 from cabinets.domain import BoundingBox3D, Cabinet, Panel, Panel3DMapper, PanelType
@@ -14,27 +16,276 @@ from cabinets.domain.services import RoomPanel3DMapper, ZoneStackLayoutResult
 from cabinets.domain.value_objects import Position3D
 
 
-def _random_ajar_angle(
-    box: BoundingBox3D, min_angle: float = 30.0, max_angle: float = 60.0
+# Fixed binary STL header (80 bytes once padded)
+STL_HEADER = b"cabinets binary STL"
+
+
+def _save_binary_stl(stl_mesh: mesh.Mesh, filepath: Path | str) -> None:
+    """Save a mesh as binary STL with a deterministic header.
+
+    numpy-stl stamps the current time and file name into the 80-byte header,
+    so identical meshes would otherwise produce different files. The header
+    is replaced with a fixed one so output bytes depend only on the geometry.
+
+    Args:
+        stl_mesh: Mesh to save.
+        filepath: Destination path.
+    """
+    filepath = Path(filepath)
+    buffer = io.BytesIO()
+    stl_mesh.save(filepath.name, fh=buffer, mode=Mode.BINARY)
+    data = bytearray(buffer.getvalue())
+    data[:80] = STL_HEADER.ljust(80)
+    filepath.write_bytes(bytes(data))
+
+
+@dataclass(frozen=True)
+class CurveLOD:
+    """Level-of-detail settings for curved decorative geometry.
+
+    Arch and scallop profiles arrive from the decorative components as dense
+    polylines sized for templates and CNC cutting. A CurveLOD resamples those
+    polylines before meshing, keeping only the points needed to stay within
+    ``max_chord_error`` of the original curve and never using more than
+    ``max_segments`` segments per arc (each scallop of a valance is its own
+    arc). Both limits default to None (no limit), which keeps every input
+    point.
+
+    Attributes:
+        max_chord_error: Maximum allowed distance in inches between the
+            resampled polyline and the original points, or None.
+        max_segments: Maximum number of segments per arc, or None.
+    """
+
+    max_chord_error: float | None = None
+    max_segments: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_chord_error is not None and self.max_chord_error < 0:
+            raise ValueError("max_chord_error must be non-negative")
+        if self.max_segments is not None and self.max_segments < 1:
+            raise ValueError("max_segments must be at least 1")
+
+    @property
+    def is_full_detail(self) -> bool:
+        """True if no resampling limits are set."""
+        return self.max_chord_error is None and self.max_segments is None
+
+    @classmethod
+    def from_name(cls, name: str) -> "CurveLOD":
+        """Look up a named LOD preset ("full" or "preview").
+
+        Raises:
+            ValueError: If the preset name is unknown.
+        """
+        try:
+            return CURVE_LOD_PRESETS[name]
+        except KeyError:
+            available = ", ".join(sorted(CURVE_LOD_PRESETS))
+            raise ValueError(
+                f"Unknown curve LOD '{name}'. Available: {available}"
+            ) from None
+
+
+# Named presets: full detail for print/fabrication, coarse for the web viewer.
+# Preview is bounded by chord error only, so wide or many-scalloped curves
+# keep the segments they need to hold their shape.
+CURVE_LOD_PRESETS: dict[str, CurveLOD] = {
+    "full": CurveLOD(),
+    "preview": CurveLOD(max_chord_error=1 / 16),
+}
+
+
+@dataclass(frozen=True)
+class RenderSettings:
+    """Presentation settings for STL meshes, seeded for reproducible output.
+
+    Doors are rendered ajar and drawers pulled out so they stand apart from
+    solid panels. Each door's angle and each drawer's pull-out jitter are
+    drawn from a hash of the seed and the panel's identity (type, position,
+    size and hinge side for doors; stack index for drawers), never from
+    process state, so identical layouts always produce byte-identical
+    meshes. Change the seed for a different, equally reproducible look.
+
+    Attributes:
+        seed: Seed mixed into every per-panel variation.
+        door_ajar_range: (min, max) door opening angle in degrees.
+        drawer_pull_out_range: (min, max) drawer pull-out in inches; the
+            bottom drawer of a stack is pulled out the most.
+        drawer_jitter: Maximum per-drawer deviation from the stacked
+            pull-out, in inches.
+        curve_lod: Level of detail for arches and scallops, or None to use
+            the mesh builder's own setting.
+    """
+
+    seed: int = 0
+    door_ajar_range: tuple[float, float] = (30.0, 60.0)
+    drawer_pull_out_range: tuple[float, float] = (2.0, 8.0)
+    drawer_jitter: float = 0.5
+    curve_lod: CurveLOD | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("door_ajar_range", "drawer_pull_out_range"):
+            low, high = getattr(self, name)
+            if low > high:
+                raise ValueError(f"{name} minimum must not exceed its maximum")
+        if self.drawer_jitter < 0:
+            raise ValueError("drawer_jitter must be non-negative")
+
+    def door_ajar_angle(self, box: BoundingBox3D, hinge_side: str = "left") -> float:
+        """Get the opening angle of a door.
+
+        Args:
+            box: The closed door's bounding box.
+            hinge_side: Hinge edge of the door.
+
+        Returns:
+            Angle in degrees within door_ajar_range.
+        """
+        low, high = self.door_ajar_range
+        return low + (high - low) * self._variation(
+            PanelType.DOOR.value, *_box_identity(box), hinge_side
+        )
+
+    def drawer_pull_out(self, drawer_index: int, drawer_count: int) -> float:
+        """Get how far a drawer is pulled out.
+
+        All panels of one drawer share the same amount so the drawer box
+        stays together.
+
+        Args:
+            drawer_index: Index of the drawer in its stack (0 = bottom).
+            drawer_count: Number of drawers in the stack.
+
+        Returns:
+            Pull-out distance in inches.
+        """
+        low, high = self.drawer_pull_out_range
+        position_factor = (
+            (drawer_count - 1 - drawer_index) / (drawer_count - 1)
+            if drawer_count > 1
+            else 0.5
+        )
+        jitter = (self._variation("drawer", drawer_index) * 2 - 1) * self.drawer_jitter
+        return low + position_factor * (high - low) + jitter
+
+    def _variation(self, *identity: object) -> float:
+        """Map the seed and a panel identity to a number in [0, 1)."""
+        key = repr((self.seed, *identity)).encode()
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, "little") / 2**64
+
+
+def _box_identity(box: BoundingBox3D) -> tuple[str, ...]:
+    """Position and size of a box, rounded so float noise keeps its identity."""
+    return tuple(
+        f"{value:.3f}"
+        for value in (
+            box.origin.x,
+            box.origin.y,
+            box.origin.z,
+            box.size_x,
+            box.size_y,
+            box.size_z,
+        )
+    )
+
+
+def _point_segment_distance(
+    p: tuple[float, float], a: tuple[float, float], b: tuple[float, float]
 ) -> float:
-    """Generate a deterministic 'random' ajar angle based on door position.
+    """Distance from point p to the line segment a-b."""
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(p[0] - a[0], p[1] - a[1])
+    t = ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq
+    t = max(0.0, min(1.0, t))
+    return math.hypot(p[0] - (a[0] + t * dx), p[1] - (a[1] + t * dy))
+
+
+def resample_curve(
+    points: list[tuple[float, float]], lod: CurveLOD
+) -> list[tuple[float, float]]:
+    """Reduce a polyline to the subset of points required by an LOD.
+
+    Uses greedy top-down refinement: starting from the end points, the input
+    point farthest from the current approximation is inserted until every
+    point is within ``lod.max_chord_error`` or ``lod.max_segments`` is
+    reached. End points are always kept and output points are a subset of
+    the input, in the original order.
 
-    Uses the door's position as a seed so the same door always gets the same
-    angle, making output reproducible while varying angles between doors.
+    Args:
+        points: Polyline as (x, y) tuples.
+        lod: Level-of-detail limits.
+
+    Returns:
+        The resampled polyline.
+    """
+    if lod.is_full_detail or len(points) <= 2:
+        return list(points)
+
+    tolerance = lod.max_chord_error if lod.max_chord_error is not None else 0.0
+    max_segments = lod.max_segments or len(points) - 1
+
+    def farthest(start: int, end: int) -> tuple[float, int]:
+        worst, index = -1.0, start
+        for k in range(start + 1, end):
+            d = _point_segment_distance(points[k], points[start], points[end])
+            if d > worst:
+                worst, index = d, k
+        return worst, index
+
+    last = len(points) - 1
+    kept = {0, last}
+    error, index = farthest(0, last)
+    heap: list[tuple[float, int, int, int]] = [(-error, 0, last, index)]
+    segments = 1
+
+    while heap and segments < max_segments:
+        neg_error, start, end, index = heapq.heappop(heap)
+        if -neg_error <= tolerance:
+            break
+        kept.add(index)
+        segments += 1
+        for a, b in ((start, index), (index, end)):
+            if b - a > 1:
+                error, k = farthest(a, b)
+                heapq.heappush(heap, (-error, a, b, k))
+
+    return [points[i] for i in sorted(kept)]
+
+
+def resample_scallops(
+    points: list[tuple[float, float]], lod: CurveLOD
+) -> list[tuple[float, float]]:
+    """Resample a scallop profile one scallop at a time.
+
+    The profile is split at the cusps between scallops (interior points
+    shallower than both neighbours), so ``lod.max_segments`` limits each
+    scallop rather than the whole valance.
 
     Args:
-        box: The door's bounding box (position used as seed).
-        min_angle: Minimum angle in degrees.
-        max_angle: Maximum angle in degrees.
+        points: Scallop profile as (x, depth) tuples.
+        lod: Level-of-detail limits.
 
     Returns:
-        A 'random' angle between min_angle and max_angle.
+        The resampled profile; cusps are always kept.
     """
-    # Create a seed from the door's position
-    seed_str = f"{box.origin.x:.2f},{box.origin.y:.2f},{box.origin.z:.2f}"
-    seed = int(hashlib.md5(seed_str.encode()).hexdigest()[:8], 16)
-    rng = random.Random(seed)
-    return rng.uniform(min_angle, max_angle)
+    if lod.is_full_detail or len(points) <= 2:
+        return list(points)
+
+    resampled = [points[0]]
+    start = 0
+    for i in range(1, len(points)):
+        is_cusp = i == len(points) - 1 or (
+            points[i][1] < points[i - 1][1] and points[i][1] <= points[i + 1][1]
+        )
+        if is_cusp:
+            resampled.extend(resample_curve(points[start : i + 1], lod)[1:])
+            start = i
+    return resampled
 
 
 class StlMeshBuilder:
@@ -49,8 +300,20 @@ class StlMeshBuilder:
     - x' = x (width unchanged)
     - y' = z (domain height becomes viewer vertical)
     - z' = y (domain depth becomes viewer depth)
+
+    Curved decorative profiles (arch headers, scalloped valances) are
+    resampled according to ``curve_lod`` before triangulation.
     """
 
+    def __init__(self, curve_lod: CurveLOD | None = None) -> None:
+        """Initialize the mesh builder.
+
+        Args:
+            curve_lod: Level of detail for curved decorative geometry.
+                Defaults to full detail.
+        """
+        self.curve_lod = curve_lod or CurveLOD()
+
     def build_box_mesh(self, box: BoundingBox3D) -> mesh.Mesh:
         """Create an STL mesh for a single bounding box.
 
@@ -131,6 +394,26 @@ class StlMeshBuilder:
 
         return box_mesh
 
+    def build_box_mesh_from_corners(
+        self, box: BoundingBox3D, corners: np.ndarray
+    ) -> mesh.Mesh:
+        """Create an STL mesh for a box from its transformed corners.
+
+        Args:
+            box: The 3D bounding box, used for its triangle layout.
+            corners: Array of shape (8, 3) with the box's corners in room
+                coordinates, in BoundingBox3D.get_vertices() order.
+
+        Returns:
+            A numpy-stl Mesh object representing the transformed box.
+        """
+        # Transform to Y-up: (x, y, z) -> (x, z, y)
+        vertices = corners[:, [0, 2, 1]]
+
+        box_mesh = mesh.Mesh(np.zeros(12, dtype=mesh.Mesh.dtype))
+        box_mesh.vectors[:] = vertices[np.array(box.get_triangles())]
+        return box_mesh
+
     def build_ajar_door_mesh(
         self,
         box: BoundingBox3D,
@@ -278,6 +561,7 @@ class StlMeshBuilder:
         max_pull_out: float = 8.0,
         wall_rotation: float = 0.0,
         wall_position: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        pull_out_amount: float | None = None,
     ) -> mesh.Mesh:
         """Create an STL mesh for a drawer panel pulled out from the cabinet.
 
@@ -292,33 +576,39 @@ class StlMeshBuilder:
             drawer_count: Total number of drawers in the stack.
             base_pull_out: Minimum pull-out distance in inches (default 2").
             max_pull_out: Maximum pull-out distance in inches (default 8").
+            wall_rotation: Rotation around Z axis in degrees.
+            wall_position: Translation (x, y, z) after rotation.
+            pull_out_amount: Pull-out distance in inches, e.g. from
+                RenderSettings.drawer_pull_out(); overrides the stacked
+                amount computed from base_pull_out and max_pull_out.
 
         Returns:
             A numpy-stl Mesh object representing the pulled-out drawer.
         """
-        # Calculate the base pull-out for this drawer based on position in stack
-        # drawer_index 0 = bottom (most pulled out), drawer_count-1 = top (least)
-        # Invert the index so bottom drawer has highest value
-        inverted_index = drawer_count - 1 - drawer_index
-
-        # Scale between base_pull_out and max_pull_out based on position
-        if drawer_count > 1:
-            position_factor = inverted_index / (drawer_count - 1)
-        else:
-            position_factor = 0.5  # Single drawer gets middle pull-out
+        if pull_out_amount is None:
+            # Calculate the base pull-out for this drawer based on position in stack
+            # drawer_index 0 = bottom (most pulled out), drawer_count-1 = top (least)
+            # Invert the index so bottom drawer has highest value
+            inverted_index = drawer_count - 1 - drawer_index
+
+            # Scale between base_pull_out and max_pull_out based on position
+            if drawer_count > 1:
+                position_factor = inverted_index / (drawer_count - 1)
+            else:
+                position_factor = 0.5  # Single drawer gets middle pull-out
 
-        pull_out_range = max_pull_out - base_pull_out
-        base_amount = base_pull_out + (position_factor * pull_out_range)
+            pull_out_range = max_pull_out - base_pull_out
+            base_amount = base_pull_out + (position_factor * pull_out_range)
 
-        # Add small pseudo-random variation based on drawer_index
-        # This creates slight variation between drawers without affecting
-        # the cohesion of parts within the same drawer
-        hash_bytes = hashlib.md5(str(drawer_index).encode()).digest()
-        random_factor = int.from_bytes(hash_bytes[:4], "little") / (2**32)
-        # Random variation of +/- 0.5 inch (smaller to keep drawers cohesive)
-        random_offset = (random_factor - 0.5) * 1.0
+            # Add small pseudo-random variation based on drawer_index
+            # This creates slight variation between drawers without affecting
+            # the cohesion of parts within the same drawer
+            hash_bytes = hashlib.md5(str(drawer_index).encode()).digest()
+            random_factor = int.from_bytes(hash_bytes[:4], "little") / (2**32)
+            # Random variation of +/- 0.5 inch (smaller to keep drawers cohesive)
+            random_offset = (random_factor - 0.5) * 1.0
 
-        pull_out_amount = base_amount + random_offset
+            pull_out_amount = base_amount + random_offset
 
         # Get base vertices in domain coordinates (Z-up)
         # Apply pull-out by translating in the +Y direction (forward/out from cabinet)
@@ -379,6 +669,7 @@ class StlMeshBuilder:
         curve_points: list[tuple[float, float]],
         wall_rotation: float = 0.0,
         wall_position: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        curve_lod: CurveLOD | None = None,
     ) -> mesh.Mesh:
         """Create an STL mesh for an arch header panel with curved bottom edge.
 
@@ -392,6 +683,7 @@ class StlMeshBuilder:
                          y is the height at that point (0 = spring line).
             wall_rotation: Rotation around Z axis in degrees.
             wall_position: Translation (x, y, z) after rotation.
+            curve_lod: Level of detail overriding the builder's curve_lod.
 
         Returns:
             A numpy-stl Mesh object representing the arch header with curve.
@@ -400,6 +692,8 @@ class StlMeshBuilder:
             # Fall back to box mesh if no curve data
             return self.build_box_mesh_with_transform(box, wall_rotation, wall_position)
 
+        curve_points = resample_curve(curve_points, curve_lod or self.curve_lod)
+
         # Box dimensions in domain coordinates (Z-up)
         x0 = box.origin.x
         y0 = box.origin.y  # Front face Y position
@@ -507,6 +801,7 @@ class StlMeshBuilder:
         scallop_points: list[tuple[float, float]],
         wall_rotation: float = 0.0,
         wall_position: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        curve_lod: CurveLOD | None = None,
     ) -> mesh.Mesh:
         """Create an STL mesh for a panel with scalloped bottom edge.
 
@@ -520,6 +815,7 @@ class StlMeshBuilder:
                            y is the depth of cut (0 = top edge, positive = down).
             wall_rotation: Rotation around Z axis in degrees.
             wall_position: Translation (x, y, z) after rotation.
+            curve_lod: Level of detail overriding the builder's curve_lod.
 
         Returns:
             A numpy-stl Mesh object representing the scalloped panel.
@@ -528,6 +824,8 @@ class StlMeshBuilder:
             # Fall back to box mesh if no scallop data
             return self.build_box_mesh_with_transform(box, wall_rotation, wall_position)
 
+        scallop_points = resample_scallops(scallop_points, curve_lod or self.curve_lod)
+
         # Box dimensions in domain coordinates (Z-up)
         x0 = box.origin.x
         y0 = box.origin.y  # Front face Y position
@@ -751,17 +1049,32 @@ class StlExporter:
 
     Dependency Inversion: Depends on domain abstractions (Cabinet, BoundingBox3D),
     not on numpy-stl implementation details exposed to the domain.
+
+    Door angles, drawer pull-outs and curve detail come from RenderSettings,
+    so exporting the same layout with the same settings always produces the
+    same bytes.
     """
 
-    def __init__(self, mesh_builder: StlMeshBuilder | None = None) -> None:
+    def __init__(
+        self,
+        mesh_builder: StlMeshBuilder | None = None,
+        settings: RenderSettings | None = None,
+    ) -> None:
         """Initialize the exporter.
 
         Args:
             mesh_builder: Optional mesh builder instance for dependency injection.
+            settings: Default render settings. Defaults to RenderSettings().
         """
         self.mesh_builder = mesh_builder or StlMeshBuilder()
+        self.settings = settings or RenderSettings()
 
-    def export(self, cabinet: Cabinet, door_ajar_angle: float = 45.0) -> mesh.Mesh:
+    def export(
+        self,
+        cabinet: Cabinet,
+        door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
+    ) -> mesh.Mesh:
         """Export a cabinet to an STL mesh object.
 
         Doors are rendered slightly ajar (open) to make them visually
@@ -770,12 +1083,15 @@ class StlExporter:
 
         Args:
             cabinet: The cabinet to export.
-            door_ajar_angle: Angle in degrees to open doors (default 15°).
+            door_ajar_angle: Unused; kept for protocol compatibility. Door
+                angles come from settings.door_ajar_range.
+            settings: Render settings overriding the exporter's default.
 
         Returns:
             A numpy-stl Mesh object representing the entire cabinet.
         """
-        mapper = Panel3DMapper(cabinet)
+        settings = settings or self.settings
+        mapper = Panel3DMapper.for_cabinet(cabinet)
         panels_with_boxes = mapper.map_all_panels_with_types()
 
         # Define drawer panel types that should be rendered pulled out
@@ -790,9 +1106,9 @@ class StlExporter:
         for box, panel in panels_with_boxes:
             if panel.panel_type == PanelType.DOOR:
                 # Render doors ajar so they're visually distinguishable
-                # Use random angle (30-60°) so stacked doors don't align perfectly
+                # Angles vary per door so stacked doors don't align perfectly
                 hinge_side = panel.metadata.get("hinge_side", "left")
-                ajar_angle = _random_ajar_angle(box)
+                ajar_angle = settings.door_ajar_angle(box, hinge_side)
                 meshes.append(
                     self.mesh_builder.build_ajar_door_mesh(
                         box, ajar_angle=ajar_angle, hinge_side=hinge_side
@@ -808,6 +1124,9 @@ class StlExporter:
                         box,
                         drawer_index=drawer_index,
                         drawer_count=drawer_count,
+                        pull_out_amount=settings.drawer_pull_out(
+                            drawer_index, drawer_count
+                        ),
                     )
                 )
             elif panel.panel_type == PanelType.ARCH_HEADER:
@@ -815,7 +1134,9 @@ class StlExporter:
                 curve_points = panel.metadata.get("curve_points")
                 if curve_points:
                     meshes.append(
-                        self.mesh_builder.build_arch_header_mesh(box, curve_points)
+                        self.mesh_builder.build_arch_header_mesh(
+                            box, curve_points, curve_lod=settings.curve_lod
+                        )
                     )
                 else:
                     meshes.append(self.mesh_builder.build_box_mesh(box))
@@ -825,7 +1146,7 @@ class StlExporter:
                 if scallop_points:
                     meshes.append(
                         self.mesh_builder.build_scalloped_panel_mesh(
-                            box, scallop_points
+                            box, scallop_points, curve_lod=settings.curve_lod
                         )
                     )
                 else:
@@ -855,22 +1176,27 @@ class StlExporter:
         cabinet: Cabinet,
         filepath: Path | str,
         door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
     ) -> None:
         """Export a cabinet to an STL file.
 
         Args:
             cabinet: The cabinet to export.
             filepath: Path where the STL file will be saved.
-            door_ajar_angle: Angle in degrees to open doors (default 15°).
+            door_ajar_angle: Unused; kept for protocol compatibility.
+            settings: Render settings overriding the exporter's default.
         """
-        combined_mesh = self.export(cabinet, door_ajar_angle=door_ajar_angle)
-        combined_mesh.save(str(filepath))
+        combined_mesh = self.export(
+            cabinet, door_ajar_angle=door_ajar_angle, settings=settings
+        )
+        _save_binary_stl(combined_mesh, filepath)
 
     def export_room_layout(
         self,
         room_output: RoomLayoutOutput,
         filepath: Path | str,
         door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
     ) -> None:
         """Export a room layout with multiple cabinets to an STL file.
 
@@ -880,15 +1206,19 @@ class StlExporter:
         Args:
             room_output: The room layout output containing cabinets and transforms.
             filepath: Path where the STL file will be saved.
-            door_ajar_angle: Angle in degrees to open doors (default 45).
+            door_ajar_angle: Unused; kept for protocol compatibility.
+            settings: Render settings overriding the exporter's default.
         """
-        room_mesh = self.export_room(room_output, door_ajar_angle=door_ajar_angle)
-        room_mesh.save(str(filepath))
+        room_mesh = self.export_room(
+            room_output, door_ajar_angle=door_ajar_angle, settings=settings
+        )
+        _save_binary_stl(room_mesh, filepath)
 
     def export_room(
         self,
         room_output: RoomLayoutOutput,
         door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
     ) -> mesh.Mesh:
         """Export a room layout to an STL mesh object.
 
@@ -899,11 +1229,13 @@ class StlExporter:
 
         Args:
             room_output: The room layout output containing cabinets and transforms.
-            door_ajar_angle: Angle in degrees to open doors (default 45).
+            door_ajar_angle: Unused; kept for protocol compatibility.
+            settings: Render settings overriding the exporter's default.
 
         Returns:
             A numpy-stl Mesh object representing the entire room layout.
         """
+        settings = settings or self.settings
         if not room_output.cabinets:
             return mesh.Mesh(np.zeros(0, dtype=mesh.Mesh.dtype))
 
@@ -921,9 +1253,15 @@ class StlExporter:
             PanelType.DRAWER_BOTTOM,
         }
 
+        # Room-space corners of every panel, transformed in one batch
+        room_corners = RoomPanel3DMapper.room_corners(
+            [box for box, _, _ in panels_with_boxes],
+            [transform for _, _, transform in panels_with_boxes],
+        )
+
         # Build meshes for each panel, applying transforms after ajar/pull-out effects
         meshes = []
-        for box, panel, transform in panels_with_boxes:
+        for i, (box, panel, transform) in enumerate(panels_with_boxes):
             # Extract transform info for mesh builders
             wall_rotation = transform.rotation_z
             wall_position = (
@@ -934,9 +1272,9 @@ class StlExporter:
 
             if panel.panel_type == PanelType.DOOR:
                 # Render doors ajar, then transform to room coordinates
-                # Use random angle (30-60°) so stacked doors don't align perfectly
+                # Angles vary per door so stacked doors don't align perfectly
                 hinge_side = panel.metadata.get("hinge_side", "left")
-                ajar_angle = _random_ajar_angle(box)
+                ajar_angle = settings.door_ajar_angle(box, hinge_side)
                 meshes.append(
                     self.mesh_builder.build_ajar_door_mesh(
                         box,
@@ -957,6 +1295,9 @@ class StlExporter:
                         drawer_count=drawer_count,
                         wall_rotation=wall_rotation,
                         wall_position=wall_position,
+                        pull_out_amount=settings.drawer_pull_out(
+                            drawer_index, drawer_count
+                        ),
                     )
                 )
             elif panel.panel_type == PanelType.ARCH_HEADER:
@@ -969,6 +1310,7 @@ class StlExporter:
                             curve_points,
                             wall_rotation=wall_rotation,
                             wall_position=wall_position,
+                            curve_lod=settings.curve_lod,
                         )
                     )
                 else:
@@ -989,6 +1331,7 @@ class StlExporter:
                             scallop_points,
                             wall_rotation=wall_rotation,
                             wall_position=wall_position,
+                            curve_lod=settings.curve_lod,
                         )
                     )
                 else:
@@ -1023,13 +1366,9 @@ class StlExporter:
                         )
                     )
             else:
-                # Regular panel - just apply transform
+                # Regular panel - corners are already in room coordinates
                 meshes.append(
-                    self.mesh_builder.build_box_mesh_with_transform(
-                        box,
-                        wall_rotation=wall_rotation,
-                        wall_position=wall_position,
-                    )
+                    self.mesh_builder.build_box_mesh_from_corners(box, room_corners[i])
                 )
 
         return self.mesh_builder.combine_meshes(meshes)
@@ -1039,6 +1378,7 @@ class StlExporter:
         result: ZoneStackLayoutResult,
         output_path: Path | str,
         door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
     ) -> None:
         """Export a complete zone stack to an STL file.
 
@@ -1050,15 +1390,17 @@ class StlExporter:
         Args:
             result: Zone stack layout result from ZoneLayoutService.
             output_path: Path where the STL file will be saved.
-            door_ajar_angle: Angle in degrees to open doors (default 45).
+            door_ajar_angle: Unused; kept for protocol compatibility.
+            settings: Render settings overriding the exporter's default.
         """
-        zone_mesh = self.export_zone_stack_mesh(result, door_ajar_angle)
-        zone_mesh.save(str(output_path))
+        zone_mesh = self.export_zone_stack_mesh(result, door_ajar_angle, settings)
+        _save_binary_stl(zone_mesh, output_path)
 
     def export_zone_stack_mesh(
         self,
         result: ZoneStackLayoutResult,
         door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
     ) -> mesh.Mesh:
         """Export a zone stack to an STL mesh object.
 
@@ -1069,7 +1411,8 @@ class StlExporter:
 
         Args:
             result: Zone stack layout result from ZoneLayoutService.
-            door_ajar_angle: Angle in degrees to open doors (default 45).
+            door_ajar_angle: Unused; kept for protocol compatibility.
+            settings: Render settings overriding the exporter's default.
 
         Returns:
             A numpy-stl Mesh object representing the entire zone stack.
@@ -1086,7 +1429,7 @@ class StlExporter:
 
         # Export base cabinet at floor level
         if result.base_cabinet:
-            base_mesh = self.export(result.base_cabinet, door_ajar_angle)
+            base_mesh = self.export(result.base_cabinet, door_ajar_angle, settings)
             meshes.append(base_mesh)
 
         # Export countertop panels
@@ -1106,6 +1449,7 @@ class StlExporter:
                 result.upper_cabinet,
                 z_offset=mounting_height,
                 door_ajar_angle=door_ajar_angle,
+                settings=settings,
             )
             meshes.append(upper_mesh)
 
@@ -1282,19 +1626,21 @@ class StlExporter:
         cabinet: Cabinet,
         z_offset: float,
         door_ajar_angle: float = 45.0,
+        settings: RenderSettings | None = None,
     ) -> mesh.Mesh:
         """Export a cabinet with a vertical offset.
 
         Args:
             cabinet: The cabinet to export.
             z_offset: Vertical offset in inches (height from floor).
-            door_ajar_angle: Angle in degrees to open doors.
+            door_ajar_angle: Unused; kept for protocol compatibility.
+            settings: Render settings overriding the exporter's default.
 
         Returns:
             A numpy-stl Mesh object representing the offset cabinet.
         """
         # Export the cabinet normally
-        cabinet_mesh = self.export(cabinet, door_ajar_angle)
+        cabinet_mesh = self.export(cabinet, door_ajar_angle, settings)
 
         # Apply the z offset (domain height) to all vertices.
         #
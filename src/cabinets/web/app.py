@@ -1,8 +1,12 @@
 """FastAPI application factory."""
 
+from typing import Any
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from cabinets.application.config import get_config_parse_cache
+from cabinets.infrastructure.artifact_store import get_artifact_store
 from cabinets.web.exceptions import register_exception_handlers
 from cabinets.web.routers import (
     export_router,
@@ -33,6 +37,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],  # Clients echo it back in If-None-Match
     )
 
     # Register exception handlers
@@ -49,6 +54,17 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy"}
 
+    @app.get("/metrics")
+    async def metrics() -> dict[str, Any]:
+        """Runtime metrics for the API's shared caches."""
+        result: dict[str, Any] = {
+            "config_parse": get_config_parse_cache().metrics().to_dict()
+        }
+        store = get_artifact_store()
+        if store is not None:
+            result["artifact_store"] = store.metrics().to_dict()
+        return result
+
     return app
 
 
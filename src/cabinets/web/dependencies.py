@@ -1,13 +1,22 @@
 """FastAPI dependency injection for cabinet services."""
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from cabinets.application.commands import GenerateLayoutCommand
+from cabinets.application.config import (
+    CabinetConfiguration,
+    ConfigParseCache,
+    get_config_parse_cache,
+)
 from cabinets.application.factory import ServiceFactory, get_factory
+from cabinets.application.services import AsyncGenerationService
 from cabinets.application.templates.manager import TemplateManager
+from cabinets.infrastructure.artifact_store import ArtifactStore, get_artifact_store
+from cabinets.infrastructure.llm import LLMAssemblyGenerator
 
 
 @lru_cache(maxsize=1)
@@ -23,12 +32,112 @@ def get_generate_command(
     return factory.create_generate_command()
 
 
+@lru_cache(maxsize=1)
+def get_stage_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by the generation stages of all requests."""
+    return ThreadPoolExecutor(thread_name_prefix="cabinets-stage")
+
+
+def get_generation_service(
+    command: Annotated[GenerateLayoutCommand, Depends(get_generate_command)],
+) -> AsyncGenerationService:
+    """Dependency for the async generation facade over the command."""
+    return AsyncGenerationService(command, executor=get_stage_executor())
+
+
 def get_template_manager() -> TemplateManager:
     """Dependency for TemplateManager."""
     return TemplateManager()
 
 
+def get_shared_artifact_store() -> ArtifactStore | None:
+    """Dependency for the shared artifact store (None if not configured)."""
+    return get_artifact_store()
+
+
+def get_parse_cache() -> ConfigParseCache:
+    """Dependency for the shared configuration parse cache."""
+    return get_config_parse_cache()
+
+
+async def get_parsed_config(
+    request: Request,
+    cache: Annotated[ConfigParseCache, Depends(get_parse_cache)],
+) -> CabinetConfiguration:
+    """Parse the ``{"config": {...}}`` request body into a configuration.
+
+    The raw body bytes are validated directly (no intermediate dict) and the
+    result is cached by body hash, so repeated requests for the same
+    configuration across endpoints skip validation entirely.
+    """
+    return cache.parse_envelope(await request.body())
+
+
+@lru_cache(maxsize=16)
+def _shared_llm_assembly_generator(settings: str | None) -> LLMAssemblyGenerator:
+    """Get the generator shared by all requests with the same LLM settings.
+
+    Args:
+        settings: JSON of the configuration's output.assembly section, or
+            None for defaults.
+    """
+    from cabinets.application.config.schemas import AssemblyOutputConfigSchema
+    from cabinets.infrastructure.exporters.llm_assembly import LLMAssemblyExporter
+
+    assembly = (
+        AssemblyOutputConfigSchema.model_validate_json(settings)
+        if settings is not None
+        else None
+    )
+    return LLMAssemblyExporter.from_config(assembly).generator
+
+
+def get_llm_assembly_generator(
+    config: Annotated[CabinetConfiguration, Depends(get_parsed_config)],
+) -> LLMAssemblyGenerator:
+    """Dependency for an LLM assembly generator using the config's settings.
+
+    Generators are shared across requests with the same settings, so their
+    cached Ollama server and model checks outlive a single request.
+    """
+    assembly = config.output.assembly if config.output else None
+    return _shared_llm_assembly_generator(
+        assembly.model_dump_json() if assembly is not None else None
+    )
+
+
+# OpenAPI description for endpoints that read the body via ParsedConfigDep
+CONFIG_BODY_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "required": ["config"],
+                    "properties": {
+                        "config": {
+                            "type": "object",
+                            "description": "Full cabinet configuration JSON",
+                        }
+                    },
+                }
+            }
+        },
+    }
+}
+
+
 # Type aliases for cleaner endpoint signatures
 ServiceFactoryDep = Annotated[ServiceFactory, Depends(get_service_factory)]
 GenerateCommandDep = Annotated[GenerateLayoutCommand, Depends(get_generate_command)]
+GenerationServiceDep = Annotated[
+    AsyncGenerationService, Depends(get_generation_service)
+]
 TemplateManagerDep = Annotated[TemplateManager, Depends(get_template_manager)]
+ParseCacheDep = Annotated[ConfigParseCache, Depends(get_parse_cache)]
+ParsedConfigDep = Annotated[CabinetConfiguration, Depends(get_parsed_config)]
+ArtifactStoreDep = Annotated[ArtifactStore | None, Depends(get_shared_artifact_store)]
+AssemblyGeneratorDep = Annotated[
+    LLMAssemblyGenerator, Depends(get_llm_assembly_generator)
+]
@@ -0,0 +1,76 @@
+"""Strong ETags and conditional requests for export endpoints.
+
+Export artifacts are a pure function of the configuration (or export
+request), the exporter that produced them and the exporter options, so an
+ETag can be computed from those inputs before any layout is generated. When the client's
+``If-None-Match`` header matches, endpoints answer 304 Not Modified and
+skip generation entirely.
+
+The exporter version is the installed package version combined with the
+exporter class's optional ``format_version`` attribute. Exporters should
+bump ``format_version`` whenever their byte output changes. ETags share
+their digest with the keys of the persistent artifact store.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from cabinets.infrastructure.artifact_store import artifact_key, exporter_version
+
+__all__ = ["artifact_etag", "etag_matches", "exporter_version", "not_modified"]
+
+
+def artifact_etag(
+    source: BaseModel,
+    exporter_cls: type,
+    **options: Any,
+) -> str:
+    """Compute a strong ETag for an export artifact.
+
+    The ETag is a prefix of the artifact's key in the shared artifact store.
+
+    Args:
+        source: Configuration or request model the artifact is generated from.
+        exporter_cls: Exporter class producing the artifact.
+        **options: Exporter options that affect the output bytes.
+
+    Returns:
+        Quoted ETag value suitable for the ``ETag`` header.
+    """
+    return f'"{artifact_key(source, exporter_cls, **options)[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether a request's If-None-Match header matches an ETag.
+
+    Uses the weak comparison required for If-None-Match, so ``W/`` prefixed
+    client values match the same opaque tag.
+
+    Args:
+        request: Incoming request.
+        etag: Quoted ETag of the current artifact.
+
+    Returns:
+        True if the client already holds this artifact.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 Not Modified response carrying the ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -3,6 +3,8 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from cabinets.application.config import ConfigError
+from cabinets.application.services import StageTimeoutError
 from cabinets.application.templates.manager import TemplateNotFoundError
 from cabinets.domain.section_resolver import SectionWidthError
 
@@ -51,6 +53,17 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(ConfigError)
+    async def config_error_handler(request: Request, exc: ConfigError) -> JSONResponse:
+        return JSONResponse(
+            status_code=422,
+            content={
+                "error": exc.message,
+                "error_type": exc.error_type,
+                "details": exc.details or None,
+            },
+        )
+
     @app.exception_handler(CabinetGenerationError)
     async def generation_error_handler(
         request: Request, exc: CabinetGenerationError
@@ -64,6 +77,19 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(StageTimeoutError)
+    async def stage_timeout_handler(
+        request: Request, exc: StageTimeoutError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=504,
+            content={
+                "error": str(exc),
+                "error_type": "stage_timeout",
+                "details": [{"stage": exc.stage, "timeout": exc.timeout}],
+            },
+        )
+
     @app.exception_handler(ExportError)
     async def export_error_handler(request: Request, exc: ExportError) -> JSONResponse:
         return JSONResponse(
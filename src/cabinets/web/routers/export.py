@@ -1,26 +1,51 @@
-"""Export format endpoints."""
+"""Export format endpoints.
 
-import tempfile
-from pathlib import Path
+Artifacts are read from and written to the shared artifact store when one
+is configured, so an artifact rendered by another process (the CLI or a
+batch job) is served without generating the layout again.
+"""
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, Response
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, Literal
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from cabinets.application.dtos import LayoutParametersInput, WallInput
-from cabinets.infrastructure import BinPackingConfig, BinPackingService
+from cabinets.application.services import AsyncGenerationService
+from cabinets.infrastructure import BinPackingConfig
+from cabinets.infrastructure.artifact_store import (
+    ArtifactStore,
+    artifact_key,
+    artifact_options,
+)
 from cabinets.infrastructure.cut_diagram_renderer import CutDiagramRenderer
 from cabinets.infrastructure.exporters import ExporterRegistry
+from cabinets.infrastructure.exporters.assembly import AssemblyInstructionGenerator
 from cabinets.infrastructure.exporters.bom import BomGenerator
-from cabinets.web.dependencies import GenerateCommandDep
+from cabinets.infrastructure.exporters.gltf import GlbExporter
+from cabinets.infrastructure.exporters.stl import StlLayoutExporter
+from cabinets.infrastructure.llm import AssemblyEvent
+from cabinets.web.dependencies import (
+    CONFIG_BODY_OPENAPI,
+    ArtifactStoreDep,
+    AssemblyGeneratorDep,
+    GenerationServiceDep,
+    ParsedConfigDep,
+)
+from cabinets.web.etags import artifact_etag, etag_matches, not_modified
 from cabinets.web.exceptions import CabinetGenerationError, UnsupportedFormatError
-from cabinets.web.schemas.requests import ExportRequest, GenerateFromConfigRequest
+from cabinets.web.schemas.requests import ExportRequest
 from cabinets.web.schemas.responses import ExportFormatsSchema
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+# Cut diagram scale for web display (slightly smaller than the CLI default)
+CUT_LAYOUT_SCALE = 8.0
+
 
-def _generate_layout(command: GenerateCommandDep, request: ExportRequest):
+async def _generate_layout(service: AsyncGenerationService, request: ExportRequest):
     """Helper to generate layout from export request."""
     wall_input = WallInput(
         width=request.dimensions.width,
@@ -46,7 +71,25 @@ def _generate_layout(command: GenerateCommandDep, request: ExportRequest):
         )
 
     # Generate layout
-    output = command.execute(wall_input, params_input)
+    output = await service.generate_layout(wall_input, params_input)
+
+    if not output.is_valid:
+        raise CabinetGenerationError(output.errors)
+
+    return output
+
+
+async def _generate_from_config(
+    service: AsyncGenerationService, config: ParsedConfigDep
+):
+    """Helper to generate a single-cabinet or room layout from a configuration."""
+    try:
+        output = await service.generate(config)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={"error": str(e), "error_type": "config_error"},
+        ) from e
 
     if not output.is_valid:
         raise CabinetGenerationError(output.errors)
@@ -54,6 +97,45 @@ def _generate_layout(command: GenerateCommandDep, request: ExportRequest):
     return output
 
 
+async def _artifact(
+    store: ArtifactStore | None,
+    source: BaseModel,
+    exporter: object,
+    http_request: Request,
+    create: Callable[[], Awaitable[bytes]],
+) -> tuple[str, bytes | None]:
+    """Resolve the ETag of an artifact and its bytes.
+
+    The ETag and store key are derived from the exporter's
+    artifact_options(), exactly as ExportManager derives them, so
+    artifacts the CLI stored for a configuration are served here.
+
+    Args:
+        store: Shared artifact store, or None if not configured.
+        source: Configuration or request the artifact is generated from.
+        exporter: Exporter instance producing the artifact.
+        http_request: Raw request, used for If-None-Match.
+        create: Coroutine function generating the artifact bytes on a
+            store miss.
+
+    Returns:
+        Quoted ETag and the artifact bytes, or None for the bytes if the
+        client's copy is current.
+    """
+    options = artifact_options(exporter) or {}
+    etag = artifact_etag(source, type(exporter), **options)
+    if etag_matches(http_request, etag):
+        return etag, None
+    if store is None:
+        return etag, await create()
+    key = artifact_key(source, type(exporter), **options)
+    content = store.get(key)
+    if content is None:
+        content = await create()
+        store.put(key, content)
+    return etag, content
+
+
 @router.get("/formats", response_model=ExportFormatsSchema)
 async def list_export_formats() -> ExportFormatsSchema:
     """List all available export formats.
@@ -70,39 +152,48 @@ async def list_export_formats() -> ExportFormatsSchema:
 @router.post("/stl")
 async def export_stl(
     request: ExportRequest,
-    command: GenerateCommandDep,
-) -> FileResponse:
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
+) -> Response:
     """Export cabinet as STL file (binary 3D model).
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
-        STL file as binary download.
+        STL file as binary download, or 304 if the client's copy is current.
     """
-    output = _generate_layout(command, request)
+    exporter = StlLayoutExporter()
 
-    # Export to temporary file
-    with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
+    async def create() -> bytes:
+        output = await _generate_layout(service, request)
+        return await service.export_bytes(exporter, output, ".stl")
 
-    exporter_class = ExporterRegistry.get("stl")
-    exporter = exporter_class()
-    exporter.export(output, tmp_path)
+    etag, content = await _artifact(store, request, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
-    return FileResponse(
-        path=tmp_path,
+    return Response(
+        content=content,
         media_type="application/octet-stream",
-        filename="cabinet.stl",
-        headers={"Content-Disposition": "attachment; filename=cabinet.stl"},
+        headers={
+            "Content-Disposition": "attachment; filename=cabinet.stl",
+            "ETag": etag,
+        },
     )
 
 
-@router.post("/stl-from-config")
+@router.post("/stl-from-config", openapi_extra=CONFIG_BODY_OPENAPI)
 async def export_stl_from_config(
-    request: GenerateFromConfigRequest,
-    command: GenerateCommandDep,
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
+    lod: Literal["preview", "full"] = "preview",
 ) -> Response:
     """Export cabinet as STL from full configuration.
 
@@ -114,138 +205,127 @@ async def export_stl_from_config(
     Supports both single-cabinet configurations and room layouts with
     multiple walls.
 
+    Curved decorative geometry (arches, scallops) is simplified for the
+    viewer by default; pass ``lod=full`` for print-quality curves.
+
     Args:
-        request: Request containing full cabinet configuration.
-        command: Injected GenerateLayoutCommand.
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
+        lod: Curve level of detail ("preview" or "full").
 
     Returns:
-        STL binary data.
+        STL binary data, or 304 if the client's copy is current.
     """
-    from cabinets.application.config import (
-        config_to_all_section_specs,
-        config_to_dtos,
-        config_to_room,
-        config_to_section_specs,
-        config_to_zone_configs,
-        load_config_from_dict,
-    )
+    exporter = StlLayoutExporter(curve_lod=lod)
 
-    try:
-        config = load_config_from_dict(request.config)
-
-        # Check for room configuration
-        if config.room is not None:
-            # Room layout mode - generate cabinets for each wall section
-            room = config_to_room(config)
-            if room is None:
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "error": "Invalid room configuration",
-                        "error_type": "config_error",
-                    },
-                )
-            room_section_specs = config_to_all_section_specs(config)
-            _, params_input = config_to_dtos(config)
-
-            # Execute room layout generation
-            output = command.execute_room_layout(room, room_section_specs, params_input)
-
-            if not output.is_valid:
-                raise CabinetGenerationError(output.errors)
-
-            # Export room layout to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as tmp:
-                tmp_path = Path(tmp.name)
-
-            exporter_class = ExporterRegistry.get("stl")
-            exporter = exporter_class()
-            exporter.export(output, tmp_path)
-
-            # Read the file and return as response
-            stl_data = tmp_path.read_bytes()
-            tmp_path.unlink()  # Clean up temp file
-
-            return Response(
-                content=stl_data,
-                media_type="application/octet-stream",
-                headers={"Content-Disposition": "attachment; filename=cabinet.stl"},
-            )
+    async def create() -> bytes:
+        output = await _generate_from_config(service, config)
+        return await service.export_bytes(exporter, output, ".stl")
 
-        # Single-cabinet mode (original behavior)
-        wall_input, params_input = config_to_dtos(config)
-        section_specs = config_to_section_specs(config)
-        zone_configs = config_to_zone_configs(config)
+    etag, content = await _artifact(store, config, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
-        cabinet_output = command.execute(
-            wall_input,
-            params_input,
-            section_specs=section_specs,
-            zone_configs=zone_configs,
-        )
+    return Response(
+        content=content,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": "attachment; filename=cabinet.stl",
+            "ETag": etag,
+        },
+    )
 
-        if not cabinet_output.is_valid:
-            raise CabinetGenerationError(cabinet_output.errors)
 
-        # Export to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+@router.post("/glb-from-config", openapi_extra=CONFIG_BODY_OPENAPI)
+async def export_glb_from_config(
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
+    gpu_instancing: bool = False,
+) -> Response:
+    """Export cabinet as binary glTF (GLB) from full configuration.
 
-        exporter_class = ExporterRegistry.get("stl")
-        exporter = exporter_class()
-        exporter.export(cabinet_output, tmp_path)
+    A compact alternative to /stl-from-config: box geometry is stored once
+    and each panel is an instanced node, so payloads are much smaller and
+    load faster in the viewer. Supports single-cabinet and room layouts.
 
-        # Read the file and return as response
-        stl_data = tmp_path.read_bytes()
-        tmp_path.unlink()  # Clean up temp file
+    Args:
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
+        gpu_instancing: Store panel transforms with EXT_mesh_gpu_instancing.
 
-        return Response(
-            content=stl_data,
-            media_type="application/octet-stream",
-            headers={"Content-Disposition": "attachment; filename=cabinet.stl"},
-        )
+    Returns:
+        GLB binary data, or 304 if the client's copy is current.
+    """
+    exporter = GlbExporter(gpu_instancing=gpu_instancing)
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=422,
-            detail={"error": str(e), "error_type": "config_error"},
-        ) from e
+    async def create() -> bytes:
+        output = await _generate_from_config(service, config)
+        return await service.run_blocking("export", exporter.export_bytes, output)
+
+    etag, content = await _artifact(store, config, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
+
+    return Response(
+        content=content,
+        media_type="model/gltf-binary",
+        headers={
+            "Content-Disposition": "attachment; filename=cabinet.glb",
+            "ETag": etag,
+        },
+    )
 
 
 @router.post("/dxf")
 async def export_dxf(
     request: ExportRequest,
-    command: GenerateCommandDep,
-) -> FileResponse:
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
+) -> Response:
     """Export cabinet as DXF file (2D CAD format).
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         DXF file as download.
     """
-    output = _generate_layout(command, request)
+    exporter = ExporterRegistry.get("dxf")()
 
-    with tempfile.NamedTemporaryFile(suffix=".dxf", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
+    async def create() -> bytes:
+        output = await _generate_layout(service, request)
+        return await service.export_bytes(exporter, output, ".dxf")
 
-    exporter_class = ExporterRegistry.get("dxf")
-    exporter = exporter_class()
-    exporter.export(output, tmp_path)
+    etag, content = await _artifact(store, request, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
-    return FileResponse(
-        path=tmp_path,
+    return Response(
+        content=content,
         media_type="application/dxf",
-        filename="cabinet.dxf",
+        headers={
+            "Content-Disposition": 'attachment; filename="cabinet.dxf"',
+            "ETag": etag,
+        },
     )
 
 
 @router.post("/svg")
 async def export_svg(
     request: ExportRequest,
-    command: GenerateCommandDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
 ) -> Response:
     """Export cabinet as SVG file (vector graphics).
 
@@ -254,90 +334,120 @@ async def export_svg(
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         SVG content as text response.
     """
-    output = _generate_layout(command, request)
+    exporter = ExporterRegistry.get("svg")()
+
+    async def create() -> bytes:
+        output = await _generate_layout(service, request)
+        try:
+            content = await service.export_string(exporter, output)
+        except NotImplementedError:
+            # SVG may require bin packing
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "error": "SVG export requires bin packing optimization",
+                    "error_type": "missing_requirement",
+                },
+            )
+        return content.encode()
 
-    try:
-        exporter_class = ExporterRegistry.get("svg")
-        exporter = exporter_class()
-        svg_content = exporter.export_string(output)
+    etag, content = await _artifact(store, request, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
-        return Response(
-            content=svg_content,
-            media_type="image/svg+xml",
-            headers={"Content-Disposition": "attachment; filename=cabinet.svg"},
-        )
-    except NotImplementedError:
-        # SVG may require bin packing
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "SVG export requires bin packing optimization",
-                "error_type": "missing_requirement",
-            },
-        )
+    return Response(
+        content=content,
+        media_type="image/svg+xml",
+        headers={
+            "Content-Disposition": "attachment; filename=cabinet.svg",
+            "ETag": etag,
+        },
+    )
 
 
 @router.post("/json")
 async def export_json(
     request: ExportRequest,
-    command: GenerateCommandDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
 ) -> Response:
     """Export cabinet as enhanced JSON.
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         JSON content as response.
     """
-    output = _generate_layout(command, request)
+    exporter = ExporterRegistry.get("json")()
 
-    exporter_class = ExporterRegistry.get("json")
-    exporter = exporter_class()
-    json_content = exporter.export_string(output)
+    async def create() -> bytes:
+        output = await _generate_layout(service, request)
+        return (await service.export_string(exporter, output)).encode()
+
+    etag, content = await _artifact(store, request, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
     return Response(
-        content=json_content,
+        content=content,
         media_type="application/json",
+        headers={"ETag": etag},
     )
 
 
 @router.post("/assembly")
 async def export_assembly(
     request: ExportRequest,
-    command: GenerateCommandDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
 ) -> Response:
     """Export assembly instructions as Markdown.
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         Markdown content as text response.
     """
-    output = _generate_layout(command, request)
+    exporter = AssemblyInstructionGenerator(include_timestamps=False)
 
-    exporter_class = ExporterRegistry.get("assembly")
-    exporter = exporter_class()
-    markdown_content = exporter.export_string(output)
+    async def create() -> bytes:
+        output = await _generate_layout(service, request)
+        return (await service.export_string(exporter, output)).encode()
+
+    etag, content = await _artifact(store, request, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
     return Response(
-        content=markdown_content,
+        content=content,
         media_type="text/markdown",
+        headers={"ETag": etag},
     )
 
 
-@router.post("/assembly-from-config")
+@router.post("/assembly-from-config", openapi_extra=CONFIG_BODY_OPENAPI)
 async def export_assembly_from_config(
-    request: GenerateFromConfigRequest,
-    command: GenerateCommandDep,
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
 ) -> Response:
     """Export assembly instructions from full configuration.
 
@@ -346,112 +456,118 @@ async def export_assembly_from_config(
     section widths and all configuration details.
 
     Args:
-        request: Request containing full cabinet configuration.
-        command: Injected GenerateLayoutCommand.
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         Markdown content as text response.
     """
-    from cabinets.application.config import (
-        config_to_all_section_specs,
-        config_to_dtos,
-        config_to_room,
-        config_to_section_specs,
-        config_to_zone_configs,
-        load_config_from_dict,
+    exporter = AssemblyInstructionGenerator(include_timestamps=False)
+
+    async def create() -> bytes:
+        output = await _generate_from_config(service, config)
+        return (await service.export_string(exporter, output)).encode()
+
+    etag, content = await _artifact(store, config, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
+
+    return Response(
+        content=content,
+        media_type="text/markdown",
+        headers={"ETag": etag},
     )
 
-    try:
-        config = load_config_from_dict(request.config)
-
-        # Check for room configuration
-        if config.room is not None:
-            room = config_to_room(config)
-            if room is None:
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "error": "Invalid room configuration",
-                        "error_type": "config_error",
-                    },
-                )
-            room_section_specs = config_to_all_section_specs(config)
-            _, params_input = config_to_dtos(config)
-            room_output = command.execute_room_layout(
-                room, room_section_specs, params_input
-            )
 
-            if not room_output.is_valid:
-                raise CabinetGenerationError(room_output.errors)
+def _sse_frame(event: AssemblyEvent) -> str:
+    """Encode an assembly event as a server-sent event."""
+    data = "".join(f"data: {line}\n" for line in event.data.split("\n"))
+    return f"event: {event.kind}\nid: {event.cabinet}\n{data}\n"
 
-            exporter_class = ExporterRegistry.get("assembly")
-            exporter = exporter_class()
-            markdown_content = exporter.export_string(room_output)
 
-            return Response(
-                content=markdown_content,
-                media_type="text/markdown",
-            )
+@router.post("/assembly-from-config/stream", openapi_extra=CONFIG_BODY_OPENAPI)
+async def stream_assembly_from_config(
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    generator: AssemblyGeneratorDep,
+) -> StreamingResponse:
+    """Stream LLM-enhanced assembly instructions as server-sent events.
 
-        # Single-cabinet mode
-        wall_input, params_input = config_to_dtos(config)
-        section_specs = config_to_section_specs(config)
-        zone_configs = config_to_zone_configs(config)
-        cabinet_output = command.execute(
-            wall_input,
-            params_input,
-            section_specs=section_specs,
-            zone_configs=zone_configs,
-        )
+    The template-based instructions are sent immediately as a ``template``
+    event. LLM steps follow as ``step`` events (AssemblyStep JSON) while the
+    model writes them, then an ``instructions`` event with the complete
+    Markdown, or a ``fallback`` event with the reason the LLM could not
+    produce it. Each event's id is the index of its cabinet. The stream
+    ends with a ``done`` event.
 
-        if not cabinet_output.is_valid:
-            raise CabinetGenerationError(cabinet_output.errors)
+    LLM settings (model, Ollama URL, skill level, timeout) are read from the
+    configuration's output.assembly section.
 
-        exporter_class = ExporterRegistry.get("assembly")
-        exporter = exporter_class()
-        markdown_content = exporter.export_string(cabinet_output)
+    Args:
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        generator: LLM assembly generator configured from the request.
 
-        return Response(
-            content=markdown_content,
-            media_type="text/markdown",
-        )
+    Returns:
+        Event stream response.
+    """
+    output = await _generate_from_config(service, config)
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=422,
-            detail={"error": str(e), "error_type": "config_error"},
-        ) from e
+    async def events() -> AsyncIterator[str]:
+        async for event in generator.stream(output):
+            yield _sse_frame(event)
+        yield "event: done\ndata: \n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/bom")
 async def export_bom(
     request: ExportRequest,
-    command: GenerateCommandDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
 ) -> Response:
     """Export bill of materials as Markdown.
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         BOM content as markdown response.
     """
-    output = _generate_layout(command, request)
-
     exporter = BomGenerator(output_format="markdown")
-    bom_content = exporter.export_string(output)
+
+    async def create() -> bytes:
+        output = await _generate_layout(service, request)
+        return (await service.export_string(exporter, output)).encode()
+
+    etag, content = await _artifact(store, request, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
     return Response(
-        content=bom_content,
+        content=content,
         media_type="text/markdown",
+        headers={"ETag": etag},
     )
 
 
-@router.post("/bom-from-config")
+@router.post("/bom-from-config", openapi_extra=CONFIG_BODY_OPENAPI)
 async def export_bom_from_config(
-    request: GenerateFromConfigRequest,
-    command: GenerateCommandDep,
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    store: ArtifactStoreDep,
+    http_request: Request,
 ) -> Response:
     """Export bill of materials from full configuration.
 
@@ -460,79 +576,29 @@ async def export_bom_from_config(
     section widths and all configuration details.
 
     Args:
-        request: Request containing full cabinet configuration.
-        command: Injected GenerateLayoutCommand.
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        store: Shared artifact store, if configured.
+        http_request: Raw request, used for If-None-Match.
 
     Returns:
         BOM content as markdown response.
     """
-    from cabinets.application.config import (
-        config_to_all_section_specs,
-        config_to_dtos,
-        config_to_room,
-        config_to_section_specs,
-        config_to_zone_configs,
-        load_config_from_dict,
-    )
-
-    try:
-        config = load_config_from_dict(request.config)
-
-        # Check for room configuration
-        if config.room is not None:
-            room = config_to_room(config)
-            if room is None:
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "error": "Invalid room configuration",
-                        "error_type": "config_error",
-                    },
-                )
-            room_section_specs = config_to_all_section_specs(config)
-            _, params_input = config_to_dtos(config)
-            room_output = command.execute_room_layout(
-                room, room_section_specs, params_input
-            )
-
-            if not room_output.is_valid:
-                raise CabinetGenerationError(room_output.errors)
-
-            exporter = BomGenerator(output_format="markdown")
-            bom_content = exporter.export_string(room_output)
-
-            return Response(
-                content=bom_content,
-                media_type="text/markdown",
-            )
-
-        # Single-cabinet mode
-        wall_input, params_input = config_to_dtos(config)
-        section_specs = config_to_section_specs(config)
-        zone_configs = config_to_zone_configs(config)
-        cabinet_output = command.execute(
-            wall_input,
-            params_input,
-            section_specs=section_specs,
-            zone_configs=zone_configs,
-        )
+    exporter = BomGenerator(output_format="markdown")
 
-        if not cabinet_output.is_valid:
-            raise CabinetGenerationError(cabinet_output.errors)
+    async def create() -> bytes:
+        output = await _generate_from_config(service, config)
+        return (await service.export_string(exporter, output)).encode()
 
-        exporter = BomGenerator(output_format="markdown")
-        bom_content = exporter.export_string(cabinet_output)
+    etag, content = await _artifact(store, config, exporter, http_request, create)
+    if content is None:
+        return not_modified(etag)
 
-        return Response(
-            content=bom_content,
-            media_type="text/markdown",
-        )
-
-    except ValueError as e:
-        raise HTTPException(
-            status_code=422,
-            detail={"error": str(e), "error_type": "config_error"},
-        ) from e
+    return Response(
+        content=content,
+        media_type="text/markdown",
+        headers={"ETag": etag},
+    )
 
 
 class SheetLayoutSchema(BaseModel):
@@ -556,8 +622,10 @@ class CutLayoutsResponseSchema(BaseModel):
 @router.post("/cut-layouts", response_model=CutLayoutsResponseSchema)
 async def export_cut_layouts(
     request: ExportRequest,
-    command: GenerateCommandDep,
-) -> CutLayoutsResponseSchema:
+    service: GenerationServiceDep,
+    http_request: Request,
+    response: Response,
+) -> CutLayoutsResponseSchema | Response:
     """Export cut layout SVGs showing bin-packed pieces on 4x8 sheets.
 
     Performs bin packing optimization on the cut list and returns SVG
@@ -565,44 +633,36 @@ async def export_cut_layouts(
 
     Args:
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
+        http_request: Raw request, used for If-None-Match.
+        response: Outgoing response, used to set the ETag header.
 
     Returns:
-        Cut layout response with individual sheet SVGs and combined view.
+        Cut layout response with individual sheet SVGs and combined view,
+        or 304 if the client's copy is current.
     """
-    output = _generate_layout(command, request)
+    etag = artifact_etag(request, CutDiagramRenderer, scale=CUT_LAYOUT_SCALE)
+    if etag_matches(http_request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
-    # Run bin packing optimization
-    bin_packing_config = BinPackingConfig(enabled=True)
-    bin_packing_service = BinPackingService(bin_packing_config)
+    output = await _generate_layout(service, request)
+    return await _render_cut_layouts(service, output.cut_list)
 
-    try:
-        packing_result = bin_packing_service.optimize_cut_list(output.cut_list)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": f"Bin packing failed: {e}",
-                "error_type": "bin_packing_error",
-            },
-        )
 
-    # Render SVGs
+def _build_cut_layouts(packing_result: Any) -> CutLayoutsResponseSchema:
+    """Render the sheet SVGs of a packing result."""
     renderer = CutDiagramRenderer(
-        scale=8.0,  # Slightly smaller scale for web display
+        scale=CUT_LAYOUT_SCALE,
         show_dimensions=True,
         show_labels=True,
         show_grain=False,
         use_panel_colors=True,
     )
 
-    # Generate individual sheet SVGs
     individual_svgs = renderer.render_all_svg(packing_result)
-
-    # Generate combined stacked SVG
     combined_svg = renderer.render_combined_svg(packing_result)
 
-    # Build response
     sheets = []
     for i, layout in enumerate(packing_result.layouts):
         sheets.append(
@@ -622,13 +682,12 @@ async def export_cut_layouts(
     )
 
 
-def _render_cut_layouts(cut_list: list) -> CutLayoutsResponseSchema:
-    """Helper to render cut layouts from a cut list."""
-    bin_packing_config = BinPackingConfig(enabled=True)
-    bin_packing_service = BinPackingService(bin_packing_config)
-
+async def _render_cut_layouts(
+    service: AsyncGenerationService, cut_list: list
+) -> CutLayoutsResponseSchema:
+    """Helper to pack a cut list and render its cut layouts."""
     try:
-        packing_result = bin_packing_service.optimize_cut_list(cut_list)
+        packing_result = await service.pack(cut_list, BinPackingConfig(enabled=True))
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -638,41 +697,20 @@ def _render_cut_layouts(cut_list: list) -> CutLayoutsResponseSchema:
             },
         )
 
-    renderer = CutDiagramRenderer(
-        scale=8.0,
-        show_dimensions=True,
-        show_labels=True,
-        show_grain=False,
-        use_panel_colors=True,
-    )
-
-    individual_svgs = renderer.render_all_svg(packing_result)
-    combined_svg = renderer.render_combined_svg(packing_result)
-
-    sheets = []
-    for i, layout in enumerate(packing_result.layouts):
-        sheets.append(
-            SheetLayoutSchema(
-                sheet_index=i,
-                piece_count=layout.piece_count,
-                waste_percentage=layout.waste_percentage,
-                svg=individual_svgs[i],
-            )
-        )
+    return await service.run_blocking("export", _build_cut_layouts, packing_result)
 
-    return CutLayoutsResponseSchema(
-        total_sheets=packing_result.total_sheets,
-        total_waste_percentage=packing_result.total_waste_percentage,
-        sheets=sheets,
-        combined_svg=combined_svg,
-    )
 
-
-@router.post("/cut-layouts-from-config", response_model=CutLayoutsResponseSchema)
+@router.post(
+    "/cut-layouts-from-config",
+    response_model=CutLayoutsResponseSchema,
+    openapi_extra=CONFIG_BODY_OPENAPI,
+)
 async def export_cut_layouts_from_config(
-    request: GenerateFromConfigRequest,
-    command: GenerateCommandDep,
-) -> CutLayoutsResponseSchema:
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    http_request: Request,
+    response: Response,
+) -> CutLayoutsResponseSchema | Response:
     """Export cut layout SVGs from full configuration.
 
     This endpoint accepts the full cabinet configuration and returns cut layouts
@@ -680,74 +718,29 @@ async def export_cut_layouts_from_config(
     and all configuration details.
 
     Args:
-        request: Request containing full cabinet configuration.
-        command: Injected GenerateLayoutCommand.
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        http_request: Raw request, used for If-None-Match.
+        response: Outgoing response, used to set the ETag header.
 
     Returns:
-        Cut layout response with individual sheet SVGs and combined view.
+        Cut layout response with individual sheet SVGs and combined view,
+        or 304 if the client's copy is current.
     """
-    from cabinets.application.config import (
-        config_to_all_section_specs,
-        config_to_dtos,
-        config_to_room,
-        config_to_section_specs,
-        config_to_zone_configs,
-        load_config_from_dict,
-    )
-
-    try:
-        config = load_config_from_dict(request.config)
-
-        # Check for room configuration
-        if config.room is not None:
-            room = config_to_room(config)
-            if room is None:
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "error": "Invalid room configuration",
-                        "error_type": "config_error",
-                    },
-                )
-            room_section_specs = config_to_all_section_specs(config)
-            _, params_input = config_to_dtos(config)
-            room_output = command.execute_room_layout(
-                room, room_section_specs, params_input
-            )
+    etag = artifact_etag(config, CutDiagramRenderer, scale=CUT_LAYOUT_SCALE)
+    if etag_matches(http_request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
-            if not room_output.is_valid:
-                raise CabinetGenerationError(room_output.errors)
-
-            return _render_cut_layouts(room_output.cut_list)
-
-        # Single-cabinet mode
-        wall_input, params_input = config_to_dtos(config)
-        section_specs = config_to_section_specs(config)
-        zone_configs = config_to_zone_configs(config)
-        cabinet_output = command.execute(
-            wall_input,
-            params_input,
-            section_specs=section_specs,
-            zone_configs=zone_configs,
-        )
-
-        if not cabinet_output.is_valid:
-            raise CabinetGenerationError(cabinet_output.errors)
-
-        return _render_cut_layouts(cabinet_output.cut_list)
-
-    except ValueError as e:
-        raise HTTPException(
-            status_code=422,
-            detail={"error": str(e), "error_type": "config_error"},
-        ) from e
+    output = await _generate_from_config(service, config)
+    return await _render_cut_layouts(service, output.cut_list)
 
 
 @router.post("/{format_name}")
 async def export_generic(
     format_name: str,
     request: ExportRequest,
-    command: GenerateCommandDep,
+    service: GenerationServiceDep,
 ) -> Response:
     """Export cabinet to any registered format.
 
@@ -756,7 +749,7 @@ async def export_generic(
     Args:
         format_name: Export format name.
         request: Export request with cabinet dimensions.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
 
     Returns:
         Exported content as appropriate response type.
@@ -771,28 +764,24 @@ async def export_generic(
     if not ExporterRegistry.is_registered(format_name):
         raise UnsupportedFormatError(format_name, available)
 
-    output = _generate_layout(command, request)
+    output = await _generate_layout(service, request)
 
     exporter_class = ExporterRegistry.get(format_name)
     exporter = exporter_class()
 
     try:
-        content = exporter.export_string(output)
+        content = await service.export_string(exporter, output)
         return Response(
             content=content,
             media_type="text/plain",
         )
     except NotImplementedError:
-        # Binary format - export to temp file
-        with tempfile.NamedTemporaryFile(
-            suffix=f".{exporter.file_extension}", delete=False
-        ) as tmp:
-            tmp_path = Path(tmp.name)
-
-        exporter.export(output, tmp_path)
-
-        return FileResponse(
-            path=tmp_path,
+        # Binary format - export via a temporary file
+        extension = exporter.file_extension
+        return Response(
+            content=await service.export_bytes(exporter, output, f".{extension}"),
             media_type="application/octet-stream",
-            filename=f"cabinet.{exporter.file_extension}",
+            headers={
+                "Content-Disposition": f"attachment; filename=cabinet.{extension}"
+            },
         )
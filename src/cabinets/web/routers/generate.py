@@ -1,32 +1,54 @@
 """Cabinet generation endpoints."""
 
-from typing import Any
+import functools
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from cabinets.application.config import (
     config_to_all_section_specs,
+    config_to_bin_packing,
     config_to_dtos,
     config_to_room,
     config_to_section_specs,
     config_to_zone_configs,
-    load_config_from_dict,
 )
 from cabinets.application.dtos import LayoutParametersInput, WallInput
-from cabinets.web.dependencies import GenerateCommandDep
+from cabinets.application.services import (
+    DesignSweepService,
+    SectionWidthOptimizerService,
+    SheetPricing,
+    SweepRanges,
+    WidthOptimizationConfig,
+)
+from cabinets.domain.section_resolver import SectionWidthError
+from cabinets.web.dependencies import (
+    CONFIG_BODY_OPENAPI,
+    GenerationServiceDep,
+    ParsedConfigDep,
+)
 from cabinets.web.exceptions import CabinetGenerationError
-from cabinets.web.schemas.requests import GenerateFromConfigRequest, GenerateRequest
+from cabinets.web.schemas.requests import GenerateRequest, SweepRequest
 from cabinets.web.schemas.responses import (
     CabinetSummarySchema,
     CutPieceSchema,
     LayoutOutputSchema,
     MaterialEstimateSchema,
     RoomLayoutOutputSchema,
+    SweepResponseSchema,
+    SweepRowSchema,
     WallSummarySchema,
+    WidthOptimizationSchema,
 )
 
 router = APIRouter(prefix="/generate", tags=["generate"])
 
+# Time budget for optimize_widths requests, in seconds
+WIDTH_OPTIMIZATION_BUDGET = 2.0
+
+# Shared so repeated sweeps reuse previously evaluated variants
+_sweep_service = DesignSweepService()
+
 
 def _layout_output_to_schema(output: Any) -> LayoutOutputSchema:
     """Convert LayoutOutput to response schema."""
@@ -161,13 +183,13 @@ def _room_layout_output_to_schema(output: Any) -> RoomLayoutOutputSchema:
 @router.post("", response_model=LayoutOutputSchema)
 async def generate_layout(
     request: GenerateRequest,
-    command: GenerateCommandDep,
+    service: GenerationServiceDep,
 ) -> LayoutOutputSchema:
     """Generate a cabinet layout from dimensions.
 
     Args:
         request: Generation request with dimensions and parameters.
-        command: Injected GenerateLayoutCommand.
+        service: Injected async generation service.
 
     Returns:
         Generated layout output with cabinet, cut list, and estimates.
@@ -200,7 +222,7 @@ async def generate_layout(
         )
 
     # Generate layout
-    output = command.execute(wall_input, params_input)
+    output = await service.generate_layout(wall_input, params_input)
 
     if not output.is_valid:
         raise CabinetGenerationError(output.errors)
@@ -208,10 +230,17 @@ async def generate_layout(
     return _layout_output_to_schema(output)
 
 
-@router.post("/from-config", response_model=LayoutOutputSchema | RoomLayoutOutputSchema)
+@router.post(
+    "/from-config",
+    response_model=LayoutOutputSchema | RoomLayoutOutputSchema,
+    openapi_extra=CONFIG_BODY_OPENAPI,
+)
 async def generate_from_config(
-    request: GenerateFromConfigRequest,
-    command: GenerateCommandDep,
+    config: ParsedConfigDep,
+    service: GenerationServiceDep,
+    optimize_widths: bool = False,
+    width_tolerance: Annotated[float, Query(ge=0.0, le=12.0)] = 2.0,
+    depth_tolerance: Annotated[float, Query(ge=0.0, le=12.0)] = 0.0,
 ) -> LayoutOutputSchema | RoomLayoutOutputSchema:
     """Generate a cabinet layout from a full configuration.
 
@@ -219,9 +248,16 @@ async def generate_from_config(
     multiple walls. Room layouts are detected by the presence of a
     'room' section in the configuration with wall definitions.
 
+    With ``optimize_widths`` (single-cabinet only), fill-section widths
+    and depths are searched within the given tolerances for the layout
+    that needs the fewest sheets of the configured bin_packing size.
+
     Args:
-        request: Request containing full cabinet configuration.
-        command: Injected GenerateLayoutCommand.
+        config: Configuration parsed (and cached) from the request body.
+        service: Injected async generation service.
+        optimize_widths: Search fill widths for the best sheet yield.
+        width_tolerance: Max deviation from an equal split, in inches.
+        depth_tolerance: Max reduction of fill-section depth, in inches.
 
     Returns:
         Generated layout output with cabinet(s), cut list, and estimates.
@@ -232,9 +268,6 @@ async def generate_from_config(
         HTTPException: If configuration is invalid or generation fails.
     """
     try:
-        # Load config from dict
-        config = load_config_from_dict(request.config)
-
         # Check for room configuration
         if config.room is not None:
             # Room layout mode - generate cabinets for each wall section
@@ -251,8 +284,12 @@ async def generate_from_config(
             _, params_input = config_to_dtos(config)
 
             # Execute room layout generation
-            room_output = command.execute_room_layout(
-                room, room_section_specs, params_input
+            room_output = await service.run_blocking(
+                "generate",
+                service.command.execute_room_layout,
+                room,
+                room_section_specs,
+                params_input,
             )
 
             if not room_output.is_valid:
@@ -265,8 +302,35 @@ async def generate_from_config(
         section_specs = config_to_section_specs(config)
         zone_configs = config_to_zone_configs(config)
 
+        if optimize_widths:
+            optimizer = SectionWidthOptimizerService(
+                service.command,
+                config_to_bin_packing(config.bin_packing),
+                config=WidthOptimizationConfig(
+                    width_tolerance=width_tolerance,
+                    depth_tolerance=depth_tolerance,
+                    time_budget_seconds=WIDTH_OPTIMIZATION_BUDGET,
+                ),
+            )
+            try:
+                optimization = await service.run_blocking(
+                    "generate",
+                    optimizer.optimize,
+                    wall_input,
+                    params_input,
+                    section_specs,
+                    zone_configs,
+                )
+            except SectionWidthError as e:
+                raise CabinetGenerationError([str(e)]) from e
+            schema = _layout_output_to_schema(optimization.output)
+            schema.width_optimization = WidthOptimizationSchema(
+                **optimization.to_dict()
+            )
+            return schema
+
         # Generate layout with section specs for proper widths
-        cabinet_output = command.execute(
+        cabinet_output = await service.generate_layout(
             wall_input,
             params_input,
             section_specs=section_specs,
@@ -283,3 +347,60 @@ async def generate_from_config(
             status_code=422,
             detail={"error": str(e), "error_type": "config_error"},
         ) from e
+
+
+@router.post("/sweep", response_model=SweepResponseSchema)
+async def sweep_designs(
+    request: SweepRequest, service: GenerationServiceDep
+) -> SweepResponseSchema:
+    """Compare design variants across thickness, section and shelf counts.
+
+    Evaluates every combination of the requested values and marks the
+    variants that no other variant beats on cost, sheet count, weight and
+    minimum shelf capacity.
+
+    Args:
+        request: Sweep request with dimensions and parameter values.
+        service: Injected async generation service.
+
+    Returns:
+        All variants plus the Pareto-optimal subset ordered by cost.
+
+    Raises:
+        HTTPException: If the sweep has too many combinations.
+    """
+    try:
+        ranges = SweepRanges(
+            thicknesses=tuple(request.thicknesses),
+            section_counts=tuple(request.section_counts),
+            shelf_counts=tuple(request.shelf_counts),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail={"errors": [str(e)]}) from e
+
+    pricing = SheetPricing(
+        price_per_inch=request.price_per_inch,
+        prices={item.thickness: item.price for item in request.sheet_prices},
+    )
+    result = await service.run_blocking(
+        "generate",
+        functools.partial(
+            _sweep_service.run,
+            WallInput(
+                width=request.dimensions.width,
+                height=request.dimensions.height,
+                depth=request.dimensions.depth,
+            ),
+            ranges,
+            material_type=request.material_type.value,
+            back_thickness=request.back_thickness,
+            pricing=pricing,
+        ),
+    )
+
+    return SweepResponseSchema(
+        rows=[SweepRowSchema(**row.to_dict()) for row in result.rows],
+        pareto=[SweepRowSchema(**row.to_dict()) for row in result.pareto_rows],
+        evaluated=result.evaluated,
+        elapsed_seconds=round(result.elapsed_seconds, 3),
+    )
@@ -1,22 +1,61 @@
 """Configuration validation endpoints."""
 
+import threading
+from collections import OrderedDict
+
 from fastapi import APIRouter, HTTPException
 
-from cabinets.application.config import load_config_from_dict, validate_config
+from cabinets.application.config import ValidationSession, validate_config
+from cabinets.web.dependencies import ParseCacheDep
 from cabinets.web.schemas.requests import ConfigValidateRequest
 from cabinets.web.schemas.responses import ValidationResultSchema
 
 router = APIRouter(prefix="/validate", tags=["validate"])
 
+# Maximum number of editor sessions whose validator results are retained
+MAX_VALIDATION_SESSIONS = 256
+
+# Threads used to run independent validators concurrently
+VALIDATION_WORKERS = 4
+
+_sessions: OrderedDict[str, ValidationSession] = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def _get_session(session_id: str | None) -> ValidationSession | None:
+    """Get or create the validation session for an editor session id.
+
+    Sessions are evicted least-recently-used once MAX_VALIDATION_SESSIONS
+    is exceeded.
+    """
+    if session_id is None:
+        return None
+    with _sessions_lock:
+        session = _sessions.get(session_id)
+        if session is None:
+            session = ValidationSession()
+            _sessions[session_id] = session
+            while len(_sessions) > MAX_VALIDATION_SESSIONS:
+                _sessions.popitem(last=False)
+        else:
+            _sessions.move_to_end(session_id)
+        return session
+
 
 @router.post("", response_model=ValidationResultSchema)
 async def validate_configuration(
     request: ConfigValidateRequest,
+    cache: ParseCacheDep,
 ) -> ValidationResultSchema:
     """Validate a cabinet configuration without generating.
 
+    When a session_id is supplied, validators whose configuration subtrees
+    are unchanged since the previous request in that session reuse their
+    earlier results.
+
     Args:
         request: Request containing configuration to validate.
+        cache: Shared configuration parse cache.
 
     Returns:
         Validation result with errors and warnings.
@@ -25,11 +64,16 @@ async def validate_configuration(
         HTTPException: If configuration cannot be parsed.
     """
     try:
-        # Load config from dict
-        config = load_config_from_dict(request.config)
+        # Load config from dict, reusing a cached parse when unchanged
+        config = cache.parse_dict(request.config)
 
         # Validate config
-        result = validate_config(config)
+        result = validate_config(
+            config,
+            session=_get_session(request.session_id),
+            fail_fast=request.fail_fast,
+            max_workers=VALIDATION_WORKERS,
+        )
 
         return ValidationResultSchema(
             is_valid=result.is_valid,
@@ -12,6 +12,8 @@ from cabinets.web.schemas.requests import (
     ExportRequest,
     GenerateFromConfigRequest,
     GenerateRequest,
+    SheetPriceSchema,
+    SweepRequest,
 )
 from cabinets.web.schemas.responses import (
     CabinetSummarySchema,
@@ -20,6 +22,8 @@ from cabinets.web.schemas.responses import (
     ExportFormatsSchema,
     LayoutOutputSchema,
     MaterialEstimateSchema,
+    SweepResponseSchema,
+    SweepRowSchema,
     TemplateContentSchema,
     TemplateListSchema,
     ValidationResultSchema,
@@ -37,6 +41,8 @@ __all__ = [
     "ExportRequest",
     "GenerateFromConfigRequest",
     "GenerateRequest",
+    "SheetPriceSchema",
+    "SweepRequest",
     # Responses
     "CabinetSummarySchema",
     "CutPieceSchema",
@@ -44,6 +50,8 @@ __all__ = [
     "ExportFormatsSchema",
     "LayoutOutputSchema",
     "MaterialEstimateSchema",
+    "SweepResponseSchema",
+    "SweepRowSchema",
     "TemplateContentSchema",
     "TemplateListSchema",
     "ValidationResultSchema",
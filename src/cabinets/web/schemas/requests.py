@@ -1,12 +1,13 @@
 """Pydantic request schemas for the REST API."""
 
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
 from cabinets.web.schemas.common import (
     DimensionsSchema,
     MaterialSchema,
+    MaterialTypeEnum,
     SectionSpecSchema,
 )
 
@@ -30,6 +31,42 @@ class GenerateRequest(BaseModel):
     )
 
 
+class SheetPriceSchema(BaseModel):
+    """Price of one sheet of a given thickness."""
+
+    thickness: float = Field(..., ge=0.125, le=2.0, description="Thickness in inches")
+    price: float = Field(..., ge=0, description="Price per sheet in dollars")
+
+
+class SweepRequest(BaseModel):
+    """Request for a design-space sweep over thickness, sections and shelves."""
+
+    dimensions: DimensionsSchema = Field(..., description="Cabinet dimensions")
+    material_type: MaterialTypeEnum = Field(
+        default=MaterialTypeEnum.PLYWOOD, description="Case material type"
+    )
+    thicknesses: list[Annotated[float, Field(ge=0.25, le=2.0)]] = Field(
+        default=[0.75], min_length=1, description="Material thicknesses to compare"
+    )
+    section_counts: list[Annotated[int, Field(ge=1, le=10)]] = Field(
+        default=[1], min_length=1, description="Section counts to compare"
+    )
+    shelf_counts: list[Annotated[int, Field(ge=0, le=20)]] = Field(
+        default=[3], min_length=1, description="Shelves per section to compare"
+    )
+    back_thickness: float = Field(
+        default=0.25, ge=0.125, le=1.0, description="Back panel thickness in inches"
+    )
+    sheet_prices: list[SheetPriceSchema] = Field(
+        default_factory=list, description="Explicit sheet prices by thickness"
+    )
+    price_per_inch: float = Field(
+        default=80.0,
+        ge=0,
+        description="Sheet price per inch of thickness for unpriced thicknesses",
+    )
+
+
 class GenerateFromConfigRequest(BaseModel):
     """Request for generating a cabinet from a full configuration."""
 
@@ -40,6 +77,17 @@ class ConfigValidateRequest(BaseModel):
     """Request for validating a configuration."""
 
     config: dict[str, Any] = Field(..., description="Cabinet configuration JSON")
+    session_id: str | None = Field(
+        default=None,
+        max_length=128,
+        description=(
+            "Optional editor session identifier. Validators whose inputs are "
+            "unchanged since the last request in this session are skipped."
+        ),
+    )
+    fail_fast: bool = Field(
+        default=False, description="Stop at the first blocking validation error"
+    )
 
 
 class ExportRequest(BaseModel):
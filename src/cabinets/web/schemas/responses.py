@@ -35,6 +35,50 @@ class CabinetSummarySchema(BaseModel):
     total_shelves: int = Field(..., description="Total number of shelves")
 
 
+class WidthOptimizationSchema(BaseModel):
+    """Summary of a sheet-yield section width optimization."""
+
+    section_widths: list[float] = Field(..., description="Chosen section widths")
+    depth_reduction: float = Field(
+        ..., description="Depth removed from fill sections in inches"
+    )
+    sheet_count: int = Field(..., description="Sheets needed by the chosen layout")
+    baseline_sheet_count: int = Field(
+        ..., description="Sheets needed with equal fill widths"
+    )
+    sheets_saved: int = Field(..., description="Sheets saved versus the baseline")
+    candidates_evaluated: int = Field(..., description="Candidates scored")
+    timed_out: bool = Field(..., description="Whether the time budget was reached")
+    elapsed_seconds: float = Field(..., description="Search time in seconds")
+
+
+class SweepRowSchema(BaseModel):
+    """Metrics for one design variant in a sweep."""
+
+    thickness: float = Field(..., description="Material thickness in inches")
+    sections: int = Field(..., description="Number of sections")
+    shelves: int = Field(..., description="Shelves per section")
+    cost: float | None = Field(default=None, description="Sheet goods cost")
+    sheet_count: int | None = Field(default=None, description="Sheets needed")
+    weight_lbs: float | None = Field(default=None, description="Empty weight")
+    min_shelf_capacity_lbs: float | None = Field(
+        default=None, description="Lowest advisory shelf capacity"
+    )
+    pareto_optimal: bool = Field(..., description="Not dominated by another variant")
+    errors: list[str] = Field(default_factory=list, description="Generation errors")
+
+
+class SweepResponseSchema(BaseModel):
+    """Response for a design-space sweep."""
+
+    rows: list[SweepRowSchema] = Field(..., description="All variants")
+    pareto: list[SweepRowSchema] = Field(
+        ..., description="Pareto-optimal variants ordered by cost"
+    )
+    evaluated: int = Field(..., description="Variants generated by this request")
+    elapsed_seconds: float = Field(..., description="Sweep time in seconds")
+
+
 class LayoutOutputSchema(BaseModel):
     """Response for layout generation."""
 
@@ -52,6 +96,9 @@ class LayoutOutputSchema(BaseModel):
     total_estimate: MaterialEstimateSchema | None = Field(
         default=None, description="Total material estimate"
     )
+    width_optimization: WidthOptimizationSchema | None = Field(
+        default=None, description="Width optimization summary, when requested"
+    )
 
 
 class ValidationResultSchema(BaseModel):
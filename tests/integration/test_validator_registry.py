@@ -38,6 +38,8 @@ from cabinets.application.config.validators import (
     InfrastructureValidator,
     ObstacleValidator,
     SectionDimensionValidator,
+    ValidationResult,
+    ValidationSession,
     WoodworkingValidator,
 )
 
@@ -239,6 +241,180 @@ class TestComplexConfigValidation:
         ValidatorRegistry.enable("woodworking")
 
 
+class _CountingValidator:
+    """Test validator that records how often it runs."""
+
+    def __init__(
+        self,
+        name: str,
+        dependencies: tuple[str, ...] | None,
+        error: bool = False,
+    ) -> None:
+        self._name = name
+        self.dependencies = dependencies
+        self.error = error
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def validate(self, config: CabinetConfiguration) -> ValidationResult:
+        self.calls += 1
+        result = ValidationResult()
+        if self.error:
+            result.add_error(path=self._name, message=f"{self._name} failed")
+        return result
+
+
+def _simple_config(
+    width: float = 48.0, with_room: bool = False
+) -> CabinetConfiguration:
+    return CabinetConfiguration(
+        schema_version="1.6",
+        cabinet=CabinetConfig(
+            width=width,
+            height=36.0,
+            depth=24.0,
+            material=MaterialConfig(type=MaterialType.PLYWOOD, thickness=0.75),
+            sections=[SectionConfig(width="fill", shelves=3)],
+        ),
+        room=(
+            RoomConfig(
+                name="test_room",
+                walls=[WallSegmentConfig(length=120.0, height=96.0)],
+            )
+            if with_room
+            else None
+        ),
+    )
+
+
+class TestValidationSession:
+    """Tests for subtree-hash based result reuse."""
+
+    def test_unchanged_config_reuses_results(self) -> None:
+        """Second validation with identical config runs no validators."""
+        ValidatorRegistry.clear()
+        cabinet = _CountingValidator("cab", ("cabinet",))
+        room = _CountingValidator("room", ("room",))
+        ValidatorRegistry.register(cabinet)
+        ValidatorRegistry.register(room)
+        session = ValidationSession()
+
+        ValidatorRegistry.validate_all(_simple_config(), session=session)
+        ValidatorRegistry.validate_all(_simple_config(), session=session)
+
+        assert cabinet.calls == 1
+        assert room.calls == 1
+        assert session.hits == 2
+
+    def test_only_validators_of_changed_subtree_rerun(self) -> None:
+        """Changing the cabinet re-runs cabinet validators only."""
+        ValidatorRegistry.clear()
+        cabinet = _CountingValidator("cab", ("cabinet",))
+        room = _CountingValidator("room", ("room",))
+        ValidatorRegistry.register(cabinet)
+        ValidatorRegistry.register(room)
+        session = ValidationSession()
+
+        ValidatorRegistry.validate_all(_simple_config(48.0), session=session)
+        ValidatorRegistry.validate_all(_simple_config(60.0), session=session)
+
+        assert cabinet.calls == 2
+        assert room.calls == 1
+
+    def test_undeclared_dependencies_rerun_on_any_change(self) -> None:
+        """Validators without dependencies rerun when anything changes."""
+        ValidatorRegistry.clear()
+        everything = _CountingValidator("all", None)
+        ValidatorRegistry.register(everything)
+        session = ValidationSession()
+
+        ValidatorRegistry.validate_all(_simple_config(), session=session)
+        ValidatorRegistry.validate_all(_simple_config(), session=session)
+        ValidatorRegistry.validate_all(_simple_config(with_room=True), session=session)
+
+        assert everything.calls == 2
+
+    def test_cached_results_match_fresh_results(self) -> None:
+        """Reused results are identical to a fresh validation."""
+        config = _simple_config(width=200.0)
+        session = ValidationSession()
+
+        first = validate_config(config, session=session)
+        second = validate_config(config, session=session)
+        fresh = validate_config(config)
+
+        assert second.errors == fresh.errors == first.errors
+        assert second.warnings == fresh.warnings == first.warnings
+
+    def test_builtin_validators_declare_dependencies(self) -> None:
+        """Built-in validators declare the subtrees they read."""
+        assert WoodworkingValidator().dependencies == ("cabinet",)
+        assert ObstacleValidator().dependencies == ("room",)
+        assert SectionDimensionValidator().dependencies == ("cabinet",)
+        assert "infrastructure" in InfrastructureValidator().dependencies
+
+
+class TestConcurrentAndFailFast:
+    """Tests for concurrent execution and fail-fast mode."""
+
+    def test_concurrent_matches_serial(self) -> None:
+        """Running validators on threads gives the same ordered result."""
+        config = _simple_config(width=200.0, with_room=True)
+
+        serial = ValidatorRegistry.validate_all(config)
+        concurrent = ValidatorRegistry.validate_all(config, max_workers=4)
+
+        assert concurrent.errors == serial.errors
+        assert concurrent.warnings == serial.warnings
+
+    def test_fail_fast_stops_after_first_error(self) -> None:
+        """Serial fail-fast skips validators after a blocking error."""
+        ValidatorRegistry.clear()
+        first = _CountingValidator("a_first", ("cabinet",), error=True)
+        second = _CountingValidator("b_second", ("cabinet",))
+        ValidatorRegistry.register(first)
+        ValidatorRegistry.register(second)
+
+        result = ValidatorRegistry.validate_all(_simple_config(), fail_fast=True)
+
+        assert not result.is_valid
+        assert first.calls == 1
+        assert second.calls == 0
+
+    def test_fail_fast_reports_error_when_concurrent(self) -> None:
+        """Concurrent fail-fast still reports the blocking error."""
+        ValidatorRegistry.clear()
+        ValidatorRegistry.register(
+            _CountingValidator("a_first", ("cabinet",), error=True)
+        )
+        ValidatorRegistry.register(_CountingValidator("b_second", ("cabinet",)))
+
+        result = ValidatorRegistry.validate_all(
+            _simple_config(), fail_fast=True, max_workers=2
+        )
+
+        assert [e.path for e in result.errors] == ["a_first"]
+
+    def test_validator_exception_becomes_error(self) -> None:
+        """Exceptions raised on worker threads become validation errors."""
+
+        class _Broken(_CountingValidator):
+            def validate(self, config: CabinetConfiguration) -> ValidationResult:
+                raise RuntimeError("boom")
+
+        ValidatorRegistry.clear()
+        ValidatorRegistry.register(_Broken("broken", None))
+        ValidatorRegistry.register(_CountingValidator("ok", None))
+
+        result = ValidatorRegistry.validate_all(_simple_config(), max_workers=2)
+
+        assert len(result.errors) == 1
+        assert "boom" in result.errors[0].message
+
+
 class TestValidatorProtocolCompliance:
     """Tests to verify validators comply with the Validator protocol."""
 
@@ -0,0 +1,257 @@
+"""Tests for the persistent content-addressed artifact store."""
+
+from __future__ import annotations
+
+import json
+import os
+from importlib import metadata
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from cabinets.application.config import load_config_from_dict
+from cabinets.application.factory import get_factory
+from cabinets.cli.main import app as cli_app
+from cabinets.infrastructure.artifact_store import (
+    ARTIFACT_STORE_ENV,
+    ArtifactStore,
+    artifact_key,
+    artifact_options,
+    configure_artifact_store,
+    exporter_version,
+    get_artifact_store,
+)
+from cabinets.infrastructure.exporters import ExportManager, StlLayoutExporter
+
+CONFIG: dict[str, Any] = {
+    "schema_version": "1.0",
+    "cabinet": {
+        "width": 36.0,
+        "height": 48.0,
+        "depth": 12.0,
+        "sections": [{"shelves": 2}, {"shelves": 3}],
+    },
+}
+
+
+@pytest.fixture
+def shared_store(tmp_path: Path) -> Iterator[ArtifactStore]:
+    """Configure the process-wide store for one test."""
+    store = configure_artifact_store(tmp_path / "store")
+    assert store is not None
+    yield store
+    configure_artifact_store(None)
+
+
+def _age(store: ArtifactStore, key: str, seconds: int) -> None:
+    path = store.path_for(key)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
+class TestArtifactStore:
+    """Tests for ArtifactStore reads, writes and eviction."""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path)
+
+        assert store.get("ab12") is None
+        store.put("ab12", b"data")
+
+        assert store.get("ab12") == b"data"
+        assert store.path_for("ab12") == tmp_path / "ab" / "ab12.artifact"
+        metrics = store.metrics()
+        assert (metrics.hits, metrics.misses, metrics.writes) == (1, 1, 1)
+        assert metrics.hit_rate == 0.5
+
+    def test_get_or_create_calls_create_once(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path)
+        calls: list[int] = []
+
+        def create() -> bytes:
+            calls.append(1)
+            return b"artifact"
+
+        assert store.get_or_create("cd34", create) == b"artifact"
+        assert store.get_or_create("cd34", create) == b"artifact"
+        # A second process sharing the directory sees the artifact too
+        assert ArtifactStore(tmp_path).get_or_create("cd34", create) == b"artifact"
+        assert len(calls) == 1
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path, max_bytes=25)
+        store.put("aa", b"x" * 10)
+        store.put("bb", b"x" * 10)
+        _age(store, "aa", 20)
+        _age(store, "bb", 10)
+        # Reading refreshes "aa", so "bb" is now the oldest
+        store.get("aa")
+
+        store.put("cc", b"x" * 10)
+
+        assert store.get("bb") is None
+        assert store.get("aa") is not None
+        assert store.get("cc") is not None
+        assert store.total_bytes() == 20
+        assert store.metrics().evictions == 1
+
+    def test_writes_under_cap_do_not_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = ArtifactStore(tmp_path, max_bytes=1000)
+        store.put("aa", b"x" * 10)
+        scans = 0
+        entries = store._entries
+
+        def counting_entries() -> list[tuple[Path, int, int]]:
+            nonlocal scans
+            scans += 1
+            return entries()
+
+        monkeypatch.setattr(store, "_entries", counting_entries)
+        for i in range(50):
+            store.put(f"k{i:02d}", b"x" * 10)
+
+        assert scans == 0
+        store.put("big", b"x" * 500)
+        assert scans == 1
+        assert store.metrics().evictions > 0
+        assert store.total_bytes() <= 900
+
+    def test_oversized_artifact_not_stored(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path, max_bytes=4)
+        store.put("aa", b"too large")
+
+        assert store.get("aa") is None
+        assert store.total_bytes() == 0
+
+    def test_write_leaves_no_temporary_files(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path)
+        store.put("aa", b"first")
+        store.put("aa", b"second")
+
+        assert store.get("aa") == b"second"
+        assert [p.name for p in (tmp_path / "aa").iterdir()] == ["aa.artifact"]
+
+    def test_rejects_zero_cap(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            ArtifactStore(tmp_path, max_bytes=0)
+
+
+class TestArtifactKey:
+    """Tests for artifact_key."""
+
+    def test_key_depends_on_source_exporter_and_options(self) -> None:
+        config = load_config_from_dict(CONFIG)
+        other = load_config_from_dict(
+            {**CONFIG, "cabinet": {**CONFIG["cabinet"], "width": 40.0}}
+        )
+        key = artifact_key(config, StlLayoutExporter)
+
+        assert key == artifact_key(load_config_from_dict(CONFIG), StlLayoutExporter)
+        assert len(key) == 64
+        assert key != artifact_key(other, StlLayoutExporter)
+        assert key != artifact_key(config, StlLayoutExporter, curve_lod="full")
+        assert key != artifact_key(config, ExportManager)
+
+    def test_version_includes_installed_package_version(self) -> None:
+        installed = metadata.version("builtin-cabinets-and-shelves")
+
+        version = exporter_version(StlLayoutExporter)
+
+        assert version.startswith(f"{installed}:")
+        assert "0+unknown" not in version
+
+    def test_options_resolve_exporter_defaults(self) -> None:
+        default = artifact_options(StlLayoutExporter())
+
+        assert default == artifact_options(StlLayoutExporter(curve_lod="full"))
+        assert default != artifact_options(StlLayoutExporter(curve_lod="preview"))
+        assert artifact_options(ExportManager(Path("."))) is None
+
+
+class TestProcessStore:
+    """Tests for the process-wide store configuration."""
+
+    def test_configured_from_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(ARTIFACT_STORE_ENV, str(tmp_path))
+        monkeypatch.setattr(
+            "cabinets.infrastructure.artifact_store._default_store_configured",
+            False,
+        )
+        try:
+            store = get_artifact_store()
+            assert store is not None
+            assert store.root == tmp_path
+        finally:
+            configure_artifact_store(None)
+
+
+class TestExportManagerStore:
+    """Tests for ExportManager reuse of stored artifacts."""
+
+    def test_second_export_served_from_store(self, tmp_path: Path) -> None:
+        config = load_config_from_dict(CONFIG)
+        output = get_factory().create_generate_command().execute_from_config(config)
+        store = ArtifactStore(tmp_path / "store")
+
+        first = ExportManager(tmp_path / "a", artifact_store=store).export_all(
+            ["stl", "json"], output, source=config
+        )
+        second = ExportManager(tmp_path / "b", artifact_store=store).export_all(
+            ["stl", "json"], output, source=config
+        )
+
+        assert store.metrics().writes == 2
+        assert store.metrics().hits == 2
+        for fmt in ("stl", "json"):
+            assert first[fmt].read_bytes() == second[fmt].read_bytes()
+
+    def test_without_source_store_is_unused(self, tmp_path: Path) -> None:
+        config = load_config_from_dict(CONFIG)
+        output = get_factory().create_generate_command().execute_from_config(config)
+        store = ArtifactStore(tmp_path / "store")
+
+        ExportManager(tmp_path / "out", artifact_store=store).export_all(
+            ["stl"], output
+        )
+
+        assert store.total_bytes() == 0
+
+
+class TestSharedStore:
+    """Tests for the CLI filling the process-wide store."""
+
+    def test_cli_fills_store(self, tmp_path: Path, shared_store: ArtifactStore) -> None:
+        config_file = tmp_path / "cabinet.json"
+        config_file.write_text(json.dumps(CONFIG))
+        args = [
+            "generate",
+            "--config",
+            str(config_file),
+            "--output-formats",
+            "stl,bom",
+            "--output-dir",
+            str(tmp_path / "out"),
+        ]
+
+        assert CliRunner().invoke(cli_app, args).exit_code == 0
+        assert shared_store.metrics().writes == 2
+        assert CliRunner().invoke(cli_app, args).exit_code == 0
+        assert shared_store.metrics().hits == 2
+
+
+class TestExecuteFromConfig:
+    """Tests for GenerateLayoutCommand.execute_from_config."""
+
+    def test_single_cabinet(self) -> None:
+        config = load_config_from_dict(CONFIG)
+        output = get_factory().create_generate_command().execute_from_config(config)
+
+        assert output.is_valid
+        assert len(output.cabinet.sections) == 2
@@ -0,0 +1,92 @@
+"""Tests for the API serving artifacts from the shared artifact store."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from cabinets.application.config import load_config_from_dict
+from cabinets.cli.main import app as cli_app
+from cabinets.infrastructure.artifact_store import (
+    ArtifactStore,
+    artifact_key,
+    artifact_options,
+    configure_artifact_store,
+)
+from cabinets.infrastructure.exporters import StlLayoutExporter
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from cabinets.web.app import create_app  # noqa: E402
+
+CONFIG: dict[str, Any] = {
+    "schema_version": "1.0",
+    "cabinet": {
+        "width": 36.0,
+        "height": 48.0,
+        "depth": 12.0,
+        "sections": [{"shelves": 2}, {"shelves": 3}],
+    },
+}
+
+
+@pytest.fixture
+def shared_store(tmp_path: Path) -> Iterator[ArtifactStore]:
+    """Configure the process-wide store for one test."""
+    store = configure_artifact_store(tmp_path / "store")
+    assert store is not None
+    yield store
+    configure_artifact_store(None)
+
+
+class TestSharedStoreApi:
+    """Tests for sharing artifacts between the CLI and the API."""
+
+    def test_api_reuses_cli_artifact(
+        self, tmp_path: Path, shared_store: ArtifactStore
+    ) -> None:
+        config_file = tmp_path / "cabinet.json"
+        config_file.write_text(json.dumps(CONFIG))
+        out = tmp_path / "out"
+        args = ["generate", "--config", str(config_file), "--output-formats"]
+        args += ["stl,glb", "--output-dir", str(out), "--project-name", "cab"]
+        assert CliRunner().invoke(cli_app, args).exit_code == 0
+        writes = shared_store.metrics().writes
+
+        client = TestClient(create_app())
+        stl = client.post(
+            "/api/v1/export/stl-from-config?lod=full", json={"config": CONFIG}
+        )
+        glb = client.post("/api/v1/export/glb-from-config", json={"config": CONFIG})
+
+        assert stl.content == (out / "cab_stl.stl").read_bytes()
+        assert glb.content == (out / "cab_glb.glb").read_bytes()
+        assert shared_store.metrics().writes == writes
+        assert shared_store.metrics().hits == 2
+
+    def test_api_etag_is_store_key(self, shared_store: ArtifactStore) -> None:
+        config = load_config_from_dict(CONFIG)
+        options = artifact_options(StlLayoutExporter(curve_lod="preview"))
+        assert options is not None
+        key = artifact_key(config, StlLayoutExporter, **options)
+        shared_store.put(key, b"solid stored\nendsolid stored\n")
+
+        response = TestClient(create_app()).post(
+            "/api/v1/export/stl-from-config", json={"config": CONFIG}
+        )
+
+        assert response.status_code == 200
+        assert response.content == b"solid stored\nendsolid stored\n"
+        assert response.headers["etag"] == f'"{key[:32]}"'
+
+    def test_metrics_endpoint_reports_store(self, shared_store: ArtifactStore) -> None:
+        response = TestClient(create_app()).get("/metrics")
+
+        assert response.json()["artifact_store"]["max_bytes"] == shared_store.max_bytes
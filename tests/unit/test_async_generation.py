@@ -0,0 +1,126 @@
+"""Tests for the async generation facade."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cabinets.application.config import load_config
+from cabinets.application.factory import get_factory
+from cabinets.application.services import (
+    AsyncGenerationService,
+    StageDeadlines,
+    StageTimeoutError,
+)
+from cabinets.infrastructure.exporters import BomGenerator, StlLayoutExporter
+
+CONFIG_PATH = (
+    Path(__file__).parent.parent / "fixtures" / "configs" / "valid_minimal.json"
+)
+
+
+@pytest.fixture
+def service() -> Iterator[AsyncGenerationService]:
+    service = AsyncGenerationService(get_factory().create_generate_command())
+    yield service
+    service.close()
+
+
+class TestAsyncGenerationService:
+    """Tests for AsyncGenerationService stages."""
+
+    async def test_generate_matches_command(
+        self, service: AsyncGenerationService
+    ) -> None:
+        config = load_config(CONFIG_PATH)
+
+        output = await service.generate(config)
+
+        expected = service.command.execute_from_config(config)
+        assert output.is_valid
+        assert output.cut_list == expected.cut_list
+
+    async def test_stages_run_concurrently(
+        self, service: AsyncGenerationService
+    ) -> None:
+        output = await service.generate(load_config(CONFIG_PATH))
+        packing, bom, stl = await service.gather(
+            service.pack(output.cut_list),
+            service.export_string(BomGenerator(), output),
+            service.export_bytes(StlLayoutExporter(), output, ".stl"),
+        )
+
+        assert packing.total_sheets > 0
+        assert bom.strip()
+        assert stl
+
+    async def test_stage_deadline(self) -> None:
+        service = AsyncGenerationService(
+            get_factory().create_generate_command(),
+            deadlines=StageDeadlines(export=0.01),
+        )
+
+        with pytest.raises(StageTimeoutError) as exc_info:
+            await service.run_blocking("export", time.sleep, 0.5)
+        service.close()
+
+        assert exc_info.value.stage == "export"
+        assert exc_info.value.timeout == 0.01
+
+    async def test_failed_stage_cancels_others(
+        self, service: AsyncGenerationService
+    ) -> None:
+        cancelled = asyncio.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def failing() -> None:
+            raise ValueError("bad cut list")
+
+        with pytest.raises(ValueError, match="bad cut list"):
+            await service.gather(slow(), failing())
+
+        assert cancelled.is_set()
+
+    async def test_cancel_drops_queued_stage(self) -> None:
+        service = AsyncGenerationService(
+            get_factory().create_generate_command(), max_workers=1
+        )
+        release = threading.Event()
+        ran: list[str] = []
+        blocker = asyncio.create_task(service.run_blocking("pack", release.wait))
+        queued = asyncio.create_task(
+            service.run_blocking("export", ran.append, "export")
+        )
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        await blocker
+        service.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert ran == []
+
+    async def test_assembly_awaited_on_loop(
+        self, service: AsyncGenerationService
+    ) -> None:
+        generator = AsyncMock()
+        generator.generate.return_value = "# Assembly"
+        output = await service.generate(load_config(CONFIG_PATH))
+
+        assert await service.assembly_instructions(generator, output) == "# Assembly"
+        generator.generate.assert_awaited_once_with(output)
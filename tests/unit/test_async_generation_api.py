@@ -0,0 +1,43 @@
+"""Tests for the web tier's use of the async generation facade."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cabinets.application.config import load_config
+from cabinets.application.factory import get_factory
+from cabinets.application.services import AsyncGenerationService, StageDeadlines
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from cabinets.web.app import create_app  # noqa: E402
+from cabinets.web.dependencies import get_generation_service  # noqa: E402
+
+CONFIG_PATH = (
+    Path(__file__).parent.parent / "fixtures" / "configs" / "valid_minimal.json"
+)
+
+
+class TestStageTimeoutResponse:
+    """Tests for the web tier's handling of stage deadlines."""
+
+    def test_timed_out_stage_returns_504(self) -> None:
+        app = create_app()
+        slow = AsyncGenerationService(
+            get_factory().create_generate_command(),
+            deadlines=StageDeadlines(generate=1e-9),
+        )
+        app.dependency_overrides[get_generation_service] = lambda: slow
+
+        response = TestClient(app).post(
+            "/api/v1/generate/from-config",
+            json={"config": load_config(CONFIG_PATH).model_dump(mode="json")},
+        )
+        slow.close()
+
+        assert response.status_code == 504
+        assert response.json()["error_type"] == "stage_timeout"
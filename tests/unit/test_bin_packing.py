@@ -2948,3 +2948,44 @@ class TestPackingResultEdgeCases:
             sheets_by_material={standard_material: 1},
         )
         assert result.total_waste_percentage == 100.0
+
+
+class TestGuillotineBinPackerCountSheets:
+    """Tests for the layout-free sheet count used by optimizers."""
+
+    def _pieces(self, material: MaterialSpec, quantity: int) -> list[CutPiece]:
+        return [
+            CutPiece(
+                width=23.0,
+                height=30.0,
+                quantity=quantity,
+                label="Shelf",
+                panel_type=PanelType.SHELF,
+                material=material,
+            )
+        ]
+
+    def test_matches_pack(
+        self, packer: GuillotineBinPacker, standard_material: MaterialSpec
+    ) -> None:
+        """count_sheets agrees with the number of layouts from pack()."""
+        pieces = self._pieces(standard_material, 20)
+
+        result = packer.pack(pieces, standard_material)
+
+        assert packer.count_sheets(pieces) == result.total_sheets
+
+    def test_empty_is_zero(self, packer: GuillotineBinPacker) -> None:
+        """No pieces need no sheets."""
+        assert packer.count_sheets([]) == 0
+
+    def test_sheet_limit_aborts(
+        self, packer: GuillotineBinPacker, standard_material: MaterialSpec
+    ) -> None:
+        """Exceeding sheet_limit returns None instead of a count."""
+        pieces = self._pieces(standard_material, 20)
+        needed = packer.count_sheets(pieces)
+        assert needed is not None and needed > 1
+
+        assert packer.count_sheets(pieces, sheet_limit=needed - 1) is None
+        assert packer.count_sheets(pieces, sheet_limit=needed) == needed
@@ -0,0 +1,163 @@
+"""Unit tests for CeilingField batch ceiling queries."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from cabinets.domain.services import (
+    CeilingField,
+    RadialCeilingService,
+    SkylightVoidService,
+    SlopedCeilingService,
+)
+from cabinets.domain.value_objects import BayAlcoveConfig, CeilingSlope, Skylight
+
+
+def _bay_config() -> BayAlcoveConfig:
+    return BayAlcoveConfig(
+        bay_type="five_wall",
+        walls=tuple({"length": length} for length in (30.0, 40.0, 48.0, 40.0, 30.0)),
+        opening_width=None,
+        bay_depth=None,
+        arc_angle=None,
+        segment_count=None,
+        apex=None,
+        apex_mode="auto",
+        edge_height=84.0,
+        min_cabinet_width=12.0,
+        filler_treatment="panel",
+        sill_clearance=2.0,
+        head_clearance=2.0,
+        seat_surface_style="flat",
+        flank_integration="separate",
+        top_style=None,
+        shelf_alignment="rectangular",
+    )
+
+
+class TestSlopeField:
+    """Tests for sloped ceiling queries."""
+
+    @pytest.mark.parametrize("direction", ["left_to_right", "right_to_left"])
+    def test_matches_height_at_position(self, direction: str) -> None:
+        slope = CeilingSlope(
+            angle=35, start_height=96, direction=direction, min_height=30
+        )
+        field = CeilingField(slope=slope, wall_length=120.0)
+        xs = np.linspace(0.0, 120.0, 241)
+
+        heights = field.slope_heights(xs, clamp=False)
+
+        for x, height in zip(xs.tolist(), heights.tolist()):
+            position = 120.0 - x if direction == "right_to_left" else x
+            assert height == slope.height_at_position(position)
+        assert field.slope_heights(xs).min() == 30
+
+    def test_section_heights_match_service(self) -> None:
+        rng = random.Random(3)
+        slope = CeilingSlope(angle=40, start_height=90, direction="right_to_left")
+        widths = [rng.uniform(6.0, 30.0) for _ in range(200)]
+        wall_length = sum(widths)
+
+        heights = CeilingField(slope, wall_length).section_heights(widths)
+
+        # Reference: scalar evaluation at each section midpoint
+        expected = []
+        position = 0.0
+        for width in widths:
+            height = slope.height_at_position(wall_length - (position + width / 2))
+            expected.append(max(height, slope.min_height))
+            position += width
+        assert heights.tolist() == expected
+
+    def test_batch_edge_heights_match_single_section(self) -> None:
+        service = SlopedCeilingService()
+        slope = CeilingSlope(angle=30, start_height=96, direction="left_to_right")
+        widths = [24.0, 18.0, 30.0]
+
+        batch = service.calculate_all_section_edge_heights(widths, slope, 72.0)
+        specs = service.generate_taper_specs(widths, slope, 72.0)
+
+        assert batch == [
+            service.calculate_section_edge_heights(0.0, 24.0, slope, 72.0),
+            service.calculate_section_edge_heights(24.0, 18.0, slope, 72.0),
+            service.calculate_section_edge_heights(42.0, 30.0, slope, 72.0),
+        ]
+        assert specs[1] == service.generate_taper_spec(24.0, 18.0, slope, 72.0)
+
+    def test_for_room_shares_field(self) -> None:
+        slope = CeilingSlope(angle=20, start_height=90, direction="left_to_right")
+
+        assert CeilingField.for_room(slope, 96) is CeilingField.for_room(slope, 96.0)
+
+    def test_requires_slope(self) -> None:
+        with pytest.raises(ValueError, match="no sloped ceiling"):
+            CeilingField().slope_heights([1.0])
+
+
+class TestSkylightField:
+    """Tests for skylight void queries."""
+
+    def test_sections_with_voids_match_per_section(self) -> None:
+        service = SkylightVoidService()
+        skylights = [
+            Skylight(x_position=10.0, width=20.0, projection_depth=6.0),
+            Skylight(
+                x_position=50.0, width=12.0, projection_depth=4.0, projection_angle=60
+            ),
+        ]
+        specs = [(0.0, 24.0), (24.0, 24.0), (48.0, 24.0), (72.0, 24.0)]
+
+        result = service.get_sections_with_voids(skylights, specs, 12.0)
+
+        assert sorted(result) == [0, 1, 2]
+        for i, (x, width) in enumerate(specs):
+            expected = [
+                notch
+                for skylight in skylights
+                if (
+                    notch := service.calculate_void_intersection(
+                        skylight, x, width, 12.0
+                    )
+                )
+                is not None
+            ]
+            assert result.get(i, []) == expected
+
+    def test_voids_cached_per_depth(self) -> None:
+        field = CeilingField(
+            skylights=[Skylight(x_position=10.0, width=20.0, projection_depth=6.0)]
+        )
+
+        assert field.skylight_voids(12.0) is field.skylight_voids(12.0)
+        starts, ends = field.skylight_voids(12.0)
+        assert starts.tolist() == [10.0]
+        assert ends.tolist() == [30.0]
+
+
+class TestRadialField:
+    """Tests for radial ceiling queries."""
+
+    def test_matches_height_at_point(self) -> None:
+        service = RadialCeilingService(_bay_config())
+        geometry = service.build_radial_ceiling_geometry()
+        rng = np.random.default_rng(11)
+        xs = rng.uniform(-20.0, 80.0, 2000)
+        ys = rng.uniform(-10.0, 90.0, 2000)
+
+        heights = service.get_ceiling_heights_at(xs, ys)
+
+        assert heights.tolist() == [
+            geometry.height_at_point(x, y) for x, y in zip(xs.tolist(), ys.tolist())
+        ]
+
+    def test_field_cached_until_invalidated(self) -> None:
+        service = RadialCeilingService(_bay_config())
+        field = service.build_ceiling_field()
+
+        assert service.build_ceiling_field() is field
+        service.invalidate_cache()
+        assert service.build_ceiling_field() is not field
@@ -0,0 +1,168 @@
+"""Unit tests for the cached configuration parser.
+
+These tests verify:
+- Identical raw JSON, envelopes and dicts are served from the cache
+- LRU eviction bounds the cache size
+- Invalid input raises ConfigError with readable paths and is not cached
+- Parse metrics track hits, misses and parse time
+"""
+
+import json
+
+import pytest
+
+from cabinets.application.config import (
+    CabinetConfiguration,
+    ConfigError,
+    ConfigParseCache,
+)
+
+
+MINIMAL = {
+    "schema_version": "1.0",
+    "cabinet": {"width": 48.0, "height": 84.0, "depth": 12.0},
+}
+
+
+def _config(width: float) -> dict:
+    data = json.loads(json.dumps(MINIMAL))
+    data["cabinet"]["width"] = width
+    return data
+
+
+class TestConfigParseCache:
+    """Tests for ConfigParseCache lookups."""
+
+    def test_parse_json_returns_configuration(self) -> None:
+        """Raw JSON bytes are validated into a CabinetConfiguration."""
+        cache = ConfigParseCache()
+
+        config = cache.parse_json(json.dumps(MINIMAL).encode())
+
+        assert isinstance(config, CabinetConfiguration)
+        assert config.cabinet.width == 48.0
+
+    def test_repeat_json_is_cache_hit(self) -> None:
+        """Parsing identical bytes twice returns the cached instance."""
+        cache = ConfigParseCache()
+        raw = json.dumps(MINIMAL).encode()
+
+        first = cache.parse_json(raw)
+        second = cache.parse_json(raw)
+
+        assert first is second
+        metrics = cache.metrics()
+        assert metrics.hits == 1
+        assert metrics.misses == 1
+
+    def test_envelope_extracts_config(self) -> None:
+        """Request bodies of the form {"config": ...} are unwrapped."""
+        cache = ConfigParseCache()
+        body = json.dumps({"config": MINIMAL}).encode()
+
+        config = cache.parse_envelope(body)
+
+        assert config.cabinet.height == 84.0
+        assert cache.parse_envelope(body) is config
+
+    def test_dict_key_ignores_key_order(self) -> None:
+        """Dicts with the same content in a different order share an entry."""
+        cache = ConfigParseCache()
+        reordered = {"cabinet": MINIMAL["cabinet"], "schema_version": "1.0"}
+
+        first = cache.parse_dict(MINIMAL)
+        second = cache.parse_dict(reordered)
+
+        assert first is second
+
+    def test_lru_eviction(self) -> None:
+        """Least recently used entries are evicted beyond max_size."""
+        cache = ConfigParseCache(max_size=2)
+
+        a = cache.parse_dict(_config(30.0))
+        cache.parse_dict(_config(40.0))
+        cache.parse_dict(_config(30.0))  # refresh a
+        cache.parse_dict(_config(50.0))  # evicts 40
+
+        assert cache.metrics().size == 2
+        assert cache.parse_dict(_config(30.0)) is a
+        misses_before = cache.metrics().misses
+        cache.parse_dict(_config(40.0))
+        assert cache.metrics().misses == misses_before + 1
+
+    def test_invalid_max_size_rejected(self) -> None:
+        """max_size must be positive."""
+        with pytest.raises(ValueError):
+            ConfigParseCache(max_size=0)
+
+    def test_clear_resets_entries_and_metrics(self) -> None:
+        """clear() empties the cache and zeroes statistics."""
+        cache = ConfigParseCache()
+        cache.parse_dict(MINIMAL)
+
+        cache.clear()
+
+        metrics = cache.metrics()
+        assert metrics.size == 0
+        assert metrics.misses == 0
+
+
+class TestConfigParseCacheErrors:
+    """Tests for error reporting from the cached parser."""
+
+    def test_malformed_json_raises_json_parse_error(self) -> None:
+        """Malformed JSON raises ConfigError with json_parse type."""
+        cache = ConfigParseCache()
+
+        with pytest.raises(ConfigError) as exc_info:
+            cache.parse_json(b'{"schema_version": ')
+
+        assert exc_info.value.error_type == "json_parse"
+
+    def test_validation_error_paths_strip_envelope(self) -> None:
+        """Envelope errors report paths relative to the configuration."""
+        cache = ConfigParseCache()
+        bad = _config(-1.0)
+
+        with pytest.raises(ConfigError) as exc_info:
+            cache.parse_envelope(json.dumps({"config": bad}).encode())
+
+        assert exc_info.value.error_type == "validation"
+        assert any(d["path"] == "cabinet.width" for d in exc_info.value.details)
+
+    def test_failures_are_not_cached(self) -> None:
+        """Invalid input is re-validated (and re-raised) every time."""
+        cache = ConfigParseCache()
+        raw = json.dumps(_config(-1.0)).encode()
+
+        for _ in range(2):
+            with pytest.raises(ConfigError):
+                cache.parse_json(raw)
+
+        metrics = cache.metrics()
+        assert metrics.size == 0
+        assert metrics.misses == 2
+
+
+class TestParseMetrics:
+    """Tests for ParseMetrics reporting."""
+
+    def test_parse_time_recorded(self) -> None:
+        """Misses accumulate parse time."""
+        cache = ConfigParseCache()
+        cache.parse_dict(MINIMAL)
+
+        metrics = cache.metrics()
+        assert metrics.total_parse_seconds > 0
+        assert metrics.last_parse_seconds > 0
+
+    def test_to_dict_reports_hit_rate(self) -> None:
+        """to_dict() includes hit rate and millisecond timings."""
+        cache = ConfigParseCache()
+        cache.parse_dict(MINIMAL)
+        cache.parse_dict(MINIMAL)
+
+        data = cache.metrics().to_dict()
+
+        assert data["hit_rate"] == 0.5
+        assert "total_parse_ms" in data
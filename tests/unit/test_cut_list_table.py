@@ -0,0 +1,150 @@
+"""Tests for the columnar CutListTable."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from cabinets.domain.services import MaterialEstimator
+from cabinets.domain.value_objects import (
+    CutListTable,
+    CutPiece,
+    MaterialSpec,
+    MaterialType,
+    PanelType,
+)
+from cabinets.infrastructure.bin_packing import (
+    BinPackingConfig,
+    BinPackingService,
+    GuillotineBinPacker,
+)
+
+THREE_QUARTER = MaterialSpec.standard_3_4()
+HALF = MaterialSpec(thickness=0.5, material_type=MaterialType.PLYWOOD)
+
+
+def _pieces() -> list[CutPiece]:
+    grain = {"grain_direction": "length"}
+    return [
+        CutPiece(30.0, 12.0, 2, "Side", PanelType.LEFT_SIDE, THREE_QUARTER, grain),
+        CutPiece(34.5, 11.25, 3, "Shelf", PanelType.SHELF, THREE_QUARTER),
+        CutPiece(36.0, 30.0, 1, "Back", PanelType.BACK, HALF),
+        CutPiece(30.0, 12.0, 1, "Side", PanelType.RIGHT_SIDE, THREE_QUARTER, grain),
+    ]
+
+
+def _random_pieces(count: int, seed: int = 7) -> list[CutPiece]:
+    rng = random.Random(seed)
+    return [
+        CutPiece(
+            width=round(rng.uniform(2.0, 40.0), 3),
+            height=round(rng.uniform(2.0, 90.0), 3),
+            quantity=rng.randint(1, 3),
+            label=f"P{rng.randint(0, 50)}",
+            panel_type=rng.choice([PanelType.SHELF, PanelType.DIVIDER]),
+            material=rng.choice([THREE_QUARTER, HALF]),
+        )
+        for _ in range(count)
+    ]
+
+
+class TestCutListTable:
+    """Tests for CutListTable conversion and aggregation."""
+
+    def test_round_trip(self) -> None:
+        pieces = _pieces()
+        table = CutListTable.from_pieces(pieces)
+
+        assert len(table) == 4
+        assert table.to_pieces() == pieces
+        assert table.total_quantity == 7
+
+    def test_side_tables_are_interned(self) -> None:
+        table = CutListTable.from_pieces(_pieces())
+
+        assert table.labels == ("Side", "Shelf", "Back")
+        assert table.materials == (THREE_QUARTER, HALF)
+        # Both sides share one metadata dict
+        assert len(table.metadata) == 1
+        assert table.metadata_codes.tolist() == [0, -1, -1, 0]
+
+    def test_area_by_material_matches_piece_sums(self) -> None:
+        pieces = _random_pieces(500)
+        table = CutListTable.from_pieces(pieces)
+
+        expected: dict[MaterialSpec, float] = {}
+        for piece in pieces:
+            expected[piece.material] = expected.get(piece.material, 0) + piece.area
+        assert table.area_by_material() == expected
+        assert table.total_area() == sum(p.area for p in pieces)
+
+    def test_group_by_material(self) -> None:
+        groups = CutListTable.from_pieces(_pieces()).group_by_material()
+
+        assert list(groups) == [THREE_QUARTER, HALF]
+        assert [p.label for p in groups[THREE_QUARTER].to_pieces()] == [
+            "Side",
+            "Shelf",
+            "Side",
+        ]
+        assert groups[HALF].widths.tolist() == [36.0]
+
+    def test_empty_table(self) -> None:
+        table = CutListTable.from_pieces([])
+
+        assert len(table) == 0
+        assert table.total_area() == 0
+        assert table.area_by_material() == {}
+        assert table.group_by_material() == {}
+
+
+class TestCutListTableConsumers:
+    """Tests that consumers give identical results for tables and lists."""
+
+    def test_material_estimator(self) -> None:
+        pieces = _random_pieces(200)
+        table = CutListTable.from_pieces(pieces)
+        estimator = MaterialEstimator()
+
+        assert estimator.estimate(table) == estimator.estimate(pieces)
+        assert estimator.estimate_total(table) == estimator.estimate_total(pieces)
+
+    def test_packer_accepts_table(self) -> None:
+        pieces = [p for p in _random_pieces(300) if p.material == THREE_QUARTER]
+        packer = GuillotineBinPacker(BinPackingConfig())
+        table = CutListTable.from_pieces(pieces)
+
+        from_list = packer.pack(pieces, THREE_QUARTER)
+        from_table = packer.pack(table, THREE_QUARTER)
+
+        assert from_table == from_list
+        assert packer.count_sheets(table) == from_list.total_sheets
+        assert sum(len(layout.placements) for layout in from_table.layouts) == int(
+            np.sum(table.quantities)
+        )
+
+    def test_packing_order_numbers_units(self) -> None:
+        packer = GuillotineBinPacker(BinPackingConfig())
+        table = CutListTable.from_pieces(_pieces())
+
+        labels = [p.label for p in packer._packing_order(table)]
+
+        assert labels == [
+            "Back",
+            "Shelf #1",
+            "Shelf #2",
+            "Shelf #3",
+            "Side #1",
+            "Side #2",
+            "Side",
+        ]
+
+    def test_service_packs_large_table(self) -> None:
+        table = CutListTable.from_pieces(_random_pieces(1_000))
+
+        result = BinPackingService(BinPackingConfig()).optimize_cut_list(table)
+
+        placed = sum(len(layout.placements) for layout in result.layouts)
+        assert placed == table.total_quantity
+        assert set(result.sheets_by_material) == {THREE_QUARTER, HALF}
@@ -0,0 +1,205 @@
+"""Tests for the per-panel cutout index and cross-component validation."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from cabinets.domain.components import (
+    CableManagementComponent,
+    ComponentContext,
+    CutoutIndex,
+    ElectricalComponent,
+    check_infrastructure_conflicts,
+)
+from cabinets.domain.value_objects import (
+    MaterialSpec,
+    PanelCutout,
+    PanelType,
+    Point2D,
+    Position,
+)
+
+
+@pytest.fixture
+def context() -> ComponentContext:
+    """Create a component context for a 48x84x12 cabinet."""
+    return ComponentContext(
+        width=48.0,
+        height=84.0,
+        depth=12.0,
+        material=MaterialSpec.standard_3_4(),
+        position=Position(0, 0),
+        section_index=0,
+        cabinet_width=48.0,
+        cabinet_height=84.0,
+        cabinet_depth=12.0,
+    )
+
+
+def _brute_force_pairs(index: CutoutIndex) -> set[tuple[int, int]]:
+    pairs: set[tuple[int, int]] = set()
+    for panel in index.panels:
+        for a, b in itertools.combinations(index.cutouts(panel), 2):
+            if (
+                a.left < b.right
+                and b.left < a.right
+                and a.bottom < b.top
+                and b.bottom < a.top
+            ):
+                pairs.add((a.sequence, b.sequence))
+    return pairs
+
+
+class TestCutoutIndex:
+    """Tests for CutoutIndex overlap and edge checks."""
+
+    def test_matches_all_pairs_comparison(self) -> None:
+        rng = random.Random(7)
+        index = CutoutIndex()
+        for i in range(300):
+            index.add_centered(
+                "grommets",
+                i,
+                rng.choice(["back", "bottom"]),
+                "grommet",
+                (rng.uniform(0, 96), rng.uniform(0, 84)),
+                rng.choice([2.0, 2.5, 3.0]),
+                rng.choice([2.0, 2.5, 3.0]),
+            )
+
+        pairs = [(c.first.sequence, c.second.sequence) for c in index.overlaps()]
+
+        assert set(pairs) == _brute_force_pairs(index)
+        assert pairs == sorted(pairs)
+
+    def test_mixed_heights_in_shared_column(self) -> None:
+        """Tall and short cutouts sharing one x-range match all pairs."""
+        rng = random.Random(11)
+        index = CutoutIndex()
+        for i in range(200):
+            index.add_centered(
+                "av",
+                i,
+                "back",
+                rng.choice(["grommet", "vent"]),
+                (rng.choice([10.0, 10.5]), rng.uniform(0, 84)),
+                2.0,
+                rng.choice([1.0, 2.0, 30.0]),
+            )
+
+        pairs = {(c.first.sequence, c.second.sequence) for c in index.overlaps()}
+
+        assert pairs == _brute_force_pairs(index)
+
+    def test_grommet_column_overlaps_neighbours_only(self) -> None:
+        """A column of grommets reports only adjacent overlapping pairs."""
+        index = CutoutIndex()
+        for i in range(1000):
+            index.add_centered("av", i, "back", "grommet", (10.0, 1.5 * i), 2.0, 2.0)
+
+        pairs = [(c.first.sequence, c.second.sequence) for c in index.overlaps()]
+
+        assert pairs == [(i, i + 1) for i in range(999)]
+
+    def test_touching_cutouts_do_not_overlap(self) -> None:
+        index = CutoutIndex()
+        index.add("a", 0, "back", "outlet", 0.0, 0.0, 2.0, 2.0)
+        index.add("a", 1, "back", "outlet", 2.0, 0.0, 4.0, 2.0)
+        index.add("a", 2, "back", "outlet", 0.0, 2.0, 2.0, 4.0)
+
+        assert index.overlaps() == []
+
+    def test_different_panels_do_not_overlap(self) -> None:
+        index = CutoutIndex()
+        index.add("a", 0, "back", "outlet", 0.0, 0.0, 2.0, 2.0)
+        index.add("a", 1, "left_side", "outlet", 0.0, 0.0, 2.0, 2.0)
+
+        assert index.overlaps() == []
+
+    def test_cross_component_conflicts(self) -> None:
+        index = CutoutIndex()
+        index.add_centered("electrical", 0, "back", "outlet", (10, 40), 2.75, 4.5)
+        index.add_centered("electrical", 1, "back", "outlet", (11, 41), 2.75, 4.5)
+        index.add_centered("cable", 0, "back", "grommet", (10, 40), 2.5, 2.5)
+
+        assert len(index.overlaps()) == 3
+        cross = index.cross_component_conflicts()
+        assert len(cross) == 2
+        assert all(c.second.source == "cable" for c in cross)
+        assert "overlaps with cable cutout 0 (grommet) on back" in cross[0].message
+
+    def test_edge_violations(self) -> None:
+        index = CutoutIndex()
+        index.add_centered("a", 0, "back", "grommet", (1.5, 40), 2.0, 2.0)
+        index.add_centered("a", 1, "back", "grommet", (24, 40), 2.0, 2.0)
+        index.add_centered("a", 2, "back", "grommet", (24, 82.5), 2.0, 2.0)
+        index.add_centered("a", 3, "top", "grommet", (1.5, 6), 2.0, 2.0)
+
+        violations = index.edge_violations({"back": (48.0, 84.0)}, 1.0)
+
+        assert [c.index for c in violations] == [0, 2]
+
+
+class TestInfrastructureConflicts:
+    """Tests for validating several infrastructure components together."""
+
+    def test_grommet_through_outlet_reported(self, context: ComponentContext) -> None:
+        electrical = ElectricalComponent().generate(
+            {"type": "single", "panel": "back", "position": {"x": 20, "y": 40}},
+            context,
+        )
+        cable = CableManagementComponent().generate(
+            {
+                "grommets": [
+                    {"size": 2.5, "panel": "back", "position": {"x": 20, "y": 41}},
+                    {"size": 2.5, "panel": "back", "position": {"x": 40, "y": 41}},
+                ]
+            },
+            context,
+        )
+
+        result = check_infrastructure_conflicts(
+            {
+                "infrastructure.electrical": electrical,
+                "infrastructure.cable_management": cable,
+            },
+            context,
+        )
+
+        assert not result.is_valid
+        assert len(result.errors) == 1
+        assert "infrastructure.cable_management cutout 0" in result.errors[0]
+
+    def test_edge_distance_reported(self, context: ComponentContext) -> None:
+        cable = CableManagementComponent().generate(
+            {
+                "grommets": [
+                    {"size": 2.5, "panel": "back", "position": {"x": 1, "y": 40}}
+                ]
+            },
+            context,
+        )
+
+        result = check_infrastructure_conflicts({"cable": cable}, context)
+
+        assert len(result.errors) == 1
+        assert "edge of the back panel" in result.errors[0]
+
+    def test_component_overlap_check(self) -> None:
+        cutouts = [
+            PanelCutout(
+                cutout_type="grommet",
+                panel=PanelType.BACK,
+                position=Point2D(x, 40),
+                width=2.0,
+                height=2.0,
+            )
+            for x in (10.0, 11.0, 30.0)
+        ]
+
+        errors = CableManagementComponent()._check_cutout_overlap(cutouts)
+
+        assert errors == ["Cutout 0 (grommet) overlaps with cutout 1 (grommet) on back"]
@@ -0,0 +1,221 @@
+"""Tests for the design-space sweep service and CLI command."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from cabinets.application.dtos import WallInput
+from cabinets.application.services import (
+    DesignSweepService,
+    SheetPricing,
+    SweepPoint,
+    SweepRanges,
+    SweepRow,
+)
+from cabinets.application.services.design_sweep import MAX_SWEEP_POINTS
+from cabinets.cli.main import app
+
+runner = CliRunner()
+
+WALL = WallInput(width=48.0, height=60.0, depth=12.0)
+
+
+def _row(cost: float, sheets: int, weight: float, capacity: float) -> SweepRow:
+    return SweepRow(
+        point=SweepPoint(0.75, 1, 1),
+        cost=cost,
+        sheet_count=sheets,
+        weight_lbs=weight,
+        min_shelf_capacity_lbs=capacity,
+    )
+
+
+class TestSweepRanges:
+    """Tests for SweepRanges validation and expansion."""
+
+    def test_points_are_deduplicated_product(self) -> None:
+        ranges = SweepRanges(
+            thicknesses=(0.75, 0.625, 0.75),
+            section_counts=(2, 3),
+            shelf_counts=(3,),
+        )
+        points = ranges.points()
+        assert len(points) == 4
+        assert points == sorted(points)
+
+    def test_empty_range_rejected(self) -> None:
+        with pytest.raises(ValueError, match="at least one value"):
+            SweepRanges(thicknesses=(), section_counts=(2,), shelf_counts=(3,))
+
+    def test_too_many_points_rejected(self) -> None:
+        with pytest.raises(ValueError, match="maximum"):
+            SweepRanges(
+                thicknesses=(0.75,),
+                section_counts=tuple(range(1, 11)),
+                shelf_counts=tuple(range(MAX_SWEEP_POINTS // 10 + 1)),
+            )
+
+
+class TestSheetPricing:
+    """Tests for SheetPricing."""
+
+    def test_explicit_price_used(self) -> None:
+        pricing = SheetPricing(prices={0.75: 68.0})
+        assert pricing.sheet_price(0.75) == 68.0
+
+    def test_falls_back_to_price_per_inch(self) -> None:
+        pricing = SheetPricing(price_per_inch=100.0, prices={0.75: 68.0})
+        assert pricing.sheet_price(0.5) == 50.0
+
+    def test_negative_price_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            SheetPricing(prices={0.75: -1.0})
+
+
+class TestSweepRowDominance:
+    """Tests for Pareto dominance between rows."""
+
+    def test_better_on_all_objectives_dominates(self) -> None:
+        assert _row(100, 2, 50, 80).dominates(_row(120, 3, 60, 70))
+
+    def test_trade_off_does_not_dominate(self) -> None:
+        cheap = _row(100, 2, 50, 40)
+        strong = _row(120, 3, 60, 80)
+        assert not cheap.dominates(strong)
+        assert not strong.dominates(cheap)
+
+    def test_equal_rows_do_not_dominate(self) -> None:
+        assert not _row(100, 2, 50, 80).dominates(_row(100, 2, 50, 80))
+
+
+class TestDesignSweepService:
+    """Tests for DesignSweepService."""
+
+    @pytest.fixture
+    def ranges(self) -> SweepRanges:
+        return SweepRanges(
+            thicknesses=(0.75, 0.5),
+            section_counts=(1, 2),
+            shelf_counts=(2,),
+        )
+
+    def test_evaluates_every_point(self, ranges: SweepRanges) -> None:
+        service = DesignSweepService(use_processes=False)
+        result = service.run(WALL, ranges)
+
+        assert [row.point for row in result.rows] == ranges.points()
+        assert result.evaluated == 4
+        for row in result.rows:
+            assert row.is_valid
+            assert row.cost is not None and row.cost > 0
+            assert row.sheet_count is not None and row.sheet_count >= 1
+            assert row.min_shelf_capacity_lbs is not None
+
+    def test_pareto_rows_are_not_dominated(self, ranges: SweepRanges) -> None:
+        result = DesignSweepService(use_processes=False).run(WALL, ranges)
+
+        assert result.pareto_rows
+        for row in result.pareto_rows:
+            assert not any(other.dominates(row) for other in result.rows)
+        costs = [row.cost for row in result.pareto_rows]
+        assert costs == sorted(costs)
+
+    def test_thinner_material_is_lighter(self, ranges: SweepRanges) -> None:
+        result = DesignSweepService(use_processes=False).run(WALL, ranges)
+        by_point = {row.point: row for row in result.rows}
+
+        thin = by_point[SweepPoint(0.5, 2, 2)]
+        thick = by_point[SweepPoint(0.75, 2, 2)]
+        assert thin.weight_lbs < thick.weight_lbs
+        assert thin.min_shelf_capacity_lbs < thick.min_shelf_capacity_lbs
+
+    def test_repeat_sweep_uses_cache(self, ranges: SweepRanges) -> None:
+        service = DesignSweepService(use_processes=False)
+        first = service.run(WALL, ranges)
+        second = service.run(WALL, ranges)
+
+        assert second.evaluated == 0
+        assert [r.to_dict() for r in second.rows] == [r.to_dict() for r in first.rows]
+
+    def test_pricing_change_misses_cache(self, ranges: SweepRanges) -> None:
+        service = DesignSweepService(use_processes=False)
+        service.run(WALL, ranges)
+        result = service.run(WALL, ranges, pricing=SheetPricing(price_per_inch=10))
+
+        assert result.evaluated == 4
+
+    def test_cache_evicts_least_recently_used(self, ranges: SweepRanges) -> None:
+        service = DesignSweepService(use_processes=False, cache_size=2)
+        service.run(WALL, ranges)
+
+        assert len(service._cache) == 2
+        assert service.run(WALL, ranges).evaluated == 2
+
+    def test_pool_reused_across_sweeps(self, ranges: SweepRanges) -> None:
+        service = DesignSweepService(use_processes=False)
+        service.run(WALL, ranges)
+        pool = service._pool
+
+        service.run(WALL, ranges, pricing=SheetPricing(price_per_inch=10))
+
+        assert pool is not None and service._pool is pool
+        service.close()
+        assert service._pool is None
+
+    def test_invalid_point_reports_errors(self) -> None:
+        ranges = SweepRanges(
+            thicknesses=(0.75,), section_counts=(1,), shelf_counts=(2,)
+        )
+        result = DesignSweepService(use_processes=False).run(
+            WallInput(width=-1.0, height=60.0, depth=12.0), ranges
+        )
+
+        row = result.rows[0]
+        assert not row.is_valid
+        assert row.cost is None
+        assert not row.pareto_optimal
+
+
+class TestSweepCommand:
+    """Tests for the sweep CLI command."""
+
+    def test_json_output(self) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "sweep",
+                "-w", "48", "-h", "60", "-d", "12",
+                "-t", "0.75,0.5",
+                "-s", "1-2",
+                "--shelves", "2",
+                "--workers", "1",
+                "-f", "json",
+            ],
+        )  # fmt: skip
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert len(data["rows"]) == 4
+        assert data["pareto"]
+
+    def test_table_output_marks_pareto_rows(self) -> None:
+        result = runner.invoke(
+            app,
+            ["sweep", "-w", "48", "-h", "60", "-d", "12", "--workers", "1"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "* 0.750" in result.output
+        assert "1 Pareto-optimal of 1 variants" in result.output
+
+    def test_invalid_sheet_price(self) -> None:
+        result = runner.invoke(
+            app,
+            ["sweep", "-w", "48", "-h", "60", "-d", "12", "--sheet-price", "68"],
+        )
+
+        assert result.exit_code == 1
+        assert "THICKNESS=PRICE" in result.output
@@ -0,0 +1,52 @@
+"""Tests for the design-space sweep endpoint."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from cabinets.web.app import create_app  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Create a test client for the API."""
+    return TestClient(create_app())
+
+
+class TestSweepEndpoint:
+    """Tests for POST /api/v1/generate/sweep."""
+
+    def test_sweep(self, client: TestClient) -> None:
+        response = client.post(
+            "/api/v1/generate/sweep",
+            json={
+                "dimensions": {"width": 48.0, "height": 60.0, "depth": 12.0},
+                "thicknesses": [0.75, 0.5],
+                "section_counts": [2],
+                "shelf_counts": [2],
+                "sheet_prices": [{"thickness": 0.75, "price": 68.0}],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["rows"]) == 2
+        assert all(row["cost"] > 0 for row in data["rows"])
+        assert data["pareto"]
+
+    def test_too_many_points(self, client: TestClient) -> None:
+        response = client.post(
+            "/api/v1/generate/sweep",
+            json={
+                "dimensions": {"width": 48.0, "height": 60.0, "depth": 12.0},
+                "thicknesses": [0.5, 0.625, 0.75],
+                "section_counts": list(range(1, 11)),
+                "shelf_counts": list(range(0, 21)),
+            },
+        )
+
+        assert response.status_code == 422
@@ -7,6 +7,8 @@ These tests verify:
 - Room aggregate with geometry calculations
 """
 
+import random
+
 import pytest
 
 from cabinets.domain.entities import (
@@ -565,6 +567,65 @@ class TestRoom:
         assert depth == pytest.approx(24.0)
         assert len(room.validate_geometry()) == 0
 
+    # --- Cached Geometry Tests ---
+
+    def test_geometry_is_cached(self) -> None:
+        """Test geometry is computed once while walls are unchanged."""
+        walls = [
+            WallSegment(length=120.0, height=96.0, angle=0),
+            WallSegment(length=96.0, height=96.0, angle=90),
+        ]
+        room = Room(name="test", walls=walls)
+
+        assert room.geometry is room.geometry
+        assert room.get_wall_positions() == list(room.geometry.wall_positions)
+
+    def test_geometry_invalidated_when_walls_change(self) -> None:
+        """Test geometry is recomputed after walls are edited or added."""
+        walls = [
+            WallSegment(length=120.0, height=96.0, angle=0),
+            WallSegment(length=96.0, height=96.0, angle=90),
+        ]
+        room = Room(name="test", walls=walls)
+        before = room.geometry
+
+        walls[1].length = 48.0
+        assert room.geometry is not before
+        assert room.bounding_box == pytest.approx((120.0, 48.0))
+
+        room.walls.append(WallSegment(length=200.0, height=96.0, angle=90))
+        assert len(room.get_wall_positions()) == 3
+        assert room.bounding_box == pytest.approx((200.0, 48.0))
+
+    def test_many_wall_intersections_match_pairwise(self) -> None:
+        """Test sweep-line intersection agrees with checking every pair."""
+        rng = random.Random(5)
+        walls = [WallSegment(length=100.0, height=96.0, angle=0)] + [
+            WallSegment(
+                length=rng.uniform(20.0, 150.0),
+                height=96.0,
+                angle=rng.choice([90, -90, 45, -45, 135, -135]),
+            )
+            for _ in range(300)
+        ]
+        room = Room(name="maze", walls=walls, is_closed=True)
+        positions = room.get_wall_positions()
+
+        expected = [
+            (i, j)
+            for i in range(len(positions))
+            for j in range(i + 2, len(positions))
+            if not (i == 0 and j == len(positions) - 1)
+            and room._segments_intersect(positions[i], positions[j])
+        ]
+        assert expected
+        assert room.geometry.intersecting_walls(is_closed=True) == expected
+        assert [
+            e.wall_indices
+            for e in room.validate_geometry()
+            if e.error_type == "intersection"
+        ] == expected
+
 
 class TestSectionSectionType:
     """Tests for Section section_type field (FRD-04)."""
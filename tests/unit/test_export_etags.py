@@ -0,0 +1,136 @@
+"""Tests for ETags and conditional requests on export endpoints."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from cabinets.web.app import create_app  # noqa: E402
+
+CONFIG = {
+    "schema_version": "1.0",
+    "cabinet": {
+        "width": 36.0,
+        "height": 48.0,
+        "depth": 12.0,
+        "sections": [{"shelves": 2}, {"shelves": 3}],
+    },
+}
+
+EXPORT_REQUEST = {
+    "dimensions": {"width": 36.0, "height": 48.0, "depth": 12.0},
+    "num_sections": 2,
+    "shelves_per_section": 3,
+}
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Create a test client for the API."""
+    return TestClient(create_app())
+
+
+class TestConfigExportETags:
+    """Tests for ETags on *-from-config export endpoints."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/v1/export/stl-from-config",
+            "/api/v1/export/glb-from-config",
+            "/api/v1/export/assembly-from-config",
+            "/api/v1/export/bom-from-config",
+            "/api/v1/export/cut-layouts-from-config",
+        ],
+    )
+    def test_repeat_request_returns_304(self, client: TestClient, path: str) -> None:
+        """A matching If-None-Match short-circuits to 304 with no body."""
+        first = client.post(path, json={"config": CONFIG})
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = client.post(
+            path, json={"config": CONFIG}, headers={"If-None-Match": etag}
+        )
+
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
+    def test_artifacts_are_deterministic(self, client: TestClient) -> None:
+        """Identical configurations produce byte-identical STL artifacts."""
+        path = "/api/v1/export/stl-from-config"
+        first = client.post(path, json={"config": CONFIG})
+        second = client.post(path, json={"config": CONFIG})
+
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_options_change_etag(self, client: TestClient) -> None:
+        """Exporter options are part of the ETag."""
+        path = "/api/v1/export/stl-from-config"
+        preview = client.post(path, json={"config": CONFIG})
+        full = client.post(f"{path}?lod=full", json={"config": CONFIG})
+
+        assert preview.headers["etag"] != full.headers["etag"]
+
+    def test_config_change_etag(self, client: TestClient) -> None:
+        """A different configuration yields a different ETag."""
+        path = "/api/v1/export/bom-from-config"
+        changed = {**CONFIG, "cabinet": {**CONFIG["cabinet"], "width": 40.0}}
+
+        first = client.post(path, json={"config": CONFIG})
+        second = client.post(
+            path,
+            json={"config": changed},
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+
+    def test_weak_and_list_validators_match(self, client: TestClient) -> None:
+        """Weak validators and lists in If-None-Match are honoured."""
+        path = "/api/v1/export/glb-from-config"
+        etag = client.post(path, json={"config": CONFIG}).headers["etag"]
+
+        response = client.post(
+            path,
+            json={"config": CONFIG},
+            headers={"If-None-Match": f'"stale", W/{etag}'},
+        )
+
+        assert response.status_code == 304
+
+
+class TestRequestExportETags:
+    """Tests for ETags on ExportRequest-based endpoints."""
+
+    @pytest.mark.parametrize("fmt", ["stl", "json", "assembly", "bom"])
+    def test_repeat_request_returns_304(self, client: TestClient, fmt: str) -> None:
+        """Simple export endpoints honour If-None-Match."""
+        path = f"/api/v1/export/{fmt}"
+        first = client.post(path, json=EXPORT_REQUEST)
+        assert first.status_code == 200
+
+        second = client.post(
+            path,
+            json=EXPORT_REQUEST,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+        assert second.status_code == 304
+
+    @pytest.mark.parametrize("fmt", ["stl", "dxf", "json", "assembly", "bom"])
+    def test_artifacts_are_deterministic(self, client: TestClient, fmt: str) -> None:
+        """Identical requests produce byte-identical artifacts."""
+        path = f"/api/v1/export/{fmt}"
+        first = client.post(path, json=EXPORT_REQUEST)
+        second = client.post(path, json=EXPORT_REQUEST)
+
+        assert first.status_code == 200
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
@@ -0,0 +1,322 @@
+"""Tests for the GLB (binary glTF) exporter."""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from cabinets.application.dtos import LayoutOutput, RoomLayoutOutput
+from cabinets.domain import MaterialEstimate, Panel3DMapper
+from cabinets.domain.entities import Cabinet, Room, Section, WallSegment
+from cabinets.domain.services import RoomPanel3DMapper
+from cabinets.domain.value_objects import (
+    MaterialSpec,
+    Position,
+    Position3D,
+    SectionTransform,
+)
+from cabinets.infrastructure.exporters import (
+    ExporterRegistry,
+    GlbExporter,
+    StlLayoutExporter,
+)
+from cabinets.infrastructure.exporters.gltf import GLB_MAGIC, _unit_box_geometry
+
+
+# --- Helpers ---
+
+
+def parse_glb(data: bytes) -> tuple[dict[str, Any], bytes]:
+    """Split GLB bytes into the JSON document and binary chunk."""
+    magic, version, length = struct.unpack("<III", data[:12])
+    assert magic == GLB_MAGIC
+    assert version == 2
+    assert length == len(data)
+    json_length, _ = struct.unpack("<II", data[12:20])
+    document = json.loads(data[20 : 20 + json_length])
+    offset = 20 + json_length
+    binary = b""
+    if offset < len(data):
+        bin_length, _ = struct.unpack("<II", data[offset : offset + 8])
+        binary = data[offset + 8 : offset + 8 + bin_length]
+    return document, binary
+
+
+def node_corners(node: dict[str, Any]) -> np.ndarray:
+    """World-space (domain coordinates) corners of an instanced box node."""
+    corners = np.array(
+        [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=float
+    )
+    corners = corners * np.array(node["scale"])
+    qx, qy, qz, qw = node.get("rotation", [0.0, 0.0, 0.0, 1.0])
+    angle = 2 * math.atan2(qz, qw)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    rotated = np.column_stack(
+        [
+            corners[:, 0] * cos_a - corners[:, 1] * sin_a,
+            corners[:, 0] * sin_a + corners[:, 1] * cos_a,
+            corners[:, 2],
+        ]
+    )
+    return rotated + np.array(node["translation"])
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def cabinet() -> Cabinet:
+    """Create a two-section cabinet for testing."""
+    return Cabinet(
+        width=48.0,
+        height=84.0,
+        depth=12.0,
+        material=MaterialSpec.standard_3_4(),
+        sections=[
+            Section(
+                width=23.25, height=82.5, depth=11.75, position=Position(0.75, 0.75)
+            ),
+            Section(
+                width=23.25, height=82.5, depth=11.75, position=Position(24.0, 0.75)
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def estimate() -> MaterialEstimate:
+    """Create a material estimate for testing."""
+    return MaterialEstimate(
+        total_area_sqin=4608.0,
+        total_area_sqft=32.0,
+        sheet_count_4x8=1,
+        sheet_count_5x5=1,
+        waste_percentage=0.1,
+    )
+
+
+@pytest.fixture
+def layout_output(cabinet: Cabinet, estimate: MaterialEstimate) -> LayoutOutput:
+    """Create a single-cabinet LayoutOutput."""
+    return LayoutOutput(
+        cabinet=cabinet,
+        cut_list=[],
+        material_estimates={},
+        total_estimate=estimate,
+    )
+
+
+@pytest.fixture
+def room_output(cabinet: Cabinet, estimate: MaterialEstimate) -> RoomLayoutOutput:
+    """Create a room layout with cabinets on two perpendicular walls."""
+    room = Room(
+        name="Test Room",
+        walls=[
+            WallSegment(length=120.0, height=96.0, angle=0),
+            WallSegment(length=96.0, height=96.0, angle=90),
+        ],
+    )
+    return RoomLayoutOutput(
+        room=room,
+        cabinets=[cabinet, cabinet],
+        transforms=[
+            SectionTransform(
+                section_index=0,
+                wall_index=0,
+                position=Position3D(x=0.0, y=0.0, z=0.0),
+                rotation_z=0.0,
+            ),
+            SectionTransform(
+                section_index=1,
+                wall_index=1,
+                position=Position3D(x=120.0, y=0.0, z=0.0),
+                rotation_z=90.0,
+            ),
+        ],
+        cut_list=[],
+        material_estimates={},
+        total_estimate=estimate,
+    )
+
+
+# --- Tests ---
+
+
+class TestGlbRegistration:
+    """Tests for exporter registration."""
+
+    def test_registered_as_glb(self) -> None:
+        """GLB exporter is available through the registry."""
+        assert ExporterRegistry.get("glb") is GlbExporter
+        assert "glb" in ExporterRegistry.available_formats()
+
+    def test_string_export_not_supported(self, layout_output: LayoutOutput) -> None:
+        """GLB is binary and does not support string export."""
+        with pytest.raises(NotImplementedError):
+            GlbExporter().export_string(layout_output)
+
+    def test_invalid_units_rejected(self) -> None:
+        """Only inches and meters are supported."""
+        with pytest.raises(ValueError):
+            GlbExporter(units="feet")
+
+
+class TestUnitBox:
+    """Tests for the shared unit-cube geometry."""
+
+    def test_unit_box_triangles_face_outward(self) -> None:
+        """Every triangle's winding normal matches its vertex normal."""
+        positions, normals, indices = _unit_box_geometry()
+        triangles = indices.reshape(-1, 3)
+
+        for a, b, c in triangles:
+            winding = np.cross(positions[b] - positions[a], positions[c] - positions[a])
+            assert np.dot(winding, normals[a]) > 0
+
+    def test_unit_box_size(self) -> None:
+        """Unit box has 24 vertices and 12 triangles."""
+        positions, normals, indices = _unit_box_geometry()
+        assert positions.shape == (24, 3)
+        assert normals.shape == (24, 3)
+        assert indices.shape == (36,)
+
+
+class TestGlbStructure:
+    """Tests for the GLB document structure."""
+
+    def test_single_cabinet_nodes_match_panels(
+        self, layout_output: LayoutOutput, cabinet: Cabinet
+    ) -> None:
+        """Each panel becomes one node under the Y-up root node."""
+        document, binary = parse_glb(GlbExporter().export_bytes(layout_output))
+
+        panel_count = len(Panel3DMapper(cabinet).map_all_panels())
+        root = document["nodes"][document["scenes"][0]["nodes"][0]]
+        assert len(root["children"]) == panel_count
+        assert root["rotation"] == pytest.approx(
+            [-math.sqrt(0.5), 0, 0, math.sqrt(0.5)]
+        )
+        assert document["buffers"][0]["byteLength"] == len(binary)
+
+    def test_box_geometry_stored_once(self, layout_output: LayoutOutput) -> None:
+        """All box meshes share the same position accessor."""
+        document, _ = parse_glb(GlbExporter().export_bytes(layout_output))
+
+        position_accessors = {
+            mesh["primitives"][0]["attributes"]["POSITION"]
+            for mesh in document["meshes"]
+        }
+        assert len(position_accessors) == 1
+
+    def test_materials_per_panel_type(self, layout_output: LayoutOutput) -> None:
+        """Each panel type gets exactly one named material."""
+        document, _ = parse_glb(GlbExporter().export_bytes(layout_output))
+
+        names = [material["name"] for material in document["materials"]]
+        assert len(names) == len(set(names))
+        assert "left_side" in names
+
+    def test_node_extras_carry_panel_metadata(
+        self, layout_output: LayoutOutput
+    ) -> None:
+        """Panel nodes include panel type and dimensions as extras."""
+        document, _ = parse_glb(GlbExporter().export_bytes(layout_output))
+
+        extras = document["nodes"][0]["extras"]
+        assert {"panel_type", "width", "height", "thickness"} <= set(extras)
+
+    def test_metadata_can_be_omitted(self, layout_output: LayoutOutput) -> None:
+        """include_metadata=False drops extras."""
+        exporter = GlbExporter(include_metadata=False)
+        document, _ = parse_glb(exporter.export_bytes(layout_output))
+
+        assert all("extras" not in node for node in document["nodes"][:-1])
+
+    def test_meters_scale_root(self, layout_output: LayoutOutput) -> None:
+        """Meters output scales the root node."""
+        document, _ = parse_glb(GlbExporter(units="meters").export_bytes(layout_output))
+
+        root = document["nodes"][-1]
+        assert root["scale"] == pytest.approx([0.0254] * 3)
+
+    def test_export_writes_file(self, layout_output: LayoutOutput) -> None:
+        """export() writes the GLB bytes to disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cabinet.glb"
+            GlbExporter().export(layout_output, path)
+            assert path.read_bytes()[:4] == b"glTF"
+
+
+class TestGlbRoomLayout:
+    """Tests for room layouts with wall transforms."""
+
+    def test_room_node_bounds_match_mapper(self, room_output: RoomLayoutOutput) -> None:
+        """Node transforms reproduce the mapper's room-space boxes."""
+        document, _ = parse_glb(GlbExporter().export_bytes(room_output))
+        expected = RoomPanel3DMapper().map_cabinets_to_boxes(
+            room_output.cabinets, room_output.transforms
+        )
+
+        panel_nodes = document["nodes"][:-1]
+        assert len(panel_nodes) == len(expected)
+        for node, box in zip(panel_nodes, expected):
+            corners = node_corners(node)
+            assert corners.min(axis=0) == pytest.approx(
+                [box.origin.x, box.origin.y, box.origin.z], abs=1e-3
+            )
+            assert corners.max(axis=0) - corners.min(axis=0) == pytest.approx(
+                [box.size_x, box.size_y, box.size_z], abs=1e-3
+            )
+
+    def test_room_extras_identify_wall(self, room_output: RoomLayoutOutput) -> None:
+        """Room nodes record their wall index."""
+        document, _ = parse_glb(GlbExporter().export_bytes(room_output))
+
+        walls = {node["extras"]["wall_index"] for node in document["nodes"][:-1]}
+        assert walls == {0, 1}
+
+    def test_gpu_instancing_one_node_per_type(
+        self, room_output: RoomLayoutOutput
+    ) -> None:
+        """GPU instancing groups all boxes of a type into one node."""
+        exporter = GlbExporter(gpu_instancing=True)
+        document, _ = parse_glb(exporter.export_bytes(room_output))
+
+        assert "EXT_mesh_gpu_instancing" in document["extensionsRequired"]
+        panel_nodes = document["nodes"][:-1]
+        total = sum(node["extras"]["count"] for node in panel_nodes)
+        expected = RoomPanel3DMapper().map_cabinets_to_boxes(
+            room_output.cabinets, room_output.transforms
+        )
+        assert total == len(expected)
+        assert len({node["name"] for node in panel_nodes}) == len(panel_nodes)
+
+    def test_smaller_than_stl(self, room_output: RoomLayoutOutput) -> None:
+        """GLB output is smaller than the equivalent STL."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stl_path = Path(tmpdir) / "room.stl"
+            StlLayoutExporter().export(room_output, stl_path)
+            glb = GlbExporter(gpu_instancing=True).export_bytes(room_output)
+            assert len(glb) < stl_path.stat().st_size
+
+    def test_empty_room_is_valid_glb(self, room_output: RoomLayoutOutput) -> None:
+        """A room with no cabinets still produces a valid GLB."""
+        empty = RoomLayoutOutput(
+            room=room_output.room,
+            cabinets=[],
+            transforms=[],
+            cut_list=[],
+            material_estimates={},
+            total_estimate=room_output.total_estimate,
+        )
+        document, binary = parse_glb(GlbExporter().export_bytes(empty))
+
+        assert binary == b""
+        assert document["nodes"][0]["children"] == []
@@ -581,6 +581,8 @@ class TestV03CutoutOverlapDetection:
         assert not result.is_valid
         overlap_errors = [e for e in result.errors if "overlap" in e.message.lower()]
         assert len(overlap_errors) >= 1
+        assert overlap_errors[0].path == "infrastructure.outlets[0]"
+        assert "with infrastructure.grommets[0]" in overlap_errors[0].message
 
     def test_cutouts_on_different_panels_no_overlap(self) -> None:
         """Cutouts at same position on different panels should not overlap."""
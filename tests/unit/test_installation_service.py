@@ -9,6 +9,7 @@ from cabinets.domain.services.installation import (
     InstallationPlan,
     InstallationService,
     StudHitAnalysis,
+    StudPlacement,
     WeightEstimate,
 )
 from cabinets.domain.value_objects import (
@@ -933,6 +934,106 @@ class TestCalculateStudHits:
         assert 48.0 in analysis.stud_positions
 
 
+class TestFindStudPlacements:
+    """Tests for InstallationService.find_stud_placements() method."""
+
+    @pytest.fixture
+    def cabinet(self) -> Cabinet:
+        """Create a 30 inch wide cabinet."""
+        material = MaterialSpec(thickness=0.75, material_type=MaterialType.PLYWOOD)
+        return Cabinet(width=30.0, height=30.0, depth=12.0, material=material)
+
+    def test_matches_calculate_stud_hits(self, cabinet: Cabinet) -> None:
+        """Vectorized scores agree with the single-position analysis."""
+        service = InstallationService(InstallationConfig(stud_offset=5.5))
+
+        placements = service.find_stud_placements(cabinet, 96.0, step=0.5, top_n=200)
+
+        assert len(placements) == 133
+        for placement in placements:
+            analysis = service.calculate_stud_hits(cabinet, placement.left_edge)
+            assert placement.stud_hit_count == analysis.stud_hit_count
+            misses = placement.mounting_point_count - placement.mounting_point_hits
+            assert misses == len(analysis.non_stud_positions)
+
+    def test_best_placement_first(self, cabinet: Cabinet) -> None:
+        """The top placement has the most stud hits."""
+        service = InstallationService(InstallationConfig(stud_offset=8.0))
+
+        placements = service.find_stud_placements(cabinet, 96.0, top_n=400)
+
+        best = placements[0]
+        assert best.stud_hit_count == max(p.stud_hit_count for p in placements)
+        assert best.mounting_point_hits == 2
+        assert best.left_edge == 4.5
+
+    def test_preferred_left_breaks_ties(self, cabinet: Cabinet) -> None:
+        """Among equal scores the candidate closest to preferred_left wins."""
+        service = InstallationService(InstallationConfig(stud_offset=8.0))
+
+        best = service.find_stud_placements(cabinet, 96.0, preferred_left=40.0)[0]
+
+        assert best.left_edge == 37.5
+
+    def test_placements_fit_wall(self, cabinet: Cabinet) -> None:
+        """No placement extends past the wall."""
+        service = InstallationService(InstallationConfig())
+
+        placements = service.find_stud_placements(
+            cabinet, 40.0, width_deltas=(0.0, 4.0), top_n=1000
+        )
+
+        assert all(p.right_edge <= 40.0 for p in placements)
+        assert {p.width for p in placements} == {30.0, 34.0}
+
+    def test_width_delta_can_add_stud(self) -> None:
+        """Widening the cabinet can reach an additional stud."""
+        material = MaterialSpec(thickness=0.75, material_type=MaterialType.PLYWOOD)
+        cabinet = Cabinet(width=31.0, height=30.0, depth=12.0, material=material)
+        service = InstallationService(InstallationConfig())
+
+        fixed = service.find_stud_placements(cabinet, 31.0)
+        widened = service.find_stud_placements(cabinet, 32.0, width_deltas=(0.0, 1.0))
+
+        assert fixed[0].stud_hit_count == 2
+        assert widened[0].stud_hit_count == 3
+        assert widened[0].width_delta == 1.0
+
+    def test_french_cleat_ranks_by_cleat_hits(self, cabinet: Cabinet) -> None:
+        """Cleat mounting ranks placements by studs behind the cleat."""
+        config = InstallationConfig(mounting_system=MountingSystem.FRENCH_CLEAT)
+        service = InstallationService(config)
+
+        placements = service.find_stud_placements(cabinet, 96.0, top_n=400)
+
+        assert placements[0].cleat_stud_hits == max(
+            p.cleat_stud_hits for p in placements
+        )
+
+    def test_cabinet_wider_than_wall(self, cabinet: Cabinet) -> None:
+        """A cabinet that does not fit returns no placements."""
+        service = InstallationService(InstallationConfig())
+        assert service.find_stud_placements(cabinet, 24.0) == ()
+
+    def test_invalid_step_raises(self, cabinet: Cabinet) -> None:
+        """Step must be positive."""
+        service = InstallationService(InstallationConfig())
+        with pytest.raises(ValueError, match="Step must be positive"):
+            service.find_stud_placements(cabinet, 96.0, step=0)
+
+    def test_placement_model(self) -> None:
+        """StudPlacement validates hits against mounting points."""
+        with pytest.raises(ValueError):
+            StudPlacement(
+                left_edge=0.0,
+                width=30.0,
+                stud_hit_count=2,
+                mounting_point_hits=4,
+                mounting_point_count=3,
+                cleat_stud_hits=2,
+            )
+
+
 class TestEstimateWeight:
     """Tests for InstallationService.estimate_weight() method."""
 
@@ -0,0 +1,175 @@
+"""Tests for the persistent LLM instruction cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cabinets.application.dtos import LayoutOutput
+from cabinets.domain.entities import Cabinet
+from cabinets.domain.services import CutListGenerator
+from cabinets.domain.value_objects import MaterialSpec
+from cabinets.infrastructure.llm import (
+    AssemblyDeps,
+    AssemblyInstructions,
+    InstructionCache,
+    LLMAssemblyGenerator,
+    instructions_key,
+)
+
+INSTRUCTIONS = AssemblyInstructions.model_validate(
+    {
+        "title": "Cabinet Assembly",
+        "skill_level": "intermediate",
+        "cabinet_summary": "A plywood cabinet.",
+        "estimated_time": "2 hours",
+        "safety_warnings": [],
+        "tools_needed": [],
+        "materials_checklist": ["Wood glue"],
+        "steps": [
+            {
+                "step_number": 1,
+                "phase": "Carcase Assembly",
+                "title": "Glue up the carcase",
+                "description": "Glue the sides to the top and bottom.",
+                "pieces_involved": ["Sides"],
+            }
+        ],
+        "finishing_notes": "Sand and finish.",
+    }
+)
+
+AGENT = "cabinets.infrastructure.llm.generator.run_assembly_agent"
+
+
+def _cabinet(width: float = 24.0) -> Cabinet:
+    return Cabinet(
+        width=width, height=30.0, depth=12.0, material=MaterialSpec.standard_3_4()
+    )
+
+
+def _deps(width: float = 24.0, **overrides: Any) -> AssemblyDeps:
+    cabinet = _cabinet(width)
+    return AssemblyDeps(
+        cabinet=cabinet,
+        cut_list=CutListGenerator().generate(cabinet),
+        joinery=[],
+        skill_level=overrides.get("skill_level", "intermediate"),
+        material_type=cabinet.material.material_type,
+    )
+
+
+def _output(width: float = 24.0) -> LayoutOutput:
+    cabinet = _cabinet(width)
+    return LayoutOutput(cabinet=cabinet, cut_list=CutListGenerator().generate(cabinet))
+
+
+def _online(generator: LLMAssemblyGenerator) -> Any:
+    """Patch the generator's health check to report a ready server."""
+    return patch.multiple(
+        generator.health_check,
+        is_available=AsyncMock(return_value=True),
+        has_model=AsyncMock(return_value=True),
+    )
+
+
+class TestInstructionsKey:
+    """Tests for instructions_key."""
+
+    def test_equal_prompts_share_a_key(self) -> None:
+        assert instructions_key(_deps(), "llama3.2") == instructions_key(
+            _deps(), "ollama:llama3.2"
+        )
+
+    def test_key_depends_on_prompt_model_and_version(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        key = instructions_key(_deps(), "llama3.2")
+
+        assert key != instructions_key(_deps(width=30.0), "llama3.2")
+        assert key != instructions_key(_deps(skill_level="expert"), "llama3.2")
+        assert key != instructions_key(_deps(), "mistral:7b")
+        monkeypatch.setattr("cabinets.infrastructure.llm.cache.PROMPT_VERSION", "2")
+        assert key != instructions_key(_deps(), "llama3.2")
+
+
+class TestInstructionCache:
+    """Tests for InstructionCache storage."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = InstructionCache(tmp_path)
+
+        assert cache.get(_deps(), "llama3.2") is None
+        cache.put(_deps(), "llama3.2", INSTRUCTIONS)
+
+        assert cache.get(_deps(), "llama3.2") == INSTRUCTIONS
+        assert cache.get(_deps(), "mistral:7b") is None
+
+    def test_size_bounded(self, tmp_path: Path) -> None:
+        entry_size = len(INSTRUCTIONS.model_dump_json())
+        cache = InstructionCache(tmp_path, max_bytes=int(2.5 * entry_size))
+        for width in (20.0, 24.0, 30.0):
+            cache.put(_deps(width), "llama3.2", INSTRUCTIONS)
+
+        assert cache.metrics().evictions == 1
+        assert len(list(tmp_path.glob("*/*.artifact"))) == 2
+        # The newest entry is never evicted by its own write
+        assert cache.get(_deps(30.0), "llama3.2") == INSTRUCTIONS
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = InstructionCache(tmp_path)
+        cache.put(_deps(), "llama3.2", INSTRUCTIONS)
+        next(tmp_path.glob("*/*.artifact")).write_text("{}")
+
+        assert cache.get(_deps(), "llama3.2") is None
+
+
+class TestGeneratorCache:
+    """Tests for LLMAssemblyGenerator use of the cache."""
+
+    async def test_second_run_skips_model(self, tmp_path: Path) -> None:
+        generator = LLMAssemblyGenerator(cache=InstructionCache(tmp_path))
+
+        with _online(generator), patch(AGENT, return_value=INSTRUCTIONS) as agent:
+            first = await generator.generate(_output())
+            second = await generator.generate(_output())
+
+        assert agent.call_count == 1
+        assert "# Cabinet Assembly" in first
+        assert "# Cabinet Assembly" in second
+
+    async def test_cached_instructions_served_when_offline(
+        self, tmp_path: Path
+    ) -> None:
+        cache = InstructionCache(tmp_path)
+        generator = LLMAssemblyGenerator(cache=cache)
+        cache.put(generator._build_deps(_output()), "llama3.2", INSTRUCTIONS)
+
+        with patch.object(
+            generator.health_check, "is_available", AsyncMock(return_value=False)
+        ):
+            result = await generator.generate(_output())
+            missing = await generator.generate(_output(width=30.0))
+
+        assert "template fallback" not in result
+        assert "Ollama server not available; no cached instructions" in missing
+
+    async def test_cache_only_never_calls_model(self, tmp_path: Path) -> None:
+        cache = InstructionCache(tmp_path)
+        generator = LLMAssemblyGenerator(cache=cache, cache_only=True)
+        cache.put(generator._build_deps(_output()), "llama3.2", INSTRUCTIONS)
+
+        with (
+            patch.object(generator.health_check, "is_available") as available,
+            patch(AGENT) as agent,
+        ):
+            hit = await generator.generate(_output())
+            miss = await generator.generate(_output(width=30.0))
+
+        available.assert_not_called()
+        agent.assert_not_called()
+        assert "# Cabinet Assembly" in hit
+        assert "Cache-only mode; no cached instructions" in miss
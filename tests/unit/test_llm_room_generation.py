@@ -0,0 +1,236 @@
+"""Tests for concurrent room assembly generation against a stand-in Ollama.
+
+A small threaded HTTP server answers the Ollama endpoints the generator
+uses: /api/tags for health and model checks, and the OpenAI-compatible
+/v1/chat/completions endpoint, which returns AssemblyInstructions as a
+final_result tool call.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from cabinets.application.dtos import RoomLayoutOutput
+from cabinets.domain import MaterialEstimate
+from cabinets.domain.entities import Cabinet, Room, WallSegment
+from cabinets.domain.value_objects import MaterialSpec
+from cabinets.infrastructure.llm import LLMAssemblyGenerator, OllamaHealthCheck
+
+INSTRUCTIONS: dict[str, Any] = {
+    "title": "Cabinet Assembly",
+    "skill_level": "intermediate",
+    "cabinet_summary": "A plywood cabinet.",
+    "estimated_time": "2 hours",
+    "safety_warnings": [],
+    "tools_needed": [],
+    "materials_checklist": ["Wood glue"],
+    "steps": [
+        {
+            "step_number": 1,
+            "phase": "Carcase Assembly",
+            "title": "Glue up the carcase",
+            "description": "Glue the sides to the top and bottom.",
+            "pieces_involved": ["Sides", "Top", "Bottom"],
+        }
+    ],
+    "finishing_notes": "Sand and finish.",
+}
+
+
+class StandInOllama:
+    """Records traffic to the stand-in server."""
+
+    def __init__(self, delay: float = 0.05, fail_prompts: tuple[str, ...] = ()):
+        self.delay = delay
+        self.fail_prompts = fail_prompts
+        self.tag_requests = 0
+        self.chat_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+
+def _handler(state: StandInOllama) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _send(self, status: int, body: dict[str, Any]) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            with state.lock:
+                state.tag_requests += 1
+            self._send(200, {"models": [{"name": "llama3.2:latest"}]})
+
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with state.lock:
+                state.chat_requests += 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(state.delay)
+                prompt = json.dumps(request["messages"])
+                if any(marker in prompt for marker in state.fail_prompts):
+                    self._send(500, {"error": "model crashed"})
+                    return
+                self._send(200, _completion(request["model"]))
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+def _completion(model: str) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {
+                                "name": "final_result",
+                                "arguments": json.dumps(INSTRUCTIONS),
+                            },
+                        }
+                    ],
+                },
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+
+@pytest.fixture
+def stand_in() -> Iterator[tuple[StandInOllama, str]]:
+    """Run a stand-in Ollama server for one test."""
+    state = StandInOllama()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield state, f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _room_output(widths: list[float]) -> RoomLayoutOutput:
+    cabinets = [
+        Cabinet(
+            width=width, height=30.0, depth=12.0, material=MaterialSpec.standard_3_4()
+        )
+        for width in widths
+    ]
+    return RoomLayoutOutput(
+        room=Room(
+            name="Den",
+            walls=[WallSegment(length=sum(widths), height=96.0, angle=0, depth=12.0)],
+        ),
+        cabinets=cabinets,
+        transforms=[],
+        cut_list=[],
+        material_estimates={},
+        total_estimate=MaterialEstimate(
+            total_area_sqin=0.0,
+            total_area_sqft=0.0,
+            sheet_count_4x8=0,
+            sheet_count_5x5=0,
+            waste_percentage=0.1,
+        ),
+    )
+
+
+class TestRoomGeneration:
+    """Tests for per-cabinet concurrent generation."""
+
+    async def test_generates_each_cabinet_within_concurrency_limit(
+        self, stand_in: tuple[StandInOllama, str]
+    ) -> None:
+        state, url = stand_in
+        generator = LLMAssemblyGenerator(ollama_url=url, max_concurrency=2)
+
+        result = await generator.generate(_room_output([24.0, 30.0, 36.0, 18.0, 12.0]))
+
+        assert result.startswith("# Den Assembly")
+        assert result.count("# Cabinet Assembly") == 5
+        assert "template fallback" not in result
+        assert state.chat_requests == 5
+        assert 1 <= state.max_in_flight <= 2
+
+    async def test_failed_cabinet_falls_back_alone(
+        self, stand_in: tuple[StandInOllama, str]
+    ) -> None:
+        state, url = stand_in
+        state.fail_prompts = ('36.00\\"W',)
+        generator = LLMAssemblyGenerator(ollama_url=url)
+
+        result = await generator.generate(_room_output([24.0, 36.0]))
+
+        assert result.count("# Cabinet Assembly") == 1
+        assert result.count("template fallback") == 1
+        assert "<!-- Cabinet 2 of 2 -->" in result
+
+    async def test_health_checks_cached_between_calls(
+        self, stand_in: tuple[StandInOllama, str]
+    ) -> None:
+        state, url = stand_in
+        generator = LLMAssemblyGenerator(ollama_url=url)
+        output = _room_output([24.0, 30.0])
+
+        await generator.generate(output)
+        await generator.generate(output)
+
+        # One check for the server and one for the model, reused by call two
+        assert state.tag_requests == 2
+        assert state.chat_requests == 4
+
+
+class TestHealthCheckCache:
+    """Tests for OllamaHealthCheck result caching."""
+
+    async def test_results_expire_after_ttl(
+        self, stand_in: tuple[StandInOllama, str]
+    ) -> None:
+        state, url = stand_in
+        now = [0.0]
+        health = OllamaHealthCheck(url, cache_ttl=10.0, clock=lambda: now[0])
+
+        assert await health.is_available()
+        assert await health.has_model("llama3.2")
+        assert await health.is_available()
+        assert state.tag_requests == 2
+
+        now[0] = 10.0
+        assert await health.is_available()
+        assert state.tag_requests == 3
+
+        health.clear_cache()
+        assert await health.has_model("llama3.2")
+        assert state.tag_requests == 4
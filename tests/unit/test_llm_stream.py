@@ -0,0 +1,237 @@
+"""Tests for streamed LLM assembly instruction generation."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+from cabinets.application.config import load_config_from_dict
+from cabinets.application.dtos import LayoutOutput
+from cabinets.domain.entities import Cabinet
+from cabinets.domain.services import CutListGenerator
+from cabinets.domain.value_objects import MaterialSpec
+from cabinets.infrastructure.llm import (
+    AssemblyDeps,
+    AssemblyEvent,
+    AssemblyInstructions,
+    AssemblyStep,
+    LLMAssemblyGenerator,
+    stream_assembly_agent,
+)
+
+STEPS = [
+    {
+        "step_number": number,
+        "phase": "Carcase Assembly",
+        "title": f"Step {number}",
+        "description": "Glue and clamp.",
+        "pieces_involved": ["Sides"],
+    }
+    for number in (1, 2, 3)
+]
+
+INSTRUCTIONS = {
+    "title": "Cabinet Assembly",
+    "skill_level": "intermediate",
+    "cabinet_summary": "A plywood cabinet.",
+    "estimated_time": "2 hours",
+    "safety_warnings": [],
+    "tools_needed": [],
+    "materials_checklist": ["Wood glue"],
+    "steps": STEPS,
+    "finishing_notes": "Sand and finish.",
+}
+
+CONFIG = {
+    "schema_version": "1.0",
+    "cabinet": {"width": 36.0, "height": 48.0, "depth": 12.0},
+}
+
+
+def _streaming_agent(
+    chunks_sent: list[int], delay: float = 0.0
+) -> Agent[AssemblyDeps, AssemblyInstructions]:
+    """Agent whose model streams INSTRUCTIONS as a final_result tool call."""
+    args = json.dumps(INSTRUCTIONS)
+
+    async def stream(
+        messages: list[ModelMessage], info: AgentInfo
+    ) -> AsyncIterator[dict[int, DeltaToolCall]]:
+        for start in range(0, len(args), 32):
+            chunks_sent.append(start)
+            await asyncio.sleep(delay)
+            yield {
+                0: DeltaToolCall(
+                    name="final_result" if start == 0 else None,
+                    json_args=args[start : start + 32],
+                )
+            }
+
+    return Agent(
+        FunctionModel(stream_function=stream),
+        deps_type=AssemblyDeps,
+        output_type=AssemblyInstructions,
+    )
+
+
+def _output() -> LayoutOutput:
+    cabinet = Cabinet(
+        width=24.0, height=30.0, depth=12.0, material=MaterialSpec.standard_3_4()
+    )
+    return LayoutOutput(cabinet=cabinet, cut_list=CutListGenerator().generate(cabinet))
+
+
+def _online(generator: LLMAssemblyGenerator, agent: Agent) -> Any:
+    """Patch the generator to find a ready server running ``agent``."""
+    generator.health_check.is_available = AsyncMock(return_value=True)
+    generator.health_check.has_model = AsyncMock(return_value=True)
+    return patch(
+        "cabinets.infrastructure.llm.generator.create_assembly_agent",
+        return_value=agent,
+    )
+
+
+async def _collect(generator: LLMAssemblyGenerator) -> list[AssemblyEvent]:
+    return [event async for event in generator.stream(_output())]
+
+
+class TestStreamAssemblyAgent:
+    """Tests for stream_assembly_agent."""
+
+    async def test_steps_yielded_while_streaming(self) -> None:
+        chunks_sent: list[int] = []
+        agent = _streaming_agent(chunks_sent)
+        deps = LLMAssemblyGenerator()._build_deps(_output())
+        seen: list[tuple[str, int]] = []
+
+        async for item in stream_assembly_agent(deps, agent=agent):
+            seen.append((type(item).__name__, len(chunks_sent)))
+
+        assert [kind for kind, _ in seen] == [
+            "AssemblyStep",
+            "AssemblyStep",
+            "AssemblyStep",
+            "AssemblyInstructions",
+        ]
+        # The first step arrives before the model has finished writing
+        assert seen[0][1] < seen[-1][1]
+
+    async def test_idle_timeout(self) -> None:
+        agent = _streaming_agent([], delay=0.2)
+        deps = LLMAssemblyGenerator()._build_deps(_output())
+
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in stream_assembly_agent(deps, agent=agent, idle_timeout=0.01):
+                pass
+
+
+class TestGeneratorStream:
+    """Tests for LLMAssemblyGenerator.stream."""
+
+    async def test_template_then_steps_then_instructions(self) -> None:
+        generator = LLMAssemblyGenerator()
+
+        with _online(generator, _streaming_agent([])):
+            events = await _collect(generator)
+
+        assert [event.kind for event in events] == [
+            "template",
+            "step",
+            "step",
+            "step",
+            "instructions",
+        ]
+        assert "Assembly Instructions" in events[0].data
+        assert AssemblyStep.model_validate_json(events[1].data).title == "Step 1"
+        assert events[-1].data.startswith("# Cabinet Assembly")
+
+    async def test_template_sent_before_server_is_contacted(self) -> None:
+        generator = LLMAssemblyGenerator()
+        generator.health_check.is_available = AsyncMock(return_value=False)
+
+        stream = generator.stream(_output())
+        first = await anext(stream)
+        generator.health_check.is_available.assert_not_called()
+        rest = [event async for event in stream]
+
+        assert first.kind == "template"
+        assert [(e.kind, e.data) for e in rest] == [
+            ("fallback", "Ollama server not available")
+        ]
+
+    async def test_stalled_model_falls_back(self) -> None:
+        generator = LLMAssemblyGenerator(timeout=0.01)
+
+        with _online(generator, _streaming_agent([], delay=0.2)):
+            events = await _collect(generator)
+
+        assert events[-1].kind == "fallback"
+        assert "No output from the model" in events[-1].data
+
+
+class TestStreamEndpoint:
+    """Tests for POST /export/assembly-from-config/stream."""
+
+    @pytest.fixture(autouse=True)
+    def _requires_fastapi(self) -> None:
+        """Skip when the optional web extra is not installed."""
+        pytest.importorskip("fastapi")
+
+    def test_streams_server_sent_events(self) -> None:
+        from fastapi.testclient import TestClient
+
+        from cabinets.web.app import create_app
+        from cabinets.web.dependencies import get_llm_assembly_generator
+
+        app = create_app()
+        generator = LLMAssemblyGenerator()
+        app.dependency_overrides[get_llm_assembly_generator] = lambda: generator
+
+        with _online(generator, _streaming_agent([])):
+            response = TestClient(app).post(
+                "/api/v1/export/assembly-from-config/stream",
+                json={"config": CONFIG},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        kinds = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert kinds == ["template", "step", "step", "step", "instructions", "done"]
+
+    def test_invalid_config_rejected_before_streaming(self) -> None:
+        from fastapi.testclient import TestClient
+
+        from cabinets.web.app import create_app
+
+        response = TestClient(create_app()).post(
+            "/api/v1/export/assembly-from-config/stream",
+            json={"config": {"schema_version": "1.0", "cabinet": {"width": -1}}},
+        )
+
+        assert response.status_code == 422
+
+    def test_generator_shared_across_requests(self) -> None:
+        from cabinets.web.dependencies import get_llm_assembly_generator
+
+        def settings(model: str) -> Any:
+            return load_config_from_dict(
+                {**CONFIG, "output": {"assembly": {"llm_model": model}}}
+            )
+
+        first = get_llm_assembly_generator(settings("mistral:7b"))
+
+        assert get_llm_assembly_generator(settings("mistral:7b")) is first
+        assert get_llm_assembly_generator(settings("llama3.2")) is not first
+        assert first.model == "mistral:7b"
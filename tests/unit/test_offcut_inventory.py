@@ -0,0 +1,192 @@
+"""Tests for the persistent offcut inventory and its use by the packer."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cabinets.domain.value_objects import CutPiece, MaterialSpec, PanelType
+from cabinets.infrastructure import (
+    BinPackingConfig,
+    BinPackingService,
+    GuillotineBinPacker,
+    Offcut,
+    OffcutConflictError,
+    OffcutInventory,
+)
+
+PLY = MaterialSpec.standard_3_4()
+BACK = MaterialSpec.standard_1_4()
+
+
+def _offcut(width: float, height: float, material: MaterialSpec = PLY) -> Offcut:
+    return Offcut(width=width, height=height, material=material, sheet_index=0)
+
+
+def _piece(width: float, height: float, quantity: int = 1) -> CutPiece:
+    return CutPiece(
+        width=width,
+        height=height,
+        quantity=quantity,
+        label="Shelf",
+        panel_type=PanelType.SHELF,
+        material=PLY,
+    )
+
+
+@pytest.fixture
+def inventory(tmp_path: Path) -> OffcutInventory:
+    return OffcutInventory(tmp_path / "offcuts.db")
+
+
+class TestOffcutInventory:
+    """Tests for OffcutInventory storage and lookup."""
+
+    def test_find_filters_by_material_and_size(
+        self, inventory: OffcutInventory
+    ) -> None:
+        inventory.add(
+            [_offcut(30, 40), _offcut(10, 20), _offcut(20, 12), _offcut(30, 40, BACK)]
+        )
+
+        found = inventory.find(PLY, min_short_side=12, min_long_side=20)
+
+        assert [(o.width, o.height) for o in found] == [(20, 12), (30, 40)]
+        assert all(o.material == PLY for o in found)
+
+    def test_persists_across_instances(self, inventory: OffcutInventory) -> None:
+        inventory.add([_offcut(30, 40)], source="Smith House")
+
+        reopened = OffcutInventory(inventory.path)
+
+        assert len(reopened) == 1
+        assert reopened.all()[0].source == "Smith House"
+
+    def test_consume_is_atomic(self, inventory: OffcutInventory) -> None:
+        first, second = inventory.add([_offcut(30, 40), _offcut(20, 20)])
+        inventory.consume([first])
+
+        with pytest.raises(OffcutConflictError):
+            inventory.consume([first, second], [_offcut(10, 10)])
+
+        assert [o.id for o in inventory.all()] == [second]
+
+    def test_lookup_uses_size_index(self, inventory: OffcutInventory) -> None:
+        inventory.add(_offcut(10 + i % 30, 10 + i % 50) for i in range(2000))
+
+        with sqlite3.connect(inventory.path) as db:
+            plan = db.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM offcuts WHERE material_type = ?"
+                " AND thickness = ? AND short_side >= ? AND long_side >= ?",
+                ("plywood", 0.75, 20.0, 30.0),
+            ).fetchall()
+
+        assert "offcuts_by_size" in str(plan)
+        expected = sorted(
+            o.id
+            for o in inventory.all()
+            if min(o.width, o.height) >= 20 and max(o.width, o.height) >= 30
+        )
+        assert sorted(o.id for o in inventory.find(PLY, 20.0, 30.0)) == expected
+
+
+class TestPackingWithInventory:
+    """Tests for GuillotineBinPacker filling stored offcuts first."""
+
+    def test_stored_offcut_filled_before_new_sheet(
+        self, inventory: OffcutInventory
+    ) -> None:
+        (stored,) = inventory.add([_offcut(30, 40)])
+        packer = GuillotineBinPacker(BinPackingConfig(), inventory)
+
+        result = packer.pack([_piece(12, 18, quantity=2)], PLY, job="Pantry")
+
+        assert result.sheets_by_material == {PLY: 0}
+        assert [layout.offcut_id for layout in result.layouts] == [stored]
+        assert result.total_pieces_placed == 2
+        # The used offcut is gone and its leftovers are stored
+        remaining = inventory.all()
+        assert stored not in [o.id for o in remaining]
+        assert remaining and {o.source for o in remaining} == {"Pantry"}
+        assert len(remaining) == len(result.offcuts)
+
+    def test_piece_opens_narrowest_offcut_it_fits(
+        self, inventory: OffcutInventory
+    ) -> None:
+        ids = inventory.add(
+            [_offcut(60, 60), _offcut(10, 100), _offcut(25, 25), _offcut(50, 30)]
+        )
+        packer = GuillotineBinPacker(BinPackingConfig(), inventory)
+
+        result = packer.pack([_piece(20, 40)], PLY)
+
+        assert [layout.offcut_id for layout in result.layouts] == [ids[3]]
+
+    def test_too_narrow_offcuts_not_tried(self, inventory: OffcutInventory) -> None:
+        inventory.add([_offcut(5, 5) for _ in range(500)])
+        (stored,) = inventory.add([_offcut(30, 40)])
+        packer = GuillotineBinPacker(BinPackingConfig(), inventory)
+        place = packer._place_on_new_shelf
+
+        with patch.object(
+            packer, "_place_on_new_shelf", side_effect=place
+        ) as new_shelf:
+            result = packer.pack([_piece(12, 18, quantity=3), _piece(4, 4)], PLY)
+
+        assert result.sheets_by_material == {PLY: 0}
+        assert stored in [layout.offcut_id for layout in result.layouts]
+        assert new_shelf.call_count < 10
+
+    def test_pieces_that_do_not_fit_go_on_new_sheets(
+        self, inventory: OffcutInventory
+    ) -> None:
+        inventory.add([_offcut(20, 20)])
+        service = BinPackingService(BinPackingConfig(), inventory)
+
+        result = service.optimize_cut_list([_piece(16, 16), _piece(30, 60)])
+
+        assert result.sheets_by_material == {PLY: 1}
+        assert [layout.is_offcut for layout in result.layouts] == [False, True]
+        assert result.total_pieces_placed == 2
+
+    def test_repeat_job_buys_fewer_sheets(self, inventory: OffcutInventory) -> None:
+        service = BinPackingService(BinPackingConfig(), inventory)
+        pieces = [_piece(22, 30, quantity=2)]
+
+        first = service.optimize_cut_list(pieces, job="first")
+        second = service.optimize_cut_list(pieces, job="second")
+
+        assert first.total_sheets == 1
+        assert second.total_sheets == 0
+
+    def test_replans_when_offcut_taken(self, inventory: OffcutInventory) -> None:
+        inventory.add([_offcut(30, 40)])
+        packer = GuillotineBinPacker(BinPackingConfig(), inventory)
+        consume = inventory.consume
+        calls: list[int] = []
+
+        def take_first(*args: object, **kwargs: object) -> list[int]:
+            calls.append(1)
+            if len(calls) == 1:
+                inventory.clear()
+                raise OffcutConflictError("taken")
+            return consume(*args, **kwargs)  # type: ignore[arg-type]
+
+        with patch.object(inventory, "consume", side_effect=take_first):
+            result = packer.pack([_piece(12, 18)], PLY)
+
+        assert len(calls) == 2
+        assert result.sheets_by_material == {PLY: 1}
+        assert not any(layout.is_offcut for layout in result.layouts)
+
+    def test_count_sheets_leaves_inventory_alone(
+        self, inventory: OffcutInventory
+    ) -> None:
+        inventory.add([_offcut(30, 40)])
+        packer = GuillotineBinPacker(BinPackingConfig(), inventory)
+
+        assert packer.count_sheets([_piece(12, 18)]) == 1
+        assert len(inventory) == 1
@@ -7,12 +7,14 @@ These tests verify:
 - Panel metadata handling for angled panels
 """
 
+import contextvars
 import math
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from cabinets.domain.entities import Cabinet, Panel
-from cabinets.domain.services import Panel3DMapper
+from cabinets.domain.services import Panel3DMapper, mapper_session
 from cabinets.domain.value_objects import (
     BoundingBox3D,
     MaterialSpec,
@@ -1145,3 +1147,74 @@ class TestFallbackPanelType:
         assert isinstance(result, BoundingBox3D)
         # Should use horizontal panel semantics
         assert result.size_z == pytest.approx(standard_material.thickness)
+
+
+class TestPanel3DMapperMemoization:
+    """Tests for cached panels and boxes."""
+
+    def test_map_panel_cached_per_panel(self, mapper: Panel3DMapper) -> None:
+        """Mapping the same panel twice should return the cached box."""
+        panel = mapper.panels()[0]
+
+        assert mapper.map_panel(panel) is mapper.map_panel(panel)
+
+    def test_equal_panels_mapped_separately(
+        self, mapper: Panel3DMapper, standard_material: MaterialSpec
+    ) -> None:
+        """Cache entries are keyed by panel identity, not equality."""
+        first = Panel(
+            PanelType.SHELF, 22.5, 11.5, standard_material, Position(0.75, 10)
+        )
+        second = Panel(
+            PanelType.SHELF, 22.5, 11.5, standard_material, Position(0.75, 20)
+        )
+
+        assert mapper.map_panel(first).origin.z == 10
+        assert mapper.map_panel(second).origin.z == 20
+
+    def test_all_panels_generated_once(self, mapper: Panel3DMapper) -> None:
+        """Repeated mapping reuses the generated panels and boxes."""
+        first = mapper.map_all_panels_with_types()
+        second = mapper.map_all_panels_with_types()
+
+        assert all(a[0] is b[0] and a[1] is b[1] for a, b in zip(first, second))
+        assert mapper.map_all_panels() == [box for box, _ in first]
+
+    def test_for_cabinet_shares_mapper_in_session(
+        self, simple_cabinet: Cabinet
+    ) -> None:
+        """for_cabinet should return one mapper per cabinet within a session."""
+        with mapper_session():
+            mapper = Panel3DMapper.for_cabinet(simple_cabinet)
+            with mapper_session():
+                assert Panel3DMapper.for_cabinet(simple_cabinet) is mapper
+
+        assert mapper.cabinet is simple_cabinet
+        assert Panel3DMapper.for_cabinet(simple_cabinet) is not mapper
+
+    def test_cabinet_changed_between_sessions(self, simple_cabinet: Cabinet) -> None:
+        """A cabinet modified after an export is mapped afresh."""
+        with mapper_session():
+            before = Panel3DMapper.for_cabinet(simple_cabinet).map_all_panels()
+
+        simple_cabinet.width += 12.0
+        with mapper_session():
+            after = Panel3DMapper.for_cabinet(simple_cabinet).map_all_panels()
+
+        assert max(box.size_x for box in after) > max(box.size_x for box in before)
+
+    def test_session_shared_across_threads(self, simple_cabinet: Cabinet) -> None:
+        """Threads running in a copy of the session's context share mappers."""
+        with mapper_session():
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                mappers = list(
+                    pool.map(
+                        lambda _: context.copy().run(
+                            Panel3DMapper.for_cabinet, simple_cabinet
+                        ),
+                        range(8),
+                    )
+                )
+
+        assert all(mapper is mappers[0] for mapper in mappers)
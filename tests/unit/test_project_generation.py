@@ -0,0 +1,217 @@
+"""Tests for multi-room project configuration, generation and CLI command."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from typer.testing import CliRunner
+
+from cabinets.application.config import (
+    ConfigError,
+    ProjectConfiguration,
+    config_to_bin_packing,
+    load_config,
+    load_project_config,
+)
+from cabinets.application.services import ProjectGenerationService
+from cabinets.application.services.project_generation import _consolidate_hardware
+from cabinets.cli.main import app
+from cabinets.domain.components.results import HardwareItem
+from cabinets.infrastructure import BinPackingService, OffcutInventory
+
+runner = CliRunner()
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "configs"
+
+PANTRY = {
+    "schema_version": "1.0",
+    "cabinet": {"width": 36.0, "height": 48.0, "depth": 12.0, "default_shelves": 3},
+}
+
+
+@pytest.fixture
+def project_file(tmp_path: Path) -> Path:
+    """Write a project with two room files and one inline room."""
+    for name in ("room_l_shape.json", "valid_minimal.json"):
+        shutil.copy(FIXTURES / name, tmp_path / name)
+    path = tmp_path / "house.json"
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": "1.0",
+                "name": "Smith House",
+                "rooms": [
+                    {"name": "Den", "path": "room_l_shape.json"},
+                    {"name": "Office", "path": "valid_minimal.json"},
+                    {"name": "Pantry", "config": PANTRY},
+                ],
+            }
+        )
+    )
+    return path
+
+
+class TestProjectConfiguration:
+    """Tests for ProjectConfiguration validation."""
+
+    def test_room_needs_config_or_path(self) -> None:
+        with pytest.raises(ValidationError, match="exactly one of"):
+            ProjectConfiguration.model_validate(
+                {"schema_version": "1.0", "rooms": [{"name": "Den"}]}
+            )
+
+    def test_duplicate_room_names_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="Duplicate room name"):
+            ProjectConfiguration.model_validate(
+                {
+                    "schema_version": "1.0",
+                    "rooms": [
+                        {"name": "Den", "config": PANTRY},
+                        {"name": "Den", "config": PANTRY},
+                    ],
+                }
+            )
+
+    def test_unsupported_version_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="Unsupported schema version"):
+            ProjectConfiguration.model_validate(
+                {"schema_version": "9.0", "rooms": [{"name": "Den", "config": PANTRY}]}
+            )
+
+
+class TestLoadProjectConfig:
+    """Tests for load_project_config."""
+
+    def test_room_files_resolved_relative_to_project(self, project_file: Path) -> None:
+        project = load_project_config(project_file)
+
+        assert [room.name for room in project.rooms] == ["Den", "Office", "Pantry"]
+        assert all(room.path is None for room in project.rooms)
+        assert project.rooms[0].config == load_config(FIXTURES / "room_l_shape.json")
+
+    def test_missing_room_file(self, project_file: Path) -> None:
+        (project_file.parent / "valid_minimal.json").unlink()
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_project_config(project_file)
+
+        assert exc_info.value.error_type == "file_not_found"
+        assert exc_info.value.path == project_file.parent / "valid_minimal.json"
+
+
+class TestProjectGenerationService:
+    """Tests for ProjectGenerationService."""
+
+    def test_rooms_packed_together(self, project_file: Path) -> None:
+        project = load_project_config(project_file)
+
+        result = ProjectGenerationService(use_processes=False).run(project)
+
+        assert result.is_valid
+        assert list(result.rooms) == ["Den", "Office", "Pantry"]
+        assert result.packing_result is not None
+        assert any(piece.label.startswith("Pantry: ") for piece in result.cut_list)
+        assert sum(p.quantity for p in result.cut_list) == sum(
+            p.quantity for output in result.rooms.values() for p in output.cut_list
+        )
+        # One shared pass never needs more sheets than packing rooms apart
+        packer = BinPackingService(config_to_bin_packing(None))
+        separate = sum(
+            packer.optimize_cut_list(output.cut_list).total_sheets
+            for output in result.rooms.values()
+        )
+        assert result.packing_result.total_sheets <= separate
+
+    def test_cut_list_grouped_by_material(self, project_file: Path) -> None:
+        project = load_project_config(project_file)
+
+        result = ProjectGenerationService(use_processes=False).run(project)
+
+        materials = [piece.material for piece in result.cut_list]
+        groups = [m for i, m in enumerate(materials) if i == 0 or m != materials[i - 1]]
+        assert len(groups) == len(set(materials))
+
+    def test_failed_room_reported_by_name(self) -> None:
+        bad = {**PANTRY, "cabinet": {**PANTRY["cabinet"], "sections": [{"width": 99}]}}
+        project = ProjectConfiguration.model_validate(
+            {
+                "schema_version": "1.0",
+                "rooms": [
+                    {"name": "Pantry", "config": PANTRY},
+                    {"name": "Closet", "config": bad},
+                ],
+            }
+        )
+
+        result = ProjectGenerationService(use_processes=False).run(project)
+
+        assert not result.is_valid
+        assert list(result.rooms) == ["Pantry"]
+        assert result.errors and result.errors[0].startswith("Closet: ")
+
+    def test_hardware_consolidated(self) -> None:
+        items = [
+            HardwareItem(name="Hinge", quantity=2, sku="H1"),
+            HardwareItem(name="Screw", quantity=8),
+            HardwareItem(name="Hinge", quantity=4, sku="H1"),
+        ]
+
+        assert _consolidate_hardware(items) == [
+            HardwareItem(name="Hinge", quantity=6, sku="H1"),
+            HardwareItem(name="Screw", quantity=8),
+        ]
+
+
+class TestProjectCommand:
+    """Tests for the project CLI command."""
+
+    def test_json_output(self, project_file: Path) -> None:
+        result = runner.invoke(
+            app, ["project", str(project_file), "--workers", "1", "-f", "json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert [room["name"] for room in data["rooms"]] == ["Den", "Office", "Pantry"]
+        assert sum(data["sheets"].values()) == sum(
+            item["quantity"] for item in data["bom"]["sheet_goods"]
+        )
+
+    def test_writes_bom_file(self, project_file: Path, tmp_path: Path) -> None:
+        bom = tmp_path / "bom.csv"
+
+        result = runner.invoke(
+            app, ["project", str(project_file), "--workers", "1", "-o", str(bom)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Project: Smith House (3 rooms)" in result.output
+        assert bom.read_text().startswith("Category,")
+
+    def test_offcut_inventory_used_on_repeat_job(
+        self, project_file: Path, tmp_path: Path
+    ) -> None:
+        inventory = tmp_path / "offcuts.db"
+        args = ["project", str(project_file), "--workers", "1", "-f", "json"]
+        args += ["--offcut-inventory", str(inventory)]
+
+        first = json.loads(runner.invoke(app, args).output)
+        second = json.loads(runner.invoke(app, args).output)
+
+        assert first["offcuts_used"] == 0
+        assert second["offcuts_used"] > 0
+        assert sum(second["sheets"].values()) <= sum(first["sheets"].values())
+        assert len(OffcutInventory(inventory)) > 0
+
+    def test_invalid_project(self, tmp_path: Path) -> None:
+        path = tmp_path / "house.json"
+        path.write_text(json.dumps({"schema_version": "1.0", "rooms": []}))
+
+        result = runner.invoke(app, ["project", str(path)])
+
+        assert result.exit_code == 1
+        assert "rooms" in result.output
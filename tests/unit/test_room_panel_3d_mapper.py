@@ -681,3 +681,78 @@ class TestIntegrationScenarios:
             assert orig.size_x == pytest.approx(rot.size_x, abs=1e-9)
             assert orig.size_y == pytest.approx(rot.size_y, abs=1e-9)
             assert orig.size_z == pytest.approx(rot.size_z, abs=1e-9)
+
+
+class TestBatchTransforms:
+    """Tests for batched room transforms."""
+
+    def test_room_corners_match_rotated_vertices(self, simple_cabinet: Cabinet) -> None:
+        """Batched corners should equal rotating each vertex on its own."""
+        boxes = Panel3DMapper(simple_cabinet).map_all_panels()
+        transforms = [
+            SectionTransform(
+                section_index=i,
+                wall_index=0,
+                position=Position3D(x=10.0 * i, y=50.0, z=1.0),
+                rotation_z=37.0 * i,
+            )
+            for i in range(len(boxes))
+        ]
+
+        corners = RoomPanel3DMapper.room_corners(boxes, transforms)
+
+        assert corners.shape == (len(boxes), 8, 3)
+        for box, transform, box_corners in zip(boxes, transforms, corners):
+            angle = math.radians(transform.rotation_z)
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            expected = [
+                (
+                    x * cos_a - y * sin_a + transform.position.x,
+                    x * sin_a + y * cos_a + transform.position.y,
+                    z + transform.position.z,
+                )
+                for x, y, z in box.get_vertices()
+            ]
+            assert box_corners.tolist() == [list(v) for v in expected]
+
+    def test_batch_matches_single_box_transform(
+        self, room_mapper: RoomPanel3DMapper, simple_cabinet: Cabinet
+    ) -> None:
+        """Mapping several cabinets at once should match one-by-one mapping."""
+        transforms = [
+            SectionTransform(
+                section_index=0,
+                wall_index=0,
+                position=Position3D(x=0.0, y=0.0, z=0.0),
+                rotation_z=0.0,
+            ),
+            SectionTransform(
+                section_index=1,
+                wall_index=1,
+                position=Position3D(x=120.0, y=0.0, z=0.0),
+                rotation_z=90.0,
+            ),
+        ]
+        second = Cabinet(
+            width=36.0,
+            height=30.0,
+            depth=12.0,
+            material=simple_cabinet.material,
+            back_material=simple_cabinet.back_material,
+        )
+
+        batched = room_mapper.map_cabinets_to_boxes(
+            [simple_cabinet, second], transforms
+        )
+        single = [
+            room_mapper._apply_transform(box, transform)
+            for cabinet, transform in zip([simple_cabinet, second], transforms)
+            for box in Panel3DMapper(cabinet).map_all_panels()
+        ]
+
+        assert batched == single
+
+    def test_empty_batch(self, room_mapper: RoomPanel3DMapper) -> None:
+        """An empty batch should produce no boxes."""
+        assert room_mapper._apply_transforms([], []) == []
+        assert RoomPanel3DMapper.room_corners([], []).shape == (0, 8, 3)
@@ -1237,6 +1237,44 @@ class TestSafetyServiceWeightCapacity:
 
         assert capacities == []
 
+    def test_get_shelf_capacities_matches_beam_formula(self) -> None:
+        """Batched capacities match the per-shelf beam deflection formula."""
+        config = SafetyConfig(safety_factor=3.0, deflection_limit_ratio=240)
+        service = SafetyService(config)
+        cabinet = self.make_cabinet_with_shelves(width=36.0, num_shelves=2)
+
+        capacities = service.get_shelf_capacities(cabinet)
+
+        span = cabinet.sections[0].width - 1.5
+        depth = cabinet.sections[0].shelves[0].depth
+        moment_of_inertia = (depth * 0.75**3) / 12
+        max_deflection = span / 240
+        max_load = (max_deflection * 384 * 1_200_000 * moment_of_inertia) / (
+            5 * span**4
+        )
+        assert [c.panel_id for c in capacities] == [
+            "section_0_shelf_0",
+            "section_0_shelf_1",
+        ]
+        assert capacities[0].span_inches == pytest.approx(span)
+        assert capacities[0].safe_load_lbs == round(max_load / 3.0, 1)
+        assert capacities[0].max_deflection_inches == round(max_deflection, 3)
+
+    def test_analyze_reuses_shelf_capacities(self) -> None:
+        """analyze() reports the same capacities as get_shelf_capacities()."""
+        service = SafetyService(SafetyConfig(safety_factor=4.0))
+        cabinet = self.make_cabinet_with_shelves(num_shelves=3)
+
+        assessment = service.analyze(cabinet)
+
+        assert assessment.weight_capacities == service.get_shelf_capacities(cabinet)
+        capacity_checks = [
+            r
+            for r in assessment.check_results
+            if r.check_id.startswith("weight_capacity_section")
+        ]
+        assert len(capacity_checks) == 3
+
 
 # ==============================================================================
 # SafetyService Structural Checks Tests
@@ -1417,3 +1455,95 @@ class TestSafetyServiceLabelGeneration:
 
         anti_tip_labels = [label for label in labels if label.label_type == "anti_tip"]
         assert len(anti_tip_labels) == 0
+
+
+class TestSafetyAnalysisContext:
+    """Test the shared analysis context and concurrent assessment."""
+
+    def make_cabinet(self, num_sections: int = 2, num_shelves: int = 3) -> Cabinet:
+        """Create a tall multi-section cabinet for testing."""
+        material = MaterialSpec.standard_3_4()
+        cabinet = Cabinet(width=48.0, height=84.0, depth=12.0, material=material)
+        section_width = (48.0 - (num_sections + 1) * material.thickness) / num_sections
+        for i in range(num_sections):
+            section = Section(
+                width=section_width,
+                height=84.0,
+                depth=12.0,
+                position=Position(material.thickness + i * section_width, 0),
+            )
+            for _ in range(num_shelves):
+                section.add_shelf(
+                    Shelf(
+                        width=section_width,
+                        depth=12.0 - material.thickness,
+                        material=material,
+                        position=Position(0, 0),
+                    )
+                )
+            cabinet.sections.append(section)
+        return cabinet
+
+    def test_build_context(self) -> None:
+        """Test context gathers bounds, shelf heights, weight and capacities."""
+        service = SafetyService(SafetyConfig())
+        cabinet = self.make_cabinet()
+
+        context = service.build_context(cabinet)
+
+        assert context.bounds["right"] == 48.0
+        assert context.bounds["top"] == 84.0
+        assert len(context.shelf_placements) == 6
+        assert len(context.weight_capacities) == 6
+        assert len(context.shelf_table) == 6
+        assert context.empty_weight_lbs > 0
+        assert not context.is_wall_mounted
+        heights = [p.height_from_floor for p in context.shelf_placements[:3]]
+        assert heights == sorted(heights)
+
+    def test_context_matches_direct_analysis(self) -> None:
+        """Test context-based accessibility matches a standalone analysis."""
+        service = SafetyService(SafetyConfig(accessibility_enabled=True))
+        cabinet = self.make_cabinet()
+
+        context = service.build_context(cabinet)
+
+        assert service._accessibility.analyze_accessibility(
+            cabinet, context
+        ) == service.analyze_accessibility(cabinet)
+
+    def test_anti_tip_details_include_weight(self) -> None:
+        """Test context adds the estimated weight to a required restraint."""
+        service = SafetyService(SafetyConfig())
+        cabinet = self.make_cabinet()
+
+        result = service.check_anti_tip_requirement(
+            cabinet, service.build_context(cabinet)
+        )
+
+        assert result.details["anti_tip_required"] is True
+        assert result.details["empty_weight_lbs"] > 0
+
+    def test_concurrent_analyze_matches_sequential(self) -> None:
+        """Test running checks on threads yields the same assessment."""
+        config = SafetyConfig(
+            accessibility_enabled=True,
+            child_safe_mode=True,
+            seismic_zone=SeismicZone.D,
+        )
+        cabinet = self.make_cabinet()
+
+        sequential = SafetyService(config).analyze(cabinet, obstacles=[])
+        concurrent = SafetyService(config, max_workers=4).analyze(cabinet, obstacles=[])
+
+        assert [r.check_id for r in concurrent.check_results] == [
+            r.check_id for r in sequential.check_results
+        ]
+        assert concurrent.weight_capacities == sequential.weight_capacities
+        assert concurrent.accessibility_report == sequential.accessibility_report
+        assert concurrent.anti_tip_required is sequential.anti_tip_required is True
+
+    def test_invalid_max_workers(self) -> None:
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            SafetyService(SafetyConfig(), max_workers=0)
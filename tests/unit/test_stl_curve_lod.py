@@ -0,0 +1,209 @@
+"""Tests for level-of-detail resampling of curved STL geometry."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from cabinets.domain import BoundingBox3D
+from cabinets.domain.value_objects import Position3D
+from cabinets.infrastructure.exporters import StlLayoutExporter
+from cabinets.infrastructure.stl_exporter import (
+    CurveLOD,
+    StlMeshBuilder,
+    _point_segment_distance,
+    resample_curve,
+    resample_scallops,
+)
+
+
+def semicircle(
+    num_points: int = 101, radius: float = 12.0
+) -> list[tuple[float, float]]:
+    """Dense semicircular arch profile centred on x=0."""
+    return [
+        (
+            -radius * math.cos(math.pi * i / (num_points - 1)),
+            radius * math.sin(math.pi * i / (num_points - 1)),
+        )
+        for i in range(num_points)
+    ]
+
+
+def max_deviation(
+    original: list[tuple[float, float]], resampled: list[tuple[float, float]]
+) -> float:
+    """Largest distance from an original point to the resampled polyline."""
+    return max(
+        min(
+            _point_segment_distance(p, resampled[i], resampled[i + 1])
+            for i in range(len(resampled) - 1)
+        )
+        for p in original
+    )
+
+
+@pytest.fixture
+def box() -> BoundingBox3D:
+    """Arch header stock: 24" wide, 3/4" thick, 14" tall."""
+    return BoundingBox3D(
+        origin=Position3D(x=0.0, y=0.0, z=0.0),
+        size_x=24.0,
+        size_y=0.75,
+        size_z=14.0,
+    )
+
+
+class TestCurveLOD:
+    """Tests for CurveLOD settings."""
+
+    def test_default_is_full_detail(self) -> None:
+        """No limits means full detail."""
+        assert CurveLOD().is_full_detail
+
+    def test_presets(self) -> None:
+        """Named presets resolve to CurveLOD instances."""
+        assert CurveLOD.from_name("full").is_full_detail
+        assert not CurveLOD.from_name("preview").is_full_detail
+
+    def test_unknown_preset_rejected(self) -> None:
+        """Unknown preset names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown curve LOD"):
+            CurveLOD.from_name("ultra")
+
+    def test_invalid_limits_rejected(self) -> None:
+        """Negative error and zero segments are invalid."""
+        with pytest.raises(ValueError):
+            CurveLOD(max_chord_error=-1.0)
+        with pytest.raises(ValueError):
+            CurveLOD(max_segments=0)
+
+
+class TestResampleCurve:
+    """Tests for resample_curve."""
+
+    def test_full_detail_keeps_all_points(self) -> None:
+        """Full detail returns the input unchanged."""
+        points = semicircle()
+        assert resample_curve(points, CurveLOD()) == points
+
+    def test_chord_error_respected(self) -> None:
+        """Every original point stays within the chord error."""
+        points = semicircle()
+        lod = CurveLOD(max_chord_error=0.05)
+
+        resampled = resample_curve(points, lod)
+
+        assert len(resampled) < len(points)
+        assert max_deviation(points, resampled) <= 0.05
+
+    def test_max_segments_caps_output(self) -> None:
+        """Segment count never exceeds max_segments."""
+        resampled = resample_curve(semicircle(), CurveLOD(max_segments=8))
+        assert len(resampled) == 9
+
+    def test_endpoints_and_order_preserved(self) -> None:
+        """Output is an ordered subset of the input including both ends."""
+        points = semicircle()
+        resampled = resample_curve(points, CurveLOD(max_chord_error=0.1))
+
+        assert resampled[0] == points[0]
+        assert resampled[-1] == points[-1]
+        indices = [points.index(p) for p in resampled]
+        assert indices == sorted(indices)
+
+    def test_straight_line_collapses(self) -> None:
+        """Collinear points reduce to the two end points."""
+        points = [(float(x), 0.0) for x in range(10)]
+        assert resample_curve(points, CurveLOD(max_chord_error=0.0)) == [
+            (0.0, 0.0),
+            (9.0, 0.0),
+        ]
+
+    def test_scallop_cusps_kept(self) -> None:
+        """Scallop boundaries (y=0 between scallops) survive a coarse LOD."""
+        points: list[tuple[float, float]] = []
+        for i in range(3):
+            for j in range(11):
+                if i > 0 and j == 0:
+                    continue
+                angle = math.pi * j / 10
+                points.append((4.0 + 8.0 * i - 4.0 * math.cos(angle), math.sin(angle)))
+
+        resampled = resample_curve(points, CurveLOD(max_chord_error=0.25))
+
+        for cusp_x in (8.0, 16.0):
+            assert any(
+                x == pytest.approx(cusp_x) and y == pytest.approx(0.0, abs=1e-9)
+                for x, y in resampled
+            )
+
+
+class TestResampleScallops:
+    """Tests for per-scallop resampling of valance profiles."""
+
+    @staticmethod
+    def valance(count: int = 10, points_per_scallop: int = 41) -> list:
+        """Ten 3" semicircular scallops, 1" deep, sharing their cusps."""
+        points = []
+        for i in range(count):
+            for j in range(0 if i == 0 else 1, points_per_scallop):
+                angle = math.pi * j / (points_per_scallop - 1)
+                points.append((3.0 * i + 1.5 - 1.5 * math.cos(angle), math.sin(angle)))
+        return points
+
+    def test_max_segments_applies_per_scallop(self) -> None:
+        """Every scallop keeps its own segment budget and cusps."""
+        points = self.valance()
+
+        resampled = resample_scallops(points, CurveLOD(max_segments=4))
+
+        assert len(resampled) == 10 * 4 + 1
+        cusps = [x for x, y in resampled if y < 1e-9]
+        assert cusps == pytest.approx([3.0 * i for i in range(11)])
+
+    def test_preview_preserves_valance_shape(self) -> None:
+        """The preview preset stays within its chord error on a valance."""
+        points = self.valance()
+        lod = CurveLOD.from_name("preview")
+
+        resampled = resample_scallops(points, lod)
+
+        assert len(resampled) < len(points)
+        assert lod.max_chord_error is not None
+        assert max_deviation(points, resampled) <= lod.max_chord_error + 1e-9
+
+
+class TestMeshBuilderLOD:
+    """Tests for LOD in the decorative mesh builders."""
+
+    def test_preview_arch_has_fewer_triangles(self, box: BoundingBox3D) -> None:
+        """Preview LOD reduces arch header triangle count."""
+        points = semicircle()
+        full = StlMeshBuilder().build_arch_header_mesh(box, points)
+        preview = StlMeshBuilder(CurveLOD.from_name("preview")).build_arch_header_mesh(
+            box, points
+        )
+
+        assert len(preview.vectors) < len(full.vectors)
+        # Four triangles per boundary vertex (front, back, two edge)
+        assert len(full.vectors) == 4 * (len(points) + 2)
+
+    def test_preview_scallop_has_fewer_triangles(self, box: BoundingBox3D) -> None:
+        """Preview LOD reduces scalloped panel triangle count."""
+        points = [(24.0 * i / 200, math.sin(math.pi * i / 200)) for i in range(201)]
+        full = StlMeshBuilder().build_scalloped_panel_mesh(box, points)
+        preview = StlMeshBuilder(CurveLOD(max_segments=10)).build_scalloped_panel_mesh(
+            box, points
+        )
+
+        assert len(preview.vectors) == 4 * (11 + 2)
+        assert len(preview.vectors) < len(full.vectors)
+
+    def test_layout_exporter_accepts_preset_name(self) -> None:
+        """StlLayoutExporter builds a mesh builder from a preset name."""
+        exporter = StlLayoutExporter(curve_lod="preview")
+        builder = exporter._exporter.mesh_builder
+
+        assert builder.curve_lod == CurveLOD.from_name("preview")
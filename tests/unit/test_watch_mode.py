@@ -0,0 +1,287 @@
+"""Tests for generate --watch and incremental artifact rebuilds."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from cabinets.application.config import CabinetConfiguration, load_config_from_dict
+from cabinets.cli.commands.watch import (
+    IncrementalBuilder,
+    changed_config_fields,
+    watch_config,
+)
+from cabinets.cli.main import app
+from cabinets.infrastructure.exporters import (
+    AssemblyInstructionGenerator,
+    DxfExporter,
+    ExportManager,
+)
+
+runner = CliRunner()
+
+BASE: dict[str, Any] = {
+    "schema_version": "1.0",
+    "cabinet": {"width": 48, "height": 60, "depth": 12},
+}
+
+
+def _config(**updates: Any) -> CabinetConfiguration:
+    return load_config_from_dict({**BASE, **updates})
+
+
+def _mtimes(directory: Path) -> dict[str, int]:
+    return {p.name: p.stat().st_mtime_ns for p in directory.iterdir()}
+
+
+class TestChangedConfigFields:
+    """Tests for changed_config_fields."""
+
+    def test_first_build_changes_every_field(self) -> None:
+        fields = changed_config_fields(None, _config())
+        assert fields == list(CabinetConfiguration.model_fields)
+
+    def test_reports_only_changed_fields(self) -> None:
+        changed = _config(cabinet={"width": 60, "height": 60, "depth": 12})
+        assert changed_config_fields(_config(), changed) == ["cabinet"]
+        assert changed_config_fields(_config(), _config()) == []
+
+
+class TestIncrementalBuilder:
+    """Tests for IncrementalBuilder stage selection and artifact writes."""
+
+    def test_first_build_runs_every_stage(self, tmp_path: Path) -> None:
+        report = IncrementalBuilder(["stl", "bom"], tmp_path).rebuild(_config())
+
+        assert report.is_valid
+        assert report.stages == ("layout", "packing", "export")
+        assert sorted(p.name for p in report.written) == [
+            "cabinet_bom.txt",
+            "cabinet_stl.stl",
+        ]
+
+    def test_unchanged_config_runs_nothing(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl"], tmp_path)
+        builder.rebuild(_config())
+
+        report = builder.rebuild(_config())
+        assert report.stages == ()
+        assert report.writes == ()
+
+    def test_output_change_skips_all_stages(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl"], tmp_path)
+        builder.rebuild(_config())
+
+        report = builder.rebuild(_config(output={"format": "json"}))
+        assert report.changed_fields == ("output",)
+        assert report.stages == ()
+
+    def test_packing_change_keeps_layout(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl", "svg"], tmp_path)
+        builder.rebuild(_config())
+        layout = builder.result
+
+        report = builder.rebuild(_config(bin_packing={"enabled": True}))
+
+        assert report.stages == ("packing", "export")
+        assert builder.result.cabinet is layout.cabinet
+        assert layout.packing_result is None
+        assert [p.name for p in report.written] == ["cabinet_svg.svg"]
+        assert [p.name for p in report.unchanged] == ["cabinet_stl.stl"]
+
+    def test_layout_change_rewrites_only_changed_files(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl", "assembly"], tmp_path)
+        builder.rebuild(_config())
+        before = _mtimes(tmp_path)
+
+        report = builder.rebuild(
+            _config(cabinet={"width": 60, "height": 60, "depth": 12})
+        )
+
+        assert report.stages == ("layout", "packing", "export")
+        assert "cabinet_stl.stl" in [p.name for p in report.written]
+        after = _mtimes(tmp_path)
+        for path in report.unchanged:
+            assert after[path.name] == before[path.name]
+
+    def test_restarted_builder_leaves_identical_files(self, tmp_path: Path) -> None:
+        formats = ["stl", "dxf", "json", "assembly", "bom"]
+        IncrementalBuilder(formats, tmp_path).rebuild(_config())
+        before = _mtimes(tmp_path)
+
+        report = IncrementalBuilder(formats, tmp_path).rebuild(_config())
+
+        assert report.written == []
+        assert len(report.unchanged) == len(formats)
+        assert _mtimes(tmp_path) == before
+
+    def test_failed_layout_keeps_previous_state(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl"], tmp_path)
+        builder.rebuild(_config())
+        layout = builder.result
+
+        bad = _config(
+            cabinet={
+                "width": 48,
+                "height": 60,
+                "depth": 12,
+                "sections": [{"width": 40}, {"width": 40}],
+            }
+        )
+        report = builder.rebuild(bad)
+
+        assert not report.is_valid
+        assert "exceed" in report.errors[0]
+        assert builder.result is layout
+        # Returning to the last good config needs no work
+        assert builder.rebuild(_config()).stages == ()
+
+    def test_failed_export_keeps_previous_packing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        builder = IncrementalBuilder(["stl", "svg"], tmp_path)
+        builder.rebuild(_config(bin_packing={"enabled": True}))
+        layout = builder.result
+        packing = layout.packing_result
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(ExportManager, "export_changed", fail)
+        report = builder.rebuild(_config(bin_packing={"enabled": False}))
+
+        assert not report.is_valid
+        assert builder.result is layout
+        assert packing is not None
+        assert layout.packing_result is packing
+
+    def test_zone_stack_config(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["json", "stl", "bom"], tmp_path)
+        config = _config(
+            cabinet={
+                "width": 48,
+                "height": 84,
+                "depth": 24,
+                "zone_stack": {"preset": "kitchen"},
+            }
+        )
+
+        report = builder.rebuild(config)
+
+        assert report.is_valid
+        assert report.stages == ("layout", "export")
+        assert sorted(p.name for p in report.written) == [
+            "cabinet_base.stl",
+            "cabinet_upper.stl",
+            "cabinet_zone_stack.json",
+        ]
+        assert any("bom" in warning for warning in report.warnings)
+        assert (
+            IncrementalBuilder(["json", "stl"], tmp_path).rebuild(config).written == []
+        )
+
+
+class TestExportChanged:
+    """Tests for ExportManager.export_changed."""
+
+    def test_second_export_is_unchanged(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl"], tmp_path)
+        builder.rebuild(_config())
+        manager = ExportManager(tmp_path)
+
+        writes = manager.export_changed(["stl", "dxf"], builder.result)
+        again = manager.export_changed(["stl", "dxf"], builder.result)
+
+        assert [w.changed for w in writes] == [False, True]
+        assert [w.changed for w in again] == [False, False]
+        assert [w.digest for w in again] == [w.digest for w in writes]
+        # Scratch directories are removed
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "cabinet_dxf.dxf",
+            "cabinet_stl.stl",
+        ]
+
+    def test_dxf_export_is_byte_identical(self, tmp_path: Path) -> None:
+        builder = IncrementalBuilder(["stl"], tmp_path)
+        builder.rebuild(_config())
+        exporter = DxfExporter()
+
+        exporter.export(builder.result, tmp_path / "a.dxf")
+        exporter.export(builder.result, tmp_path / "b.dxf")
+
+        assert (tmp_path / "a.dxf").read_bytes() == (tmp_path / "b.dxf").read_bytes()
+        assert exporter.export_string(builder.result) == exporter.export_string(
+            builder.result
+        )
+
+    def test_assembly_digest_ignores_timestamp(self) -> None:
+        first = b"# Title\n*Generated: 2026-10-18 10:00*\nStep 1\n"
+        second = b"# Title\n*Generated: 2026-10-18 10:05*\nStep 1\n"
+        digest = AssemblyInstructionGenerator.content_digest
+        assert digest(first) == digest(second)
+
+
+class TestWatchConfig:
+    """Tests for the polling watch loop."""
+
+    def test_rebuilds_after_change(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "cabinet.json"
+        config_file.write_text(json.dumps(BASE))
+        out_dir = tmp_path / "out"
+        builder = IncrementalBuilder(["stl"], out_dir)
+        edits = iter(
+            [
+                # Saving the same content is ignored
+                json.dumps(BASE),
+                "{not json",
+                json.dumps({**BASE, "cabinet": {**BASE["cabinet"], "width": 60}}),
+            ]
+        )
+
+        def sleep(seconds: float) -> None:
+            if seconds == 1.0:
+                config_file.write_text(next(edits))
+
+        attempts = watch_config(
+            config_file,
+            builder,
+            interval=1.0,
+            debounce=0.0,
+            max_rebuilds=3,
+            sleep=sleep,
+        )
+
+        assert attempts == 3
+        assert builder.result is not None
+        assert builder.result.cabinet.width == 60
+
+    def test_overrides_apply_to_every_build(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "cabinet.json"
+        config_file.write_text(json.dumps(BASE))
+        builder = IncrementalBuilder(["stl"], tmp_path / "out")
+
+        watch_config(config_file, builder, overrides={"width": 36}, max_rebuilds=1)
+
+        assert builder.result is not None
+        assert builder.result.cabinet.width == 36
+
+
+class TestWatchOption:
+    """Tests for the --watch CLI option."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["-w", "48", "-h", "60", "-d", "12", "--output-formats", "stl"],
+            ["--config", "cabinet.json"],
+        ],
+    )
+    def test_requires_config_and_formats(self, args: list[str]) -> None:
+        result = runner.invoke(app, ["generate", "--watch", *args])
+
+        assert result.exit_code == 1
+        assert "--watch requires --config and --output-formats" in result.output
@@ -0,0 +1,157 @@
+"""Unit tests for SectionWidthOptimizerService.
+
+These tests verify:
+- Fill widths are searched within tolerance and keep the total width
+- The optimizer never does worse than the equal-split baseline
+- Depth reductions and time budgets are honoured
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cabinets.application.dtos import LayoutParametersInput, WallInput
+from cabinets.application.factory import get_factory
+from cabinets.application.services import (
+    SectionWidthOptimizerService,
+    WidthOptimizationConfig,
+)
+from cabinets.domain.section_resolver import SectionSpec, SectionWidthError
+from cabinets.infrastructure import BinPackingService, BinPackingConfig
+
+
+@pytest.fixture
+def command():
+    """Create a fully wired generate command."""
+    return get_factory().create_generate_command()
+
+
+def _inputs(
+    width: float, depth: float, sections: int
+) -> tuple[WallInput, LayoutParametersInput, list[SectionSpec]]:
+    wall = WallInput(width=width, height=84.0, depth=depth)
+    params = LayoutParametersInput(
+        num_sections=sections, shelves_per_section=4, material_thickness=0.75
+    )
+    specs = [SectionSpec(width="fill", shelves=4) for _ in range(sections)]
+    return wall, params, specs
+
+
+class TestWidthOptimizationConfig:
+    """Tests for optimizer configuration validation."""
+
+    def test_rejects_non_positive_step(self) -> None:
+        """Step must be positive."""
+        with pytest.raises(ValueError):
+            WidthOptimizationConfig(step=0)
+
+    def test_rejects_negative_tolerance(self) -> None:
+        """Tolerances must be non-negative."""
+        with pytest.raises(ValueError):
+            WidthOptimizationConfig(width_tolerance=-1)
+
+
+class TestSectionWidthOptimizer:
+    """Tests for the width search."""
+
+    def test_finds_layout_with_fewer_sheets(self, command) -> None:
+        """Uneven widths can save a sheet over the equal split."""
+        wall, params, specs = _inputs(100.0, 12.0, 2)
+        optimizer = SectionWidthOptimizerService(
+            command, config=WidthOptimizationConfig(width_tolerance=3.0)
+        )
+
+        result = optimizer.optimize(wall, params, specs)
+
+        assert result.sheet_count < result.baseline_sheet_count
+        packed = BinPackingService(BinPackingConfig()).optimize_cut_list(
+            result.output.cut_list
+        )
+        assert packed.total_sheets == result.sheet_count
+
+    def test_widths_within_tolerance_and_sum(self, command) -> None:
+        """Chosen widths stay within tolerance and fill the cabinet."""
+        wall, params, specs = _inputs(100.0, 12.0, 2)
+        optimizer = SectionWidthOptimizerService(
+            command, config=WidthOptimizationConfig(width_tolerance=3.0)
+        )
+
+        result = optimizer.optimize(wall, params, specs)
+
+        equal = (100.0 - 3 * 0.75) / 2
+        assert sum(result.section_widths) == pytest.approx(2 * equal)
+        assert all(abs(w - equal) <= 3.0 + 1e-9 for w in result.section_widths)
+        assert [s.width for s in result.section_specs] == result.section_widths
+
+    def test_never_worse_than_baseline(self, command) -> None:
+        """Without improvement the equal split is kept."""
+        wall, params, specs = _inputs(96.0, 16.0, 4)
+        optimizer = SectionWidthOptimizerService(
+            command, config=WidthOptimizationConfig(width_tolerance=1.0)
+        )
+
+        result = optimizer.optimize(wall, params, specs)
+
+        assert result.sheet_count <= result.baseline_sheet_count
+        if result.sheets_saved == 0:
+            assert result.section_widths == [pytest.approx(23.0625)] * 4
+
+    def test_fixed_sections_untouched(self, command) -> None:
+        """Fixed-width sections keep their width."""
+        wall, params, _ = _inputs(100.0, 12.0, 3)
+        specs = [
+            SectionSpec(width=20.0, shelves=4),
+            SectionSpec(width="fill", shelves=4),
+            SectionSpec(width="fill", shelves=4),
+        ]
+        optimizer = SectionWidthOptimizerService(command)
+
+        result = optimizer.optimize(wall, params, specs)
+
+        assert result.section_widths[0] == 20.0
+        assert result.section_specs[0] is specs[0]
+
+    def test_depth_reduction_bounded(self, command) -> None:
+        """Depth reductions never exceed depth_tolerance."""
+        wall, params, specs = _inputs(60.0, 24.0, 4)
+        optimizer = SectionWidthOptimizerService(
+            command,
+            config=WidthOptimizationConfig(width_tolerance=1.0, depth_tolerance=2.0),
+        )
+
+        result = optimizer.optimize(wall, params, specs)
+
+        assert 0.0 <= result.depth_reduction <= 2.0
+        if result.depth_reduction:
+            assert result.section_specs[0].depth == 24.0 - result.depth_reduction
+
+    def test_zero_budget_returns_baseline(self, command) -> None:
+        """A zero time budget still returns the evaluated baseline."""
+        wall, params, specs = _inputs(100.0, 12.0, 2)
+        optimizer = SectionWidthOptimizerService(
+            command, config=WidthOptimizationConfig(time_budget_seconds=0.0)
+        )
+
+        result = optimizer.optimize(wall, params, specs)
+
+        assert result.timed_out
+        assert result.candidates_evaluated == 1
+        assert result.sheet_count == result.baseline_sheet_count
+
+    def test_invalid_baseline_raises(self, command) -> None:
+        """Specs that cannot be resolved raise SectionWidthError."""
+        wall, params, _ = _inputs(30.0, 12.0, 2)
+        specs = [SectionSpec(width=40.0), SectionSpec(width="fill")]
+
+        with pytest.raises(SectionWidthError):
+            SectionWidthOptimizerService(command).optimize(wall, params, specs)
+
+    def test_to_dict_summary(self, command) -> None:
+        """to_dict() reports sheets saved and widths."""
+        wall, params, specs = _inputs(100.0, 12.0, 2)
+        result = SectionWidthOptimizerService(command).optimize(wall, params, specs)
+
+        data = result.to_dict()
+
+        assert data["sheets_saved"] == result.sheets_saved
+        assert len(data["section_widths"]) == 2
@@ -0,0 +1,42 @@
+"""Tests for the width optimizer on the generate API."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from cabinets.web.app import create_app  # noqa: E402
+
+
+class TestWidthOptimizationEndpoint:
+    """Tests for optimize_widths on /generate/from-config."""
+
+    def test_scores_on_configured_sheet_size(self) -> None:
+        """The configured bin_packing sheet size is used for scoring."""
+        client = TestClient(create_app())
+        config = {
+            "schema_version": "1.0",
+            "cabinet": {
+                "width": 100.0,
+                "height": 84.0,
+                "depth": 12.0,
+                "sections": [{"shelves": 4}, {"shelves": 4}],
+            },
+        }
+        large_sheets = {
+            **config,
+            "bin_packing": {"sheet_size": {"width": 60, "height": 120}},
+        }
+
+        def sheets(body: dict) -> int:
+            response = client.post(
+                "/api/v1/generate/from-config?optimize_widths=true",
+                json={"config": body},
+            )
+            assert response.status_code == 200
+            return response.json()["width_optimization"]["baseline_sheet_count"]
+
+        assert sheets(large_sheets) < sheets(config)
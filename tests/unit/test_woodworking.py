@@ -11,6 +11,7 @@ from cabinets.domain.services.woodworking import (
     ConnectionJoinery,
     HardwareList,
     JointSpec,
+    ShelfLoadTable,
     SpanWarning,
     WeightCapacity,
     WoodworkingConfig,
@@ -2212,6 +2213,117 @@ class TestGetShelfCapacities:
         assert capacities[0].capacity_lbs > capacities[1].capacity_lbs
 
 
+class TestShelfLoadTable:
+    """Tests for batched shelf analysis shared by span and capacity checks."""
+
+    @pytest.fixture
+    def intel(self) -> WoodworkingIntelligence:
+        """Create WoodworkingIntelligence instance."""
+        return WoodworkingIntelligence()
+
+    @pytest.fixture
+    def mixed_cabinet(self) -> Cabinet:
+        """Create a cabinet whose sections use different shelf materials."""
+        cabinet = Cabinet(
+            width=100.0,
+            height=84.0,
+            depth=16.0,
+            material=MaterialSpec.standard_3_4(),
+        )
+        shelf_specs = [
+            (20.0, MaterialSpec(thickness=0.75, material_type=MaterialType.MDF), 2),
+            (30.0, MaterialSpec.standard_3_4(), 0),
+            (
+                44.0,
+                MaterialSpec(thickness=1.0, material_type=MaterialType.SOLID_WOOD),
+                3,
+            ),
+        ]
+        x = 0.75
+        for width, material, count in shelf_specs:
+            section = Section(
+                width=width, height=82.5, depth=15.25, position=Position(x, 0.75)
+            )
+            for i in range(count):
+                section.add_shelf(
+                    Shelf(
+                        width=width,
+                        depth=15.25 - i,
+                        material=material,
+                        position=Position(x, 20.0 * (i + 1)),
+                    )
+                )
+            cabinet.sections.append(section)
+            x += width + 0.75
+        return cabinet
+
+    def test_table_columns(self, mixed_cabinet: Cabinet) -> None:
+        """Shelves are gathered section by section with their spans."""
+        table = ShelfLoadTable.from_cabinet(mixed_cabinet)
+
+        assert len(table) == 5
+        assert table.section_indices.tolist() == [0, 0, 2, 2, 2]
+        assert table.shelf_indices.tolist() == [0, 1, 0, 1, 2]
+        assert table.shelf_section_widths.tolist() == [20, 20, 44, 44, 44]
+        assert table.max_spans.tolist() == [24.0, 24.0, 42.0, 42.0, 42.0]
+
+    def test_capacities_match_scalar_formula(
+        self, intel: WoodworkingIntelligence, mixed_cabinet: Cabinet
+    ) -> None:
+        """Batched capacities equal per-shelf estimate_capacity results."""
+        capacities = intel.get_shelf_capacities(mixed_cabinet)
+
+        expected = [
+            intel.estimate_capacity(
+                thickness=shelf.material.thickness,
+                depth=shelf.depth,
+                span=section.width,
+                material_type=shelf.material.material_type,
+                panel_label=f"Section {s + 1} Shelf {i + 1}",
+            )
+            for s, section in enumerate(mixed_cabinet.sections)
+            for i, shelf in enumerate(section.shelves)
+        ]
+        assert capacities == expected
+
+    def test_shared_table_gives_same_results(
+        self, intel: WoodworkingIntelligence, mixed_cabinet: Cabinet
+    ) -> None:
+        """Passing a shared table does not change span or capacity results."""
+        table = intel.analyze_shelves(mixed_cabinet)
+
+        assert intel.check_spans(mixed_cabinet, table) == intel.check_spans(
+            mixed_cabinet
+        )
+        assert intel.get_shelf_capacities(
+            mixed_cabinet, table
+        ) == intel.get_shelf_capacities(mixed_cabinet)
+
+    def test_span_warnings_for_violating_shelves(
+        self, intel: WoodworkingIntelligence, mixed_cabinet: Cabinet
+    ) -> None:
+        """Only the solid wood shelves over 42 inches are flagged."""
+        warnings = intel.check_spans(mixed_cabinet)
+
+        shelf_warnings = [w for w in warnings if "Shelf" in w.panel_label]
+        assert [w.panel_label for w in shelf_warnings] == [
+            "Section 3 Shelf 1",
+            "Section 3 Shelf 2",
+            "Section 3 Shelf 3",
+        ]
+        assert all(w.severity == "warning" for w in shelf_warnings)
+
+    def test_empty_cabinet(self, intel: WoodworkingIntelligence) -> None:
+        """A cabinet without shelves produces an empty table."""
+        cabinet = Cabinet(
+            width=24.0, height=30.0, depth=12.0, material=MaterialSpec.standard_3_4()
+        )
+        table = intel.analyze_shelves(cabinet)
+
+        assert len(table) == 0
+        assert intel.get_shelf_capacities(cabinet, table) == []
+
+
 class TestFormatCapacityReport:
     """Tests for format_capacity_report method."""
 
@@ -0,0 +1,116 @@
+"""Tests for zone stack reuse across walls and presets."""
+
+from __future__ import annotations
+
+from cabinets.domain.services.zone_layout import (
+    CountertopConfig,
+    ZoneLayoutConfig,
+    ZoneLayoutService,
+)
+from cabinets.domain.value_objects import MaterialSpec
+
+CUSTOM_ZONES = [
+    {
+        "zone_type": "base",
+        "height": 34.5,
+        "depth": 24.0,
+        "mounting": "floor",
+        "sections": [{"width": "fill", "shelves": 1}, {"width": 12.0}],
+    },
+    {"zone_type": "gap", "height": 18.0, "mounting": "wall"},
+]
+
+
+class TestZoneLayoutReuse:
+    """Tests for memoized zone stacks and zone cabinets."""
+
+    def test_same_preset_and_width_share_cabinets(self) -> None:
+        service = ZoneLayoutService()
+
+        first = service.generate(ZoneLayoutConfig(preset="kitchen", width=48.0))
+        second = service.generate(
+            ZoneLayoutConfig(
+                preset="Kitchen", width=48.0, countertop=CountertopConfig()
+            )
+        )
+
+        assert second.base_cabinet is first.base_cabinet
+        assert second.upper_cabinet is first.upper_cabinet
+        assert second.countertop_panels and not first.countertop_panels
+
+    def test_different_width_or_material_not_shared(self) -> None:
+        service = ZoneLayoutService()
+        base = service.generate(ZoneLayoutConfig(preset="kitchen", width=48.0))
+
+        wider = service.generate(ZoneLayoutConfig(preset="kitchen", width=60.0))
+        thicker = service.generate(
+            ZoneLayoutConfig(
+                preset="kitchen", width=48.0, material=MaterialSpec(thickness=0.5)
+            )
+        )
+
+        assert wider.base_cabinet is not base.base_cabinet
+        assert wider.base_cabinet.width == 60.0
+        assert thicker.base_cabinet is not base.base_cabinet
+
+    def test_custom_zones_keyed_by_section_definitions(self) -> None:
+        service = ZoneLayoutService()
+        config = ZoneLayoutConfig(
+            preset="custom", width=36.0, custom_zones=CUSTOM_ZONES
+        )
+        changed = [
+            {**CUSTOM_ZONES[0], "sections": [{"width": "fill", "shelves": 2}]},
+            CUSTOM_ZONES[1],
+        ]
+
+        first = service.generate(config)
+        repeat = service.generate(
+            ZoneLayoutConfig(
+                preset="custom",
+                width=36.0,
+                custom_zones=[dict(zone) for zone in CUSTOM_ZONES],
+            )
+        )
+        other = service.generate(
+            ZoneLayoutConfig(preset="custom", width=36.0, custom_zones=changed)
+        )
+
+        assert repeat.base_cabinet is first.base_cabinet
+        assert other.base_cabinet is not first.base_cabinet
+        assert len(other.base_cabinet.sections) == 1
+
+    def test_cached_results_match_fresh_generation(self) -> None:
+        service = ZoneLayoutService()
+        config = ZoneLayoutConfig(preset="mudroom", width=42.0, full_height_sides=True)
+        service.generate(config)
+
+        cached = service.generate(config)
+        fresh = ZoneLayoutService().generate(config)
+
+        assert cached == fresh
+
+
+class TestGenerateWalls:
+    """Tests for multi-wall zone stack generation."""
+
+    def test_identical_walls_share_result(self) -> None:
+        service = ZoneLayoutService()
+        kitchen = ZoneLayoutConfig(preset="kitchen", width=48.0)
+
+        results = service.generate_walls(
+            [kitchen, ZoneLayoutConfig(preset="vanity", width=30.0), kitchen]
+        )
+
+        assert len(results) == 3
+        assert results[2] is results[0]
+        assert results[1].base_cabinet.width == 30.0
+
+    def test_errors_reported_per_wall(self) -> None:
+        service = ZoneLayoutService()
+
+        results = service.generate_walls(
+            [ZoneLayoutConfig(preset="custom"), ZoneLayoutConfig(preset="hutch")]
+        )
+
+        assert results[0].has_errors
+        assert not results[1].has_errors